@@ -0,0 +1,99 @@
+"""
+Taskbar startup budget check.
+
+Times importing the taskbar module and showing ``SuiteViewTaskbar`` in this
+(fresh) process, reads the resident set size afterwards, and checks that no
+File Navigator or tool-window module was pulled in on the way.  Exits 1 when
+a budget is blown, so it can gate a build:
+
+    python scripts/measure_taskbar_startup.py --max-seconds 0.3 --max-rss-mb 70
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Modules the taskbar must leave for first use / the idle preload
+DEFERRED_MODULES = (
+    "suiteview.taskbar_launcher.file_nav_window",
+    "suiteview.file_nav.file_explorer_core",
+    "suiteview.ui.widgets.bookmark_widgets",
+    "suiteview.polview.ui.main_window",
+    "suiteview.abrquote",
+    "suiteview.illustration",
+)
+
+
+def _rss_mb() -> float | None:
+    """Current resident set size in MB, or None where it can't be read."""
+    try:
+        import psutil
+    except ImportError:
+        pass
+    else:
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    try:  # Linux without psutil: resident pages are the second statm field
+        with open("/proc/self/statm") as statm:
+            pages = int(statm.read().split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def measure() -> dict:
+    from PyQt6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    start = time.perf_counter()
+    from suiteview.taskbar_launcher.suiteview_taskbar import SuiteViewTaskbar
+    imported = time.perf_counter()
+    taskbar = SuiteViewTaskbar()
+    taskbar.show()
+    app.processEvents()
+    shown = time.perf_counter()
+
+    result = {
+        "import_s": imported - start,
+        "construct_s": shown - imported,
+        "total_s": shown - start,
+        "rss_mb": _rss_mb(),
+        "loaded": [name for name in DEFERRED_MODULES if name in sys.modules],
+    }
+    taskbar.close()
+    return result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--max-seconds", type=float, default=0.3,
+                        help="budget for import + construct + first show (default 0.3)")
+    parser.add_argument("--max-rss-mb", type=float, default=70.0,
+                        help="budget for resident memory after startup (default 70)")
+    args = parser.parse_args(argv)
+
+    result = measure()
+    print(f"import     {result['import_s'] * 1000:7.1f} ms")
+    print(f"construct  {result['construct_s'] * 1000:7.1f} ms")
+    print(f"total      {result['total_s'] * 1000:7.1f} ms  (budget {args.max_seconds * 1000:.0f} ms)")
+    if result["rss_mb"] is None:
+        print("rss        unavailable (install psutil)")
+    else:
+        print(f"rss        {result['rss_mb']:7.1f} MB  (budget {args.max_rss_mb:.0f} MB)")
+
+    failures = []
+    if result["total_s"] > args.max_seconds:
+        failures.append(f"startup took {result['total_s']:.3f} s")
+    if result["rss_mb"] is not None and result["rss_mb"] > args.max_rss_mb:
+        failures.append(f"RSS is {result['rss_mb']:.1f} MB")
+    if result["loaded"]:
+        failures.append(f"loaded at startup: {', '.join(result['loaded'])}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -49,6 +49,8 @@ from .dynamic_group import DynamicQuery
 from .field_picker_panel import FieldPickerPanel
 from .group_config import load_ui_settings, save_ui_settings
 from .ui.bottom_bar import AuditBottomBar, FOOTER_BG
+from .paged_query import Page, PagedQuery
+from .result_store import shared_result_store
 from .query_runner import (
     execute_odbc_query,
     run_button_context,
@@ -575,6 +577,7 @@ class AuditWindow(FramelessWindowBase):
         )
     def _connect_signals(self):
         self.btn_run.clicked.connect(self._run_audit)
+        self.cyberlife_bottom_bar.refresh_requested.connect(self._rerun_audit_without_reuse)
         self.sql_tab.build_sql_requested.connect(self._build_cyberlife_sql_only)
         self.sql_tab.move_to_build.connect(self._on_move_to_build)
         self.build_sql_tab.run_sql_requested.connect(self._run_build_sql)
@@ -1680,6 +1683,9 @@ class AuditWindow(FramelessWindowBase):
     # ── Run audit ────────────────────────────────────────────────────
     def _run_audit(self):
         """Execute the audit query and display results."""
+        self._start_audit(refresh=False)
+
+    def _start_audit(self, refresh: bool):
         try:
             sql = self._build_sql()
         except Exception as exc:
@@ -1692,17 +1698,42 @@ class AuditWindow(FramelessWindowBase):
         db = DB2Connection(region)
         dsn = db.dsn
 
+        def load():
+            columns, rows = db.execute_query_with_headers_isolated(sql)
+            return pd.DataFrame([list(r) for r in rows], columns=columns), {}
+
+        # Large or unbounded runs preview first: COUNT(*) + one page, with the
+        # full result fetched only on export (unless it is already shared).
+        pager = PagedQuery(sql, db.execute_query_with_headers_isolated)
+        paged = pager.limit is None or pager.limit > pager.page_size
+
         def work():
             t0 = time.time()
-            columns, rows = db.execute_query_with_headers_isolated(sql)
+            if refresh:
+                shared_result_store().invalidate(dsn, sql)
+            result = shared_result_store().peek(dsn, sql) if paged else None
+            if paged and result is None:
+                page = pager.preview()
+                columns = [str(c) for c in page.columns]
+                return columns, page, time.time() - t0, None
+            if result is None:
+                result = shared_result_store().fetch(dsn, sql, load)
             t_query = time.time() - t0
-            df = pd.DataFrame([list(r) for r in rows], columns=columns)
-            return columns, df, t_query
+            df = result.dataframe
+            reused_at = result.fetched_at if result.reused else None
+            return [str(c) for c in df.columns], df, t_query, reused_at
 
         def on_success(payload):
-            columns, df, t_query = payload
+            columns, df, t_query, reused_at = payload
             t1 = time.time()
-            self.results_tab.set_results(df)
+            if isinstance(df, Page):
+                self.results_tab.set_paged_results(
+                    pager, df,
+                    load_all=lambda: shared_result_store().fetch(dsn, sql, load).dataframe)
+                row_count = df.total_rows
+            else:
+                self.results_tab.set_results(df)
+                row_count = len(df)
             self.results_tab.set_query_context(
                 sql=sql, dsn=dsn,
                 source_design="Cyberlife",
@@ -1712,7 +1743,8 @@ class AuditWindow(FramelessWindowBase):
             self.lbl_query_time.setText(f"Query time:  {fmt_time(t_query)}")
             self.lbl_print_time.setText(f"Print time:  {fmt_time(t_print)}")
             self.lbl_total_time.setText(f"Total time:  {fmt_time(t_query + t_print)}")
-            self.lbl_result_count.setText(f"Result count:   {len(df)}")
+            self.lbl_result_count.setText(f"Result count:   {row_count}")
+            self.cyberlife_bottom_bar.set_reused(reused_at)
             # Switch to Results tab
             self.tabs.setCurrentWidget(self.results_tab)
 
@@ -1730,6 +1762,10 @@ class AuditWindow(FramelessWindowBase):
             bar=self.cyberlife_bottom_bar,
         )
 
+    def _rerun_audit_without_reuse(self):
+        """Footer refresh: run again, fetching this query's result anew."""
+        self._start_audit(refresh=True)
+
     # ── Header view buttons ──────────────────────────────────────────
     def _on_cyberlife_header_clicked(self, checked: bool):
         """Switch to Cyberlife view from header button."""
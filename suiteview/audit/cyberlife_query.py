@@ -1,8 +1,18 @@
 """
 CyberLife (DB2) query builder — builds the audit SQL from all tab controls.
+
+The pure fragment builders (bill-mode predicate, valuation-date expression)
+are memoized with ``suiteview.audit.sql_cache``. The main builder reads the
+tab widgets directly, so ``build_cyberlife_sql`` first captures the criteria
+once as a frozen :class:`CyberLifeCriteria` — each tab's saved-query
+``get_state()``, plus schema, system, row cap and today's date — and only
+rebuilds the SQL when those criteria change.
 """
 from __future__ import annotations
 
+from dataclasses import dataclass
+
+from .sql_cache import SqlCache, freeze, memoize_sql
 from .sql_helpers import (
     esc, in_list, selected_codes, today_str, normalize_date,
     add_int_range, add_date_range, add_decimal_range,
@@ -43,6 +53,7 @@ _BILL_MODE_MAP = {
 }
 
 
+@memoize_sql(maxsize=32)
 def _build_bill_mode_where(modes: list[str]) -> str:
     """Build a compound OR clause for bill mode selections.
 
@@ -143,6 +154,7 @@ def _build_custom_display(custom_display_tab, result_cov_alias: str,
     return select_lines, join_lines
 
 
+@memoize_sql(maxsize=16)
 def _valuation_date_sql(schema: str) -> str:
     """SQL expression for the policy valuation date.
 
@@ -172,6 +184,35 @@ def _valuation_date_sql(schema: str) -> str:
     )
 
 
+_CYBERLIFE_SQL_CACHE = SqlCache(maxsize=32)
+
+
+@dataclass(frozen=True)
+class CyberLifeCriteria:
+    """Everything the CyberLife builder depends on, read from the UI once.
+
+    ``tab_states`` is the frozen ``get_state()`` of each tab, keyed like a
+    saved CyberLife query object's ``criteria["tabs"]``; equal criteria
+    always give the same SQL.
+    """
+
+    schema: str
+    sys_code: str
+    max_count_text: str
+    coverage_level: bool
+    as_of: str
+    tab_states: tuple
+
+    @classmethod
+    def from_tabs(cls, schema: str, sys_code: str, max_count_text: str,
+                  coverage_level: bool = False, **tabs) -> "CyberLifeCriteria":
+        """Capture the criteria; raises ``TypeError`` for unhashable tab state."""
+        states = {key: tab.get_state() for key, tab in tabs.items() if tab is not None}
+        return cls(schema=schema, sys_code=sys_code, max_count_text=max_count_text,
+                   coverage_level=bool(coverage_level), as_of=today_str(),
+                   tab_states=freeze(states))
+
+
 def build_cyberlife_sql(
     schema: str,
     sys_code: str,
@@ -202,7 +243,46 @@ def build_cyberlife_sql(
     policy_tab, display_tab, policy2_tab, adv_tab, coverages_tab,
     plancode_tab, benefits_tab, transaction_tab
         The tab widgets with filter controls.
+
+    The result is cached per :class:`CyberLifeCriteria`;
+    ``build_cyberlife_sql.uncached`` always rebuilds.
     """
+    def build() -> str:
+        return _build_cyberlife_sql(
+            schema, sys_code, max_count_text, policy_tab, display_tab,
+            policy2_tab, adv_tab, coverages_tab, plancode_tab, benefits_tab,
+            transaction_tab, coverage_level=coverage_level,
+            custom_display_tab=custom_display_tab)
+
+    try:
+        criteria = CyberLifeCriteria.from_tabs(
+            schema, sys_code, max_count_text, coverage_level,
+            policy=policy_tab, display=display_tab, policy2=policy2_tab,
+            adv=adv_tab, coverages=coverages_tab, plancode=plancode_tab,
+            benefits=benefits_tab, transaction=transaction_tab,
+            custom_display=custom_display_tab)
+    except TypeError:
+        _CYBERLIFE_SQL_CACHE.note_uncacheable()
+        return build()
+    return _CYBERLIFE_SQL_CACHE.get_or_build(criteria, build)
+
+
+def _build_cyberlife_sql(
+    schema: str,
+    sys_code: str,
+    max_count_text: str,
+    policy_tab,
+    display_tab,
+    policy2_tab,
+    adv_tab,
+    coverages_tab,
+    plancode_tab,
+    benefits_tab,
+    transaction_tab=None,
+    coverage_level: bool = False,
+    custom_display_tab=None,
+) -> str:
+    """Build the CyberLife audit SQL (uncached — see ``build_cyberlife_sql``)."""
     pt = policy_tab
     dt = display_tab
     p2t = policy2_tab
@@ -2439,3 +2519,8 @@ def build_cyberlife_sql(
         sql_parts.append("FETCH FIRST 25 ROWS ONLY")
 
     return "\n".join(sql_parts)
+
+
+build_cyberlife_sql.cache_info = _CYBERLIFE_SQL_CACHE.info
+build_cyberlife_sql.cache_clear = _CYBERLIFE_SQL_CACHE.clear
+build_cyberlife_sql.uncached = _build_cyberlife_sql
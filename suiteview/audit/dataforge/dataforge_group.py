@@ -40,7 +40,7 @@ from suiteview.audit.sql_helpers import fmt_time
 from suiteview.audit.ui.bottom_bar import AuditBottomBar
 from suiteview.audit.query_runner import (
     run_button_context,
-    execute_odbc_query,
+    execute_shared_query,
     run_query_async,
     format_query_error,
 )
@@ -1755,8 +1755,7 @@ class DataForgeGroup(QWidget):
                 metadata,
                 columns=sq.result_columns,
             )
-        columns, rows = execute_odbc_query(sq.dsn, sq.sql)
-        return pd.DataFrame([list(r) for r in rows], columns=columns)
+        return execute_shared_query(sq.dsn, sq.sql).dataframe
 
     def _resolve_display_column(self, result: pd.DataFrame, spec: dict) -> str:
         column = spec.get("column", "")
@@ -2588,10 +2587,9 @@ class DataForgeGroup(QWidget):
         df_store.delete_forge(forge_name)
         for qd in qdef_store.list_qdefs(forge_name=forge_name):
             self._delete_query_copy_records(qd.name, forge_name)
-        for obj in query_object_store.list_objects():
-            dataforge = (obj.config or {}).get("dataforge", {})
-            if dataforge.get("forge_name") == forge_name:
-                self._delete_query_copy_records(obj.name, forge_name)
+        for entry in query_object_store.list_entries():
+            if entry.forge_name == forge_name:
+                self._delete_query_copy_records(entry.name, forge_name)
 
     def _dataforge_sources_for_save(self, forge_name: str) -> list[DataForgeSource]:
         """Persist source definitions and return DataForge source records."""
@@ -608,6 +608,7 @@ def run_manual_sql(
     *,
     limit: int | None = None,
     connection: "duckdb.DuckDBPyConnection | None" = None,
+    relations: dict[str, str] | None = None,
 ) -> ForgeResult:
     """Execute hand-written DuckDB SQL against Source Snapshots (Manual mode).
 
@@ -617,10 +618,15 @@ def run_manual_sql(
     Because :func:`compile_forge_sql` defaults physical names to the aliases,
     a compiled Visual statement runs here unchanged (the Visual→Manual flip).
 
+    ``relations`` maps further aliases to a DuckDB SELECT (e.g. a lazy
+    ``read_csv`` scan) that is created as a view instead of a registered
+    DataFrame, so DuckDB reads only what the statement needs.
+
     Source filters are NOT applied — the SQL is authoritative; write them in.
     ``column_sources`` is empty: arbitrary SQL output can't be mapped back.
     """
-    if not sources:
+    relations = relations or {}
+    if not sources and not relations:
         raise ForgeEngineError("A Forge needs at least one Source.")
     statement = prepare_manual_statement(sql, limit)
 
@@ -629,12 +635,19 @@ def run_manual_sql(
     try:
         for alias, df in sources.items():
             con.register(alias, df)
+        for alias, select_sql in relations.items():
+            try:
+                con.execute(
+                    f"CREATE OR REPLACE TEMP VIEW {_qi(alias)} AS {select_sql}")
+            except duckdb.Error as exc:
+                raise ForgeEngineError(
+                    f"Could not open Source {_qi(alias)}: {exc}") from exc
         try:
             result_df = con.execute(statement).df()
         except duckdb.Error as exc:
             raise ForgeEngineError(
                 f"Manual SQL failed: {exc}\n\nSource tables available: "
-                + ", ".join(_qi(a) for a in sources)) from exc
+                + ", ".join(_qi(a) for a in [*sources, *relations])) from exc
         return ForgeResult(dataframe=result_df, sql=statement, column_sources={})
     finally:
         if own_conn:
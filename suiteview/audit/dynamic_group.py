@@ -37,7 +37,7 @@ from .ui.bottom_bar import AuditBottomBar, FOOTER_BG
 from .query_runner import (
     run_button_context,
     execute_odbc_query,
-    execute_odbc_query_with_types,
+    execute_shared_query,
     run_query_async,
     format_query_error,
 )
@@ -397,6 +397,7 @@ class DynamicQuery(QWidget):
         self._update_builder_heading()
 
         self.btn_run.clicked.connect(self._run_audit)
+        self.bottom_bar.refresh_requested.connect(self._rerun_without_reuse)
 
         root.addWidget(self.bottom_bar)
 
@@ -755,6 +756,9 @@ class DynamicQuery(QWidget):
         logger.info("Generated SQL:\n%s", sql)
 
     def _run_audit(self):
+        self._start_audit(refresh=False)
+
+    def _start_audit(self, refresh: bool):
         sql = self._build_sql()
         if not sql:
             return
@@ -766,6 +770,7 @@ class DynamicQuery(QWidget):
 
         def work():
             t0 = time.time()
+            reused_at = None
             if dsn.startswith("file:"):
                 from suiteview.audit import file_query_runner
                 fds = file_query_runner.resolve_file_source(dsn[len("file:"):])
@@ -776,13 +781,15 @@ class DynamicQuery(QWidget):
                 columns = [str(c) for c in df.columns]
                 col_types = {c: str(df[c].dtype) for c in df.columns}
             else:
-                columns, rows, col_types = execute_odbc_query_with_types(dsn, sql)
-                df = pd.DataFrame([list(r) for r in rows], columns=columns)
+                result = execute_shared_query(dsn, sql, refresh=refresh)
+                df, col_types = result.dataframe, result.column_types
+                columns = [str(c) for c in df.columns]
+                reused_at = result.fetched_at if result.reused else None
             t_query = time.time() - t0
-            return columns, col_types, df, t_query
+            return columns, col_types, df, t_query, reused_at
 
         def on_success(payload):
-            columns, col_types, df, t_query = payload
+            columns, col_types, df, t_query, reused_at = payload
             t1 = time.time()
             self.results_tab.set_results(df)
             self.results_tab.set_query_context(
@@ -798,6 +805,7 @@ class DynamicQuery(QWidget):
             self.lbl_print_time.setText(f"Print time:  {fmt_time(t_print)}")
             self.lbl_total_time.setText(f"Total time:  {fmt_time(t_query + t_print)}")
             self.lbl_result_count.setText(f"Result count:   {len(df)}")
+            self.bottom_bar.set_reused(reused_at)
             self.tab_widget.setCurrentWidget(self.results_tab)
 
         def on_error(exc):
@@ -813,6 +821,9 @@ class DynamicQuery(QWidget):
             bar=self.bottom_bar,
         )
 
+    def _rerun_without_reuse(self):
+        """Footer refresh: run again, fetching this query's result anew."""
+        self._start_audit(refresh=True)
 
     # ── Save Query Object ────────────────────────────────────────────
 
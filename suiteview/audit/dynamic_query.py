@@ -4,6 +4,10 @@ Dynamic SQL builder — generates SELECT queries from dynamic field filters.
 Builds SQL for user-created groups based on the FieldRow widgets on the
 active tab. Supports contains, regex, range, list, and combo filter modes.
 Adapts SQL dialect (quoting, row limiting) based on the target backend.
+
+The builders are pure functions of plain criteria data, so they are memoized
+(``suiteview.audit.sql_cache``): rebuilding unchanged criteria returns the
+cached statement, and each Common Table's VALUES CTE is cached on its own.
 """
 from __future__ import annotations
 
@@ -11,6 +15,8 @@ import logging
 import re
 from typing import TYPE_CHECKING
 
+from suiteview.audit.sql_cache import SqlCache, freeze, memoize_sql
+
 if TYPE_CHECKING:
     from suiteview.audit.common_table import CommonTable
 
@@ -100,6 +106,7 @@ def _select_prefix(top_clause: str, distinct: bool, dialect: str) -> str:
     return f"{top_clause}{'DISTINCT ' if distinct else ''}"
 
 
+@memoize_sql()
 def build_dynamic_sql(
     table_name: str,
     max_count: str,
@@ -321,6 +328,7 @@ def _resolve_field_key(field_key: str, alias_map: dict[str, str],
     return q(col)
 
 
+@memoize_sql()
 def build_join_sql(
     primary_table: str,
     max_count: str,
@@ -571,41 +579,52 @@ def build_common_table_cte(
     if not tables:
         return ""
 
-    cte_parts: list[str] = []
+    cte_parts = []
     for ct in tables:
-        col_names = ", ".join(c["name"] for c in ct.columns)
-
-        # Format each row as a VALUES tuple
-        row_strs: list[str] = []
-        for row in ct.rows:
-            vals: list[str] = []
-            for i, col_def in enumerate(ct.columns):
-                raw = row[i] if i < len(row) else ""
-                ctype = col_def.get("type", "TEXT")
-                if ctype in ("INTEGER", "DECIMAL") and raw != "":
-                    vals.append(str(raw))
-                else:
-                    vals.append(f"'{_escape(str(raw))}'")
-            row_strs.append(f"({', '.join(vals)})")
-
-        values_block = ",\n        ".join(row_strs)
-
-        if dialect in (DB2, DUCKDB):
-            # DuckDB accepts the same `name (cols) AS (VALUES ...)` CTE form.
-            cte = (
-                f"{ct.name} ({col_names}) AS (\n"
-                f"    VALUES {values_block}\n"
-                f")"
-            )
-        else:
-            # SQL Server / Access
-            cte = (
-                f"{ct.name} ({col_names}) AS (\n"
-                f"    SELECT * FROM (VALUES\n"
-                f"        {values_block}\n"
-                f"    ) AS _t({col_names})\n"
-                f")"
-            )
-        cte_parts.append(cte)
-
+        # Rows are keyed as-is (tuple-of-tuples hashes in C); values are
+        # stored as strings, so equal-hashing numbers are not a concern.
+        key = (ct.name, dialect, freeze(ct.columns), tuple(map(tuple, ct.rows)))
+        cte_parts.append(_CTE_CACHE.get_or_build(
+            key, lambda ct=ct: _common_table_cte(ct.name, ct.columns, ct.rows, dialect)))
     return "WITH " + ",\n".join(cte_parts)
+
+
+# One rendered VALUES CTE per Common Table content (see build_common_table_cte).
+_CTE_CACHE = SqlCache(maxsize=64)
+
+
+def _common_table_cte(name: str, columns: list[dict], rows: list[list],
+                      dialect: str) -> str:
+    """Render one Common Table as a ``name (cols) AS (VALUES ...)`` fragment."""
+    col_names = ", ".join(c["name"] for c in columns)
+
+    # Format each row as a VALUES tuple
+    row_strs: list[str] = []
+    for row in rows:
+        vals: list[str] = []
+        for i, col_def in enumerate(columns):
+            raw = row[i] if i < len(row) else ""
+            ctype = col_def.get("type", "TEXT")
+            if ctype in ("INTEGER", "DECIMAL") and raw != "":
+                vals.append(str(raw))
+            else:
+                vals.append(f"'{_escape(str(raw))}'")
+        row_strs.append(f"({', '.join(vals)})")
+
+    values_block = ",\n        ".join(row_strs)
+
+    if dialect in (DB2, DUCKDB):
+        # DuckDB accepts the same `name (cols) AS (VALUES ...)` CTE form.
+        return (
+            f"{name} ({col_names}) AS (\n"
+            f"    VALUES {values_block}\n"
+            f")"
+        )
+    # SQL Server / Access
+    return (
+        f"{name} ({col_names}) AS (\n"
+        f"    SELECT * FROM (VALUES\n"
+        f"        {values_block}\n"
+        f"    ) AS _t({col_names})\n"
+        f")"
+    )
@@ -12,20 +12,57 @@ engine (``forge_engine.run_manual_sql``). One engine, no new executor.
 Each member is its OWN table (design decision 2026-06-22): a query references
 ``"CLAIMS"`` and ``"RGACLAIMS"`` separately and UNIONs them in SQL to combine.
 
+Delimited and fixed-width members are NOT loaded into pandas: each becomes a
+DuckDB view over a lazy ``read_csv`` scan (fixed-width as ``substring`` slices
+of each line), so a limited preview reads only the head of the file and a full
+run scans the files in DuckDB rather than copying every member into pandas
+first; only the query result comes back as a DataFrame. Excel members (and the odd spec DuckDB can't read —
+an unsupported encoding, a headerless file without column names) still go
+through the pandas readers.
+
 Pure-ish: imports pandas/duckdb lazily through the readers and engine, so it
 stays importable on the minipc; actual execution needs the local files only.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from suiteview.audit.adhoc_source_intake import dataframe_from_adhoc_metadata
 from suiteview.audit.dataforge import forge_engine
-from suiteview.audit.file_source import FileDataSource
+from suiteview.audit.file_source import (
+    SOURCE_TYPE_CSV,
+    SOURCE_TYPE_FIXED_WIDTH,
+    FileDataSource,
+    FileMember,
+)
 
 if TYPE_CHECKING:
     import pandas as pd
 
+# Declared schema types that are enforced in the scan (TRY_CAST, so a stray
+# value beyond the intake sample becomes NULL rather than failing the query).
+# TEXT/DATE/TIMESTAMP stay VARCHAR: policy numbers keep their leading zeros and
+# dates keep the text the file carries, as the pandas readers returned them.
+_CAST_TYPES = {
+    "INTEGER": "BIGINT",
+    "BIGINT": "BIGINT",
+    "DOUBLE": "DOUBLE",
+    "DECIMAL": "DOUBLE",
+    "BOOLEAN": "BOOLEAN",
+}
+
+# Python codec names -> the encodings DuckDB's CSV reader supports natively.
+_DUCKDB_ENCODINGS = {
+    "utf-8": "utf-8",
+    "utf8": "utf-8",
+    "utf-8-sig": "utf-8",
+    "utf_8_sig": "utf-8",
+    "latin-1": "latin-1",
+    "latin1": "latin-1",
+    "iso-8859-1": "latin-1",
+    "utf-16": "utf-16",
+}
+
 
 def resolve_file_source(ref: str) -> FileDataSource | None:
     """Resolve a File Source by id (preferred) or name."""
@@ -35,23 +72,48 @@ def resolve_file_source(ref: str) -> FileDataSource | None:
             or file_source_store.load_file_source(ref))
 
 
-def load_source_tables(
+def member_scan_sql(file_source: FileDataSource, member: FileMember) -> str | None:
+    """DuckDB SELECT that lazily scans one member file, or None if it can't.
+
+    None means the member needs the pandas readers (Excel, an encoding DuckDB
+    doesn't read, a headerless delimited file with no column names).
+    """
+    meta = file_source.member_metadata(member)
+    encoding = _DUCKDB_ENCODINGS.get(
+        str(meta.get("encoding") or "utf-8").strip().lower())
+    if encoding is None:
+        return None
+    declared = {c.name: c.data_type for c in file_source.columns}
+    if file_source.source_type == SOURCE_TYPE_CSV:
+        return _delimited_scan_sql(meta, encoding, declared)
+    if file_source.source_type == SOURCE_TYPE_FIXED_WIDTH:
+        return _fixed_width_scan_sql(meta, encoding, declared)
+    return None
+
+
+def source_relations(
     file_source: FileDataSource,
     table_names: list[str] | None = None,
-) -> dict[str, "pd.DataFrame"]:
-    """Load member files into DataFrames keyed by table name.
+) -> tuple[dict[str, str], dict[str, "pd.DataFrame"]]:
+    """Split member tables into lazy DuckDB scans and pandas-loaded frames.
 
-    ``table_names`` limits the load to specific member tables; None loads all.
+    Returns ``(relations, frames)``: table name -> scan SELECT for members
+    DuckDB reads directly, table name -> DataFrame for the rest.
     """
     wanted = set(table_names) if table_names is not None else None
-    tables: dict[str, "pd.DataFrame"] = {}
+    relations: dict[str, str] = {}
+    frames: dict[str, "pd.DataFrame"] = {}
     for member in file_source.members:
         name = member.resolved_table_name()
         if wanted is not None and name not in wanted:
             continue
-        tables[name] = dataframe_from_adhoc_metadata(
-            file_source.source_type, file_source.member_metadata(member))
-    return tables
+        scan = member_scan_sql(file_source, member)
+        if scan is not None:
+            relations[name] = scan
+        else:
+            frames[name] = dataframe_from_adhoc_metadata(
+                file_source.source_type, file_source.member_metadata(member))
+    return relations, frames
 
 
 def run_sql(
@@ -66,12 +128,13 @@ def run_sql(
     Returns a ``ForgeResult`` (``.dataframe`` + the executed ``.sql``). Raises
     ``ForgeEngineError`` if the source has no members or the SQL fails.
     """
-    tables = load_source_tables(file_source, table_names)
-    if not tables:
+    relations, frames = source_relations(file_source, table_names)
+    if not relations and not frames:
         raise forge_engine.ForgeEngineError(
             f"File Source {file_source.name!r} has no member files to query.")
     effective_limit = limit if (limit and int(limit) > 0) else None
-    return forge_engine.run_manual_sql(tables, sql, limit=effective_limit)
+    return forge_engine.run_manual_sql(
+        frames, sql, limit=effective_limit, relations=relations)
 
 
 def run_query(
@@ -109,3 +172,63 @@ def _dtype_label(series) -> str:
     if pd.api.types.is_datetime64_any_dtype(dtype):
         return "DATE"
     return "TEXT"
+
+
+# ── DuckDB scan builders ────────────────────────────────────────────────────
+
+def _qi(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _ql(value: Any) -> str:
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _typed(expr: str, data_type: str | None) -> str:
+    cast = _CAST_TYPES.get(str(data_type or "").upper())
+    return f"TRY_CAST({expr} AS {cast})" if cast else expr
+
+
+def _delimited_scan_sql(meta: dict, encoding: str, declared: dict[str, str]) -> str | None:
+    has_header = bool(meta.get("has_header", True))
+    names = [str(n).strip() for n in meta.get("column_names", []) if str(n).strip()]
+    if not has_header and not names:
+        return None
+    options = [
+        f"delim={_ql(meta.get('delimiter', ','))}",
+        f"header={'true' if has_header else 'false'}",
+        f"skip={int(meta.get('skip_rows', 0) or 0)}",
+        f"encoding={_ql(encoding)}",
+    ]
+    if names:
+        options.append("names=[" + ", ".join(_ql(n) for n in names) + "]")
+    if declared:
+        # Read as text and apply the declared schema, instead of letting the
+        # sniffer guess types from a sample of the file.
+        options.append("all_varchar=true")
+    scan = f"read_csv({_ql(meta['path'])}, {', '.join(options)})"
+    casts = [f"{_typed(_qi(name), dtype)} AS {_qi(name)}"
+             for name, dtype in declared.items()
+             if str(dtype or "").upper() in _CAST_TYPES]
+    if casts:
+        return f"SELECT * REPLACE ({', '.join(casts)}) FROM {scan}"
+    return f"SELECT * FROM {scan}"
+
+
+def _fixed_width_scan_sql(meta: dict, encoding: str, declared: dict[str, str]) -> str | None:
+    if not meta.get("columns"):
+        return None  # the pandas reader raises the proper spec error
+    # One VARCHAR column per line (NUL never appears in a text layout), then a
+    # trimmed substring per column — the same slicing read_fwf does.
+    scan = (
+        f"read_csv({_ql(meta['path'])}, columns={{'line': 'VARCHAR'}}, "
+        f"delim=chr(0), quote='', escape='', header=false, auto_detect=false, "
+        f"skip={int(meta.get('skip_rows', 0) or 0)}, encoding={_ql(encoding)})"
+    )
+    selects = []
+    for column in meta.get("columns", []):
+        name = str(column["name"])
+        raw = (f"NULLIF(TRIM(substring(line, {int(column['start'])}, "
+               f"{int(column['width'])})), '')")
+        selects.append(f"{_typed(raw, declared.get(name))} AS {_qi(name)}")
+    return f"SELECT {', '.join(selects)} FROM {scan} WHERE line IS NOT NULL"
@@ -0,0 +1,288 @@
+"""
+Count-first, paged execution of Audit SQL (DB2).
+
+A CyberLife audit with "All" rows can return hundreds of thousands of rows,
+but the first thing a user wants is *how many* and a screenful to eyeball.
+``PagedQuery`` runs the statement in two phases:
+
+1. **Preview** — an optimized ``SELECT COUNT(*)`` wrapper (top-level ORDER BY
+   dropped) and the first ``FETCH FIRST n ROWS ONLY`` page, concurrently on
+   two connections.
+2. **Paging** — later pages with ``OFFSET k ROWS FETCH FIRST n ROWS ONLY``.
+   Pages follow the statement's own ORDER BY. Without one (the CyberLife
+   ``SELECT DISTINCT``) DB2 promises no stable order between executions, so
+   page 2 could repeat or skip rows of page 1. A caller that needs an exact
+   partition asks for ``stable=True``, which orders every page (and the full
+   fetch) by ``ORDER BY 1, 2, ..., n`` over the whole select list — at the
+   price of a sort over the whole result for each page.
+
+The full result is fetched only on demand (:meth:`PagedQuery.fetch_all` —
+export, pin to the Workbench). The user's own row cap (a trailing
+``FETCH FIRST n ROWS ONLY``) bounds the count, the pages and the full fetch
+alike, under the same ordering.
+
+The rewriting works on a *masked* copy of the SQL — string literals,
+comments and anything inside parentheses blanked — so keywords are only
+matched at the top level, and DB2's top-level-only ``WITH`` CTE prefix is
+kept in front of the wrapper instead of being nested. Pure Python (no PyQt,
+no ODBC): execution goes through the callable passed in.
+"""
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+# execute(sql) -> (columns, rows), e.g. DB2Connection.execute_query_with_headers_isolated
+Executor = Callable[[str], "tuple[list[str], list]"]
+
+DEFAULT_PAGE_SIZE = 500
+
+_FETCH_FIRST_RE = re.compile(
+    r"\bFETCH\s+FIRST\s+(\d+)\s+ROWS?\s+ONLY\b", re.IGNORECASE)
+_TAIL_RE = re.compile(
+    r"(?:\s+(?:OPTIMIZE\s+FOR\s+\d+\s+ROWS?|WITH\s+(?:UR|CS|RS|RR)"
+    r"|FOR\s+(?:READ|FETCH)\s+ONLY))+\s*$", re.IGNORECASE)
+_ORDER_BY_RE = re.compile(r"\bORDER\s+BY\b", re.IGNORECASE)
+_SELECT_RE = re.compile(r"\bSELECT\b", re.IGNORECASE)
+_FROM_RE = re.compile(r"\bFROM\b", re.IGNORECASE)
+
+
+def mask_sql(sql: str) -> str:
+    """Same-length copy of ``sql`` with literals, comments and nested text blanked.
+
+    Parentheses that open/close a top-level group are kept so positions still
+    line up; everything between them is spaces.
+    """
+    out = []
+    depth = 0
+    i = 0
+    n = len(sql)
+    while i < n:
+        ch = sql[i]
+        if ch in ("'", '"'):
+            end = i + 1
+            while end < n:
+                if sql[end] == ch:
+                    if end + 1 < n and sql[end + 1] == ch:  # doubled quote
+                        end += 2
+                        continue
+                    break
+                end += 1
+            end = min(end + 1, n)
+            out.append(" " * (end - i))
+            i = end
+            continue
+        if sql.startswith("--", i):
+            end = sql.find("\n", i)
+            end = n if end < 0 else end
+            out.append(" " * (end - i))
+            i = end
+            continue
+        if sql.startswith("/*", i):
+            end = sql.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            out.append(" " * (end - i))
+            i = end
+            continue
+        if ch == "(":
+            out.append("(" if depth == 0 else " ")
+            depth += 1
+        elif ch == ")":
+            depth = max(depth - 1, 0)
+            out.append(")" if depth == 0 else " ")
+        else:
+            out.append(ch if depth == 0 else " ")
+        i += 1
+    return "".join(out)
+
+
+@dataclass(frozen=True)
+class SqlParts:
+    """A statement split at its top-level clauses."""
+
+    cte_prefix: str      # "WITH a AS (...), b AS (...)\n" or ""
+    body: str            # the main SELECT, without FETCH FIRST / tail clauses
+    order_by: str        # top-level "ORDER BY ..." clause of the body, or ""
+    limit: int | None    # the statement's own FETCH FIRST n, if any
+    tail: str            # trailing isolation / optimize clauses, e.g. " WITH UR"
+
+    @property
+    def body_without_order(self) -> str:
+        if not self.order_by:
+            return self.body
+        return self.body[: len(self.body) - len(self.order_by)].rstrip()
+
+
+def split_sql(sql: str) -> SqlParts:
+    """Split ``sql`` into CTE prefix, main body, ORDER BY, row cap and tail."""
+    text = sql.strip().rstrip(";").rstrip()
+    masked = mask_sql(text)
+
+    tail = ""
+    tail_match = _TAIL_RE.search(masked)
+    if tail_match:
+        tail = text[tail_match.start():]
+        text, masked = text[:tail_match.start()], masked[:tail_match.start()]
+
+    limit = None
+    fetches = list(_FETCH_FIRST_RE.finditer(masked))
+    if fetches and not masked[fetches[-1].end():].strip():
+        limit = int(fetches[-1].group(1))
+        text, masked = text[:fetches[-1].start()].rstrip(), masked[:fetches[-1].start()].rstrip()
+
+    prefix = ""
+    if masked.lstrip().upper().startswith("WITH"):
+        select = _SELECT_RE.search(masked)
+        if select:
+            prefix, text, masked = text[:select.start()], text[select.start():], masked[select.start():]
+
+    order_by = ""
+    orders = list(_ORDER_BY_RE.finditer(masked))
+    if orders:
+        order_by = text[orders[-1].start():]
+
+    return SqlParts(cte_prefix=prefix, body=text, order_by=order_by,
+                    limit=limit, tail=tail)
+
+
+def count_sql(sql: str) -> str:
+    """``SELECT COUNT(*)`` over the statement, ORDER BY and row cap removed."""
+    parts = split_sql(sql)
+    return (f"{parts.cte_prefix}SELECT COUNT(*) AS ROW_COUNT FROM (\n"
+            f"{parts.body_without_order}\n) AS PAGED_COUNT{parts.tail}")
+
+
+def select_list_size(sql: str) -> int | None:
+    """Number of top-level select-list items, or None when it can't be told (``*``)."""
+    masked = mask_sql(split_sql(sql).body)
+    select = _SELECT_RE.search(masked)
+    if not select:
+        return None
+    end = _FROM_RE.search(masked, select.end())
+    items = masked[select.end():end.start() if end else len(masked)]
+    if "*" in items:
+        return None
+    return items.count(",") + 1
+
+
+def page_sql(sql: str, page_size: int | None, offset: int = 0,
+             column_count: int | None = None, *, stable: bool = False) -> str:
+    """One page of the statement: ``[OFFSET k ROWS] FETCH FIRST n ROWS ONLY``.
+
+    ``page_size=None`` leaves the rows unbounded (from ``offset`` on). With
+    ``stable=True`` a statement without a top-level ORDER BY is ordered by
+    every select-list position so consecutive pages partition the result;
+    ``column_count`` is needed then only when the select list can't be
+    counted (``SELECT *``).
+    """
+    parts = split_sql(sql)
+    body = parts.body
+    if stable and not parts.order_by:
+        count = select_list_size(sql) or column_count
+        if not count:
+            raise ValueError("page_sql needs column_count to order an unordered SELECT *")
+        body = f"{body}\nORDER BY {', '.join(str(i) for i in range(1, count + 1))}"
+    clauses = []
+    if offset > 0:
+        clauses.append(f"OFFSET {int(offset)} ROWS")
+    if page_size is not None:
+        clauses.append(f"FETCH FIRST {int(page_size)} ROWS ONLY")
+    if not clauses:
+        return f"{parts.cte_prefix}{body}{parts.tail}"
+    return f"{parts.cte_prefix}{body}\n{' '.join(clauses)}{parts.tail}"
+
+
+@dataclass
+class Page:
+    """One fetched page plus what is known about the whole result."""
+
+    columns: list[str]
+    rows: list
+    index: int
+    page_size: int
+    total_rows: int | None = None
+    row_offset: int = field(init=False)
+
+    def __post_init__(self):
+        self.row_offset = self.index * self.page_size
+
+    @property
+    def page_count(self) -> int | None:
+        if self.total_rows is None:
+            return None
+        return max(1, -(-self.total_rows // self.page_size))
+
+    @property
+    def has_next(self) -> bool:
+        if self.total_rows is None:
+            return len(self.rows) == self.page_size
+        return self.row_offset + len(self.rows) < self.total_rows
+
+
+class PagedQuery:
+    """Two-phase (count + first page) execution with on-demand paging."""
+
+    def __init__(self, sql: str, execute: Executor, *,
+                 page_size: int = DEFAULT_PAGE_SIZE, stable: bool = False):
+        self.sql = sql
+        self.execute = execute
+        self.page_size = max(1, int(page_size))
+        self.stable = stable
+        self._parts = split_sql(sql)
+        self.total_rows: int | None = None
+        # Synthetic ORDER BY 1..n only when asked for (see page_sql)
+        self._ordered = stable and not self._parts.order_by
+        # Width of the result, for ordering an unordered SELECT *
+        self._column_count = select_list_size(sql) if self._ordered else None
+
+    @property
+    def limit(self) -> int | None:
+        """The statement's own row cap (FETCH FIRST n), if it had one."""
+        return self._parts.limit
+
+    def preview(self) -> Page:
+        """Run the COUNT(*) wrapper and the first page concurrently."""
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="paged-query") as pool:
+            counting = pool.submit(self.execute, count_sql(self.sql))
+            first = pool.submit(self._fetch_page_rows, 0)
+            columns, rows = first.result()
+            _count_columns, count_rows = counting.result()
+        total = int(count_rows[0][0]) if count_rows else 0
+        if self.limit is not None:
+            total = min(total, self.limit)
+        self.total_rows = total
+        return Page(columns=columns, rows=rows, index=0,
+                    page_size=self.page_size, total_rows=total)
+
+    def page(self, index: int) -> Page:
+        """Fetch page ``index`` (0-based)."""
+        index = max(0, int(index))
+        columns, rows = self._fetch_page_rows(index)
+        return Page(columns=columns, rows=rows, index=index,
+                    page_size=self.page_size, total_rows=self.total_rows)
+
+    def fetch_all(self) -> tuple[list[str], list]:
+        """The complete result: the rows the pages walk through, up to the cap."""
+        if not self._ordered:
+            return self.execute(self.sql)
+        return self.execute(self._page_statement(self.limit, 0))
+
+    def _page_statement(self, size: int | None, offset: int) -> str:
+        if self._ordered and self._column_count is None:
+            # SELECT * without ORDER BY: one row tells how many columns to order by
+            probe = f"{self._parts.cte_prefix}{self._parts.body}\nFETCH FIRST 1 ROWS ONLY{self._parts.tail}"
+            self._column_count = max(1, len(self.execute(probe)[0]))
+        return page_sql(self.sql, size, offset, self._column_count, stable=self.stable)
+
+    def _fetch_page_rows(self, index: int) -> tuple[list[str], list]:
+        offset = index * self.page_size
+        size = self.page_size
+        if self.limit is not None:
+            size = min(size, max(self.limit - offset, 0))
+            if size == 0:
+                # Past the user's cap: ask for nothing, but keep the columns.
+                columns, _rows = self.execute(self._page_statement(1, 0))
+                return columns, []
+        return self.execute(self._page_statement(size, offset))
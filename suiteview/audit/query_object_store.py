@@ -14,6 +14,13 @@ Name-based APIs (``load_object``/``delete_object``/``object_exists``) remain
 as compatibility seams for subsystems that still key by name (DataForge
 Re-sync, qdef_store, saved visual designs); they resolve to the **newest
 updated** object with that name. New code should use the ``*_by_id`` forms.
+
+Lookups go through a manifest (``_index.manifest`` beside the objects: id,
+name, kind, owning forge, updated_at, dependencies, plus each file's mtime and
+size). Every call re-validates it against one directory listing and re-parses
+only files whose mtime/size drifted, so by-id / by-name lookups open just the
+one matching file and :func:`list_entries` never parses at all. The manifest
+is a cache — deleting or corrupting it only costs one re-parse pass.
 """
 from __future__ import annotations
 
@@ -22,16 +29,40 @@ import json
 import logging
 import os
 import re
+import threading
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
 from uuid import uuid4
 
 from suiteview.audit.query_object import OBJECT_KIND_VISUAL, QueryObject
+from suiteview.core.json_store import read_json, write_json
 
 logger = logging.getLogger(__name__)
 
 _ID_SUFFIX_RE = re.compile(r"__([0-9a-f]{8})$")
 
+# Not *.json, so the manifest never shows up as a query object.
+_INDEX_FILENAME = "_index.manifest"
+_INDEX_VERSION = 1
+
+_index_lock = threading.RLock()
+_index_dir: Path | None = None
+_index_files: dict[str, dict] = {}  # filename -> manifest entry
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """Manifest row for one saved query object — listable without parsing."""
+
+    id: str
+    name: str
+    kind: str
+    forge_name: str
+    updated_at: str
+    dependencies: tuple[str, ...]
+    filename: str
+
 
 def _objects_dir() -> Path:
     override = os.environ.get("SUITEVIEW_QUERY_OBJECTS_DIR")
@@ -101,12 +132,145 @@ def _load_path(path: Path) -> QueryObject | None:
     return obj
 
 
+# ── Manifest index ──────────────────────────────────────────────────────────
+
+def _entry_for(query_object: QueryObject, stat: os.stat_result) -> dict:
+    config = query_object.config or {}
+    dataforge = config.get("dataforge", {})
+    forge_name = ""
+    if isinstance(dataforge, dict):
+        forge_name = str(dataforge.get("forge_name") or "")
+    return {
+        "id": query_object.id,
+        "name": query_object.name,
+        "kind": query_object.kind,
+        "forge_name": forge_name,
+        "updated_at": query_object.updated_at.isoformat(),
+        "dependencies": sorted({s.name for s in query_object.sources if s.name}),
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+    }
+
+
+def _unreadable_entry(stat: os.stat_result) -> dict:
+    # Remembered so a broken file isn't re-parsed until it changes on disk.
+    return {"id": "", "name": "", "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _write_index() -> None:
+    try:
+        write_json(_objects_dir() / _INDEX_FILENAME,
+                   {"version": _INDEX_VERSION, "files": _index_files}, indent=None)
+    except OSError:
+        logger.warning("Could not write query object index", exc_info=True)
+
+
+def _sync_index() -> dict[str, dict]:
+    """Bring the manifest in line with the directory; return filename -> entry.
+
+    One directory listing per call; only new or mtime/size-drifted files are
+    parsed (legacy files are migrated on the way through).
+    """
+    global _index_dir, _index_files
+    directory = _ensure_dir()
+    with _index_lock:
+        if _index_dir != directory:
+            data = read_json(directory / _INDEX_FILENAME, {})
+            files = data.get("files") if isinstance(data, dict) else None
+            if not isinstance(files, dict) or data.get("version") != _INDEX_VERSION:
+                files = {}
+            _index_dir, _index_files = directory, files
+
+        fresh: dict[str, dict] = {}
+        changed: list[Path] = []
+        with os.scandir(directory) as entries:
+            for dir_entry in entries:
+                if not dir_entry.name.endswith(".json") or not dir_entry.is_file():
+                    continue
+                stat = dir_entry.stat()
+                known = _index_files.get(dir_entry.name)
+                if (known is not None and known.get("mtime_ns") == stat.st_mtime_ns
+                        and known.get("size") == stat.st_size):
+                    fresh[dir_entry.name] = known
+                else:
+                    changed.append(Path(dir_entry.path))
+
+        for path in changed:
+            obj = _load_path(path)
+            # A migrated legacy file now lives under its id-form name.
+            target = path if obj is None or path.exists() else object_path(obj)
+            try:
+                stat = target.stat()
+            except OSError:
+                continue
+            fresh.pop(path.name, None)
+            fresh[target.name] = (_entry_for(obj, stat) if obj is not None
+                                  else _unreadable_entry(stat))
+
+        if changed or fresh.keys() != _index_files.keys():
+            _index_files = fresh
+            _write_index()
+        return _index_files
+
+
+def _record(path: Path, query_object: QueryObject) -> None:
+    """Update the manifest after this module wrote ``path``."""
+    with _index_lock:
+        if _index_dir != path.parent:
+            return  # index not loaded for this directory; next sync picks it up
+        try:
+            _index_files[path.name] = _entry_for(query_object, path.stat())
+        except OSError:
+            _index_files.pop(path.name, None)
+        _write_index()
+
+
+def _forget(path: Path) -> None:
+    """Drop a removed file from the manifest."""
+    with _index_lock:
+        if _index_dir == path.parent and _index_files.pop(path.name, None) is not None:
+            _write_index()
+
+
+def _to_entry(filename: str, entry: dict) -> IndexEntry:
+    return IndexEntry(
+        id=entry["id"],
+        name=entry["name"],
+        kind=entry.get("kind", OBJECT_KIND_VISUAL),
+        forge_name=entry.get("forge_name", ""),
+        updated_at=entry.get("updated_at", ""),
+        dependencies=tuple(entry.get("dependencies", ())),
+        filename=filename,
+    )
+
+
+def list_entries(*, include_forge_owned: bool = True) -> list[IndexEntry]:
+    """Return index rows for every query object, newest first — no JSON parsing.
+
+    Use this when a list only needs names/ids/kinds/owners; load the full
+    object with :func:`load_object_by_id` for the rows that need more.
+    """
+    files = _sync_index()
+    entries = [_to_entry(filename, entry) for filename, entry in files.items()
+               if entry.get("id")]
+    if not include_forge_owned:
+        entries = [entry for entry in entries if not entry.forge_name]
+    entries.sort(key=lambda entry: entry.updated_at, reverse=True)
+    return entries
+
+
+def _filenames_where(**criteria: str) -> list[str]:
+    files = _sync_index()
+    return [filename for filename, entry in files.items()
+            if entry.get("id") and all(entry.get(k) == v for k, v in criteria.items())]
+
+
 def list_objects() -> list[QueryObject]:
     """Return all query objects sorted newest first (migrating legacy files)."""
-    _ensure_dir()
+    directory = _ensure_dir()
     objects: list[QueryObject] = []
-    for path in sorted(_objects_dir().glob("*.json")):
-        obj = _load_path(path)
+    for filename in sorted(_filenames_where()):
+        obj = _load_path(directory / filename)
         if obj is not None:
             objects.append(obj)
     objects.sort(key=lambda obj: obj.updated_at, reverse=True)
@@ -135,34 +299,21 @@ def load_object_by_id(object_id: str) -> QueryObject | None:
     """Load one query object by its permanent id."""
     if not object_id:
         return None
-    _ensure_dir()
-    for path in _objects_dir().glob(f"*__{object_id[:8]}.json"):
-        obj = _load_path(path)
+    directory = _ensure_dir()
+    for filename in _filenames_where(id=object_id):
+        obj = _load_path(directory / filename)
         if obj is not None and obj.id == object_id:
             return obj
-    # Legacy/renamed fallback: full scan (also migrates stragglers).
-    for obj in list_objects():
-        if obj.id == object_id:
-            return obj
     return None
 
 
 def _objects_named(name: str) -> list[QueryObject]:
-    """All objects with this exact name, newest-updated first.
-
-    Filename matching is plain string prefix — NOT glob — because query names
-    legally contain glob metacharacters (e.g. ``Trad CV [Forge]``).
-    """
-    _ensure_dir()
-    safe = _safe_filename(name)
+    """All objects with this exact name, newest-updated first."""
+    directory = _ensure_dir()
     matches: list[QueryObject] = []
     seen_ids: set[str] = set()
-    for path in _objects_dir().glob("*.json"):
-        stem = path.stem
-        if not (stem == safe or
-                (stem.startswith(f"{safe}__") and _ID_SUFFIX_RE.search(stem))):
-            continue
-        obj = _load_path(path)
+    for filename in _filenames_where(name=name):
+        obj = _load_path(directory / filename)
         if obj is not None and obj.name == name and obj.id not in seen_ids:
             matches.append(obj)
             seen_ids.add(obj.id)
@@ -181,14 +332,8 @@ def load_object(name: str) -> QueryObject | None:
 
 
 def _find_path_by_id(object_id: str) -> Path | None:
-    for path in _objects_dir().glob(f"*__{object_id[:8]}.json"):
-        try:
-            with open(path, "r", encoding="utf-8") as handle:
-                if json.load(handle).get("id") == object_id:
-                    return path
-        except Exception:
-            continue
-    return None
+    filenames = _filenames_where(id=object_id)
+    return _objects_dir() / filenames[0] if filenames else None
 
 
 def save_object(query_object: QueryObject, *, force_new: bool = False) -> None:
@@ -209,18 +354,18 @@ def save_object(query_object: QueryObject, *, force_new: bool = False) -> None:
         if existing:
             query_object.id = existing[0].id
     target = object_path(query_object)
+    stale_files = [filename for filename in _filenames_where(id=query_object.id)
+                   if filename != target.name]
     with open(target, "w", encoding="utf-8") as handle:
         json.dump(query_object.to_dict(), handle, indent=2)
+    _record(target, query_object)
 
     # A rename moves the file: clear any other file carrying this id.
-    for path in _objects_dir().glob(f"*__{query_object.id[:8]}.json"):
-        if path == target:
-            continue
+    for filename in stale_files:
+        path = _objects_dir() / filename
         try:
-            with open(path, "r", encoding="utf-8") as handle:
-                stale = json.load(handle).get("id") == query_object.id
-            if stale:
-                path.unlink()
+            path.unlink()
+            _forget(path)
         except Exception:
             logger.exception("Failed to clean stale query object file: %s", path)
     # Pre-migration leftover for the same name (no id inside) is superseded.
@@ -412,6 +557,7 @@ def delete_object_by_id(object_id: str) -> None:
     path = object_path(obj)
     if path.exists():
         path.unlink()
+    _forget(path)
 
 
 def delete_object(name: str) -> None:
@@ -427,6 +573,7 @@ def delete_object(name: str) -> None:
     path = object_path(obj)
     if path.exists():
         path.unlink()
+    _forget(path)
     # Pre-migration file with this name, if any, is the same logical object.
     legacy = _objects_dir() / f"{_safe_filename(name)}.json"
     if legacy.exists():
@@ -440,4 +587,4 @@ def delete_object(name: str) -> None:
 
 def object_exists(name: str) -> bool:
     """Whether ANY query object has this name (names may be duplicated)."""
-    return bool(_objects_named(name))
+    return bool(_filenames_where(name=name))
@@ -4548,8 +4548,13 @@ class QueryObjectViewerWindow(FramelessWindowBase):
 
     def _query_objects_for_forge(self, forge_name: str) -> list[QueryObject]:
         objects = []
-        for obj in query_object_store.list_objects():
-            info = _dataforge_info(obj)
+        for entry in query_object_store.list_entries():
+            # Prefilter on the index so only this forge's files are parsed.
+            if (entry.forge_name.strip() != forge_name
+                    and not entry.name.endswith(f" [{forge_name}]")):
+                continue
+            obj = query_object_store.load_object_by_id(entry.id)
+            info = _dataforge_info(obj) if obj is not None else None
             if info is not None and info[0] == forge_name:
                 objects.append(obj)
         return sorted(objects, key=lambda item: item.name.lower())
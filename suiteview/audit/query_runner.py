@@ -14,6 +14,7 @@ import pyodbc
 from PyQt6.QtCore import QThread, pyqtSignal
 from PyQt6.QtWidgets import QApplication, QPushButton
 
+from suiteview.audit.result_store import SharedResult, shared_result_store
 from suiteview.audit.sql_helpers import fmt_time
 from suiteview.audit.ui.bottom_bar import AuditBottomBar
 
@@ -79,6 +80,20 @@ def execute_odbc_query_with_types(dsn: str, sql: str) -> tuple[list[str], list,
     return columns, rows, col_types
 
 
+def execute_shared_query(dsn: str, sql: str, *, refresh: bool = False) -> SharedResult:
+    """Execute SQL via ODBC through the session's shared result store.
+
+    An identical (DSN, SQL) request made recently — or still in flight from
+    another tab — is reused instead of re-run; ``result.reused`` says which.
+    ``refresh`` forces a new fetch.
+    """
+    def load():
+        columns, rows, col_types = execute_odbc_query_with_types(dsn, sql)
+        return pd.DataFrame([list(r) for r in rows], columns=columns), col_types
+
+    return shared_result_store().fetch(dsn, sql, load, refresh=refresh)
+
+
 def execute_to_dataframe(dsn: str, sql: str) -> pd.DataFrame:
     """Execute SQL via ODBC and return a DataFrame."""
     columns, rows = execute_odbc_query(dsn, sql)
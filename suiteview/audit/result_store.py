@@ -0,0 +1,426 @@
+"""
+Shared, session-scoped query result reuse for the Audit window.
+
+The Audit tabs (CyberLife, Dynamic Queries, DataForge Sources) often send the
+same SQL to the same DSN within minutes of each other. Every fetch goes
+through one ``QueryResultStore`` keyed by ``(DSN, normalized SQL)``:
+
+* **In-flight de-duplication** — a second request for a key that is already
+  being fetched waits for that fetch instead of opening another connection.
+* **Byte-budgeted memory** — entries are evicted least-recently-used once
+  their estimated size (``DataFrame.memory_usage(deep=False)``) passes
+  ``max_bytes`` or their count passes ``max_entries``.
+* **Shared frames** — every caller gets the cached frame's data, not a copy;
+  with pandas copy-on-write a caller's edits never reach the cache.
+* **Parquet-backed entries** — a result is also written, on a background
+  writer thread, to ``~/.suiteview/result_cache/<key>.parquet`` (+ a small
+  JSON sidecar), so a restart within the TTL still reuses it. A frame pyarrow
+  can't write (mixed object types) simply stays memory-only.
+* **Explicit invalidation** — :meth:`QueryResultStore.invalidate` drops one
+  key, a whole DSN, or everything; the footer's refresh button calls it.
+
+Each lookup reports whether it was ``reused`` so the UI can say so. Pure data
+(pandas; pyarrow for the Parquet side) — no PyQt. Tests and tools can move the
+disk cache with SUITEVIEW_RESULT_CACHE_DIR.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+from suiteview.core.json_store import read_json, write_json
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL = timedelta(minutes=15)
+DEFAULT_MAX_ENTRIES = 24
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+DEFAULT_MAX_DISK_ENTRIES = 64
+
+# A fetch returns the frame plus its column-type labels (may be empty).
+Loader = Callable[[], "tuple[pd.DataFrame, dict[str, str]]"]
+
+
+def _cache_dir() -> Path:
+    override = os.environ.get("SUITEVIEW_RESULT_CACHE_DIR")
+    if override:
+        return Path(override)
+    return Path.home() / ".suiteview" / "result_cache"
+
+
+def _copy_on_write() -> bool:
+    """True when pandas shares data between frames until one is written."""
+    if int(pd.__version__.split(".")[0]) >= 3:
+        return True
+    return pd.get_option("mode.copy_on_write") is True
+
+
+def estimated_bytes(dataframe: pd.DataFrame) -> int:
+    """Shallow size estimate used for the memory budget (no per-object walk)."""
+    return int(dataframe.memory_usage(index=True, deep=False).sum())
+
+
+def normalize_sql(sql: str) -> str:
+    """Canonical form for cache keys: whitespace collapsed outside literals.
+
+    Case and literal text are left alone — DB2 string comparisons and quoted
+    identifiers are case-sensitive. Trailing semicolons are dropped.
+    """
+    out: list[str] = []
+    quote = ""
+    pending_space = False
+    for ch in sql.strip().rstrip(";").strip():
+        if quote:
+            out.append(ch)
+            if ch == quote:
+                quote = ""
+            continue
+        if ch.isspace():
+            pending_space = True
+            continue
+        if pending_space and out:
+            out.append(" ")
+        pending_space = False
+        out.append(ch)
+        if ch in ("'", '"'):
+            quote = ch
+    return "".join(out)
+
+
+def result_key(dsn: str, sql: str) -> str:
+    """Stable hex key for ``(DSN, normalized SQL)``."""
+    text = f"{dsn.strip().upper()}\n{normalize_sql(sql)}"
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class SharedResult:
+    """One query result handed out by the store."""
+
+    dataframe: pd.DataFrame
+    column_types: dict[str, str] = field(default_factory=dict)
+    fetched_at: datetime = field(default_factory=datetime.now)
+    reused: bool = False
+
+
+@dataclass
+class _Entry:
+    dsn: str
+    dataframe: pd.DataFrame
+    column_types: dict[str, str]
+    fetched_at: datetime
+    nbytes: int = 0
+
+
+class _InFlight:
+    def __init__(self):
+        self.done = threading.Event()
+        self.entry: _Entry | None = None
+        self.error: BaseException | None = None
+
+
+class QueryResultStore:
+    """(DSN, normalized SQL) -> result, with in-flight sharing and Parquet backing."""
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path | None = None,
+        ttl: timedelta = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_disk_entries: int = DEFAULT_MAX_DISK_ENTRIES,
+        persist: bool = True,
+    ):
+        self._cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_disk_entries = max_disk_entries
+        self.persist = persist
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._in_flight: dict[str, _InFlight] = {}
+        # Parquet writes run off the fetch path. _pending maps a key to the
+        # entry still to be written; dropping the key cancels the write, and
+        # _disk_lock keeps a write and a delete of the same files apart.
+        # Lock order: _lock, then _disk_lock, then _pending_lock.
+        self._writer: ThreadPoolExecutor | None = None
+        self._pending: dict[str, _Entry] = {}
+        self._pending_lock = threading.Lock()
+        self._writes: list[Future] = []
+        self._disk_lock = threading.RLock()
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir or _cache_dir()
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated size of the results held in memory."""
+        with self._lock:
+            return self._bytes
+
+    def flush(self) -> None:
+        """Wait for queued Parquet writes to finish."""
+        with self._lock:
+            writes, self._writes = self._writes, []
+        for future in writes:
+            future.result()
+
+    # ── Lookup ───────────────────────────────────────────────────────
+
+    def fetch(self, dsn: str, sql: str, loader: Loader, *,
+              refresh: bool = False) -> SharedResult:
+        """Return the result for ``(dsn, sql)``, running ``loader`` only if needed.
+
+        ``refresh`` forces a new fetch (the result then replaces the cached
+        one). Concurrent calls for the same key share a single ``loader`` run;
+        its exception propagates to every waiter.
+        """
+        key = result_key(dsn, sql)
+        with self._lock:
+            if refresh:
+                self._drop(key)
+            entry = self._fresh_entry(key)
+            if entry is not None:
+                return self._hand_out(entry, reused=True)
+            flight = self._in_flight.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._in_flight[key] = _InFlight()
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._hand_out(flight.entry, reused=True)
+
+        try:
+            entry = self._disk_entry(key, dsn) if not refresh else None
+            reused = entry is not None
+            if entry is None:
+                dataframe, column_types = loader()
+                entry = _Entry(dsn=dsn, dataframe=dataframe,
+                               column_types=dict(column_types or {}),
+                               fetched_at=datetime.now(),
+                               nbytes=estimated_bytes(dataframe))
+                self._queue_write(key, sql, entry)
+            flight.entry = entry
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                if flight.entry is not None:
+                    self._remember(key, flight.entry)
+                self._in_flight.pop(key, None)
+            flight.done.set()
+        return self._hand_out(entry, reused=reused)
+
+    def peek(self, dsn: str, sql: str) -> SharedResult | None:
+        """The cached result for ``(dsn, sql)`` without fetching, else None."""
+        key = result_key(dsn, sql)
+        with self._lock:
+            entry = self._fresh_entry(key)
+        if entry is None:
+            entry = self._disk_entry(key, dsn)
+            if entry is not None:
+                with self._lock:
+                    self._remember(key, entry)
+        return self._hand_out(entry, reused=True) if entry is not None else None
+
+    # ── Invalidation ─────────────────────────────────────────────────
+
+    def invalidate(self, dsn: str | None = None, sql: str | None = None) -> int:
+        """Drop cached results; returns how many entries were removed.
+
+        ``dsn`` + ``sql`` drops one key, ``dsn`` alone every result for that
+        DSN, and no arguments clears the store (memory and disk).
+        """
+        removed = 0
+        one_key = result_key(dsn, sql) if (dsn is not None and sql is not None) else None
+        with self._lock:
+            if one_key is not None:
+                keys = [one_key]
+            elif dsn is not None:
+                keys = [key for key, entry in self._entries.items()
+                        if entry.dsn.upper() == dsn.upper()]
+            else:
+                keys = list(self._entries)
+            for key in keys:
+                removed += self._drop(key)
+        # Disk entries from earlier runs that never made it into memory.
+        directory = self.cache_dir
+        if self.persist and one_key is None and directory.exists():
+            for meta_path in directory.glob("*.json"):
+                if dsn is not None:
+                    meta = read_json(meta_path, {}) or {}
+                    if str(meta.get("dsn", "")).upper() != dsn.upper():
+                        continue
+                removed += self._delete_files(meta_path.stem)
+        return removed
+
+    # ── Internals (lock held where noted) ────────────────────────────
+
+    def _hand_out(self, entry: _Entry, *, reused: bool) -> SharedResult:
+        # A shallow copy shares the cached columns; copy-on-write keeps a
+        # caller's edits out of the cache. Without it (pandas 2 default)
+        # every caller still needs its own copy.
+        return SharedResult(
+            dataframe=entry.dataframe.copy(deep=not _copy_on_write()),
+            column_types=dict(entry.column_types),
+            fetched_at=entry.fetched_at,
+            reused=reused,
+        )
+
+    def _is_fresh(self, fetched_at: datetime) -> bool:
+        return datetime.now() - fetched_at <= self.ttl
+
+    def _fresh_entry(self, key: str) -> _Entry | None:  # lock held
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if not self._is_fresh(entry.fetched_at):
+            self._drop(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def _remember(self, key: str, entry: _Entry) -> None:  # lock held
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = entry
+        self._bytes += entry.nbytes
+        # The newest entry is dropped too when it alone blows the budget
+        # (its Parquet copy still serves the next lookup).
+        while self._entries and (len(self._entries) > self.max_entries
+                                 or self._bytes > self.max_bytes):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    def _drop(self, key: str) -> int:  # lock held
+        entry = self._entries.pop(key, None)
+        in_memory = entry is not None
+        if in_memory:
+            self._bytes -= entry.nbytes
+        with self._pending_lock:
+            self._pending.pop(key, None)
+        on_disk = self._delete_files(key)
+        return 1 if (in_memory or on_disk) else 0
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        directory = self.cache_dir
+        return directory / f"{key}.parquet", directory / f"{key}.json"
+
+    def _delete_files(self, key: str) -> int:
+        if not self.persist:
+            return 0
+        removed = 0
+        with self._disk_lock:
+            for path in self._paths(key):
+                try:
+                    path.unlink()
+                    removed = 1
+                except FileNotFoundError:
+                    pass
+                except OSError:
+                    logger.warning("Could not remove cached result %s", path, exc_info=True)
+        return removed
+
+    def _disk_entry(self, key: str, dsn: str) -> _Entry | None:
+        if not self.persist:
+            return None
+        data_path, meta_path = self._paths(key)
+        meta = read_json(meta_path, None)
+        if not isinstance(meta, dict) or not data_path.exists():
+            return None
+        try:
+            fetched_at = datetime.fromisoformat(meta["fetched_at"])
+        except (KeyError, ValueError):
+            return None
+        if not self._is_fresh(fetched_at):
+            self._delete_files(key)
+            return None
+        try:
+            dataframe = pd.read_parquet(data_path)
+        except Exception:
+            logger.warning("Could not read cached result %s", data_path, exc_info=True)
+            self._delete_files(key)
+            return None
+        return _Entry(dsn=dsn, dataframe=dataframe,
+                      column_types=dict(meta.get("column_types", {})),
+                      fetched_at=fetched_at, nbytes=estimated_bytes(dataframe))
+
+    def _queue_write(self, key: str, sql: str, entry: _Entry) -> None:
+        if not self.persist:
+            return
+        with self._pending_lock:
+            self._pending[key] = entry
+        with self._lock:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="result-cache")
+            self._writes = [f for f in self._writes if not f.done()]
+            self._writes.append(self._writer.submit(self._write_disk, key, sql, entry))
+
+    def _write_disk(self, key: str, sql: str, entry: _Entry) -> None:
+        with self._disk_lock:
+            with self._pending_lock:
+                if self._pending.get(key) is not entry:
+                    return  # invalidated or refetched while queued
+            try:
+                self._write_files(key, sql, entry)
+            finally:
+                with self._pending_lock:
+                    if self._pending.get(key) is entry:
+                        del self._pending[key]
+
+    def _write_files(self, key: str, sql: str, entry: _Entry) -> None:  # disk lock held
+        data_path, meta_path = self._paths(key)
+        try:
+            data_path.parent.mkdir(parents=True, exist_ok=True)
+            entry.dataframe.to_parquet(data_path, index=False)
+        except Exception:
+            # Mixed object columns etc. — keep the result memory-only.
+            logger.debug("Result for %s not persisted", entry.dsn, exc_info=True)
+            data_path.unlink(missing_ok=True)
+            return
+        write_json(meta_path, {
+            "dsn": entry.dsn,
+            "sql": normalize_sql(sql),
+            "fetched_at": entry.fetched_at.isoformat(),
+            "column_types": entry.column_types,
+        })
+        self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        metas = sorted(self.cache_dir.glob("*.json"),
+                       key=lambda p: p.stat().st_mtime, reverse=True)
+        for meta_path in metas[self.max_disk_entries:]:
+            self._delete_files(meta_path.stem)
+
+
+_shared_store: QueryResultStore | None = None
+_shared_lock = threading.Lock()
+
+
+def shared_result_store() -> QueryResultStore:
+    """The process-wide store every Audit tab fetches through."""
+    global _shared_store
+    with _shared_lock:
+        if _shared_store is None:
+            _shared_store = QueryResultStore()
+        return _shared_store
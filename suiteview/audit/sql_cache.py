@@ -0,0 +1,128 @@
+"""
+Memoized SQL generation for the Audit query builders.
+
+The SQL builders are called again for every Build SQL click, run, save and
+validation pass, usually with criteria that did not change since the last
+call. ``freeze`` turns the plain criteria the builders take (dicts, lists,
+tuples, strings, numbers) into an immutable, hashable key, and
+``memoize_sql`` caches a builder's output per key in a small LRU. Builders
+stay ordinary functions; a call whose arguments cannot be frozen simply runs
+uncached.
+
+Fragment builders (e.g. one Common Table's VALUES CTE) are memoized the same
+way, so reassembling a statement only re-renders the fragments whose inputs
+changed. Pure Python — no PyQt.
+"""
+from __future__ import annotations
+
+import functools
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+F = TypeVar("F", bound=Callable[..., str])
+
+DEFAULT_MAXSIZE = 128
+
+
+def freeze(value):
+    """Immutable, hashable, order-stable form of plain criteria data.
+
+    Dicts become sorted ``(key, value)`` tuples (tagged so they never collide
+    with a list of pairs), lists/tuples become tuples, sets become sorted
+    tuples and numbers carry their type. Raises ``TypeError`` for anything
+    else that is unhashable.
+    """
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bool, int, float)):
+        # 1, 1.0 and True hash alike but render differently in SQL.
+        return (type(value).__name__, value)
+    if isinstance(value, dict):
+        items = [(freeze(k), freeze(v)) for k, v in value.items()]
+        items.sort(key=lambda kv: repr(kv[0]))
+        return ("__dict__", tuple(items))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return ("__set__", tuple(sorted((freeze(v) for v in value), key=repr)))
+    hash(value)  # raises TypeError for unhashable objects
+    return value
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    hits: int
+    misses: int
+    uncacheable: int
+    size: int
+    maxsize: int
+
+
+class SqlCache:
+    """Thread-safe LRU of generated SQL keyed by frozen arguments."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[object, str] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+
+    def get_or_build(self, key, build: Callable[[], str]) -> str:
+        with self._lock:
+            sql = self._entries.get(key)
+            if sql is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return sql
+            self._misses += 1
+        sql = build()
+        with self._lock:
+            self._entries[key] = sql
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return sql
+
+    def note_uncacheable(self) -> None:
+        with self._lock:
+            self._uncacheable += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._uncacheable = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._uncacheable,
+                             len(self._entries), self.maxsize)
+
+
+def memoize_sql(maxsize: int = DEFAULT_MAXSIZE) -> Callable[[F], F]:
+    """Decorator: cache a pure SQL builder's result per frozen arguments.
+
+    The wrapped function gains ``cache_info()``, ``cache_clear()`` and
+    ``uncached`` (the original function, for benchmarks).
+    """
+    def decorate(fn: F) -> F:
+        cache = SqlCache(maxsize)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            try:
+                key = (freeze(args), freeze(kwargs))
+            except TypeError:
+                cache.note_uncacheable()
+                return fn(*args, **kwargs)
+            return cache.get_or_build(key, lambda: fn(*args, **kwargs))
+
+        wrapper.cache_info = cache.info
+        wrapper.cache_clear = cache.clear
+        wrapper.uncached = fn
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
@@ -384,9 +384,13 @@ class Policy2Tab(QWidget):
     def get_state(self) -> dict:
         from ..profile_manager import (
             get_lineedit_text as _t, get_checkbox_checked as _c,
-            get_listbox_selected as _sel,
+            get_combo_text as _cmb, get_listbox_selected as _sel,
         )
         return {
+            "cmb_first_name_match": _cmb(self.cmb_first_name_match),
+            "txt_first_name": _t(self.txt_first_name),
+            "cmb_last_name_match": _cmb(self.cmb_last_name_match),
+            "txt_last_name": _t(self.txt_last_name),
             "txt_tamra_7pay_prem_lo": _t(self.txt_tamra_7pay_prem_lo),
             "txt_tamra_7pay_prem_hi": _t(self.txt_tamra_7pay_prem_hi),
             "txt_tamra_7pay_av_lo": _t(self.txt_tamra_7pay_av_lo),
@@ -441,8 +445,12 @@ class Policy2Tab(QWidget):
     def set_state(self, state: dict):
         from ..profile_manager import (
             set_lineedit_text as _t, set_checkbox_checked as _c,
-            set_listbox_selected as _sel,
+            set_combo_text as _cmb, set_listbox_selected as _sel,
         )
+        _cmb(self.cmb_first_name_match, state.get("cmb_first_name_match", ""))
+        _t(self.txt_first_name, state.get("txt_first_name", ""))
+        _cmb(self.cmb_last_name_match, state.get("cmb_last_name_match", ""))
+        _t(self.txt_last_name, state.get("txt_last_name", ""))
         _t(self.txt_tamra_7pay_prem_lo, state.get("txt_tamra_7pay_prem_lo", ""))
         _t(self.txt_tamra_7pay_prem_hi, state.get("txt_tamra_7pay_prem_hi", ""))
         _t(self.txt_tamra_7pay_av_lo, state.get("txt_tamra_7pay_av_lo", ""))
@@ -33,6 +33,11 @@ class ResultsTab(QWidget):
         super().__init__(parent)
         self._df: pd.DataFrame | None = None
         self._query_context: dict | None = None  # SQL, DSN, columns, types, source_design
+        # Count-first preview: the PagedQuery, the shown Page, and a callable
+        # returning the full DataFrame (fetched only for export / pin).
+        self._pager = None
+        self._page = None
+        self._load_all = None
         self._build_ui()
 
     def _build_ui(self):
@@ -98,6 +103,19 @@ class ResultsTab(QWidget):
         self.lbl_status.setFont(_FONT)
         self.lbl_status.setStyleSheet("color: #888;")
         bottom.addWidget(self.lbl_status)
+
+        # Pager (count-first preview): hidden unless a PagedQuery is loaded
+        self.btn_prev_page = QPushButton("◀")
+        self.btn_next_page = QPushButton("▶")
+        for btn, tip in ((self.btn_prev_page, "Previous page"),
+                         (self.btn_next_page, "Next page")):
+            btn.setFont(_FONT)
+            btn.setFixedSize(24, 20)
+            btn.setToolTip(tip)
+            btn.setVisible(False)
+            bottom.addWidget(btn)
+        self.btn_prev_page.clicked.connect(lambda: self._go_to_page(-1))
+        self.btn_next_page.clicked.connect(lambda: self._go_to_page(+1))
         bottom.addStretch()
 
         self.btn_export = QPushButton("Export to Excel")
@@ -111,6 +129,16 @@ class ResultsTab(QWidget):
         )
         self.btn_export.setEnabled(False)
         self.btn_export.clicked.connect(self._export_to_excel)
+
+        # Pin: shown only where something listens to pin_requested
+        self.btn_pin = QPushButton("Pin")
+        self.btn_pin.setFont(_FONT)
+        self.btn_pin.setFixedSize(80, 28)
+        self.btn_pin.setToolTip("Pin these results to the Workbench")
+        self.btn_pin.setVisible(False)
+        self.btn_pin.setEnabled(False)
+        self.btn_pin.clicked.connect(self.request_pin)
+        bottom.addWidget(self.btn_pin)
         bottom.addWidget(self.btn_export)
 
         root.addLayout(bottom)
@@ -149,20 +177,114 @@ class ResultsTab(QWidget):
 
     def set_results(self, df: pd.DataFrame):
         """Load query results into the table."""
+        self._set_paging(None)
         self._df = df
         self.table.set_dataframe(df, limit_rows=False)
         row_count = len(df)
         self.lbl_status.setText(
             f"Showing all {row_count} rows" if row_count else "")
-        self.btn_export.setEnabled(row_count > 0)
+        self._set_result_actions_enabled(row_count > 0)
+
+    def set_paged_results(self, pager, page, load_all=None):
+        """Show one page of a count-first run (see ``suiteview.audit.paged_query``).
+
+        ``load_all()`` returns the complete DataFrame; it runs in the
+        background only when the user exports (defaults to ``pager.fetch_all``).
+        """
+        self._set_paging(pager, load_all)
+        self._show_page(page)
+
+    def is_paged(self) -> bool:
+        return self._pager is not None
+
+    def _set_paging(self, pager, load_all=None):
+        self._pager = pager
+        self._page = None
+        if pager is not None and load_all is None:
+            def load_all():
+                columns, rows = pager.fetch_all()
+                return pd.DataFrame([list(r) for r in rows], columns=columns)
+        self._load_all = load_all if pager is not None else None
+        self.btn_prev_page.setVisible(pager is not None)
+        self.btn_next_page.setVisible(pager is not None)
+
+    def _show_page(self, page):
+        self._page = page
+        df = pd.DataFrame([list(r) for r in page.rows], columns=page.columns)
+        self._df = df
+        self.table.set_dataframe(df, limit_rows=False)
+        if page.rows:
+            first = page.row_offset + 1
+            last = page.row_offset + len(page.rows)
+            total = f"{page.total_rows:,}" if page.total_rows is not None else "?"
+            self.lbl_status.setText(f"Rows {first:,}–{last:,} of {total}")
+        else:
+            self.lbl_status.setText("No rows" if page.index == 0 else "No more rows")
+        self._update_pager_buttons()
+        self._set_result_actions_enabled(bool(page.rows) or page.index > 0)
+
+    def _set_result_actions_enabled(self, enabled: bool):
+        self.btn_export.setEnabled(enabled)
+        self.btn_pin.setVisible(self.receivers(self.pin_requested) > 0)
+        self.btn_pin.setEnabled(enabled)
+
+    def _update_pager_buttons(self, busy: bool = False):
+        page = self._page
+        self.btn_prev_page.setEnabled(not busy and page is not None and page.index > 0)
+        self.btn_next_page.setEnabled(not busy and page is not None and page.has_next)
+
+    def _go_to_page(self, step: int):
+        if self._pager is None or self._page is None:
+            return
+        from suiteview.audit.query_runner import format_query_error, run_query_async
+
+        pager = self._pager
+        index = max(0, self._page.index + step)
+
+        def on_success(page):
+            if pager is self._pager:
+                self._show_page(page)
+
+        def on_error(exc):
+            logger.error("Page fetch failed: %s", exc)
+            QMessageBox.warning(self, "Query Error", format_query_error(exc))
+
+        run_query_async(owner=self, work=lambda: pager.page(index),
+                        on_success=on_success, on_error=on_error,
+                        on_busy=self._update_pager_buttons)
+
+    def _fetch_all_then(self, then, btn: QPushButton, restore_text: str):
+        """Paged view: fetch the complete result in the background, then ``then()``."""
+        from suiteview.audit.query_runner import format_query_error, run_query_async
+
+        def on_success(df):
+            self.set_results(df)
+            then()
+
+        def on_error(exc):
+            logger.error("Full result fetch failed: %s", exc)
+            QMessageBox.warning(self, "Query Error", format_query_error(exc))
+
+        run_query_async(owner=self, work=self._load_all, on_success=on_success,
+                        on_error=on_error, btn=btn,
+                        running_text="Fetching...", restore_text=restore_text)
+
+    def request_pin(self):
+        """Emit ``pin_requested`` with the complete result (fetched first when paged)."""
+        if self._pager is not None:
+            self._fetch_all_then(self.request_pin, self.btn_pin, "Pin")
+            return
+        if self._df is not None and not self._df.empty:
+            self.pin_requested.emit(self._df)
 
     def clear_results(self):
         """Clear displayed rows and any captured query metadata."""
+        self._set_paging(None)
         self._df = None
         self._query_context = None
         self.table.set_dataframe(pd.DataFrame(), limit_rows=False)
         self.lbl_status.setText("")
-        self.btn_export.setEnabled(False)
+        self._set_result_actions_enabled(False)
 
     def set_query_context(self, *, sql: str, dsn: str, source_design: str = "",
                           result_columns: list[str] = None,
@@ -185,6 +307,9 @@ class ResultsTab(QWidget):
 
     def _export_to_excel(self):
         """Open a new unsaved Excel workbook with results + SQL sheet."""
+        if self._pager is not None:
+            self._fetch_all_then(self._export_to_excel, self.btn_export, "Export to Excel")
+            return
         if self._df is None or self._df.empty:
             return
 
@@ -4,7 +4,9 @@ and Run button.  Used by Cyberlife, Dynamic Query, and DataForge groups.
 """
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt
+from datetime import datetime
+
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from PyQt6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QPushButton, QLabel, QLineEdit,
@@ -17,6 +19,9 @@ FOOTER_BG = "#C8D4E4"
 class AuditBottomBar(QWidget):
     """Common bottom bar: [left…] stretch [All/MaxCount/ResultCount] [timing] [actions…] [Run]."""
 
+    # The "reused" badge's refresh button: drop the cached result and re-run.
+    refresh_requested = pyqtSignal()
+
     def __init__(
         self,
         bg_color: str,
@@ -96,7 +101,25 @@ class AuditBottomBar(QWidget):
             time_stack.addWidget(lbl)
 
         layout.addLayout(time_stack)
+        layout.addSpacing(4)
+
+        # ── Reused-result badge (hidden until a result comes from the store) ──
+        reuse_stack = QVBoxLayout()
+        reuse_stack.setSpacing(1)
+        reuse_stack.setContentsMargins(0, 0, 0, 0)
+        self.lbl_reused = QLabel("")
+        self.lbl_reused.setFont(_FONT_SM)
+        self.lbl_reused.setStyleSheet("color: #1E5BA8; font-style: italic;")
+        self.btn_refresh_result = QPushButton("\u21bb")
+        self.btn_refresh_result.setFont(_FONT_SM)
+        self.btn_refresh_result.setFixedSize(20, 20)
+        self.btn_refresh_result.setToolTip("Re-run against the database instead of reusing")
+        self.btn_refresh_result.clicked.connect(self.refresh_requested.emit)
+        reuse_stack.addWidget(self.lbl_reused)
+        reuse_stack.addWidget(self.btn_refresh_result, 0, Qt.AlignmentFlag.AlignLeft)
+        layout.addLayout(reuse_stack)
         layout.addSpacing(12)
+        self.set_reused(None)
 
         # Action zone — caller adds Save/Delete/etc. here
         self.action_layout = QHBoxLayout()
@@ -122,3 +145,14 @@ class AuditBottomBar(QWidget):
         self.lbl_print_time.setText("Print time:")
         self.lbl_total_time.setText("Total time:")
         self.lbl_result_count.setText("Result count:")
+        self.set_reused(None)
+
+    def set_reused(self, fetched_at: datetime | None):
+        """Show (or hide, for None) the badge for a result reused from the store."""
+        reused = fetched_at is not None
+        self.lbl_reused.setText(
+            f"Reused {fetched_at:%H:%M:%S}" if reused else "")
+        self.lbl_reused.setToolTip(
+            "Same SQL on the same DSN ran recently — showing that result" if reused else "")
+        self.lbl_reused.setVisible(reused)
+        self.btn_refresh_result.setVisible(reused)
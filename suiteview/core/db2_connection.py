@@ -244,6 +244,12 @@ class DB2Connection:
         """Apply schema rewrite, WITH clause, and local-dev LIMIT rewrite."""
         sql = self._add_with_clause(sql)
         if local_data_enabled():
+            sql = re.sub(
+                r"\s+OFFSET\s+(\d+)\s+ROWS\s+FETCH\s+FIRST\s+(\d+)\s+ROWS\s+ONLY\s*$",
+                r" LIMIT \2 OFFSET \1",
+                sql,
+                flags=re.IGNORECASE,
+            )
             sql = re.sub(
                 r"\s+FETCH\s+FIRST\s+(\d+)\s+ROWS\s+ONLY\s*$",
                 r" LIMIT \1",
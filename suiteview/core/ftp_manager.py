@@ -2,10 +2,29 @@
 
 import ftplib
 import logging
-from typing import List, Dict, Optional, Tuple
+import threading
+from contextlib import contextmanager
+from typing import List, Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Bytes per 3390 track, for estimating a sequential dataset's line count
+DASD_TRACK_BYTES = 56664
+
+# Sessions an FTPSessionPool opens by default - most sites cap concurrent
+# FTP logins per user, so keep this small
+FTP_MAX_SESSIONS = 4
+
+
+def describe_total(preview: Dict[str, any]) -> str:
+    """Total line count text for a ``preview_dataset`` result"""
+    total = preview['total_lines']
+    if total is None:
+        return "more lines not counted"
+    if preview['total_estimated']:
+        return f"about {total:,} lines"
+    return f"{total:,} lines"
+
 
 class MainframeFTPManager:
     """Manages FTP connections to mainframe systems for dataset access"""
@@ -29,8 +48,10 @@ class MainframeFTPManager:
         self.ftp: Optional[ftplib.FTP] = None
         self.connected = False
         self.keepalive_timer = None
+        self.keepalive = True  # False for sessions driven from worker threads (no Qt timer)
         # Note: May need to pause keepalive during active transfers if we see interference
         self.on_reconnect_callback = None  # Optional callback for status updates
+        self.mirror = None  # Optional MainframeMirror serving listings/members from disk
     
     def connect(self) -> bool:
         """
@@ -55,7 +76,8 @@ class MainframeFTPManager:
             self.ftp.sendcmd('TYPE A')
             
             # Start keepalive timer to prevent idle timeout
-            self._start_keepalive()
+            if self.keepalive:
+                self._start_keepalive()
             
             # Navigate to initial path if specified
             if self.initial_path:
@@ -209,13 +231,17 @@ class MainframeFTPManager:
             self.connected = False
             return False
     
-    def list_datasets(self, path: str = '') -> List[Dict[str, any]]:
+    def list_datasets(self, path: str = '', refresh: bool = False) -> List[Dict[str, any]]:
         """
         List datasets/members at specified path
         
+        With a ``mirror`` attached, a listing of ``path`` fetched within the
+        mirror's TTL is returned without going to the host.
+        
         Args:
             path: Dataset path (e.g., 'D03.AA0139.CKAS.CIRF.DATA')
                   If empty, lists current directory
+            refresh: List from the host even if the mirror has the path
         
         Returns:
             List of dictionaries with dataset info:
@@ -225,6 +251,12 @@ class MainframeFTPManager:
                 - modified: Last modified date (if available)
                 - vv_mm: Version.Modification (mainframe specific)
         """
+        if self.mirror and path and not refresh:
+            cached = self._from_mirror(self.mirror.get_listing, path)
+            if cached is not None:
+                logger.info(f"Listed {len(cached)} items at path: {path} (from mirror)")
+                return cached
+        
         if not self.connected:
             logger.error("Not connected to FTP server")
             return []
@@ -306,6 +338,9 @@ class MainframeFTPManager:
                 except Exception as e:
                     logger.warning(f"Failed to return to original path: {e}")
             
+            if self.mirror and path:
+                self._from_mirror(self.mirror.put_listing, path, items)
+            
             logger.info(f"Listed {len(items)} items at path: {path or 'current directory'} (from {len(lines)} raw lines)")
             return items
             
@@ -578,20 +613,170 @@ class MainframeFTPManager:
         
         return None
     
-    def read_dataset(self, dataset_name: str, max_lines: int = 1000) -> Tuple[str, int]:
+    def iter_dataset_lines(self, dataset_name: str, max_lines: Optional[int] = None) -> Iterator[str]:
         """
-        Read contents of a dataset/member
+        Stream the lines of a dataset/member as they arrive
+        
+        The RETR runs while the caller consumes lines. Once ``max_lines``
+        lines have been yielded (or the caller stops iterating), the
+        transfer is aborted with ABOR and the control connection is
+        resynchronised, so the rest of the dataset never crosses the wire
+        and the session stays usable.
         
         Args:
             dataset_name: Name of dataset/member to read
-            max_lines: Maximum number of lines to read (default 1000)
+            max_lines: Stop after this many lines (None = whole dataset)
+        
+        Raises:
+            ftplib.Error, OSError, EOFError, UnicodeDecodeError on failure
+        """
+        # ASCII mode - the server converts EBCDIC records to text lines
+        self.ftp.sendcmd('TYPE A')
+        conn = self.ftp.transfercmd(f"RETR '{dataset_name}'")
+        fp = conn.makefile('r', encoding=self.ftp.encoding)
+        complete = False
+        try:
+            count = 0
+            while max_lines is None or count < max_lines:
+                line = fp.readline(ftplib.MAXLINE + 1)
+                if not line:
+                    complete = True
+                    break
+                if len(line) > ftplib.MAXLINE:
+                    raise ftplib.Error(f"got more than {ftplib.MAXLINE} bytes")
+                if line[-2:] == '\r\n':
+                    line = line[:-2]
+                elif line[-1:] == '\n':
+                    line = line[:-1]
+                count += 1
+                yield line
+        finally:
+            fp.close()
+            if complete:
+                conn.close()
+                self.ftp.voidresp()
+            else:
+                self._abort_transfer(conn)
+    
+    def _abort_transfer(self, conn):
+        """
+        Stop a RETR in flight and resynchronise the control connection
+        
+        The data connection is closed and ABOR sent, then a NOOP. Replies
+        are drained up to the NOOP's 200, which swallows the transfer's
+        426/226 and the ABOR's 225/226 whatever order the host sends them
+        in. Only if that fails is the session reconnected.
+        """
+        try:
+            conn.close()
+        except OSError:
+            pass
+        sock = self.ftp.sock
+        old_timeout = sock.gettimeout() if sock else None
+        try:
+            sock.settimeout(15)
+            self.ftp.putcmd('ABOR')
+            self.ftp.putcmd('NOOP')
+            for _ in range(4):
+                resp = self.ftp.getmultiline()
+                logger.debug(f"Transfer abort reply: {resp}")
+                if resp[:3] == '200':
+                    sock.settimeout(old_timeout)
+                    logger.info("Transfer stopped early (ABOR)")
+                    return
+        except (ftplib.Error, OSError, EOFError, AttributeError) as e:
+            logger.warning(f"ABOR handshake failed: {e}")
+        logger.warning("Control connection did not resync after ABOR - reconnecting")
+        self._attempt_reconnect()
+    
+    def get_catalog_size(self, dataset_name: str) -> Optional[Dict[str, any]]:
+        """
+        Size of a dataset/member from the catalog listing (no data transfer)
+        
+        PDS members report their ISPF line count. Sequential datasets report
+        tracks used; for fixed-length records the line count is estimated
+        from tracks, block size and record length.
         
         Returns:
-            Tuple of (content as string, total lines in dataset)
+            Dict with 'lines' (int or None), 'estimated' (bool) and 'tracks'
+            (int or None), or None if the listing is unavailable
         """
+        if not self.connected or not self.ftp:
+            return None
+        
+        lines = []
+        original_dir = None
+        try:
+            if dataset_name.endswith(')') and '(' in dataset_name:
+                pds, member = dataset_name[:-1].split('(', 1)
+                original_dir = self.ftp.pwd()
+                self.ftp.cwd(f"'{pds}'")
+                self.ftp.retrlines(f"LIST {member}", lines.append)
+            else:
+                member = None
+                self.ftp.retrlines(f"LIST '{dataset_name}'", lines.append)
+        except (ftplib.Error, OSError, EOFError) as e:
+            logger.debug(f"Catalog listing unavailable for {dataset_name}: {e}")
+            return None
+        finally:
+            if original_dir:
+                try:
+                    self.ftp.cwd(original_dir)
+                except Exception:
+                    pass
+        
+        for line in lines:
+            if member is not None:
+                item = self._parse_mvs_listing(line)
+                if item and item['name'].upper() == member.upper():
+                    # ISPF statistics carry the member's line count
+                    lines_count = item['size'] if item.get('vv_mm') else None
+                    return {'lines': lines_count, 'estimated': False, 'tracks': None}
+                continue
+            attrs = self._parse_dataset_attributes(line)
+            if not attrs:
+                continue
+            tracks = int(attrs['used']) if attrs['used'] else None
+            lines_count = None
+            if tracks and attrs['recfm'].startswith('F') and attrs['lrecl'] and attrs['blksz']:
+                lrecl, blksz = int(attrs['lrecl']), int(attrs['blksz'])
+                if lrecl and blksz:
+                    blocks_per_track = max(1, DASD_TRACK_BYTES // blksz)
+                    lines_count = tracks * blocks_per_track * (blksz // lrecl)
+            return {'lines': lines_count, 'estimated': True, 'tracks': tracks}
+        return None
+    
+    def preview_dataset(self, dataset_name: str, max_lines: Optional[int] = 1000) -> Dict[str, any]:
+        """
+        Read the first ``max_lines`` lines of a dataset/member
+        
+        Only those lines are transferred (see ``iter_dataset_lines``); when
+        the dataset is longer, its total comes from the catalog listing.
+        With a ``mirror`` attached, a member whose ISPF statistics are
+        unchanged is read from disk, and a member read in full is mirrored.
+        
+        Returns:
+            Dict with:
+                - content: The lines read, joined with newlines
+                - lines: Number of lines read
+                - truncated: True if the dataset has more lines
+                - total_lines: Total line count (None if unknown)
+                - total_estimated: True if total_lines is an estimate
+        """
+        preview = {'content': '', 'lines': 0, 'truncated': False,
+                   'total_lines': 0, 'total_estimated': False}
+        if self.mirror:
+            mirrored = self._from_mirror(self.mirror.member_lines, dataset_name)
+            if mirrored is not None:
+                logger.info(f"Read {dataset_name} from mirror ({len(mirrored)} lines)")
+                lines = mirrored[:max_lines] if max_lines else mirrored
+                preview.update(content='\n'.join(lines), lines=len(lines),
+                               truncated=len(lines) < len(mirrored), total_lines=len(mirrored))
+                return preview
+        
         if not self.connected:
             logger.error("Not connected to FTP server")
-            return "", 0
+            return preview
         
         # Save current directory to restore later
         original_dir = None
@@ -605,36 +790,14 @@ class MainframeFTPManager:
             # Ensure connection is alive (auto-reconnect if needed)
             if not self._ensure_connected():
                 logger.error("Cannot read dataset - connection unavailable")
-                return "", 0
+                return preview
             
-            # Read all lines - use retrlines which handles EBCDIC→ASCII conversion properly
+            # One line past the limit tells whether the dataset is longer
+            limit = max_lines + 1 if max_lines else None
             lines = []
-            
-            def collect_line(line):
-                """Callback to collect lines"""
-                lines.append(line)
-            
-            # Download dataset using retrlines
             try:
-                # Log current directory for debugging
-                try:
-                    current_dir = self.ftp.pwd()
-                    logger.debug(f"Current FTP directory: {current_dir}")
-                except:
-                    pass
-                
                 logger.info(f"Attempting to read dataset: {dataset_name}")
-                
-                # Capture the response from the RETR command
-                ftp_response = []
-                original_callback = self.ftp.lastresp if hasattr(self.ftp, 'lastresp') else None
-                
-                self.ftp.retrlines(f"RETR '{dataset_name}'", collect_line)
-                
-                # Log the FTP server's response
-                if hasattr(self.ftp, 'lastresp'):
-                    logger.info(f"FTP server response: {self.ftp.lastresp}")
-                
+                lines.extend(self.iter_dataset_lines(dataset_name, limit))
                 logger.info(f"RETR completed: {len(lines)} lines")
             except ftplib.error_perm as e:
                 error_msg = str(e)
@@ -652,38 +815,43 @@ class MainframeFTPManager:
                     logger.warning("Forcing reconnect to clear FTP state after error")
                     self._attempt_reconnect()
                     
-                    return "", 0
+                    return preview
             except UnicodeDecodeError as e:
-                # This happens when retrlines() tries to decode bytes that aren't valid UTF-8
-                # The FTP connection is now in a bad state
+                # The dataset holds bytes that aren't valid text in the FTP encoding
                 logger.error(f"UTF-8 decode error reading {dataset_name}: {e}")
                 logger.warning("Dataset contains binary/non-text data - forcing reconnect")
                 
                 # Force reconnect to clear corrupted FTP state
                 self._attempt_reconnect()
                 
-                return "", 0
+                return preview
             except (ftplib.error_temp, EOFError, OSError, ConnectionError) as e:
                 logger.error(f"Connection error reading {dataset_name}: {e}")
                 self.connected = False
-                return "", 0
+                return preview
             except Exception as e:
                 logger.error(f"Failed to read dataset {dataset_name}: {e}")
-                return "", 0
+                return preview
             
-            total_lines = len(lines)
+            if max_lines and len(lines) > max_lines:
+                lines = lines[:max_lines]
+                preview['truncated'] = True
+                catalog = self.get_catalog_size(dataset_name)
+                preview['total_lines'] = catalog['lines'] if catalog else None
+                preview['total_estimated'] = bool(catalog and catalog['estimated'])
+            else:
+                preview['total_lines'] = len(lines)
+                if self.mirror:
+                    self._from_mirror(self.mirror.put_member, dataset_name, lines)
             
             # Log results
-            if total_lines == 0:
+            if not lines:
                 logger.warning(f"Dataset {dataset_name} returned 0 lines (may be empty)")
             else:
-                logger.info(f"Successfully read {total_lines} lines from {dataset_name}")
+                logger.info(f"Successfully read {len(lines)} lines from {dataset_name}")
             
-            # Trim to max_lines if specified
-            if max_lines and len(lines) > max_lines:
-                lines = lines[:max_lines]
-            
-            content = '\n'.join(lines)
+            preview['content'] = '\n'.join(lines)
+            preview['lines'] = len(lines)
             
             # Restore original directory
             if original_dir:
@@ -693,7 +861,7 @@ class MainframeFTPManager:
                 except Exception as e:
                     logger.warning(f"Could not restore directory: {e}")
             
-            return content, total_lines
+            return preview
             
         except Exception as e:
             logger.error(f"Unexpected error reading dataset {dataset_name}: {e}")
@@ -706,7 +874,27 @@ class MainframeFTPManager:
                 except:
                     pass
             
-            return "", 0
+            return preview
+    
+    def read_dataset(self, dataset_name: str, max_lines: int = 1000) -> Tuple[str, int]:
+        """
+        Read contents of a dataset/member
+        
+        Args:
+            dataset_name: Name of dataset/member to read
+            max_lines: Maximum number of lines to read (default 1000)
+        
+        Returns:
+            Tuple of (content as string, total lines in dataset). For a
+            truncated read the total comes from the catalog listing, or is
+            the number of lines read when the catalog has no count.
+        """
+        preview = self.preview_dataset(dataset_name, max_lines)
+        total_lines = preview['total_lines']
+        if total_lines is None:
+            total_lines = preview['lines']
+        return preview['content'], total_lines
+    
     def get_dataset_info(self, dataset_name: str) -> Optional[Dict[str, any]]:
         """
         Get information about a specific dataset
@@ -790,6 +978,7 @@ class MainframeFTPManager:
                 self.ftp.storbinary(f'STOR {remote_dataset_name}', file)
             
             logger.info(f"Successfully uploaded {local_file_path} to {remote_dataset_name}")
+            self._forget_in_mirror(remote_dataset_name)
             return True, f"Successfully uploaded to {remote_dataset_name}"
             
         except FileNotFoundError:
@@ -837,6 +1026,7 @@ class MainframeFTPManager:
                 self.ftp.storlines(f'STOR {remote_dataset_name}', file)
             
             logger.info(f"Successfully uploaded {local_file_path} to {remote_dataset_name} (text mode)")
+            self._forget_in_mirror(remote_dataset_name)
             return True, f"Successfully uploaded to {remote_dataset_name}"
             
         except FileNotFoundError:
@@ -873,6 +1063,7 @@ class MainframeFTPManager:
             self.ftp.delete(f"'{member_path}'")
             
             logger.info(f"Successfully deleted {member_path}")
+            self._forget_in_mirror(member_path)
             return True, f"Successfully deleted {member_path}"
             
         except ftplib.error_perm as e:
@@ -918,6 +1109,7 @@ class MainframeFTPManager:
             self.ftp.storlines(f"STOR '{member_path}'", content_bytes)
             
             logger.info(f"Successfully wrote content to {member_path}")
+            self._forget_in_mirror(member_path)
             return True, f"Successfully saved {member_path}"
             
         except ftplib.error_perm as e:
@@ -936,6 +1128,19 @@ class MainframeFTPManager:
             logger.error(error_msg)
             return False, error_msg
     
+    def _from_mirror(self, method, *args):
+        """Call a mirror method; a mirror failure only costs the trip to the host"""
+        try:
+            return method(*args)
+        except Exception as e:
+            logger.warning(f"Mainframe mirror unavailable: {e}")
+            return None
+    
+    def _forget_in_mirror(self, dataset_name: str):
+        """Drop a written/deleted dataset from the mirror so it is read fresh"""
+        if self.mirror:
+            self._from_mirror(self.mirror.invalidate, dataset_name)
+    
     def __enter__(self):
         """Context manager entry"""
         self.connect()
@@ -944,3 +1149,117 @@ class MainframeFTPManager:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
         self.disconnect()
+
+
+class FTPSessionPool:
+    """
+    Extra authenticated FTP sessions for parallel reads from one host
+    
+    Sessions are logged in with the credentials of ``manager`` as they are
+    needed, up to ``max_sessions``, and each is handed to one caller at a
+    time. If the host refuses a login once some sessions are open, the cap
+    drops to the sessions already open instead of failing the work. The
+    browsing session in ``manager`` itself is never used, and pooled
+    sessions run without the Qt keepalive timer so worker threads can
+    drive them.
+    """
+    
+    def __init__(self, manager: MainframeFTPManager, max_sessions: int = FTP_MAX_SESSIONS):
+        self.manager = manager
+        self.max_sessions = max(1, max_sessions)
+        self._idle: List[MainframeFTPManager] = []
+        self._open = 0
+        self._cond = threading.Condition()
+        self._closed = False
+    
+    @property
+    def open_sessions(self) -> int:
+        """Number of sessions currently logged in"""
+        return self._open
+    
+    def _login(self) -> MainframeFTPManager:
+        session = MainframeFTPManager(self.manager.host, self.manager.username,
+                                      self.manager.password, self.manager.port)
+        session.keepalive = False
+        session.connect()
+        return session
+    
+    def acquire(self) -> MainframeFTPManager:
+        """
+        Take a session, logging in a new one while under the cap
+        
+        Blocks until a session is free once the cap is reached.
+        
+        Raises:
+            Exception: If no session at all could be logged in
+        """
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("FTP session pool is closed")
+                if self._idle:
+                    return self._idle.pop()
+                if self._open < self.max_sessions:
+                    self._open += 1
+                    break
+                self._cond.wait()
+        
+        try:
+            return self._login()
+        except Exception as e:
+            with self._cond:
+                self._open -= 1
+                if self._open == 0:
+                    raise
+                # The host allows no more logins - make do with what is open
+                logger.warning(f"FTP login refused with {self._open} session(s) open, "
+                               f"capping the pool there: {e}")
+                self.max_sessions = self._open
+                self._cond.notify_all()
+            return self.acquire()
+    
+    def release(self, session: MainframeFTPManager, healthy: bool = True):
+        """Hand a session back, reconnecting it first if it broke"""
+        if not healthy or not session.connected:
+            if not session._attempt_reconnect():
+                session.disconnect()
+                with self._cond:
+                    self._open -= 1
+                    self._cond.notify_all()
+                return
+        with self._cond:
+            if self._closed:
+                session.disconnect()
+                self._open -= 1
+                return
+            self._idle.append(session)
+            self._cond.notify()
+    
+    @contextmanager
+    def session(self) -> Iterator[MainframeFTPManager]:
+        """``acquire``/``release`` around a block; connection errors reconnect the session"""
+        session = self.acquire()
+        healthy = True
+        try:
+            yield session
+        except (ftplib.error_temp, EOFError, OSError):
+            healthy = False
+            raise
+        finally:
+            self.release(session, healthy)
+    
+    def close(self):
+        """Log out every idle session; sessions still in use log out on release"""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._cond.notify_all()
+        for session in idle:
+            session.disconnect()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,192 @@
+"""
+Local mirror of mainframe dataset listings and members
+
+Mainframe Nav lists the same libraries and opens the same members all day,
+and each of those is a LIST or RETR over FTP. The mirror keeps both in a
+SQLite file per host and user under ``~/.suiteview/mainframe_mirror/``:
+
+* ``listings`` — the parsed ``list_datasets`` result per dataset path and
+  when it was fetched; it is served again until ``listing_ttl`` expires;
+* ``members`` — a member's text (zlib-compressed) keyed by its full name
+  plus the ISPF statistics it had when read (``vv_mm`` and the changed
+  timestamp from the listing).
+
+A member is served from disk only while the current listing of its
+library still shows the same statistics, so an edit saved by ISPF (which
+bumps the modification level and timestamp) is fetched again. Members
+without ISPF statistics are never mirrored. ``member_lines`` with
+``current_only=False`` ignores the listing age, which lets a content
+search run against whatever is mirrored while offline. Pure Python — no
+PyQt.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MIRROR_DIR = Path.home() / ".suiteview" / "mainframe_mirror"
+LISTING_TTL = 10 * 60  # seconds a directory listing is reused
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (path TEXT PRIMARY KEY, fetched REAL, items TEXT);
+CREATE TABLE IF NOT EXISTS members (
+    name TEXT PRIMARY KEY,
+    library TEXT,
+    vv_mm TEXT,
+    changed TEXT,
+    lines INTEGER,
+    content BLOB,
+    fetched REAL
+);
+CREATE INDEX IF NOT EXISTS members_library ON members(library);
+"""
+
+_MEMBER_RE = re.compile(r"^(?P<library>[^()]+)\((?P<member>[^()]+)\)$")
+
+
+def mirror_path_for(host: str, username: str) -> Path:
+    """The mirror file for a host and user."""
+    key = f"{host.strip().upper()}|{username.strip().upper()}"
+    return MIRROR_DIR / (hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + ".sqlite")
+
+
+def split_member(name: str) -> Optional[Tuple[str, str]]:
+    """(library, member) for ``LIB.NAME(MEMBER)``, None for anything else."""
+    match = _MEMBER_RE.match(name.strip().strip("'\"").upper())
+    if not match:
+        return None
+    return match.group("library"), match.group("member")
+
+
+def member_stats(item: Dict) -> Optional[Tuple[str, str]]:
+    """The ISPF statistics of a listed member, None if the listing has none."""
+    if item.get("type") != "member" or not item.get("vv_mm") or not item.get("modified"):
+        return None
+    return item["vv_mm"], item["modified"]
+
+
+class MainframeMirror:
+    """Mirrored listings and members for one host and user."""
+
+    def __init__(self, host: str, username: str, path: Optional[Path] = None,
+                 listing_ttl: float = LISTING_TTL):
+        self.path = Path(path) if path is not None else mirror_path_for(host, username)
+        self.listing_ttl = listing_ttl
+        self._conn: Optional[sqlite3.Connection] = None
+        # Content searches read and write from several worker threads
+        self._lock = threading.RLock()
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ── Listings ────────────────────────────────────────────────────
+
+    def _listing(self, path: str, current_only: bool) -> Optional[List[Dict]]:
+        with self._lock:
+            row = self.conn.execute("SELECT fetched, items FROM listings WHERE path = ?",
+                                    (path.strip("'\"").upper(),)).fetchone()
+        if row is None:
+            return None
+        if current_only and time.time() - row[0] > self.listing_ttl:
+            return None
+        return json.loads(row[1])
+
+    def get_listing(self, path: str) -> Optional[List[Dict]]:
+        """The stored listing of ``path`` while it is younger than the TTL."""
+        return self._listing(path, current_only=True)
+
+    def put_listing(self, path: str, items: List[Dict]):
+        """Store a fresh listing and forget mirrored members it shows as changed."""
+        library = path.strip("'\"").upper()
+        listed = {item["name"].upper(): member_stats(item) for item in items if item.get("name")}
+        with self._lock, self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO listings (path, fetched, items) VALUES (?, ?, ?)",
+                              (library, time.time(), json.dumps(items)))
+            stale = [
+                name for name, vv_mm, changed in self.conn.execute(
+                    "SELECT name, vv_mm, changed FROM members WHERE library = ?", (library,))
+                if listed.get(split_member(name)[1]) != (vv_mm, changed)
+            ]
+            self.conn.executemany("DELETE FROM members WHERE name = ?", [(name,) for name in stale])
+        if stale:
+            logger.debug(f"Mirror dropped {len(stale)} changed member(s) of {library}")
+
+    def invalidate(self, name: str):
+        """Forget a dataset/member and the listing that contains it (after a write or delete)."""
+        name = name.strip("'\"").upper()
+        parts = split_member(name)
+        library = parts[0] if parts else name.rsplit(".", 1)[0]
+        with self._lock, self.conn:
+            self.conn.execute("DELETE FROM members WHERE name = ?", (name,))
+            self.conn.execute("DELETE FROM listings WHERE path IN (?, ?)", (library, name))
+
+    # ── Members ─────────────────────────────────────────────────────
+
+    def stats_for(self, name: str, current_only: bool = True) -> Optional[Tuple[str, str]]:
+        """A member's ISPF statistics from its library's stored listing."""
+        parts = split_member(name)
+        if not parts:
+            return None
+        items = self._listing(parts[0], current_only)
+        if not items:
+            return None
+        for item in items:
+            if item.get("name", "").upper() == parts[1]:
+                return member_stats(item)
+        return None
+
+    def member_lines(self, name: str, current_only: bool = True) -> Optional[List[str]]:
+        """
+        A mirrored member's lines, or None if it has to be read from the host
+
+        With ``current_only`` the copy must match the statistics in a
+        listing younger than the TTL; without it any mirrored copy is used.
+        """
+        name = name.strip("'\"").upper()
+        with self._lock:
+            row = self.conn.execute("SELECT vv_mm, changed, content FROM members WHERE name = ?",
+                                    (name,)).fetchone()
+        if row is None:
+            return None
+        if current_only and self.stats_for(name) != (row[0], row[1]):
+            return None
+        text = zlib.decompress(row[2]).decode("utf-8")
+        return text.split("\n") if text else []
+
+    def put_member(self, name: str, lines: List[str]) -> bool:
+        """Mirror a member read in full; only members with known ISPF statistics are kept."""
+        name = name.strip("'\"").upper()
+        stats = self.stats_for(name)
+        if stats is None:
+            return False
+        content = zlib.compress("\n".join(lines).encode("utf-8"))
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO members (name, library, vv_mm, changed, lines, content, fetched) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, split_member(name)[0], stats[0], stats[1], len(lines), content, time.time()))
+        return True
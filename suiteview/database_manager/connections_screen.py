@@ -588,7 +588,7 @@ class ConnectionsScreen(QWidget):
     
     def load_ftp_dataset_preview(self, connection: dict, dataset_name: str):
         """Load preview of FTP dataset - show first 2000 lines in text viewer"""
-        from suiteview.core.ftp_manager import MainframeFTPManager
+        from suiteview.core.ftp_manager import MainframeFTPManager, describe_total
         from suiteview.core.credential_manager import CredentialManager
         
         try:
@@ -622,9 +622,10 @@ class ConnectionsScreen(QWidget):
             if not ftp_mgr.connect():
                 raise ValueError("Failed to connect to FTP server")
             
-            # Read all lines
-            content, total_lines = ftp_mgr.read_dataset(dataset_name, max_lines=1000)
+            # Read the first 1000 lines (the rest is never transferred)
+            preview = ftp_mgr.preview_dataset(dataset_name, max_lines=1000)
             ftp_mgr.disconnect()
+            content, total_lines = preview['content'], preview['lines']
             
             # Store content for export button
             self.current_ftp_content = content
@@ -653,7 +654,7 @@ class ConnectionsScreen(QWidget):
             
             # Update info label
             self.table_info_label.setText(
-                f"Dataset: {dataset_name} - Showing {min(1000, total_lines)} of {total_lines} lines (80-byte card format)"
+                f"Dataset: {dataset_name} - Showing {total_lines} of {describe_total(preview)} (80-byte card format)"
             )
             
             # Create button bar if it doesn't exist
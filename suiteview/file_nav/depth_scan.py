@@ -0,0 +1,200 @@
+"""
+Concurrent directory walk for FileNav's depth search.
+
+Network shares answer one directory listing per round trip, so walking a
+department drive one folder at a time is dominated by latency. The scan
+here is a work queue: every folder still to be listed is a task for a
+bounded thread pool. When a listing finishes, its subfolders are queued
+(down to the requested depth), so many listings are in flight at once.
+
+Each entry becomes a plain dict that the depth-search UI renders:
+``path``, ``display_name`` (ancestors joined with `` | ``), ``is_dir`` and
+``depth``. Stat data is left for display time:
+
+* ``size`` / ``mtime`` / ``atime`` hold raw numbers only when the listing
+  already carries them (Windows ``scandir``). Elsewhere they are ``None``
+  and ``ensure_stat`` fills them in when the row is first shown.
+* ``format_timestamp`` and ``format_size`` turn a timestamp / byte count
+  into the column text when the row is shown.
+
+Results go to ``on_items`` one folder listing at a time, so callers can
+show partial results while the scan runs. ``iter_folder`` lists a single
+folder the same way, in fixed-size batches, for the details view's
+incremental load. Pure Python — no PyQt.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8  # concurrent directory listings
+FOLDER_BATCH_SIZE = 1000  # entries per iter_folder batch
+
+# On Windows DirEntry.stat() is served from the directory listing itself;
+# elsewhere it is one extra system (or network) call per entry.
+STAT_FROM_LISTING = os.name == "nt"
+
+TIME_FORMAT = "%Y-%m-%d %H:%M"
+
+Item = Dict[str, object]
+ItemsCallback = Optional[Callable[[List[Item]], None]]
+# (folder, display name, depth, with_stat) -> (items, [(subfolder, display name)])
+Lister = Callable[[str, str, int, bool], Tuple[List[Item], List[Tuple[str, str]]]]
+
+
+def _entry_item(entry: os.DirEntry, relative_path: str, depth: int,
+                with_stat: bool) -> Optional[Item]:
+    try:
+        is_dir = entry.is_dir()
+    except OSError:
+        return None
+    item: Item = {
+        'path': entry.path,
+        'display_name': f"{relative_path} | {entry.name}" if relative_path else entry.name,
+        'is_dir': is_dir,
+        'depth': depth + 1,
+        'size': 0 if is_dir else None,
+        'mtime': None,
+        'atime': None,
+    }
+    if with_stat:
+        _fill_stat(item, entry.stat)
+    return item
+
+
+def list_folder(folder: str, relative_path: str, depth: int, with_stat: bool,
+                strict: bool = False) -> Tuple[List[Item], List[Tuple[str, str]]]:
+    """One directory listing: (items, [(subfolder path, its display name)]).
+
+    An unreadable folder lists as empty, or raises ``OSError`` when ``strict``.
+    """
+    items: List[Item] = []
+    folders: List[Tuple[str, str]] = []
+    try:
+        with os.scandir(folder) as entries:
+            for entry in entries:
+                item = _entry_item(entry, relative_path, depth, with_stat)
+                if item is None:
+                    continue
+                items.append(item)
+                if item['is_dir']:
+                    folders.append((entry.path, item['display_name']))
+    except OSError:  # includes PermissionError
+        if strict:
+            raise
+    return items, folders
+
+
+def iter_folder(folder: str, batch_size: int = FOLDER_BATCH_SIZE,
+                with_stat: Optional[bool] = None,
+                cancel: Optional[threading.Event] = None) -> Iterator[List[Item]]:
+    """The entries directly in ``folder``, ``batch_size`` at a time.
+
+    Items have the ``list_folder`` shape at depth 1 (``display_name`` is the
+    entry name). Stops early when ``cancel`` is set; raises ``OSError`` if
+    the folder cannot be listed.
+    """
+    if with_stat is None:
+        with_stat = STAT_FROM_LISTING
+    batch: List[Item] = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if cancel is not None and cancel.is_set():
+                return
+            item = _entry_item(entry, "", 0, with_stat)
+            if item is None:
+                continue
+            batch.append(item)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _fill_stat(item: Item, stat: Callable[[], os.stat_result]):
+    try:
+        info = stat()
+    except OSError:
+        item['size'], item['mtime'], item['atime'] = 0, 0.0, 0.0
+        return
+    item['size'] = 0 if item['is_dir'] else info.st_size
+    item['mtime'] = info.st_mtime
+    item['atime'] = info.st_atime
+
+
+def ensure_stat(item: Item) -> Item:
+    """Fill in ``size`` / ``mtime`` / ``atime`` if the scan deferred them."""
+    if item.get('mtime') is None and 'modified' not in item:
+        _fill_stat(item, lambda: os.stat(item['path']))
+    return item
+
+
+def format_timestamp(timestamp: Optional[float]) -> str:
+    """Column text for a timestamp ("" when unknown)."""
+    if not timestamp:
+        return ""
+    try:
+        return time.strftime(TIME_FORMAT, time.localtime(timestamp))
+    except (OverflowError, OSError, ValueError):
+        return ""
+
+
+def format_size(size: Optional[int]) -> str:
+    """Column text for a file size in bytes ("" when unknown)."""
+    if size is None:
+        return ""
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    if size < 1024 * 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    return f"{size / (1024 * 1024 * 1024):.2f} GB"
+
+
+def scan_tree(root: str, depth_level: int = -1, max_workers: int = DEFAULT_MAX_WORKERS,
+              cancel: Optional[threading.Event] = None, on_items: ItemsCallback = None,
+              with_stat: Optional[bool] = None, lister: Optional[Lister] = None) -> List[Item]:
+    """Every entry under ``root`` down to ``depth_level`` levels (-1 = no limit).
+
+    ``on_items`` gets each folder's entries as soon as that listing finishes
+    (called on the scanning thread). When ``cancel`` is set, no further
+    folders are started and the entries found so far are returned.
+    ``lister`` replaces the ``os.scandir`` listing (e.g. a persistent index
+    answering unchanged folders).
+    """
+    lister = lister or list_folder
+    if with_stat is None:
+        with_stat = STAT_FROM_LISTING
+    results: List[Item] = []
+    if depth_level == 0:
+        return results
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                            thread_name_prefix="depth-scan") as pool:
+        pending = {pool.submit(lister, str(root), "", 0, with_stat): 0}
+        while pending:
+            done, _ = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                break
+            for future in done:
+                depth = pending.pop(future)
+                items, folders = future.result()
+                if not items:
+                    continue
+                results.extend(items)
+                if on_items is not None:
+                    on_items(items)
+                if depth_level == -1 or depth + 1 < depth_level:
+                    for path, display_name in folders:
+                        pending[pool.submit(lister, path, display_name, depth + 1, with_stat)] = depth + 1
+    return results
@@ -6,9 +6,12 @@ Shows Quick Access shortcuts (OneDrive) alongside system drives
 import os
 import sys
 import shutil
+import sqlite3
 import subprocess
 import json
+import threading
 import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from PyQt6.QtWidgets import (QTreeView, QVBoxLayout, QHBoxLayout, QWidget, 
@@ -26,11 +29,21 @@ from suiteview.file_nav.sharepoint_client import (
     SharePointListWorker, SharePointResolveWorker, SharePointDownloadWorker,
     SharePointDiscoverWorker, SharePointDepthScanWorker,
 )
+from suiteview.file_nav.depth_scan import (
+    DEFAULT_MAX_WORKERS, ensure_stat, format_size, format_timestamp, iter_folder, scan_tree,
+)
+from suiteview.file_nav.file_index import FileIndex
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Depth results this large answer the details name search from the file index
+DEPTH_INDEX_SEARCH_MIN_ROWS = 5000
+
+# Rows added to the details model per event-loop turn while a folder loads
+DETAILS_INSERT_SLICE = 500
+
 
 class FileSortProxyModel(QSortFilterProxyModel):
     """Custom sort proxy that uses UserRole+1 data for proper sorting
@@ -47,6 +60,18 @@ class FileSortProxyModel(QSortFilterProxyModel):
     def __init__(self, parent=None):
         super().__init__(parent)
         self._length_filter = None  # Tuple of (operator, value) or None
+        self._path_filter = None  # Set of accepted paths (UserRole) or None
+    
+    def setPathFilter(self, paths):
+        """Show only rows whose path is in ``paths`` (a name search answered by the file index)"""
+        super().setFilterRegularExpression(QRegularExpression())
+        self._path_filter = paths
+        self.invalidateFilter()
+    
+    def setFilterRegularExpression(self, regex):
+        """A regex filter replaces any path filter"""
+        self._path_filter = None
+        super().setFilterRegularExpression(regex)
     
     def setLengthFilter(self, operator: str, value: int):
         """Set a length-based filter. operator is one of: =, >, <, >=, <=, !="""
@@ -60,6 +85,10 @@ class FileSortProxyModel(QSortFilterProxyModel):
     
     def filterAcceptsRow(self, source_row: int, source_parent) -> bool:
         """Override to apply length filter in addition to regex filter"""
+        if self._path_filter is not None:
+            index = self.sourceModel().index(source_row, 0, source_parent)
+            return self.sourceModel().data(index, Qt.ItemDataRole.UserRole) in self._path_filter
+        
         # First check length filter if active
         if self._length_filter:
             operator, target_len = self._length_filter
@@ -448,106 +477,142 @@ class DropFolderTreeView(QTreeView):
 
 
 class DepthScanWorker(QThread):
-    """Background thread for scanning folders at specified depth"""
+    """Background thread for scanning folders at specified depth.
+
+    Folder listings run concurrently (see ``depth_scan.scan_tree``); each
+    folder's entries are emitted through ``batch_ready`` as they arrive,
+    and ``finished`` carries everything found (partial when cancelled).
+
+    With ``use_index`` a previously scanned tree is emitted at once from its
+    persistent ``FileIndex`` and then revalidated folder by folder;
+    ``batches_superseded`` is set when that revalidation found changes.
+    """
     progress = pyqtSignal(int, str)
+    batch_ready = pyqtSignal(list)
     finished = pyqtSignal(list)
-    
-    def __init__(self, root_path, depth_level):
+
+    # Partial results are coalesced so the GUI thread gets a few batches a second
+    BATCH_INTERVAL = 0.3
+
+    def __init__(self, root_path, depth_level, max_workers=DEFAULT_MAX_WORKERS, use_index=True):
         super().__init__()
         self.root_path = root_path
         self.depth_level = depth_level
+        self.max_workers = max_workers
+        self.use_index = use_index
+        self.batches_superseded = False
         self._cancelled = False
+        self._cancel_event = threading.Event()
+        self._pending = []
+        self._found = 0
+        self._last_emit = 0.0
         
     def cancel(self):
         """Request cancellation of the scan"""
         self._cancelled = True
+        self._cancel_event.set()
         
     def run(self):
         """Scan folders up to specified depth and return results"""
         results = []
+        index = self._open_index() if self.use_index else None
+        snapshot = index.snapshot(self.depth_level) if index is not None else None
+        if snapshot:
+            self.batch_ready.emit(snapshot)
+            self.progress.emit(len(snapshot), "Checking for changes...")
         
         try:
-            root = Path(self.root_path)
-            
-            # Scan folders recursively up to depth_level
-            self._scan_folder(root, "", 0, results)
-            
+            results = scan_tree(index.root if index is not None else self.root_path,
+                                self.depth_level, self.max_workers, self._cancel_event,
+                                None if snapshot else self._on_items,
+                                lister=index.lister if index is not None else None)
+            if index is not None:
+                index.save(self.depth_level, complete=not self._cancelled)
         except Exception as e:
             logger.error(f"Error during depth scan: {e}")
+        finally:
+            if index is not None:
+                index.close()
+        self._flush()
+        
+        if snapshot:
+            if self._cancelled:
+                results = snapshot  # what is on screen; the revalidation was cut short
+            else:
+                self.batches_superseded = index.changed
         
         # Emit results
         self.finished.emit(results)
     
-    def _scan_folder(self, folder_path: Path, relative_path: str, current_depth: int, results: list):
-        """Recursively scan folder up to specified depth"""
-        # Check if cancelled
-        if self._cancelled:
-            return
-        
-        # If depth_level is -1 (Max), scan everything; otherwise check depth limit
-        if self.depth_level != -1 and current_depth >= self.depth_level:
-            return
-        
+    def _open_index(self):
         try:
-            # Get all items in this folder
-            with os.scandir(str(folder_path)) as entries:
-                folders = []
-                files = []
-                
-                for entry in entries:
-                    try:
-                        is_dir = entry.is_dir()
-                        item_path = Path(entry.path)
-                        
-                        # Build display name with pipe delimiters
-                        if relative_path:
-                            display_name = f"{relative_path} | {entry.name}"
-                        else:
-                            display_name = entry.name
-                        
-                        # Get file stats (if not network drive)
-                        size = 0
-                        modified = ""
-                        accessed = ""
-                        
-                        try:
-                            stat_info = entry.stat()
-                            size = stat_info.st_size if not is_dir else 0
-                            modified = datetime.fromtimestamp(stat_info.st_mtime).strftime("%Y-%m-%d %H:%M")
-                            accessed = datetime.fromtimestamp(stat_info.st_atime).strftime("%Y-%m-%d %H:%M")
-                        except:
-                            pass
-                        
-                        # Add to results
-                        item_data = {
-                            'path': str(item_path),
-                            'display_name': display_name,
-                            'is_dir': is_dir,
-                            'depth': current_depth + 1,
-                            'size': size,
-                            'modified': modified,
-                            'accessed': accessed
-                        }
-                        
-                        if is_dir:
-                            folders.append((item_path, display_name))
-                        
-                        results.append(item_data)
-                        
-                        # Emit progress every 50 items
-                        if len(results) % 50 == 0:
-                            self.progress.emit(len(results), f"Scanning depth {current_depth + 1}...")
-                        
-                    except (PermissionError, OSError):
-                        continue
-                
-                # Recursively scan subfolders if we haven't reached max depth (or if Max mode)
-                if self.depth_level == -1 or current_depth + 1 < self.depth_level:
-                    for subfolder_path, subfolder_display in folders:
-                        self._scan_folder(subfolder_path, subfolder_display, current_depth + 1, results)
-                        
-        except (PermissionError, OSError):
-            pass
+            return FileIndex(self.root_path).load()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"File index unavailable for {self.root_path}: {e}")
+            return None
+    
+    def _on_items(self, items: list):
+        self._pending.extend(items)
+        self._found += len(items)
+        now = time.monotonic()
+        if now - self._last_emit >= self.BATCH_INTERVAL:
+            self._last_emit = now
+            self._flush()
+            depth = max(item['depth'] for item in items)
+            self.progress.emit(self._found, f"Scanning depth {depth}...")
+    
+    def _flush(self):
+        if self._pending:
+            batch, self._pending = self._pending, []
+            self.batch_ready.emit(batch)
+
+
+class FolderListWorker(QThread):
+    """Background thread listing one folder for the details view.
+
+    Entries arrive through ``batch_ready`` in ``depth_scan.iter_folder``
+    batches, then ``listing_done`` fires. Both carry the load generation
+    so the view can drop a listing that a newer navigation replaced.
+    """
+    batch_ready = pyqtSignal(list, int)  # items, generation
+    listing_done = pyqtSignal(int)       # generation
+
+    def __init__(self, folder, generation):
+        super().__init__()
+        self.folder = folder
+        self.generation = generation
+        self._cancel_event = threading.Event()
+
+    def cancel(self):
+        """A newer navigation replaced this listing"""
+        self._cancel_event.set()
+
+    def run(self):
+        try:
+            for batch in iter_folder(self.folder, cancel=self._cancel_event):
+                self.batch_ready.emit(batch, self.generation)
+        except OSError as e:  # includes PermissionError
+            logger.warning(f"Cannot list {self.folder}: {e}")
+        if not self._cancel_event.is_set():
+            self.listing_done.emit(self.generation)
+
+
+class DetailsStatWorker(QThread):
+    """Background thread reading stat data for details rows that came into view.
+
+    ``stats_ready`` carries ``[(row, stat result or None)]`` — ``row`` is
+    whatever token the view passed in — plus the load generation.
+    """
+    stats_ready = pyqtSignal(list, int)  # [(row, stat_result)], generation
+
+    def __init__(self, rows, generation):
+        super().__init__()
+        self.rows = rows  # [(row token, path)]
+        self.generation = generation
+
+    def run(self):
+        stats = [(row, FileExplorerCore._stat_path(Path(path))) for row, path in self.rows]
+        self.stats_ready.emit(stats, self.generation)
 
 
 class DirectoryExportThread(QThread):
@@ -831,6 +896,13 @@ class FileExplorerCore(QWidget):
         
         self.current_file_path = None
         self.current_file_content = None
+        self._folder_load_generation = 0
+        self._folder_list_worker = None  # FolderListWorker filling the details view
+        self._folder_list_workers = []  # running FolderListWorkers (kept alive until done)
+        self._details_stat_workers = []  # running DetailsStatWorkers (kept alive until done)
+        self._details_pending_items = deque()  # listed entries not yet in the model
+        self._details_load_start = 0.0
+        self._details_select_after_load = None  # file to select once the load finishes
         self.current_details_folder = None  # Track current folder in details view
         self.clipboard = {"paths": [], "operation": None}
         
@@ -841,6 +913,8 @@ class FileExplorerCore(QWidget):
         self.depth_search_folder_name = None  # Display name of that folder (SharePoint)
         self.depth_search_locked = False  # True when depth search is active and locked
         self.depth_search_active_results = None  # Currently displayed depth results
+        self.depth_streamed_count = 0  # Rows shown while the scan runs (-1 = stopped)
+        self._depth_file_index = None  # FileIndex answering name searches over depth results
         
         # Folder-specific search terms
         self.folder_search_terms = {}  # Cache: {folder_path: search_text}
@@ -1864,16 +1938,8 @@ class FileExplorerCore(QWidget):
         
         # Size column
         if stat_result:
-            size = stat_result.st_size
-            size_bytes = size
-            if size < 1024:
-                size_str = f"{size} B"
-            elif size < 1024 * 1024:
-                size_str = f"{size / 1024:.1f} KB"
-            elif size < 1024 * 1024 * 1024:
-                size_str = f"{size / (1024 * 1024):.1f} MB"
-            else:
-                size_str = f"{size / (1024 * 1024 * 1024):.2f} GB"
+            size_bytes = stat_result.st_size
+            size_str = format_size(size_bytes)
         else:
             size_str = ""
             size_bytes = 0
@@ -2216,6 +2282,23 @@ class FileExplorerCore(QWidget):
         # Set the proxy model on the view
         self.details_view.setModel(self.details_sort_proxy)
         
+        # Incremental folder loads: listed entries are added a slice per
+        # event-loop turn, and icons / stat data are filled in for the rows
+        # that come into view
+        self._details_insert_timer = QTimer(self)
+        self._details_insert_timer.setSingleShot(True)
+        self._details_insert_timer.timeout.connect(self._insert_pending_details_rows)
+        self._details_resolve_timer = QTimer(self)
+        self._details_resolve_timer.setSingleShot(True)
+        self._details_resolve_timer.setInterval(30)
+        self._details_resolve_timer.timeout.connect(self._resolve_visible_details_rows)
+        scroll_bar = self.details_view.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._schedule_details_resolve)
+        scroll_bar.rangeChanged.connect(self._schedule_details_resolve)
+        self.details_sort_proxy.layoutChanged.connect(self._schedule_details_resolve)
+        # Anything that repopulates the details view stops a folder load in flight
+        self.details_model.modelReset.connect(self._cancel_folder_load)
+        
         # Configure header
         header_view = self.details_view.header()
         header_view.setSectionResizeMode(0, QHeaderView.ResizeMode.Interactive)
@@ -2383,11 +2466,40 @@ class FileExplorerCore(QWidget):
             self.details_sort_proxy.setFilterRegularExpression(QRegularExpression())
             return
 
+        # Large depth results: the persistent file index answers the name search
+        paths = self._depth_index_search(query)
+        if paths is not None:
+            self.details_sort_proxy.setPathFilter(paths)
+            return
+
         # Treat user input as a literal substring match (case-insensitive)
         escaped = QRegularExpression.escape(query)
         regex = QRegularExpression(escaped, QRegularExpression.PatternOption.CaseInsensitiveOption)
         self.details_sort_proxy.setFilterRegularExpression(regex)
     
+    def _depth_index_search(self, query: str):
+        """Paths matching ``query`` from the depth folder's file index, or None to filter rows"""
+        results = self.depth_search_active_results
+        folder = self.depth_search_folder
+        if (not self.depth_search_locked or not results or not folder or is_sp_path(folder)
+                or len(results) < DEPTH_INDEX_SEARCH_MIN_ROWS
+                or self.current_details_folder != folder):
+            return None
+        depth_text = self.depth_level_combo.currentText()
+        depth_level = -1 if depth_text == "Max" else int(depth_text)
+        try:
+            index = self._depth_file_index
+            if index is None or index.root != os.path.abspath(folder):
+                if index is not None:
+                    index.close()
+                index = self._depth_file_index = FileIndex(folder)
+            if not index.is_complete(depth_level):
+                return None
+            return index.search(query, depth_level)
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"File index search failed: {e}")
+            return None
+    
     def toggle_depth_search(self):
         """Toggle depth search on/off based on button state"""
         # Guard against callback during widget deletion
@@ -2594,6 +2706,9 @@ class FileExplorerCore(QWidget):
         else:
             self.depth_scan_worker = DepthScanWorker(search_folder, depth_level_int)
         self.depth_scan_worker.finished.connect(self._on_depth_scan_complete)
+        if hasattr(self.depth_scan_worker, 'batch_ready'):
+            self.depth_scan_worker.batch_ready.connect(self._on_depth_scan_batch)
+        self.depth_streamed_count = 0
         self.depth_scan_worker.progress.connect(self._on_depth_scan_progress)
         
         # Create progress dialog with 3 second delay and actual progress bar
@@ -2693,8 +2808,13 @@ class FileExplorerCore(QWidget):
         currently_in_search_folder = (self.current_details_folder == search_folder)
         
         if currently_in_search_folder:
-            # Populate all results (partial or complete)
-            self._populate_depth_results(results)
+            # Populate all results (partial or complete) unless every row
+            # already streamed in while the scan ran
+            if (self.depth_streamed_count != len(results)
+                    or getattr(self.depth_scan_worker, 'batches_superseded', False)):
+                self._populate_depth_results(results)
+            else:
+                self.update_details_footer()
             
             # Enable lock mode
             self.depth_search_locked = True
@@ -2802,6 +2922,17 @@ class FileExplorerCore(QWidget):
         if not depth_items:
             return
         
+        self._begin_depth_results()
+        
+        # Sort by depth level then alphabetically
+        sorted_items = sorted(depth_items, key=lambda x: (x['depth'], x['display_name'].lower()))
+        self._append_depth_rows(sorted_items)
+        
+        # Update footer
+        self.update_details_footer()
+    
+    def _begin_depth_results(self):
+        """Clear the details view and set it up for depth search rows"""
         # Clear the model
         self.details_model.clear()
         self.details_model.setHorizontalHeaderLabels(['Name', 'Size', 'Type', 'Date Modified', 'Date Accessed'])
@@ -2819,23 +2950,32 @@ class FileExplorerCore(QWidget):
             self.details_view.setColumnWidth(col, width)
         
         header_view.sectionResized.connect(self.on_column_resized)
-        
-        # Sort by depth level then alphabetically
-        sorted_items = sorted(depth_items, key=lambda x: (x['depth'], x['display_name'].lower()))
-        
+    
+    def _append_depth_rows(self, depth_items: list):
+        """Append depth search rows (the sort proxy keeps them ordered)"""
         # PERFORMANCE: Disable view updates during bulk insertion
         self.details_view.setUpdatesEnabled(False)
         try:
             # Add all items to view
-            for item in sorted_items:
+            for item in depth_items:
                 row_items = self._create_depth_search_item(item)
                 self.details_model.appendRow(row_items)
         finally:
             # Re-enable updates and trigger single repaint
             self.details_view.setUpdatesEnabled(True)
-        
-        # Update footer
-        self.update_details_footer()
+    
+    def _on_depth_scan_batch(self, items: list):
+        """Show partial depth results while the scan is still running"""
+        if self.depth_streamed_count < 0:
+            return
+        if self.current_details_folder != self.depth_search_folder:
+            # Navigated away: the completed scan repopulates in full
+            self.depth_streamed_count = -1
+            return
+        if not self.depth_streamed_count:
+            self._begin_depth_results()
+        self.depth_streamed_count += len(items)
+        self._append_depth_rows(items)
     
     def _create_depth_search_item(self, item_data: dict):
         """Create a row item for depth search results"""
@@ -2843,13 +2983,19 @@ class FileExplorerCore(QWidget):
         full_path = item_data['path']
         is_dir = item_data['is_dir']
         depth = item_data['depth']
-        size = item_data.get('size', 0)
-        modified = item_data.get('modified', '')
-        accessed = item_data.get('accessed', '')
         
         # SharePoint results carry sp:// virtual paths — derive icon/type from
         # the item's leaf name (the sp path is an opaque drive/item id pair)
         is_sp = is_sp_path(full_path)
+        if 'modified' in item_data:
+            modified = item_data['modified']
+            accessed = item_data.get('accessed', '')
+        else:
+            # Local scans defer stat and timestamp text until the row is shown
+            ensure_stat(item_data)
+            modified = format_timestamp(item_data['mtime'])
+            accessed = format_timestamp(item_data['atime'])
+        size = item_data.get('size') or 0
         if is_sp:
             leaf_name = item_data.get('name') or display_name.split(' | ')[-1]
             path_obj = Path(leaf_name)
@@ -3040,7 +3186,11 @@ class FileExplorerCore(QWidget):
             self.details_model.itemChanged.connect(self.on_item_renamed)
     
     def load_folder_contents_in_details(self, dir_path):
-        """Load folder contents into the details view - optimized for network drives"""
+        """Load folder contents into the details view - optimized for network drives
+
+        The folder is listed on a FolderListWorker and rows appear in slices
+        as entries arrive (see ``_start_folder_load``).
+        """
         # Check if we're returning to the depth search folder while locked
         if (self.depth_search_locked and 
             self.depth_search_folder and 
@@ -3178,59 +3328,18 @@ class FileExplorerCore(QWidget):
             # Reconnect resize signal
             header_view.sectionResized.connect(self.on_column_resized)
             
-            # Check if it's a network path
-            is_network = str(dir_path).startswith('\\\\')
-            
-            # Get all items in directory - use os.scandir() which is MUCH faster
-            # os.scandir() caches stat info in DirEntry objects (150x faster on network!)
-            items_with_type = []
-            try:
-                with os.scandir(str(dir_path)) as entries:
-                    for entry in entries:
-                        try:
-                            # DirEntry.is_dir() uses cached stat - very fast!
-                            is_directory = entry.is_dir()
-                            # Convert to Path for compatibility with existing code
-                            item_path = Path(entry.path)
-                            # Keep the DirEntry for cached stat data (long-path support)
-                            items_with_type.append((item_path, is_directory, entry))
-                        except (PermissionError, OSError):
-                            continue
-                
-                # Sort by name only (case-insensitive), folders first
-                items_with_type.sort(key=lambda x: (not x[1], x[0].name.lower()))
-            except Exception:
-                items_with_type = []
-            
-            # PERFORMANCE: Disable view updates during bulk insertion
-            # This prevents Qt from repainting after every single row is added
-            self.details_view.setUpdatesEnabled(False)
-            try:
-                # Add items to view - use cached is_dir result
-                for item_path, is_directory, dir_entry in items_with_type:
-                    try:
-                        if is_directory:
-                            row_items = self.create_folder_item(item_path, dir_entry=dir_entry)
-                        else:
-                            row_items = self.create_file_item(item_path, dir_entry=dir_entry)
-                        
-                        self.details_model.appendRow(row_items)
-                    except (PermissionError, OSError):
-                        # Skip items we can't access
-                        continue
-            finally:
-                # Re-enable updates and trigger single repaint
-                self.details_view.setUpdatesEnabled(True)
-            
-            # Re-apply current sort order (default: Name ascending)
+            # Re-apply current sort order (default: Name ascending, which puts
+            # folders first); the proxy keeps rows in order as they stream in
             header = self.details_view.header()
             sort_column = header.sortIndicatorSection()
             sort_order = header.sortIndicatorOrder()
+            if not 0 <= sort_column < self.details_model.columnCount():
+                sort_column, sort_order = 0, Qt.SortOrder.AscendingOrder
             self.details_sort_proxy.sort(sort_column, sort_order)
             
-            # Calculate elapsed time and update footer with timing
-            elapsed_ms = int((time.perf_counter() - start_time) * 1000)
-            self.update_details_footer(timing_ms=elapsed_ms)
+            # List the folder on a FolderListWorker (clearing the model above
+            # already cancelled any earlier load)
+            self._start_folder_load(dir_path, start_time)
                     
         except (PermissionError, OSError) as e:
             self.details_model.clear()
@@ -3260,6 +3369,194 @@ class FileExplorerCore(QWidget):
             elapsed_ms = int((time.perf_counter() - start_time) * 1000)
             self.update_details_footer(timing_ms=elapsed_ms)
     
+    def _start_folder_load(self, dir_path, start_time):
+        """List ``dir_path`` in the background and stream its rows into the details view"""
+        self._folder_load_generation += 1
+        self._details_load_start = start_time
+        worker = FolderListWorker(str(dir_path), self._folder_load_generation)
+        worker.batch_ready.connect(self._on_folder_batch)
+        worker.listing_done.connect(self._on_folder_listing_done)
+        self._folder_list_worker = worker
+        self._folder_list_workers = [w for w in self._folder_list_workers if w.isRunning()]
+        self._folder_list_workers.append(worker)
+        worker.start()
+    
+    def _cancel_folder_load(self):
+        """Drop a folder load in flight (its worker stops at the next entry)"""
+        self._folder_load_generation += 1
+        if self._folder_list_worker is not None:
+            self._folder_list_worker.cancel()
+            self._folder_list_worker = None
+        self._details_pending_items.clear()
+        self._details_insert_timer.stop()
+        self._details_select_after_load = None
+    
+    def _folder_load_in_progress(self):
+        return self._folder_list_worker is not None or bool(self._details_pending_items)
+    
+    def _on_folder_batch(self, items: list, generation: int):
+        if generation != self._folder_load_generation:
+            return
+        self._details_pending_items.extend(items)
+        if not self._details_insert_timer.isActive():
+            self._details_insert_timer.start(0)
+    
+    def _on_folder_listing_done(self, generation: int):
+        if generation != self._folder_load_generation:
+            return
+        self._folder_list_worker = None
+        if not self._details_pending_items:
+            self._finish_folder_load()
+    
+    def _insert_pending_details_rows(self):
+        """Add the next slice of listed entries, then yield to the event loop"""
+        pending = self._details_pending_items
+        self.details_view.setUpdatesEnabled(False)
+        try:
+            for _ in range(min(DETAILS_INSERT_SLICE, len(pending))):
+                self.details_model.appendRow(self._create_lazy_details_row(pending.popleft()))
+        finally:
+            self.details_view.setUpdatesEnabled(True)
+        self._schedule_details_resolve()
+        if pending:
+            self._details_insert_timer.start(0)
+        elif self._folder_list_worker is None:
+            self._finish_folder_load()
+        else:
+            self.update_details_footer()
+    
+    def _finish_folder_load(self):
+        elapsed_ms = int((time.perf_counter() - self._details_load_start) * 1000)
+        self.update_details_footer(timing_ms=elapsed_ms)
+        if self._details_select_after_load:
+            file_path, self._details_select_after_load = self._details_select_after_load, None
+            self.select_file_in_details(file_path)
+    
+    def _create_lazy_details_row(self, item: dict):
+        """Create a details row for a listed entry, deferring what is not at hand
+        
+        Rows whose icon or stat data is not known yet are flagged
+        (UserRole + 6) and completed by ``_resolve_visible_details_rows``
+        when they come into view.
+        """
+        path = Path(item['path'])
+        is_dir = item['is_dir']
+        suffix = path.suffix.lower()
+        
+        if is_dir:
+            icon = FileExplorerCore._folder_icon
+        else:
+            icon = FileExplorerCore._icon_cache.get(suffix)
+        name_item = QStandardItem(path.name)
+        name_item.setIcon(icon if icon is not None else FileExplorerCore._icon_cache.get('_default', QIcon()))
+        name_item.setData(str(path), Qt.ItemDataRole.UserRole)
+        name_item.setEditable(True)  # Allow editing for F2 rename
+        # Same sort data as create_folder_item / create_file_item: folders first
+        name_item.setData(f"{'0' if is_dir else '1'}_{path.name.lower()}", Qt.ItemDataRole.UserRole + 1)
+        
+        size_item = QStandardItem("")
+        size_item.setEditable(False)
+        size_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)  # Right-align
+        size_item.setData(0, Qt.ItemDataRole.UserRole + 1)
+        
+        type_item = QStandardItem("Folder" if is_dir else (suffix.upper()[1:] if suffix else "File"))
+        type_item.setEditable(False)
+        
+        date_item = QStandardItem("")
+        date_item.setEditable(False)
+        date_item.setData(0, Qt.ItemDataRole.UserRole + 1)
+        adate_item = QStandardItem("")
+        adate_item.setEditable(False)
+        adate_item.setData(0, Qt.ItemDataRole.UserRole + 1)
+        
+        if is_dir:
+            # Add placeholder child to make it expandable
+            name_item.appendRow([
+                QStandardItem("Loading..."),
+                QStandardItem(""),
+                QStandardItem(""),
+                QStandardItem(""),
+                QStandardItem("")
+            ])
+        
+        row_items = [name_item, size_item, type_item, date_item, adate_item]
+        if item['mtime'] is not None:
+            self._set_details_stat(row_items, is_dir, item['size'], item['mtime'], item['atime'])
+        if icon is None or item['mtime'] is None:
+            name_item.setData(True, Qt.ItemDataRole.UserRole + 6)
+        return row_items
+    
+    @staticmethod
+    def _set_details_stat(row_items, is_dir, size, mtime, atime):
+        """Fill the size and date columns of a details row"""
+        _name_item, size_item, _type_item, date_item, adate_item = row_items
+        if not is_dir and size is not None:
+            size_item.setText(format_size(size))
+            size_item.setData(size, Qt.ItemDataRole.UserRole + 1)
+        date_item.setText(format_timestamp(mtime))
+        date_item.setData(mtime or 0, Qt.ItemDataRole.UserRole + 1)
+        adate_item.setText(format_timestamp(atime))
+        adate_item.setData(atime or 0, Qt.ItemDataRole.UserRole + 1)
+    
+    def _schedule_details_resolve(self, *args):
+        if not self._details_resolve_timer.isActive():
+            self._details_resolve_timer.start()
+    
+    def _resolve_visible_details_rows(self):
+        """Fill in icons and stat data for flagged rows in the viewport"""
+        view = self.details_view
+        top = view.indexAt(view.viewport().rect().topLeft())
+        if not top.isValid():
+            return
+        bottom = view.indexAt(view.viewport().rect().bottomLeft())
+        last = bottom.row() if bottom.isValid() else self.details_sort_proxy.rowCount() - 1
+        
+        rows = []
+        for proxy_row in range(top.row(), last + 1):
+            source = self.details_sort_proxy.mapToSource(self.details_sort_proxy.index(proxy_row, 0))
+            name_item = self.details_model.itemFromIndex(source)
+            if name_item is not None and name_item.data(Qt.ItemDataRole.UserRole + 6):
+                rows.append(source.row())
+        if not rows:
+            return
+        
+        # Icon and date updates are not renames
+        unstatted = []
+        self.details_model.itemChanged.disconnect(self.on_item_renamed)
+        try:
+            for row in rows:
+                name_item = self.details_model.item(row, 0)
+                path = name_item.data(Qt.ItemDataRole.UserRole)
+                is_dir = name_item.data(Qt.ItemDataRole.UserRole + 1).startswith("0_")
+                name_item.setData(None, Qt.ItemDataRole.UserRole + 6)
+                name_item.setIcon(self._get_cached_icon(Path(path), is_directory=is_dir))
+                if not self.details_model.item(row, 3).text():
+                    unstatted.append((QPersistentModelIndex(name_item.index()), path))
+        finally:
+            self.details_model.itemChanged.connect(self.on_item_renamed)
+        if unstatted:
+            # stat() can be a network round trip per file: read them off the GUI thread
+            worker = DetailsStatWorker(unstatted, self._folder_load_generation)
+            worker.stats_ready.connect(self._on_details_stats)
+            self._details_stat_workers = [w for w in self._details_stat_workers if w.isRunning()]
+            self._details_stat_workers.append(worker)
+            worker.start()
+    
+    def _on_details_stats(self, stats: list, generation: int):
+        if generation != self._folder_load_generation:
+            return
+        self.details_model.itemChanged.disconnect(self.on_item_renamed)
+        try:
+            for index, stat_result in stats:
+                if not index.isValid() or not stat_result:
+                    continue
+                row_items = [self.details_model.item(index.row(), col) for col in range(5)]
+                is_dir = row_items[0].data(Qt.ItemDataRole.UserRole + 1).startswith("0_")
+                self._set_details_stat(row_items, is_dir, stat_result.st_size,
+                                       stat_result.st_mtime, stat_result.st_atime)
+        finally:
+            self.details_model.itemChanged.connect(self.on_item_renamed)
+    
     def on_details_item_double_clicked(self, index):
         """Handle double click in details view"""
         # DEBUG: Log what we're clicking
@@ -3615,222 +3912,6 @@ class FileExplorerCore(QWidget):
         # You could store this as self.current_details_folder when loading
         return ""
         
-    def show_file_preview(self, file_path):
-        """Show enhanced file preview with support for Excel, CSV, images, etc."""
-        self.current_file_path = file_path
-        path = Path(file_path)
-        suffix = path.suffix.lower()
-        
-        # Clear preview
-        self.preview_text.clear()
-        self.upload_button.setEnabled(True)
-        
-        try:
-            # Check file size first
-            file_size = path.stat().st_size
-            if file_size > 10 * 1024 * 1024:  # 10 MB
-                self.preview_text.setText(
-                    f"📄 {path.name}\n"
-                    f"Size: {file_size / (1024 * 1024):.2f} MB\n\n"
-                    f"⚠️ File too large for preview\n"
-                    f"Double-click to open in default application"
-                )
-                return
-            
-            # Excel files (.xlsx, .xls, .xlsm)
-            if suffix in ['.xlsx', '.xls', '.xlsm']:
-                self.preview_excel_file(path)
-            
-            # CSV files
-            elif suffix == '.csv':
-                self.preview_csv_file(path)
-            
-            # Text files
-            elif suffix in ['.txt', '.log', '.md', '.py', '.js', '.html', '.css', '.json', '.xml', '.sql']:
-                self.preview_text_file(path)
-            
-            # Image files
-            elif suffix in ['.jpg', '.jpeg', '.png', '.gif', '.bmp']:
-                self.preview_image_file(path)
-            
-            # PDF files
-            elif suffix == '.pdf':
-                self.preview_text.setText(
-                    f"📕 PDF Document: {path.name}\n"
-                    f"Size: {file_size / 1024:.1f} KB\n\n"
-                    f"📌 Double-click to open in PDF viewer"
-                )
-            
-            # Word documents
-            elif suffix in ['.docx', '.doc']:
-                self.preview_text.setText(
-                    f"📝 Word Document: {path.name}\n"
-                    f"Size: {file_size / 1024:.1f} KB\n\n"
-                    f"📌 Double-click to open in Microsoft Word"
-                )
-            
-            # PowerPoint
-            elif suffix in ['.pptx', '.ppt']:
-                self.preview_text.setText(
-                    f"📽️ PowerPoint: {path.name}\n"
-                    f"Size: {file_size / 1024:.1f} KB\n\n"
-                    f"📌 Double-click to open in PowerPoint"
-                )
-            
-            # Access databases
-            elif suffix in ['.accdb', '.mdb']:
-                self.preview_text.setText(
-                    f"🗃️ Access Database: {path.name}\n"
-                    f"Size: {file_size / 1024:.1f} KB\n\n"
-                    f"📌 Double-click to open in Microsoft Access"
-                )
-            
-            # Unknown/Binary
-            else:
-                self.preview_text.setText(
-                    f"📃 {path.name}\n"
-                    f"Type: {suffix.upper()[1:] if suffix else 'Unknown'}\n"
-                    f"Size: {file_size / 1024:.1f} KB\n\n"
-                    f"Preview not available for this file type\n"
-                    f"Double-click to open"
-                )
-                
-        except Exception as e:
-            logger.error(f"Preview error: {e}")
-            self.preview_text.setText(
-                f"❌ Error previewing file:\n{str(e)}\n\n"
-                f"File: {path.name}"
-            )
-    
-    def preview_excel_file(self, path):
-        """Preview Excel file showing first few rows"""
-        try:
-            import pandas as pd
-            
-            # Read first sheet using openpyxl engine
-            df = pd.read_excel(path, engine='openpyxl', nrows=100)
-            
-            # Build preview text
-            preview = f"📊 Excel File: {path.name}\n"
-            preview += f"Rows: {len(df)}, Columns: {len(df.columns)}\n"
-            preview += "=" * 60 + "\n\n"
-            
-            # Column names
-            preview += "Columns:\n"
-            for i, col in enumerate(df.columns, 1):
-                preview += f"  {i}. {col}\n"
-            
-            preview += "\n" + "=" * 60 + "\n"
-            preview += "First 10 Rows:\n"
-            preview += "=" * 60 + "\n\n"
-            
-            # Show first 10 rows with formatting
-            preview += df.head(10).to_string(index=True, max_colwidth=40)
-            
-            if len(df) > 10:
-                preview += f"\n\n... and {len(df) - 10} more rows"
-            
-            preview += "\n\n📌 Double-click to open in Excel"
-            
-            self.preview_text.setText(preview)
-            self.current_file_content = preview
-            
-        except ImportError:
-            self.preview_text.setText(
-                f"📊 Excel File: {path.name}\n\n"
-                f"⚠️ Could not preview Excel file:\n"
-                f"Missing optional dependency 'xlrd'. Install xlrd >= 2.0.1 for xls Excel support\n"
-                f"or use openpyxl for xlsx files.\n\n"
-                f"Run: pip install openpyxl\n\n"
-                f"Double-click to open in Microsoft Excel"
-            )
-        except Exception as e:
-            self.preview_text.setText(
-                f"📊 Excel File: {path.name}\n\n"
-                f"⚠️ Could not preview Excel file:\n{str(e)}\n\n"
-                f"Double-click to open in Microsoft Excel"
-            )
-    
-    def preview_csv_file(self, path):
-        """Preview CSV file"""
-        try:
-            import pandas as pd
-            
-            # Try to read CSV
-            df = pd.read_csv(path, nrows=100)
-            
-            preview = f"📑 CSV File: {path.name}\n"
-            preview += f"Rows: {len(df)}, Columns: {len(df.columns)}\n"
-            preview += "=" * 60 + "\n\n"
-            
-            # Column names
-            preview += "Columns:\n"
-            for i, col in enumerate(df.columns, 1):
-                preview += f"  {i}. {col}\n"
-            
-            preview += "\n" + "=" * 60 + "\n"
-            preview += "First 10 Rows:\n"
-            preview += "=" * 60 + "\n\n"
-            
-            preview += df.head(10).to_string(index=False, max_colwidth=40)
-            
-            if len(df) > 10:
-                preview += f"\n\n... and {len(df) - 10} more rows"
-            
-            self.preview_text.setText(preview)
-            self.current_file_content = preview
-            
-        except Exception:
-            # Fallback to text preview
-            self.preview_text_file(path)
-    
-    def preview_text_file(self, path):
-        """Preview text files"""
-        try:
-            with open(path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read(50000)  # Read first 50KB
-                
-            preview = f"📄 Text File: {path.name}\n"
-            preview += f"Size: {path.stat().st_size / 1024:.1f} KB\n"
-            preview += "=" * 60 + "\n\n"
-            preview += content
-            
-            if path.stat().st_size > 50000:
-                preview += "\n\n... (file truncated for preview)"
-            
-            self.preview_text.setText(preview)
-            self.current_file_content = content
-            
-        except Exception as e:
-            self.preview_text.setText(
-                f"Cannot read file:\n{str(e)}\n\n"
-                f"File: {path.name}"
-            )
-    
-    def preview_image_file(self, path):
-        """Preview image file info"""
-        try:
-            from PIL import Image
-            
-            img = Image.open(path)
-            
-            preview = f"🖼️ Image: {path.name}\n"
-            preview += f"Size: {path.stat().st_size / 1024:.1f} KB\n"
-            preview += f"Dimensions: {img.width} × {img.height} pixels\n"
-            preview += f"Format: {img.format}\n"
-            preview += f"Mode: {img.mode}\n\n"
-            preview += "📌 Double-click to view image"
-            
-            self.preview_text.setText(preview)
-            
-        except:
-            # If PIL not available, show basic info
-            self.preview_text.setText(
-                f"🖼️ Image: {path.name}\n"
-                f"Size: {path.stat().st_size / 1024:.1f} KB\n\n"
-                f"📌 Double-click to view image"
-            )
-            
     def show_upload_menu(self):
         """Show mainframe upload menu"""
         if not self.current_file_path:
@@ -3990,6 +4071,10 @@ class FileExplorerCore(QWidget):
     
     def select_file_in_details(self, file_path):
         """Select a specific file in the details view"""
+        if self._folder_load_in_progress():
+            # The file's row may not be there yet
+            self._details_select_after_load = file_path
+            return
         try:
             file_name = Path(file_path).name
             # Search through the model to find and select the file
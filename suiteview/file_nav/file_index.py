@@ -0,0 +1,264 @@
+"""
+Persistent per-root file index for FileNav's depth search.
+
+A depth scan of a share is slow the first time and nearly the same the
+next time, so its results are kept in a SQLite file per scanned root
+under ``~/.suiteview/file_index/``:
+
+* ``entries`` — one row per file or folder found: path, parent folder,
+  depth-search display name, depth, size and timestamps;
+* ``dirs`` — one row per folder listed: its mtime when listed and a
+  fingerprint of its child names;
+* ``entries_fts`` — an FTS5 trigram index over the display names, so a
+  name search is a ``MATCH`` instead of a scan (LIKE when FTS5 or the
+  trigram tokenizer is missing, or the text is under three characters).
+
+On a revisit the stored rows are shown at once (``snapshot``). The tree is
+then revalidated through ``lister``, which ``depth_scan.scan_tree`` calls
+once per folder. A folder whose mtime is unchanged is answered from the
+index with a single ``stat``; only changed folders are listed again.
+Adding, removing or renaming a child changes a folder's mtime; editing a
+file's contents does not, so sizes and dates of files in unchanged folders
+are as of the last listing. ``save`` writes the re-listed folders back in
+one transaction. Pure Python — no PyQt.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import sqlite3
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from suiteview.file_nav.depth_scan import Item, list_folder
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = Path.home() / ".suiteview" / "file_index"
+SCHEMA_VERSION = "1"
+FTS_MIN_CHARS = 3  # trigram MATCH needs at least one whole trigram
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS dirs (path TEXT PRIMARY KEY, mtime REAL, fingerprint TEXT);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY,
+    path TEXT UNIQUE,
+    parent TEXT,
+    display_name TEXT,
+    is_dir INTEGER,
+    depth INTEGER,
+    size INTEGER,
+    mtime REAL,
+    atime REAL
+);
+CREATE INDEX IF NOT EXISTS entries_parent ON entries(parent);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS entries_fts USING fts5(
+    display_name, content='entries', content_rowid='id', tokenize='trigram');
+CREATE TRIGGER IF NOT EXISTS entries_ai AFTER INSERT ON entries BEGIN
+    INSERT INTO entries_fts(rowid, display_name) VALUES (new.id, new.display_name);
+END;
+CREATE TRIGGER IF NOT EXISTS entries_ad AFTER DELETE ON entries BEGIN
+    INSERT INTO entries_fts(entries_fts, rowid, display_name) VALUES ('delete', old.id, old.display_name);
+END;
+"""
+
+_COLUMNS = ('path', 'display_name', 'is_dir', 'depth', 'size', 'mtime', 'atime')
+
+
+def index_path_for(root: str) -> Path:
+    """The index file for a scanned root folder."""
+    key = os.path.normcase(os.path.abspath(str(root)))
+    return INDEX_DIR / (hashlib.sha1(key.encode("utf-8")).hexdigest()[:20] + ".sqlite")
+
+
+def fingerprint(items: List[Item]) -> str:
+    """Digest of a folder's child names and kinds (order-independent)."""
+    names = sorted(f"{'d' if item['is_dir'] else 'f'}:{os.path.basename(item['path'])}" for item in items)
+    return hashlib.sha1("\n".join(names).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _like_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _stat_of(item: Optional[Item]) -> Optional[Tuple]:
+    return (item['size'], item['mtime']) if item is not None else None
+
+
+def _covers(scanned_depth: Optional[int], depth_level: int) -> bool:
+    if scanned_depth is None:
+        return False
+    return scanned_depth == -1 or (depth_level != -1 and scanned_depth >= depth_level)
+
+
+class FileIndex:
+    """The stored depth-scan results for one root folder."""
+
+    def __init__(self, root: str, path: Optional[Path] = None):
+        self.root = os.path.abspath(str(root))
+        self.path = Path(path) if path is not None else index_path_for(self.root)
+        self.fts = False
+        self.scanned_depth: Optional[int] = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._dirs: Dict[str, Tuple[float, str]] = {}
+        self._children: Dict[str, List[Item]] = {}
+        self._changes: List[Tuple[str, float, List[Item]]] = []
+        self.changed = False  # revalidation found differences (set by save)
+
+    # ── Storage ─────────────────────────────────────────────────────
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path))
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA recursive_triggers=ON")  # REPLACE deletes update the FTS table
+            conn.executescript(_SCHEMA)
+            try:
+                conn.executescript(_FTS_SCHEMA)
+                self.fts = True
+            except sqlite3.OperationalError as e:  # no FTS5 / trigram in this SQLite
+                logger.info(f"File index without FTS: {e}")
+            self._conn = conn
+        return self._conn
+
+    def _meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def is_complete(self, depth_level: int) -> bool:
+        """Has a finished scan covered ``depth_level`` (without loading entries)?"""
+        depth = self._meta("scanned_depth")
+        return depth is not None and _covers(int(depth), depth_level)
+
+    def load(self) -> "FileIndex":
+        """Read the stored folders and entries into memory."""
+        if self._meta("version") not in (None, SCHEMA_VERSION):
+            self.clear()
+        depth = self._meta("scanned_depth")
+        self.scanned_depth = int(depth) if depth is not None else None
+        self._dirs = {path: (mtime, fp) for path, mtime, fp in
+                      self.conn.execute("SELECT path, mtime, fingerprint FROM dirs")}
+        self._children = {path: [] for path in self._dirs}
+        for row in self.conn.execute(
+                "SELECT parent, path, display_name, is_dir, depth, size, mtime, atime FROM entries"):
+            item = dict(zip(_COLUMNS, row[1:]))
+            item['is_dir'] = bool(item['is_dir'])
+            self._children.setdefault(row[0], []).append(item)
+        return self
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM entries")
+            self.conn.execute("DELETE FROM dirs")
+            self.conn.execute("DELETE FROM meta")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    # ── Depth search ────────────────────────────────────────────────
+
+    def snapshot(self, depth_level: int) -> Optional[List[Item]]:
+        """Stored entries down to ``depth_level``, or None if never scanned that deep."""
+        if not _covers(self.scanned_depth, depth_level):
+            return None
+        return [dict(item) for items in self._children.values() for item in items
+                if depth_level == -1 or item['depth'] <= depth_level]
+
+    def lister(self, folder: str, relative_path: str, depth: int,
+               with_stat: bool) -> Tuple[List[Item], List[Tuple[str, str]]]:
+        """``depth_scan`` lister: unchanged folders come from the index."""
+        try:
+            mtime = os.stat(folder).st_mtime
+        except OSError:
+            mtime = None
+        known = self._dirs.get(folder)
+        if mtime is not None and known is not None and known[0] == mtime:
+            items = [dict(item) for item in self._children.get(folder, [])]
+            return items, [(item['path'], item['display_name']) for item in items if item['is_dir']]
+        try:
+            items, folders = list_folder(folder, relative_path, depth, with_stat, strict=True)
+        except OSError:
+            # Unreadable right now (permissions, a dropped share): not an empty
+            # folder, so keep the stored listing instead of recording a change.
+            return [], []
+        if mtime is not None:
+            self._changes.append((folder, mtime, items))  # list.append is thread-safe
+        return items, folders
+
+    def save(self, depth_level: int, complete: bool = True):
+        """Write re-listed folders back; a complete scan also records its depth."""
+        changes, self._changes = self._changes, []
+        with self.conn:
+            conn = self.conn
+            for folder, mtime, items in changes:
+                fp = fingerprint(items)
+                known = self._dirs.get(folder)
+                if known is not None and known[1] == fp:
+                    # Same children: refresh their sizes and dates in place
+                    stored = {item['path']: item for item in self._children.get(folder, [])}
+                    if any(_stat_of(stored.get(item['path'])) != _stat_of(item) for item in items):
+                        self.changed = True
+                    conn.executemany(
+                        "UPDATE entries SET size = ?, mtime = ?, atime = ? WHERE path = ?",
+                        [(item['size'], item['mtime'], item['atime'], item['path']) for item in items])
+                    conn.execute("UPDATE dirs SET mtime = ? WHERE path = ?", (mtime, folder))
+                    self._dirs[folder] = (mtime, fp)
+                    self._children[folder] = [dict(item) for item in items]
+                    continue
+                self.changed = True
+                current = {item['path'] for item in items}
+                for old in self._children.get(folder, []):
+                    if old['is_dir'] and old['path'] not in current:
+                        self._drop_subtree(old['path'])
+                conn.execute("DELETE FROM entries WHERE parent = ?", (folder,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO entries (path, parent, display_name, is_dir, depth, size, mtime, atime)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(item['path'], folder, item['display_name'], int(item['is_dir']), item['depth'],
+                      item['size'], item['mtime'], item['atime']) for item in items])
+                conn.execute("INSERT OR REPLACE INTO dirs (path, mtime, fingerprint) VALUES (?, ?, ?)",
+                             (folder, mtime, fp))
+                self._dirs[folder] = (mtime, fp)
+                self._children[folder] = [dict(item) for item in items]
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)", (SCHEMA_VERSION,))
+            conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('root', ?)", (self.root,))
+            if complete and not _covers(self.scanned_depth, depth_level):
+                self.scanned_depth = depth_level
+                conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('scanned_depth', ?)",
+                             (str(depth_level),))
+
+    def _drop_subtree(self, folder: str):
+        pattern = _like_escape(folder.rstrip(os.sep) + os.sep) + "%"
+        self.conn.execute("DELETE FROM entries WHERE path LIKE ? ESCAPE '\\'", (pattern,))
+        self.conn.execute("DELETE FROM dirs WHERE path = ? OR path LIKE ? ESCAPE '\\'", (folder, pattern))
+        for path in [p for p in self._dirs if p == folder or p.startswith(folder + os.sep)]:
+            del self._dirs[path]
+            self._children.pop(path, None)
+
+    # ── Name search ─────────────────────────────────────────────────
+
+    def search(self, text: str, depth_level: int = -1) -> Set[str]:
+        """Paths whose display name contains ``text`` (case-insensitive)."""
+        text = text.strip()
+        if not text:
+            return set()
+        conn = self.conn
+        depth = "" if depth_level == -1 else f" AND depth <= {int(depth_level)}"
+        if self.fts and len(text) >= FTS_MIN_CHARS:
+            sql = ("SELECT path FROM entries WHERE id IN "
+                   "(SELECT rowid FROM entries_fts WHERE entries_fts MATCH ?)" + depth)
+            params = ('"' + text.replace('"', '""') + '"',)
+        else:
+            sql = "SELECT path FROM entries WHERE display_name LIKE ? ESCAPE '\\'" + depth
+            params = ("%" + _like_escape(text) + "%",)
+        return {row[0] for row in conn.execute(sql, params)}
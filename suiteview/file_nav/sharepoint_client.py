@@ -16,11 +16,11 @@ available; otherwise tokens live only in memory for the session.
 import json
 import logging
 import threading
-from datetime import datetime
 from pathlib import Path
 from urllib.parse import unquote, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from PyQt6.QtCore import QThread, pyqtSignal
 
 logger = logging.getLogger(__name__)
@@ -33,6 +33,14 @@ SCOPES = ["https://graph.microsoft.com/.default"]
 
 SP_PREFIX = "sp://"
 
+# Concurrent Graph requests (and pooled keep-alive connections) per client
+SP_MAX_CONCURRENCY = 4
+# Graph JSON batching accepts at most 20 requests per $batch call
+BATCH_LIMIT = 20
+
+_CHILD_SELECT = "id,name,size,lastModifiedDateTime,folder,file,webUrl"
+_DELTA_SELECT = "id,name,size,lastModifiedDateTime,folder,file,webUrl,parentReference,deleted,root"
+
 TOKEN_CACHE_FILE = Path.home() / ".suiteview" / "sp_token_cache.bin"
 
 
@@ -55,13 +63,33 @@ def is_sp_path(path) -> bool:
     return isinstance(path, str) and path.startswith(SP_PREFIX)
 
 
+def _child_entry(it: dict) -> dict:
+    """A Graph driveItem as the dict ``list_children`` returns."""
+    return {
+        "name": it.get("name", ""),
+        "id": it.get("id", ""),
+        "is_folder": "folder" in it,
+        "size": it.get("size", 0) or 0,
+        "modified": it.get("lastModifiedDateTime", ""),
+        "web_url": it.get("webUrl", ""),
+        "child_count": (it.get("folder") or {}).get("childCount", 0),
+    }
+
+
 class SharePointClient:
-    """Thin Microsoft Graph client for browsing SharePoint document libraries."""
+    """Thin Microsoft Graph client for browsing SharePoint document libraries.
 
-    def __init__(self):
+    Requests go through one ``requests.Session`` whose connection pool is
+    sized for ``SP_MAX_CONCURRENCY`` concurrent callers, so TLS connections
+    to Graph are kept alive and reused across listings.
+    """
+
+    def __init__(self, graph_url: str = GRAPH):
+        self.graph_url = graph_url
         self._lock = threading.Lock()
         self._app = None
         self._cache = None
+        self._session = None
 
     # ------------------------------------------------------------------ auth
 
@@ -138,19 +166,46 @@ class SharePointClient:
 
     # ----------------------------------------------------------------- graph
 
-    def _get(self, url: str, params: dict = None) -> dict:
-        """GET a Graph endpoint (absolute or relative), raising SharePointError."""
-        if url.startswith("/"):
-            url = GRAPH + url
-        token = self.get_token()
-        r = requests.get(url, headers={"Authorization": f"Bearer {token}"},
-                         params=params, timeout=30)
+    @property
+    def session(self) -> requests.Session:
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=SP_MAX_CONCURRENCY,
+                                  pool_maxsize=SP_MAX_CONCURRENCY)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            self._session = session
+        return self._session
+
+    @staticmethod
+    def _check(r):
         if r.status_code == 404:
             raise SharePointError("Not found — the site, library, or folder may have moved")
         if r.status_code == 403:
             raise SharePointError("Access denied — you may not have permission to this library")
+        if r.status_code == 410:
+            raise SharePointError("The library's change token expired (HTTP 410)")
         if not r.ok:
             raise SharePointError(f"SharePoint request failed (HTTP {r.status_code})")
+
+    def _get(self, url: str, params: dict = None) -> dict:
+        """GET a Graph endpoint (absolute or relative), raising SharePointError."""
+        if url.startswith("/"):
+            url = self.graph_url + url
+        token = self.get_token()
+        r = self.session.get(url, headers={"Authorization": f"Bearer {token}"},
+                             params=params, timeout=30)
+        self._check(r)
+        return r.json()
+
+    def _post(self, url: str, payload: dict) -> dict:
+        """POST JSON to a Graph endpoint (absolute or relative)."""
+        if url.startswith("/"):
+            url = self.graph_url + url
+        token = self.get_token()
+        r = self.session.post(url, headers={"Authorization": f"Bearer {token}"},
+                              json=payload, timeout=60)
+        self._check(r)
         return r.json()
 
     def resolve_library_url(self, url: str) -> dict:
@@ -239,43 +294,111 @@ class SharePointClient:
             "library_name": d.get("name", "Documents"),
         } for d in drives]
 
+    @staticmethod
+    def _children_url(drive_id: str, item_id: str) -> str:
+        return f"/drives/{drive_id}/items/{item_id}/children" if item_id != "root" \
+            else f"/drives/{drive_id}/root/children"
+
+    def _follow(self, data: dict, items: list):
+        """Append a children page and every following page to ``items``."""
+        while True:
+            items.extend(_child_entry(it) for it in data.get("value", []))
+            url = data.get("@odata.nextLink")
+            if not url:
+                return
+            data = self._get(url)  # nextLink already carries query params
+
     def list_children(self, drive_id: str, item_id: str = "root") -> list:
         """List a folder's children. Returns dicts:
         {name, id, is_folder, size, modified (ISO str), web_url, child_count}
         """
-        url = f"/drives/{drive_id}/items/{item_id}/children" if item_id != "root" \
-            else f"/drives/{drive_id}/root/children"
         params = {
             "$top": 500,
-            "$select": "id,name,size,lastModifiedDateTime,folder,file,webUrl",
+            "$select": _CHILD_SELECT,
             "$orderby": "name asc",
         }
         items = []
-        while url:
+        self._follow(self._get(self._children_url(drive_id, item_id), params=params), items)
+        return items
+
+    def list_children_batch(self, drive_id: str, item_ids: list) -> dict:
+        """List several folders of one library with Graph ``$batch`` calls.
+
+        Returns {item_id: children} (``list_children`` dicts). Folders whose
+        batched request failed are retried singly; one that still fails is
+        left out of the result.
+        """
+        listings = {}
+        query = f"?$top=500&$select={_CHILD_SELECT}&$orderby=name%20asc"
+        for start in range(0, len(item_ids), BATCH_LIMIT):
+            chunk = item_ids[start:start + BATCH_LIMIT]
+            if len(chunk) == 1:
+                responses = {}
+            else:
+                payload = {"requests": [
+                    {"id": str(i), "method": "GET",
+                     "url": self._children_url(drive_id, item_id) + query}
+                    for i, item_id in enumerate(chunk)]}
+                responses = {r.get("id"): r for r in self._post("/$batch", payload).get("responses", [])}
+            for i, item_id in enumerate(chunk):
+                response = responses.get(str(i))
+                try:
+                    if response is not None and response.get("status") == 200:
+                        items = []
+                        self._follow(response.get("body") or {}, items)
+                    else:  # throttled, failed or not batched
+                        items = self.list_children(drive_id, item_id)
+                except SharePointError as e:
+                    logger.warning(f"SharePoint listing skipped a folder: {e}")
+                    continue
+                listings[item_id] = items
+        return listings
+
+    def get_item_id(self, drive_id: str, item_id: str = "root") -> str:
+        """The real item id for ``item_id`` (resolves the "root" alias)."""
+        if item_id != "root":
+            return item_id
+        return self._get(f"/drives/{drive_id}/root", params={"$select": "id"})["id"]
+
+    def drive_delta(self, drive_id: str, delta_link: str = None, latest: bool = False):
+        """Changes in a library since ``delta_link`` (Graph ``/delta``).
+
+        Returns (changes, new delta link). Each change is a ``list_children``
+        dict plus ``parent_id`` and ``deleted``. With ``latest`` no changes
+        are enumerated — only a delta link for the library as it is now.
+        """
+        if delta_link:
+            url, params = delta_link, None
+        else:
+            url = f"/drives/{drive_id}/root/delta"
+            params = {"$select": _DELTA_SELECT}
+            if latest:
+                params["token"] = "latest"
+        changes = []
+        while True:
             data = self._get(url, params=params)
-            params = None  # nextLink already carries query params
+            params = None
             for it in data.get("value", []):
-                items.append({
-                    "name": it.get("name", ""),
-                    "id": it.get("id", ""),
-                    "is_folder": "folder" in it,
-                    "size": it.get("size", 0) or 0,
-                    "modified": it.get("lastModifiedDateTime", ""),
-                    "web_url": it.get("webUrl", ""),
-                    "child_count": (it.get("folder") or {}).get("childCount", 0),
-                })
+                entry = _child_entry(it)
+                entry["parent_id"] = (it.get("parentReference") or {}).get("id", "")
+                entry["deleted"] = "deleted" in it
+                entry["is_root"] = "root" in it
+                changes.append(entry)
+            if "@odata.deltaLink" in data:
+                return changes, data["@odata.deltaLink"]
             url = data.get("@odata.nextLink")
-        return items
+            if not url:
+                raise SharePointError("SharePoint change feed ended without a delta link")
 
     def download_file(self, drive_id: str, item_id: str, dest_path: Path,
                       progress_cb=None, cancel_cb=None) -> Path:
         """Stream a file's content to dest_path. Returns dest_path."""
         token = self.get_token()
-        url = f"{GRAPH}/drives/{drive_id}/items/{item_id}/content"
+        url = f"{self.graph_url}/drives/{drive_id}/items/{item_id}/content"
         dest_path = Path(dest_path)
         dest_path.parent.mkdir(parents=True, exist_ok=True)
-        with requests.get(url, headers={"Authorization": f"Bearer {token}"},
-                          stream=True, timeout=60) as r:
+        with self.session.get(url, headers={"Authorization": f"Bearer {token}"},
+                              stream=True, timeout=60) as r:
             if not r.ok:
                 raise SharePointError(f"Download failed (HTTP {r.status_code})")
             total = int(r.headers.get("Content-Length", 0) or 0)
@@ -430,11 +553,16 @@ class SharePointDiscoverWorker(QThread):
 
 
 class SharePointDepthScanWorker(QThread):
-    """Recursively scan a SharePoint folder for depth search (one Graph
-    listing call per subfolder). Emits result dicts shaped exactly like the
-    local ``DepthScanWorker`` items so the depth-search UI renders either
-    source, plus ``name``/``web_url`` so SP double-click/open keeps working."""
+    """Scan a SharePoint folder for depth search (see ``sharepoint_scan``).
+
+    Emits result dicts shaped exactly like the local ``DepthScanWorker``
+    items so the depth-search UI renders either source, plus
+    ``name``/``web_url`` so SP double-click/open keeps working. A first
+    scan streams each folder's entries through ``batch_ready``; a revisit
+    is answered from the cached library snapshot.
+    """
     progress = pyqtSignal(int, str)
+    batch_ready = pyqtSignal(list)
     finished = pyqtSignal(list)
 
     def __init__(self, sp_path, depth_level, parent=None):
@@ -442,67 +570,31 @@ class SharePointDepthScanWorker(QThread):
         self.sp_path = sp_path
         self.depth_level = depth_level  # -1 = unlimited ("Max")
         self._cancelled = False
+        self._cancel_event = threading.Event()
+        self._found = 0
 
     def cancel(self):
         self._cancelled = True
+        self._cancel_event.set()
 
     def run(self):
+        from suiteview.file_nav.sharepoint_scan import scan_library
+
         results = []
         try:
-            drive_id, item_id = parse_sp_path(self.sp_path)
-            self._scan(drive_id, item_id, "", 0, results)
+            results = scan_library(self.sp_path, self.depth_level,
+                                   cancel=self._cancel_event, on_items=self._on_items)
         except SharePointError as e:
             logger.error(f"SharePoint depth scan failed: {e}")
         except Exception:
             logger.exception("SharePoint depth scan failed")
         self.finished.emit(results)
 
-    def _scan(self, drive_id, item_id, relative_path, current_depth, results):
-        if self._cancelled:
-            return
-        if self.depth_level != -1 and current_depth >= self.depth_level:
-            return
-        try:
-            entries = get_sharepoint_client().list_children(drive_id, item_id)
-        except SharePointError as e:
-            logger.warning(f"SharePoint depth scan skipped a folder: {e}")
-            return
-
-        folders = []
-        for it in entries:
-            if self._cancelled:
-                return
-            display_name = (f"{relative_path} | {it['name']}"
-                            if relative_path else it["name"])
-            modified = ""
-            if it["modified"]:
-                try:
-                    dt = datetime.fromisoformat(
-                        it["modified"].replace("Z", "+00:00")).astimezone()
-                    modified = dt.strftime("%Y-%m-%d %H:%M")
-                except ValueError:
-                    pass
-            results.append({
-                "path": make_sp_path(drive_id, it["id"]),
-                "display_name": display_name,
-                "is_dir": it["is_folder"],
-                "depth": current_depth + 1,
-                "size": 0 if it["is_folder"] else it["size"],
-                "modified": modified,
-                "accessed": "",  # not available from SharePoint
-                "name": it["name"],
-                "web_url": it["web_url"],
-            })
-            if it["is_folder"] and it["child_count"] > 0:
-                folders.append((it["id"], display_name))
-
+    def _on_items(self, items):
         # One progress tick per folder listed — network calls dominate here
-        self.progress.emit(len(results), f"Scanning depth {current_depth + 1}…")
-
-        if self.depth_level == -1 or current_depth + 1 < self.depth_level:
-            for child_id, child_display in folders:
-                self._scan(drive_id, child_id, child_display,
-                           current_depth + 1, results)
+        self._found += len(items)
+        self.batch_ready.emit(items)
+        self.progress.emit(self._found, f"Scanning depth {items[0]['depth']}…")
 
 
 class SharePointDownloadWorker(QThread):
@@ -0,0 +1,320 @@
+"""
+Concurrent SharePoint depth scan with a cached library snapshot.
+
+``scan_library`` answers FileNav's depth search for an ``sp://`` folder:
+
+* The first scan crawls the folder tree. Folders still to be listed form a
+  work queue; up to ``BATCH_LIMIT`` of them go out as one Graph ``$batch``
+  call, and ``SP_MAX_CONCURRENCY`` such calls run at once over the
+  client's keep-alive session.
+* The tree found is kept as a ``LibrarySnapshot`` (one JSON file per
+  scanned folder under ``~/.suiteview/sp_snapshots/``), together with a
+  ``/delta`` link taken just before the crawl.
+* A later scan asks ``/delta`` for the library's changes since then and
+  applies them to the snapshot. Only folders the changes leave unlisted
+  (new or moved-in folders, and listings that failed) are crawled again.
+
+Items are shaped like the local ``depth_scan`` items, plus ``name`` and
+``web_url`` so SharePoint double-click/open keeps working.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from suiteview.file_nav.sharepoint_client import (
+    BATCH_LIMIT, SP_MAX_CONCURRENCY, SharePointError, get_sharepoint_client,
+    make_sp_path, parse_sp_path,
+)
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_DIR = Path.home() / ".suiteview" / "sp_snapshots"
+SNAPSHOT_VERSION = 1
+
+Item = Dict[str, object]
+ItemsCallback = Optional[Callable[[List[Item]], None]]
+
+
+def snapshot_path_for(sp_path: str) -> Path:
+    """The snapshot file for a scanned ``sp://`` folder."""
+    return SNAPSHOT_DIR / (hashlib.sha1(sp_path.encode("utf-8")).hexdigest()[:20] + ".json")
+
+
+def _covers(scanned_depth: int, depth_level: int) -> bool:
+    return scanned_depth == -1 or (depth_level != -1 and scanned_depth >= depth_level)
+
+
+def _listable(depth: int, depth_level: int) -> bool:
+    """Are the children of a folder at ``depth`` within the scan?"""
+    return depth_level == -1 or depth < depth_level
+
+
+def _scan_item(drive_id: str, entry: dict, display_name: str, depth: int) -> Item:
+    modified = ""
+    if entry["modified"]:
+        try:
+            dt = datetime.fromisoformat(entry["modified"].replace("Z", "+00:00")).astimezone()
+            modified = dt.strftime("%Y-%m-%d %H:%M")
+        except ValueError:
+            pass
+    return {
+        "path": make_sp_path(drive_id, entry["id"]),
+        "display_name": display_name,
+        "is_dir": entry["is_folder"],
+        "depth": depth,
+        "size": 0 if entry["is_folder"] else entry["size"],
+        "modified": modified,
+        "accessed": "",  # not available from SharePoint
+        "name": entry["name"],
+        "web_url": entry["web_url"],
+    }
+
+
+class LibrarySnapshot:
+    """The folder tree under one scanned SharePoint folder.
+
+    ``items`` maps item id to its ``list_children`` dict plus ``parent_id``;
+    ``unlisted`` holds folders whose children are not known yet.
+    """
+
+    def __init__(self, root_id: str, depth_level: int = -1, delta_link: Optional[str] = None):
+        self.root_id = root_id
+        self.depth_level = depth_level
+        self.delta_link = delta_link
+        self.items: Dict[str, dict] = {}
+        self.unlisted: Set[str] = set()
+        self._children: Dict[str, Set[str]] = {}
+
+    # ── Storage ─────────────────────────────────────────────────────
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["LibrarySnapshot"]:
+        try:
+            data = json.loads(Path(path).read_text(encoding="utf-8"))
+            if data.get("version") != SNAPSHOT_VERSION:
+                return None
+            snapshot = cls(data["root_id"], data["depth_level"], data.get("delta_link"))
+            for entry in data["items"]:
+                snapshot._put(entry)
+            snapshot.unlisted = set(data.get("unlisted", []))
+            return snapshot
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring SharePoint snapshot {path}: {e}")
+            return None
+
+    def save(self, path: Path):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": SNAPSHOT_VERSION,
+            "root_id": self.root_id,
+            "depth_level": self.depth_level,
+            "delta_link": self.delta_link,
+            "items": list(self.items.values()),
+            "unlisted": sorted(self.unlisted),
+        }
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def covers(self, depth_level: int) -> bool:
+        return _covers(self.depth_level, depth_level)
+
+    # ── Tree edits ──────────────────────────────────────────────────
+
+    def _put(self, entry: dict):
+        item_id = entry["id"]
+        old = self.items.get(item_id)
+        if old is not None and old["parent_id"] != entry["parent_id"]:
+            self._children.get(old["parent_id"], set()).discard(item_id)
+        self.items[item_id] = entry
+        self._children.setdefault(entry["parent_id"], set()).add(item_id)
+
+    def _drop(self, item_id: str):
+        entry = self.items.pop(item_id, None)
+        if entry is not None:
+            self._children.get(entry["parent_id"], set()).discard(item_id)
+        self.unlisted.discard(item_id)
+        for child_id in list(self._children.pop(item_id, ())):
+            self._drop(child_id)
+
+    def depth_of(self, item_id: str) -> Optional[int]:
+        """Levels below the scanned folder (0 for it), or None if not under it."""
+        depth = 0
+        while item_id != self.root_id:
+            entry = self.items.get(item_id)
+            if entry is None:
+                return None
+            item_id = entry["parent_id"]
+            depth += 1
+        return depth
+
+    def add_listing(self, folder_id: str, children: List[dict]):
+        """Replace a folder's children with a fresh listing."""
+        current = {child["id"] for child in children}
+        for old_id in list(self._children.get(folder_id, ())):
+            if old_id not in current:
+                self._drop(old_id)
+        for child in children:
+            self._put(dict(child, parent_id=folder_id))
+        self.unlisted.discard(folder_id)
+
+    def apply_delta(self, changes: List[dict]) -> Set[str]:
+        """Apply ``/delta`` changes; returns folders that now need listing."""
+        to_list = set()
+        for change in changes:
+            item_id = change["id"]
+            if change["is_root"] or item_id == self.root_id:
+                continue
+            if change["deleted"]:
+                self._drop(item_id)
+                continue
+            parent_id = change["parent_id"]
+            parent_depth = self.depth_of(parent_id)
+            if parent_depth is not None and _listable(parent_depth, self.depth_level):
+                entry = {key: value for key, value in change.items() if key not in ("deleted", "is_root")}
+                is_new = item_id not in self.items
+                self._put(entry)
+                if is_new and entry["is_folder"] and entry["child_count"] > 0:
+                    to_list.add(item_id)
+            elif item_id in self.items:
+                self._drop(item_id)  # moved out of the scanned folder
+        return to_list
+
+    # ── Results ─────────────────────────────────────────────────────
+
+    def results(self, drive_id: str, depth_level: int = -1) -> List[Item]:
+        """Depth-search items down to ``depth_level`` levels (-1 = no limit)."""
+        results: List[Item] = []
+        stack: List[Tuple[str, str, int]] = [(self.root_id, "", 0)]
+        while stack:
+            folder_id, prefix, depth = stack.pop()
+            if not _listable(depth, depth_level):
+                continue
+            children = sorted((self.items[i] for i in self._children.get(folder_id, ())),
+                              key=lambda entry: entry["name"].lower())
+            for entry in children:
+                display_name = f"{prefix} | {entry['name']}" if prefix else entry["name"]
+                results.append(_scan_item(drive_id, entry, display_name, depth + 1))
+                if entry["is_folder"]:
+                    stack.append((entry["id"], display_name, depth + 1))
+        return results
+
+    def display_name(self, item_id: str) -> str:
+        names = []
+        while item_id != self.root_id and item_id in self.items:
+            names.append(self.items[item_id]["name"])
+            item_id = self.items[item_id]["parent_id"]
+        return " | ".join(reversed(names))
+
+
+def crawl(client, drive_id: str, snapshot: LibrarySnapshot, folders: List[Tuple[str, int]],
+          depth_level: int = -1, max_workers: int = SP_MAX_CONCURRENCY,
+          cancel: Optional[threading.Event] = None, on_items: ItemsCallback = None) -> bool:
+    """List ``folders`` ((id, depth) pairs) and everything below them into ``snapshot``.
+
+    Sibling folders are listed ``BATCH_LIMIT`` at a time per ``$batch``
+    call, with up to ``max_workers`` calls in flight. ``on_items`` gets each
+    folder's entries as its listing arrives. Returns False when cancelled.
+    """
+    queue = deque((folder_id, depth) for folder_id, depth in folders
+                  if _listable(depth, depth_level))
+    names = {folder_id: snapshot.display_name(folder_id) for folder_id, _ in queue}
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers),
+                            thread_name_prefix="sp-scan") as pool:
+        pending = {}
+        while queue or pending:
+            while queue and len(pending) < max_workers:
+                chunk = [queue.popleft() for _ in range(min(BATCH_LIMIT, len(queue)))]
+                future = pool.submit(client.list_children_batch, drive_id,
+                                     [folder_id for folder_id, _ in chunk])
+                pending[future] = chunk
+            done, _ = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
+            if cancel is not None and cancel.is_set():
+                for future in pending:
+                    future.cancel()
+                return False
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    listings = future.result()
+                except SharePointError as e:
+                    logger.warning(f"SharePoint depth scan skipped {len(chunk)} folders: {e}")
+                    listings = {}
+                for folder_id, depth in chunk:
+                    children = listings.get(folder_id)
+                    if children is None:
+                        snapshot.unlisted.add(folder_id)  # retried on the next scan
+                        continue
+                    snapshot.add_listing(folder_id, children)
+                    prefix = names.pop(folder_id, "")
+                    items = []
+                    for child in children:
+                        display_name = f"{prefix} | {child['name']}" if prefix else child["name"]
+                        items.append(_scan_item(drive_id, child, display_name, depth + 1))
+                        if (child["is_folder"] and child["child_count"] > 0
+                                and _listable(depth + 1, depth_level)):
+                            names[child["id"]] = display_name
+                            queue.append((child["id"], depth + 1))
+                    if items and on_items is not None:
+                        on_items(items)
+    return True
+
+
+def scan_library(sp_path: str, depth_level: int = -1, client=None,
+                 cancel: Optional[threading.Event] = None, on_items: ItemsCallback = None,
+                 snapshot_path: Optional[Path] = None,
+                 max_workers: int = SP_MAX_CONCURRENCY) -> List[Item]:
+    """Every item under an ``sp://`` folder down to ``depth_level`` levels.
+
+    A stored snapshot covering ``depth_level`` is brought up to date through
+    ``/delta``; otherwise the folder is crawled (``on_items`` then gets the
+    entries as they arrive). A cancelled scan returns what it has and
+    leaves the stored snapshot as it was.
+    """
+    client = client or get_sharepoint_client()
+    drive_id, item_id = parse_sp_path(sp_path)
+    path = Path(snapshot_path) if snapshot_path is not None else snapshot_path_for(sp_path)
+
+    snapshot = LibrarySnapshot.load(path)
+    to_list = None
+    delta_link = None
+    if snapshot is not None and snapshot.covers(depth_level) and snapshot.delta_link:
+        try:
+            changes, delta_link = client.drive_delta(drive_id, snapshot.delta_link)
+            to_list = snapshot.apply_delta(changes) | snapshot.unlisted
+            on_items = None  # results are mostly known: no partial display
+        except SharePointError as e:
+            logger.info(f"SharePoint snapshot refresh failed, rescanning: {e}")
+    if to_list is None:
+        try:
+            delta_link = client.drive_delta(drive_id, latest=True)[1]
+        except SharePointError as e:
+            logger.info(f"SharePoint change feed unavailable, scan will not be cached: {e}")
+            delta_link = None
+        snapshot = LibrarySnapshot(client.get_item_id(drive_id, item_id), depth_level)
+        to_list = {snapshot.root_id}
+
+    folders = [(folder_id, depth) for folder_id in to_list
+               if (depth := snapshot.depth_of(folder_id)) is not None]
+    completed = crawl(client, drive_id, snapshot, folders, snapshot.depth_level,
+                      max_workers, cancel, on_items)
+    if completed and delta_link:
+        snapshot.delta_link = delta_link
+        try:
+            snapshot.save(path)
+        except OSError as e:
+            logger.warning(f"Could not save SharePoint snapshot: {e}")
+    return snapshot.results(drive_id, depth_level)
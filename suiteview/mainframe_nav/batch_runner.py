@@ -0,0 +1,267 @@
+"""
+Headless TN3270 batch screen-scrape runner
+
+Looks up a list of keys (policy numbers, usually) on host screens without
+the interactive terminal. A script is a list of steps — ``Type`` text into
+a field, ``Press`` an AID key and wait for the host's answer, ``WaitFor``
+text, ``Extract`` a screen area — run once per key, with ``{key}`` and any
+``variables`` substituted into typed text. ``setup`` steps (sign-on and
+region navigation) run once per session, and ``recover`` steps after a key
+fails. Keys are shared out over one or more concurrent sessions and the
+extracted fields come back as a DataFrame, one row per key in input order.
+
+Each session owns a ``TN3270Client`` and reads its own records, so a step
+ends as soon as the host unlocks the keyboard. Pure Python — no PyQt.
+
+Example::
+
+    script = [
+        Type("62D2,{key}  ;newco={company};."),
+        Press("enter", wait_for="POLICY"),
+        Extract("status", row=4, col=20, length=10),
+        ExtractAfter("owner", "OWNER:", length=30),
+    ]
+    frame = run_batch(host, 992, keys, script, setup=signon, sessions=3,
+                      variables={"company": "01"}, use_ssl=True, csv_path="out.csv")
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Union
+
+import pandas as pd
+
+from suiteview.mainframe_nav.tn3270 import AID, Screen, TN3270Client, screen_has_text
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for the host to answer a key or show expected text
+STEP_TIMEOUT = 10.0
+
+_AIDS = {"enter": AID.ENTER, "clear": AID.CLEAR, "pa1": AID.PA1, "pa2": AID.PA2, "pa3": AID.PA3}
+_AIDS.update({f"pf{n}": getattr(AID, f"PF{n}") for n in range(1, 25)})
+
+
+class ScreenScriptError(Exception):
+    """A script step could not be carried out on the current screen."""
+
+
+@dataclass
+class Type:
+    """Type text into the field at row/col, or into the first input field"""
+    text: str
+    row: Optional[int] = None
+    col: Optional[int] = None
+    clear: bool = True  # blank the rest of the field, like Erase EOF
+
+
+@dataclass
+class Press:
+    """Send an AID key ("enter", "clear", "pf1".."pf24", "pa1".."pa3") and wait for the answer"""
+    key: str
+    wait_for: Optional[str] = None  # text the answer must show
+    timeout: Optional[float] = None
+
+
+@dataclass
+class WaitFor:
+    """Wait for text anywhere, on a row, or exactly at row/col"""
+    text: str
+    row: Optional[int] = None
+    col: Optional[int] = None
+    timeout: Optional[float] = None
+
+
+@dataclass
+class Extract:
+    """Read ``length`` characters at row/col into column ``name``"""
+    name: str
+    row: int
+    col: int
+    length: int
+
+
+@dataclass
+class ExtractAfter:
+    """Read ``length`` characters following ``label`` into column ``name``"""
+    name: str
+    label: str
+    length: int
+    offset: int = 0  # characters skipped between label and value
+
+
+Step = Union[Type, Press, WaitFor, Extract, ExtractAfter]
+
+
+class ScreenSession:
+    """Runs script steps on one connected client."""
+
+    def __init__(self, client: TN3270Client, timeout: float = STEP_TIMEOUT):
+        self.client = client
+        self.timeout = timeout
+        self.typed_chars: Dict[int, str] = {}
+
+    @property
+    def screen(self) -> Screen:
+        return self.client.screen
+
+    def wait_until(self, predicate: Callable[[Screen], bool], timeout: Optional[float] = None) -> bool:
+        """Read host records until the keyboard is unlocked and predicate holds."""
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while not (not self.client.keyboard_locked and predicate(self.screen)):
+            if time.monotonic() >= deadline or not self.client.connected:
+                return False
+            self.client.receive_screen()
+        return True
+
+    def type_text(self, text: str, row: Optional[int] = None, col: Optional[int] = None, clear: bool = True):
+        screen = self.screen
+        if row is None:
+            inputs = sorted(screen.get_input_fields(), key=lambda f: f.address)
+            if not inputs:
+                raise ScreenScriptError("No input field on screen")
+            target = inputs[0]
+            address = target.address + 1
+        else:
+            address = row * screen.cols + (col or 0)
+            target = screen.field_at(address)
+            if target is None or target.protected:
+                raise ScreenScriptError(f"No input field at row {row}, col {col or 0}")
+        end = screen.field_end(target)
+        if address + len(text) > end:
+            raise ScreenScriptError(f"'{text}' does not fit the field at address {address}")
+        if clear:
+            for addr in range(address, end):
+                self.typed_chars[addr] = ' '
+        for i, char in enumerate(text):
+            self.typed_chars[address + i] = char
+
+    def press(self, key: str, wait_for: Optional[str] = None, timeout: Optional[float] = None):
+        aid = _AIDS.get(key.lower())
+        if aid is None:
+            raise ScreenScriptError(f"Unknown key '{key}'")
+        modified = self.screen.modified_fields(self.typed_chars) if self.typed_chars else None
+        self.typed_chars = {}
+        count = self.client.screen_count
+        self.client.send_aid(aid, modified)
+        if not self.wait_until(lambda screen: self.client.screen_count > count
+                               and (wait_for is None or screen_has_text(screen, wait_for)), timeout):
+            expected = f" showing '{wait_for}'" if wait_for else ""
+            raise ScreenScriptError(f"No answer to {key.upper()}{expected}")
+
+    def run(self, steps: Sequence[Step], variables: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Run steps and return the extracted values by column name."""
+        variables = variables or {}
+        values = {}
+        for step in steps:
+            if isinstance(step, Type):
+                self.type_text(step.text.format_map(variables), step.row, step.col, step.clear)
+            elif isinstance(step, Press):
+                wait_for = step.wait_for.format_map(variables) if step.wait_for else None
+                self.press(step.key, wait_for, step.timeout)
+            elif isinstance(step, WaitFor):
+                text = step.text.format_map(variables)
+                if not self.wait_until(lambda screen: screen_has_text(screen, text, step.row, step.col),
+                                       step.timeout):
+                    raise ScreenScriptError(f"'{text}' did not appear")
+            elif isinstance(step, Extract):
+                values[step.name] = self.screen.get_string_at(step.row, step.col, step.length).strip()
+            elif isinstance(step, ExtractAfter):
+                found = self.screen.find_text(step.label)
+                if found is None:
+                    values[step.name] = ""
+                    continue
+                row, col = found
+                address = row * self.screen.cols + col + len(step.label) + step.offset
+                values[step.name] = ''.join(self.screen.buffer[address:address + step.length]).strip()
+            else:
+                raise ScreenScriptError(f"Unknown step {step!r}")
+        return values
+
+
+def run_batch(host: str, port: int, keys: Iterable[str], script: Sequence[Step],
+              setup: Sequence[Step] = (), recover: Sequence[Step] = (),
+              sessions: int = 1, use_ssl: bool = False, variables: Optional[Dict[str, str]] = None,
+              timeout: float = STEP_TIMEOUT, terminal_type: str = "IBM-3278-2-E",
+              on_result: Optional[Callable[[Dict], None]] = None,
+              cancel: Optional[threading.Event] = None,
+              csv_path: Optional[Union[str, Path]] = None) -> pd.DataFrame:
+    """
+    Run ``script`` for every key over up to ``sessions`` concurrent connections
+
+    A session that cannot be set up (or whose ``recover`` steps fail after
+    a key errors) is dropped and reconnected for its next key. ``on_result``
+    is called from the worker threads with each row as it completes.
+
+    Returns:
+        DataFrame with a ``key`` column, one column per extracted name and
+        an ``error`` column ("" on success), in ``keys`` order; also written
+        to ``csv_path`` when given
+    """
+    keys = list(keys)
+    cancel = cancel or threading.Event()
+    pending: "queue.Queue[int]" = queue.Queue()
+    for idx in range(len(keys)):
+        pending.put(idx)
+    rows: Dict[int, Dict] = {}
+    columns: List[str] = [step.name for step in script if isinstance(step, (Extract, ExtractAfter))]
+
+    def connect() -> ScreenSession:
+        client = TN3270Client(host, port, use_ssl=use_ssl)
+        client.terminal_type = terminal_type
+        if not client.connect():
+            raise ScreenScriptError(f"Could not connect to {host}:{port}")
+        session = ScreenSession(client, timeout)
+        try:
+            session.run(setup, dict(variables or {}))
+        except Exception:
+            client.disconnect()
+            raise
+        return session
+
+    def worker():
+        session = None
+        while not cancel.is_set():
+            try:
+                idx = pending.get_nowait()
+            except queue.Empty:
+                break
+            key = keys[idx]
+            row = {"key": key}
+            try:
+                if session is None:
+                    session = connect()
+                row.update(session.run(script, {**(variables or {}), "key": key}))
+                row["error"] = ""
+            except Exception as e:
+                logger.warning(f"Batch lookup of {key} failed: {e}")
+                row["error"] = str(e)
+                if session is not None:
+                    try:
+                        session.typed_chars = {}
+                        session.run(recover, {**(variables or {}), "key": key})
+                    except Exception as recover_error:
+                        logger.warning(f"Recovery after {key} failed, reconnecting: {recover_error}")
+                        session.client.disconnect()
+                        session = None
+            rows[idx] = row
+            if on_result:
+                on_result(row)
+        if session is not None:
+            session.client.disconnect()
+
+    workers = max(1, min(sessions, len(keys)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tn3270-batch") as executor:
+        for future in [executor.submit(worker) for _ in range(workers)]:
+            future.result()
+
+    frame = pd.DataFrame([rows[idx] for idx in sorted(rows)], columns=["key", *columns, "error"])
+    frame = frame.fillna("")
+    if csv_path is not None:
+        frame.to_csv(csv_path, index=False)
+    return frame
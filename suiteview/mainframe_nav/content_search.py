@@ -0,0 +1,217 @@
+"""
+Content search across mainframe datasets
+
+Members are fanned out over an ``FTPSessionPool`` and each one is streamed
+line by line through patterns compiled once per search, so a hit is
+reported as soon as its member has been read and a member stops
+transferring once every search string has all the matches that are kept.
+Members held in a ``MainframeMirror`` are searched from disk, which also
+works offline.
+"""
+
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from suiteview.core.ftp_manager import FTPSessionPool
+from suiteview.core.mainframe_mirror import MainframeMirror
+
+logger = logging.getLogger(__name__)
+
+# Matching lines kept per search string per dataset
+MAX_MATCHES_PER_STRING = 10
+
+# Lines read between cancel checks
+CANCEL_CHECK_LINES = 1000
+
+
+def compile_search_patterns(search_strings: List[str], case_sensitive: bool = False,
+                            whole_word: bool = False) -> List[Tuple[str, Pattern]]:
+    """
+    Compile each search string, where ``*`` matches any run and ``?`` one character
+
+    Returns:
+        List of (search string, compiled regex) in input order
+    """
+    flags = 0 if case_sensitive else re.IGNORECASE
+    patterns = []
+    for search_str in search_strings:
+        pattern = re.escape(search_str).replace(r'\*', '.*').replace(r'\?', '.')
+        if whole_word:
+            pattern = r'\b' + pattern + r'\b'
+        patterns.append((search_str, re.compile(pattern, flags)))
+    return patterns
+
+
+def search_lines(lines: Iterable[str], patterns: List[Tuple[str, Pattern]],
+                 max_matches: int = MAX_MATCHES_PER_STRING,
+                 cancel: Optional[threading.Event] = None) -> Tuple[List[Dict], int]:
+    """
+    Match streamed lines against compiled patterns
+
+    Stops reading once every pattern has ``max_matches`` matches (or
+    ``cancel`` is set), so the caller can abandon the rest of the source.
+    Lines are first tested against all patterns combined, and only a line
+    that hits is tested pattern by pattern.
+
+    Returns:
+        (match groups as {'search_string', 'matches': [{'line_number',
+        'line_content'}]} for strings that matched, lines read)
+    """
+    if not patterns:
+        return [], 0
+    flags = patterns[0][1].flags
+    combined = re.compile('|'.join(f'(?:{regex.pattern})' for _, regex in patterns), flags)
+    found = [[] for _ in patterns]
+    remaining = len(patterns)
+    line_num = 0
+    for line_num, line in enumerate(lines, 1):
+        if cancel is not None and line_num % CANCEL_CHECK_LINES == 0 and cancel.is_set():
+            break
+        if not combined.search(line):
+            continue
+        for matches, (_, regex) in zip(found, patterns):
+            if len(matches) < max_matches and regex.search(line):
+                matches.append({'line_number': line_num, 'line_content': line.strip()})
+                if len(matches) == max_matches:
+                    remaining -= 1
+        if remaining == 0:
+            break
+    groups = [{'search_string': search_str, 'matches': matches}
+              for matches, (search_str, _) in zip(found, patterns) if matches]
+    return groups, line_num
+
+
+def search_datasets(pool: Optional[FTPSessionPool], datasets: List[Dict], patterns: List[Tuple[str, Pattern]],
+                    cancel: Optional[threading.Event] = None,
+                    on_result: Optional[Callable[[Dict], None]] = None,
+                    on_progress: Optional[Callable[[str, int, int], None]] = None,
+                    mirror: Optional[MainframeMirror] = None) -> Dict[str, List]:
+    """
+    Search dataset/member contents over every session of ``pool``
+
+    With a ``mirror``, members whose mirrored copy is current are searched
+    from disk and members read to the end are mirrored. With no ``pool``
+    the search runs offline against whatever the mirror holds, and
+    members not mirrored are skipped.
+
+    ``on_result`` is called with each dataset's result as soon as it has
+    matches, and ``on_progress`` with (name, datasets done, total) as each
+    finishes; both may be called from the pool's worker threads.
+
+    Returns:
+        Dict with results (in ``datasets`` order), errors and skipped
+    """
+    cancel = cancel or threading.Event()
+    total = len(datasets)
+    results: Dict[int, Dict] = {}
+    errors: List[str] = []
+    skipped: List[str] = []
+    lock = threading.Lock()
+    done = 0
+
+    def finished(idx, dataset_info, groups, line_count):
+        nonlocal done
+        member_name = dataset_info['name']
+        if not line_count:
+            with lock:
+                skipped.append(f"{member_name} (empty or no content)")
+        elif groups and not cancel.is_set():
+            result = {'dataset': member_name, 'full_path': dataset_info['full_path'], 'matches': groups}
+            with lock:
+                results[idx] = result
+            if on_result:
+                on_result(result)
+        with lock:
+            done += 1
+            count = done
+        if on_progress:
+            on_progress(member_name, count, total)
+
+    def failed(idx, dataset_info, message):
+        with lock:
+            errors.append(f"{dataset_info['name']}: {message}")
+        finished(idx, dataset_info, [], 1)
+
+    def search_one(idx, dataset_info):
+        member_name = dataset_info['name']
+        full_path = dataset_info['full_path']
+        if cancel.is_set():
+            return
+        # Keep the lines for the mirror when the member has ISPF statistics
+        kept = None
+        if mirror is not None:
+            try:
+                kept = [] if mirror.stats_for(full_path) else None
+            except Exception as e:
+                logger.warning(f"Mirror unavailable for {full_path}: {e}")
+        complete = False
+
+        def read(lines):
+            nonlocal complete
+            for line in lines:
+                kept.append(line)
+                yield line
+            complete = True
+
+        try:
+            with pool.session() as ftp:
+                lines = ftp.iter_dataset_lines(full_path)
+                try:
+                    groups, line_count = search_lines(lines if kept is None else read(lines),
+                                                      patterns, cancel=cancel)
+                finally:
+                    lines.close()
+        except Exception as e:
+            logger.error(f"Error searching {member_name}: {e}")
+            failed(idx, dataset_info, e)
+            return
+        if complete:
+            try:
+                mirror.put_member(full_path, kept)
+            except Exception as e:
+                logger.warning(f"Could not mirror {full_path}: {e}")
+        finished(idx, dataset_info, groups, line_count)
+
+    work = []
+    for idx, dataset_info in enumerate(datasets):
+        if cancel.is_set():
+            break
+        # PO datasets can't be read directly, only their members
+        if dataset_info.get('dsorg', '') == 'PO':
+            skipped.append(f"{dataset_info['name']} (PO dataset - cannot read directly)")
+            finished(idx, dataset_info, [], 1)
+            continue
+        if mirror is not None:
+            try:
+                mirrored = mirror.member_lines(dataset_info['full_path'], current_only=pool is not None)
+            except Exception as e:
+                logger.warning(f"Mirror unavailable for {dataset_info['full_path']}: {e}")
+                mirrored = None
+            if mirrored is not None:
+                groups, line_count = search_lines(mirrored, patterns, cancel=cancel)
+                finished(idx, dataset_info, groups, line_count)
+                continue
+        if pool is None:
+            skipped.append(f"{dataset_info['name']} (not in local mirror)")
+            finished(idx, dataset_info, [], 1)
+            continue
+        work.append((idx, dataset_info))
+
+    if work and not cancel.is_set():
+        # One login up front, so bad credentials fail once rather than per member
+        try:
+            with pool.session():
+                pass
+        except Exception as e:
+            logger.error(f"Could not open an FTP search session: {e}")
+            errors.append(f"Could not open an FTP search session: {e}")
+            return {'results': [results[idx] for idx in sorted(results)], 'errors': errors, 'skipped': skipped}
+        with ThreadPoolExecutor(max_workers=min(pool.max_sessions, len(work)),
+                                thread_name_prefix="ftp-search") as executor:
+            for future in [executor.submit(search_one, idx, info) for idx, info in work]:
+                future.result()
+
+    return {'results': [results[idx] for idx in sorted(results)], 'errors': errors, 'skipped': skipped}
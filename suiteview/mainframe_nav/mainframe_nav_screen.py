@@ -10,7 +10,13 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QThread, pyqtSignal
 from PyQt6.QtGui import QFont
+import functools
 import logging
+import threading
+
+from suiteview.core.ftp_manager import FTP_MAX_SESSIONS, FTPSessionPool, describe_total
+from suiteview.core.mainframe_mirror import MainframeMirror
+from suiteview.mainframe_nav.content_search import compile_search_patterns, search_datasets
 
 logger = logging.getLogger(__name__)
 
@@ -50,11 +56,13 @@ class FTPConnectionThread(QThread):
 
 
 class ContentSearchThread(QThread):
-    """Background thread for searching dataset content"""
+    """Background thread for searching dataset content over a pool of FTP sessions"""
     progress_update = pyqtSignal(str, int, int)  # message, current, total
+    result_found = pyqtSignal(object)  # One dataset's result, as soon as it has matches
     search_complete = pyqtSignal(object)  # Search results dict with results, errors, skipped
     
-    def __init__(self, ftp_manager, datasets, search_strings, case_sensitive, whole_word, current_dataset):
+    def __init__(self, ftp_manager, datasets, search_strings, case_sensitive, whole_word, current_dataset,
+                 max_sessions=FTP_MAX_SESSIONS, offline=False):
         super().__init__()
         self.ftp_manager = ftp_manager
         self.datasets = datasets
@@ -62,92 +70,29 @@ class ContentSearchThread(QThread):
         self.case_sensitive = case_sensitive
         self.whole_word = whole_word
         self.current_dataset = current_dataset
-        self._is_cancelled = False
+        self.max_sessions = max_sessions
+        self.offline = offline  # Search only the local mirror, without the host
+        self._cancel_event = threading.Event()
     
     def cancel(self):
         """Cancel the search"""
-        self._is_cancelled = True
+        self._cancel_event.set()
     
     def run(self):
         """Search through datasets"""
-        import re
-        results = []
-        errors = []
-        skipped = []
-        total = len(self.datasets)
-        
-        for idx, dataset_info in enumerate(self.datasets):
-            if self._is_cancelled:
-                break
-            
-            member_name = dataset_info['name']
-            full_path = dataset_info['full_path']
-            dsorg = dataset_info.get('dsorg', '')
-            
-            self.progress_update.emit(f"Searching {member_name}...", idx + 1, total)
-            
-            # Skip PO datasets - they can't be read directly, only their members
-            if dsorg == 'PO':
-                skipped.append(f"{member_name} (PO dataset - cannot read directly)")
-                continue
-            
-            try:
-                # Read dataset content
-                content, total_lines = self.ftp_manager.read_dataset(full_path, max_lines=None)
-                
-                if not content:
-                    skipped.append(f"{member_name} (empty or no content)")
-                    continue
-                
-                # Search for each string
-                dataset_matches = []
-                for search_str in self.search_strings:
-                    # Convert wildcard pattern to regex
-                    pattern = re.escape(search_str)
-                    pattern = pattern.replace(r'\*', '.*').replace(r'\?', '.')
-                    
-                    # Add word boundaries if whole word search
-                    if self.whole_word:
-                        pattern = r'\b' + pattern + r'\b'
-                    
-                    # Compile regex
-                    flags = 0 if self.case_sensitive else re.IGNORECASE
-                    regex = re.compile(pattern, flags)
-                    
-                    # Search each line
-                    matches = []
-                    for line_num, line in enumerate(content.split('\n'), 1):
-                        if regex.search(line):
-                            matches.append({
-                                'line_number': line_num,
-                                'line_content': line.strip()
-                            })
-                    
-                    if matches:
-                        dataset_matches.append({
-                            'search_string': search_str,
-                            'matches': matches[:10]  # Limit to first 10 matches per string
-                        })
-                
-                if dataset_matches:
-                    results.append({
-                        'dataset': member_name,
-                        'full_path': full_path,
-                        'matches': dataset_matches
-                    })
-                    
-            except Exception as e:
-                error_msg = str(e)
-                logger.error(f"Error searching {member_name}: {error_msg}")
-                errors.append(f"{member_name}: {error_msg}")
-                continue
-        
-        # Include error/skip info in results
-        self.search_complete.emit({
-            'results': results,
-            'errors': errors,
-            'skipped': skipped
-        })
+        patterns = compile_search_patterns(self.search_strings, self.case_sensitive, self.whole_word)
+        mirror = getattr(self.ftp_manager, 'mirror', None)
+        search = functools.partial(
+            search_datasets, datasets=self.datasets, patterns=patterns, cancel=self._cancel_event,
+            on_result=self.result_found.emit,
+            on_progress=lambda name, done, total: self.progress_update.emit(f"Searched {name}...", done, total),
+            mirror=mirror)
+        if self.offline:
+            outcome = search(None)
+        else:
+            with FTPSessionPool(self.ftp_manager, self.max_sessions) as pool:
+                outcome = search(pool)
+        self.search_complete.emit(outcome)
 
 
 class MainframeNavScreen(QWidget):
@@ -515,6 +460,16 @@ class MainframeNavScreen(QWidget):
         """)
         content_header_layout.addWidget(self.up_button)
         
+        self.refresh_button = QToolButton()
+        self.refresh_button.setText("⟳")
+        self.refresh_button.setToolTip("Refresh (F5) - list again from the mainframe")
+        self.refresh_button.setShortcut("F5")
+        self.refresh_button.setEnabled(False)
+        self.refresh_button.setAutoRaise(True)
+        self.refresh_button.clicked.connect(self.refresh_current_dataset)
+        self.refresh_button.setStyleSheet(self.up_button.styleSheet())
+        content_header_layout.addWidget(self.refresh_button)
+        
         # Breadcrumb navigation with clickable path input
         self.breadcrumb_container = QWidget()
         self.breadcrumb_container.setStyleSheet("""
@@ -1049,6 +1004,8 @@ class MainframeNavScreen(QWidget):
     def on_connection_success(self, ftp_manager):
         """Handle successful FTP connection"""
         self.ftp_manager = ftp_manager
+        # Listings and unchanged members are served from the local mirror
+        ftp_manager.mirror = MainframeMirror(ftp_manager.host, ftp_manager.username)
         # Clear cache on new connection
         self.folder_cache.clear()
         self.status_label.setText("✓ Connected to mainframe")
@@ -1355,8 +1312,12 @@ class MainframeNavScreen(QWidget):
         """DEPRECATED - kept for compatibility but no longer used"""
         pass
     
-    def load_members(self, dataset_path):
-        """Load members/files for the selected dataset"""
+    def load_members(self, dataset_path, refresh=False):
+        """Load members/files for the selected dataset
+        
+        ``refresh`` lists from the host, bypassing this screen's folder cache
+        and the connection's mirror.
+        """
         try:
             # Check if FTP connection is still alive
             if not self.ftp_manager or not self.ftp_manager.is_alive():
@@ -1393,12 +1354,13 @@ class MainframeNavScreen(QWidget):
             # Always try to list members (files) in the dataset from FTP
             try:
                 # Check cache first
-                if dataset_path in self.folder_cache:
+                if dataset_path in self.folder_cache and not refresh:
                     logger.info(f"Using cached data for {dataset_path}")
                     members = self.folder_cache[dataset_path]
                 else:
                     logger.info(f"Fetching data from FTP for {dataset_path}")
-                    members = self.ftp_manager.list_datasets(dataset_path)
+                    self.folder_cache.pop(dataset_path, None)
+                    members = self.ftp_manager.list_datasets(dataset_path, refresh=refresh)
                     # Store in cache
                     if members:
                         self.folder_cache[dataset_path] = members
@@ -1930,6 +1892,11 @@ class MainframeNavScreen(QWidget):
             self.navigate_to_dataset(parent_path)
         # If already at root (only one segment), do nothing
     
+    def refresh_current_dataset(self):
+        """List the current dataset again from the mainframe"""
+        if self.current_dataset:
+            self.load_members(self.current_dataset, refresh=True)
+    
     def update_navigation_buttons(self):
         """Update enabled state of navigation buttons"""
         # Back button enabled if there's history to go back to
@@ -1943,6 +1910,7 @@ class MainframeNavScreen(QWidget):
         # Up button enabled if not at root level (more than one segment)
         has_parent = self.current_dataset and len(self.current_dataset.split('.')) > 1
         self.up_button.setEnabled(has_parent)
+        self.refresh_button.setEnabled(bool(self.current_dataset))
     
     def on_connection_list_item_clicked(self, item):
         """Handle click on connection in list - load its dataset"""
@@ -2128,8 +2096,9 @@ class MainframeNavScreen(QWidget):
             self.status_label.setText(f"Loading {member_name}...")
             self.status_label.setStyleSheet("color: #3498db; font-style: italic; padding: 2px; font-size: 11px;")
             
-            # Read first 1000 rows
-            content, line_count = self.ftp_manager.read_dataset(member_path, max_lines=1000)
+            # Read first 1000 rows (the rest is never transferred)
+            preview = self.ftp_manager.preview_dataset(member_path, max_lines=1000)
+            content, line_count = preview['content'], preview['lines']
             
             # Check if connection is still alive after read attempt
             if line_count == 0 and len(content) == 0:
@@ -2190,7 +2159,7 @@ class MainframeNavScreen(QWidget):
             layout = QVBoxLayout(dialog)
             
             # Info label
-            info_label = QLabel(f"Showing first 1000 lines of {member_name} (Total: {line_count} lines)")
+            info_label = QLabel(f"Showing first {line_count} lines of {member_name} (Total: {describe_total(preview)})")
             info_label.setStyleSheet("font-weight: bold; padding: 4px; background-color: #e8f4f8;")
             layout.addWidget(info_label)
             
@@ -2255,7 +2224,7 @@ class MainframeNavScreen(QWidget):
                         edit_btn.setText("✏️ Edit")
                         save_btn.setVisible(False)
                         load_all_btn.setEnabled(True)
-                        info_label.setText(f"Showing first 1000 lines of {member_name} (Total: {line_count} lines)")
+                        info_label.setText(f"Showing first {line_count} lines of {member_name} (Total: {describe_total(preview)})")
                 else:
                     # Enter edit mode
                     text_edit.setReadOnly(False)
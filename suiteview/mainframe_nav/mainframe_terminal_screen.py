@@ -7,7 +7,7 @@ import logging
 import time
 import socket
 import ssl
-from typing import List
+from typing import Callable, List
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit, 
                               QPushButton, QLabel, QLineEdit, QComboBox,
                               QGroupBox, QGridLayout, QMessageBox, QFrame,
@@ -19,7 +19,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTextEdit,
 from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QEventLoop, QUrl
 from PyQt6.QtGui import QFont, QTextCursor, QColor, QTextCharFormat, QKeyEvent, QDesktopServices
 
-from suiteview.mainframe_nav.tn3270 import TN3270Client, Screen, AID
+from suiteview.mainframe_nav.tn3270 import TN3270Client, Screen, AID, screen_has_text
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,15 @@ class TerminalWidget(QTextEdit):
     pf_key_pressed = pyqtSignal(int)  # PF key number
     clear_pressed = pyqtSignal()  # Clear key
     
+    # Foreground per field style (protected, intensified), matching typical 3270 terminal colors
+    STYLE_COLORS = {
+        None: "#00FF00",            # Before the first field
+        (True, True): "#FFFF00",    # Intensified protected (headers, titles)
+        (True, False): "#00FFFF",   # Normal protected (labels)
+        (False, True): "#FFFFFF",   # Intensified input
+        (False, False): "#00FF00",  # Normal input
+    }
+    
     def __init__(self):
         super().__init__()
         
@@ -107,6 +116,18 @@ class TerminalWidget(QTextEdit):
         self.input_fields = []  # List of (start_addr, length, content)
         self.current_field_index = -1
         
+        # Screen updates repaint only dirty rows, so the edits must not pile up as undo history
+        self.setUndoRedoEnabled(False)
+        self._formats = {}
+        for style, color in self.STYLE_COLORS.items():
+            fmt = QTextCharFormat()
+            fmt.setForeground(QColor(color))
+            self._formats[style] = fmt
+        self._rendered_screen = None  # Screen the document currently shows
+        self._rendering = False
+        self._edited_rows = set()  # Rows changed by typing/autofill since the last screen
+        self.document().contentsChange.connect(self._on_contents_change)
+        
     def keyPressEvent(self, event: QKeyEvent):
         """Handle keyboard input"""
         key = event.key()
@@ -377,76 +398,23 @@ class TerminalWidget(QTextEdit):
         return fields
     
     def display_screen(self, screen: Screen):
-        """Display 3270 screen content with color support based on field attributes"""
-        # Save cursor position before update
-        old_cursor = self.textCursor().position()
-        
-        self.clear()
-        
+        """Display 3270 screen content, repainting only the rows that changed"""
         # Clear typed characters buffer on new screen
         self.typed_chars = {}
         
         self.screen_content = screen.get_text()
-        self.last_screen = screen
-        
-        cursor = self.textCursor()
-        
-        # Color definitions matching typical 3270 terminal colors
-        colors = {
-            'green': QColor("#00FF00"),      # Normal unprotected
-            'yellow': QColor("#FFFF00"),     # Intensified/highlighted  
-            'red': QColor("#FF6B6B"),        # Error messages
-            'cyan': QColor("#00FFFF"),       # Protected fields (labels)
-            'white': QColor("#FFFFFF"),      # High intensity protected
-            'blue': QColor("#6699FF"),       # Blue fields
-        }
         
-        # Build a color map for each position based on fields
-        # Sort fields by address to process in order
-        sorted_fields = sorted(screen.fields, key=lambda f: f.address)
+        dirty = screen.take_dirty_rows()
+        if screen is not self._rendered_screen or self.document().blockCount() != screen.rows:
+            dirty = set(range(screen.rows))
+        # Rows the user typed into show text the host never sent
+        dirty.update(row for row in self._edited_rows if row < screen.rows)
+        self._edited_rows.clear()
         
-        # Default format (green for input areas)
-        default_format = QTextCharFormat()
-        default_format.setForeground(colors['green'])
-        
-        # Process screen character by character with colors
-        for row in range(screen.rows):
-            for col in range(screen.cols):
-                addr = row * screen.cols + col
-                char = screen.buffer[addr]
-                
-                # Determine color based on which field this position belongs to
-                char_format = QTextCharFormat()
-                char_format.setForeground(colors['green'])  # default
-                
-                # Find the field this character belongs to
-                current_field = None
-                for f in sorted_fields:
-                    if f.address <= addr:
-                        current_field = f
-                    else:
-                        break
-                
-                if current_field:
-                    if current_field.protected:
-                        if current_field.intensified:
-                            # Intensified protected = white/yellow (headers, titles)
-                            char_format.setForeground(colors['yellow'])
-                        else:
-                            # Normal protected = cyan (labels)
-                            char_format.setForeground(colors['cyan'])
-                    else:
-                        # Unprotected (input) fields
-                        if current_field.intensified:
-                            char_format.setForeground(colors['white'])
-                        else:
-                            char_format.setForeground(colors['green'])
-                
-                cursor.insertText(char, char_format)
-            
-            # Add newline between rows (except last)
-            if row < screen.rows - 1:
-                cursor.insertText('\n', default_format)
+        self.last_screen = screen
+        self._rendered_screen = screen
+        if dirty:
+            self._render_rows(screen, dirty)
         
         # Position cursor at the 3270 cursor position sent by mainframe
         cursor_addr = screen.cursor_address
@@ -473,6 +441,49 @@ class TerminalWidget(QTextEdit):
         # Give focus to the terminal
         self.setFocus()
     
+    def _render_rows(self, screen: Screen, rows):
+        """Rewrite the given rows from the screen buffer, one formatted span per field run"""
+        runs = screen.row_runs()
+        doc = self.document()
+        cursor = QTextCursor(doc)
+        self._rendering = True
+        cursor.beginEditBlock()
+        try:
+            if len(rows) == screen.rows:
+                cursor.select(QTextCursor.SelectionType.Document)
+                cursor.removeSelectedText()
+                for row in range(screen.rows):
+                    if row:
+                        cursor.insertText('\n', self._formats[None])
+                    self._insert_row(cursor, screen, runs[row], row)
+            else:
+                for row in sorted(rows):
+                    block = doc.findBlockByNumber(row)
+                    cursor.setPosition(block.position())
+                    cursor.setPosition(block.position() + block.length() - 1, QTextCursor.MoveMode.KeepAnchor)
+                    self._insert_row(cursor, screen, runs[row], row)
+        finally:
+            cursor.endEditBlock()
+            self._rendering = False
+    
+    def _insert_row(self, cursor: QTextCursor, screen: Screen, spans, row: int):
+        """Insert one row's text at the cursor (replacing any selection)"""
+        start = row * screen.cols
+        text = ''.join(screen.buffer[start:start + screen.cols])
+        for begin, end, style in spans:
+            cursor.insertText(text[begin:end], self._formats[style])
+    
+    def _on_contents_change(self, position: int, removed: int, added: int):
+        """Remember rows edited outside display_screen so the next screen repaints them"""
+        if self._rendering:
+            return
+        doc = self.document()
+        first = doc.findBlock(position).blockNumber()
+        last = doc.findBlock(position + added).blockNumber()
+        if last < 0:
+            last = doc.blockCount() - 1
+        self._edited_rows.update(range(max(first, 0), last + 1))
+    
     def get_modified_text(self) -> str:
         """Get the current text from the terminal (may include user modifications)"""
         return self.toPlainText()
@@ -1062,6 +1073,9 @@ class TerminalSettingsDialog(QDialog):
 class MainframeTerminalScreen(QWidget):
     """Mainframe Terminal Screen with TN3270 emulation"""
     
+    # A screen arrived and the host unlocked the keyboard (it is done with the last AID)
+    screen_settled = pyqtSignal(object)
+    
     def __init__(self):
         super().__init__()
         
@@ -1667,8 +1681,10 @@ class MainframeTerminalScreen(QWidget):
         """Handle screen update from receive thread"""
         self.terminal.display_screen(screen)
         
-        # Increment screen update counter for _wait_for_screen
+        # Increment screen update counter for _wait_for_screen_from
         self._screen_update_count = getattr(self, '_screen_update_count', 0) + 1
+        if self._keyboard_unlocked():
+            self.screen_settled.emit(screen)
         
         # Try auto-fill if pending
         if self.pending_autofill:
@@ -1904,8 +1920,54 @@ class MainframeTerminalScreen(QWidget):
         """Capture current screen update count before sending a command."""
         return getattr(self, '_screen_update_count', 0)
     
+    def _keyboard_unlocked(self) -> bool:
+        """True when connected and the host is not still working on an AID."""
+        return bool(self.client and self.client.connected and not self.client.keyboard_locked)
+    
+    def wait_until(self, predicate: Callable[[], bool], timeout_ms: int = 2000,
+                   timeout_log_level: int = logging.WARNING) -> bool:
+        """Wait until predicate() holds on a settled screen, keeping the UI responsive.
+        
+        The predicate is checked now and again on each screen_settled signal,
+        so the wait ends the moment the host's answer is displayed. Short
+        settle polls where a timeout is expected pass logging.DEBUG as
+        timeout_log_level.
+        
+        Returns True if the predicate held, False on timeout.
+        """
+        if self._keyboard_unlocked() and predicate():
+            return True
+        
+        loop = QEventLoop()
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.timeout.connect(loop.quit)
+        
+        def check(_screen):
+            if predicate():
+                loop.quit()
+        
+        self.screen_settled.connect(check)
+        timer.start(timeout_ms)
+        loop.exec()
+        timer.stop()
+        self.screen_settled.disconnect(check)
+        
+        if self._keyboard_unlocked() and predicate():
+            return True
+        logger.log(timeout_log_level, f"wait_until: timeout after {timeout_ms}ms")
+        return False
+    
+    def wait_for_text(self, text: str, row: int = None, col: int = None,
+                      timeout_ms: int = 2000, ignore_case: bool = False) -> bool:
+        """Wait until text appears anywhere, on a row, or exactly at row/col of a settled screen."""
+        return self.wait_until(
+            lambda: self.terminal.last_screen is not None
+            and screen_has_text(self.terminal.last_screen, text, row, col, ignore_case),
+            timeout_ms)
+    
     def _wait_for_screen_from(self, initial_count: int, timeout_ms: int = 2000) -> bool:
-        """Wait for screen update count to exceed initial_count.
+        """Wait for a screen after initial_count with the keyboard unlocked.
         
         Args:
             initial_count: The count captured BEFORE sending a command
@@ -1913,14 +1975,7 @@ class MainframeTerminalScreen(QWidget):
         
         Returns True if screen was received, False if timeout.
         """
-        start = time.time()
-        while (time.time() - start) * 1000 < timeout_ms:
-            self._wait(10)  # Check every 10ms
-            if getattr(self, '_screen_update_count', 0) > initial_count:
-                return True
-        
-        logger.warning(f"_wait_for_screen_from: timeout after {timeout_ms}ms")
-        return False
+        return self.wait_until(lambda: self._capture_screen_count() > initial_count, timeout_ms)
     
     def _send_enter_and_wait(self, timeout_ms: int = 2000) -> bool:
         """Send Enter and wait for screen response. Returns True if screen received."""
@@ -1947,17 +2002,20 @@ class MainframeTerminalScreen(QWidget):
         # Capture count AFTER typing, right before sending
         count = self._capture_screen_count()
         logger.info(f"_type_and_enter: captured count={count}, sending Enter...")
-        self._wait(15)  # Brief wait for typed_chars to register
         self._auto_send_enter()
         result = self._wait_for_screen_from(count, timeout_ms)
         logger.info(f"_type_and_enter: wait result={result}, new count={self._capture_screen_count()}")
         return result
     
-    def _wait(self, ms: int):
-        """Wait for ms milliseconds while keeping UI responsive"""
-        loop = QEventLoop()
-        QTimer.singleShot(ms, loop.quit)
-        loop.exec()
+    def _at_menu_screen(self) -> bool:
+        """Check if the CICS MENU screen (where 0000 is typed) is displayed."""
+        return bool(self.terminal.last_screen) and screen_has_text(
+            self.terminal.last_screen, "MENU", ignore_case=True)
+    
+    def _at_known_post_login_screen(self) -> bool:
+        """Check if the screen after a login attempt is one the sequence knows how to handle."""
+        return (self._check_multiple_logon_screen() or self._check_reconnect_screen()
+                or self._check_primary_app_menu() or self._check_vtam_switch_menu())
     
     def start_ckpr_sequence(self):
         """Start the CKPR auto-login sequence (legacy, calls new method)."""
@@ -2003,7 +2061,7 @@ class MainframeTerminalScreen(QWidget):
         self._send_pf_and_wait(6)
         
         # After PF6, we should be at the PRIMARY APPLICATION SELECTION MENU
-        self._wait(200)  # Brief wait for screen to stabilize
+        self.wait_until(self._check_primary_app_menu, timeout_ms=200, timeout_log_level=logging.DEBUG)
         
         # Log what screen we're at for debugging
         if self.terminal.last_screen:
@@ -2060,7 +2118,6 @@ class MainframeTerminalScreen(QWidget):
             logger.info(f"Filled password into field at {field_start}")
         
         # Send Enter
-        self._wait(20)
         self._send_enter_and_wait()
     
     def _handle_reconnect_screen(self):
@@ -2085,7 +2142,6 @@ class MainframeTerminalScreen(QWidget):
                 logger.info(f"Typed password for reconnect at field {field_start}")
         
         # Send PF1 to acquire the session
-        self._wait(20)
         self._send_pf_and_wait(1)
         
         # After PF1, we're back at the login screen - need to re-enter credentials
@@ -2126,7 +2182,6 @@ class MainframeTerminalScreen(QWidget):
         logger.info("Sending OPEN command to start new session")
         # Type OPEN into the command field (===>)
         self._auto_type_in_first_field("OPEN")
-        self._wait(20)
         self._send_enter_and_wait()
     
     def _get_cics_applid(self, region_name: str) -> str:
@@ -2151,7 +2206,6 @@ class MainframeTerminalScreen(QWidget):
         logger.info(f"Opening application: {applid}")
         # Type "OPEN applid" into the command field
         self._auto_type_in_first_field(f"OPEN {applid}")
-        self._wait(20)
         self._send_enter_and_wait()
     
     def _get_cics_pf_key(self, region_name: str) -> int:
@@ -2183,10 +2237,8 @@ class MainframeTerminalScreen(QWidget):
         # We are at the blank screen now (after login or PF6)
         logger.info("Sending first Enter for blank screen")
         self._send_enter_and_wait()
-        self._wait(500)
         logger.info("Sending second Enter for blank screen")
         self._send_enter_and_wait()
-        self._wait(500)
         
         # Step 3: Primary Application Selection Menu
         # CKAS = 120, CKMO = 122, CKPR = 125
@@ -2207,14 +2259,13 @@ class MainframeTerminalScreen(QWidget):
         logger.info(f"Selecting region {region_name} (selector {selector})")
         self._type_and_enter(selector)
         
-        # Wait a bit and send Enter again
-        self._wait(1000)
+        # Send Enter again once the selection has been answered
         logger.info("Sending confirmation Enter")
         self._send_enter_and_wait()
         
         # Step 4: CICS/TS Screen (Welcome to ...)
         # Type "0000" at top left (MENU)
-        self._wait(500)
+        self.wait_until(self._at_menu_screen, timeout_ms=1000, timeout_log_level=logging.DEBUG)
         logger.info("At CICS screen - typing 0000")
         
         # "Put the cursor at the top left and type '0000' where you see 'MENU'"
@@ -2261,7 +2312,6 @@ class MainframeTerminalScreen(QWidget):
         # Disconnect if already connected (switching regions)
         if self.client and self.client.connected:
             self.disconnect_from_mainframe()
-            self._wait(200)  # Brief pause after disconnect
         
         # Reset state before starting - skip auto-fill since we handle credentials ourselves
         self._screen_update_count = 0
@@ -2280,8 +2330,8 @@ class MainframeTerminalScreen(QWidget):
         # Manually fill credentials and send Enter (this waits for response)
         self._fill_credentials_and_enter()
         
-        # Wait for the response screen after login attempt
-        self._wait(300)
+        # The login reply has settled; give a follow-up screen a moment to replace it
+        self.wait_until(self._at_known_post_login_screen, timeout_ms=300, timeout_log_level=logging.DEBUG)
         
         # Check if we got the "MULTIPLE LOGON" screen (userid already logged in elsewhere)
         # This is the key screen for dual terminal - press PF6 to create new logon session
@@ -2289,14 +2339,11 @@ class MainframeTerminalScreen(QWidget):
             self.automation_status.setText(f"🔄 {region_name} (creating new logon)...")
             logger.info("MULTIPLE LOGON screen detected - pressing PF6 for new session")
             self._handle_multiple_logon_screen()
-            # Wait for the post-PF6 screen
-            self._wait(300)
         
         # Check if we got the "session already active" reconnect screen (USER ON TERM)
         if self._check_reconnect_screen():
             self.automation_status.setText(f"🔄 {region_name} (reconnecting)...")
             self._handle_reconnect_screen()
-            self._wait(300)
         
         # Check for Port 1992 sequence (only for configured regions)
         if self.client and self.client.port == 1992:
@@ -2304,9 +2351,6 @@ class MainframeTerminalScreen(QWidget):
                 self._handle_1992_sequence(region_name)
                 return
 
-        # Wait a moment for the post-login screen to arrive
-        self._wait(200)
-        
         # Log what screen we're seeing for debugging - full screen
         if self.terminal.last_screen:
             screen_text = ''.join(self.terminal.last_screen.buffer)
@@ -2339,7 +2383,6 @@ class MainframeTerminalScreen(QWidget):
                     self.automation_status.setText(f"🔄 {region_name} (OPEN {applid})...")
                     logger.info(f"Using OPEN {applid} to start new session for dual terminal")
                     self._open_application(applid)
-                    self._wait(500)
                     # After OPEN applid, we should go directly to that CICS region
                     # Skip the normal navigation - go straight to MENU screen
                 else:
@@ -2347,10 +2390,8 @@ class MainframeTerminalScreen(QWidget):
                     self.automation_status.setText(f"🔄 {region_name} (OPEN new session)...")
                     logger.info("Using OPEN command (no APPLID) for dual terminal")
                     self._type_and_enter("OPEN")
-                    self._wait(300)
                     # Then navigate normally
                     self._type_and_enter("3")
-                    self._wait(200)
                     self._type_and_enter(region_option)
                     self._send_enter_and_wait()
             else:
@@ -2360,7 +2401,6 @@ class MainframeTerminalScreen(QWidget):
                     self.automation_status.setText(f"🔄 {region_name} (OPEN {applid})...")
                     logger.info(f"Using OPEN {applid} to start session")
                     self._open_application(applid)
-                    self._wait(500)
                 else:
                     # Navigate: 3 (CICS) → region option
                     if not region_option:
@@ -2373,7 +2413,6 @@ class MainframeTerminalScreen(QWidget):
                     self._type_and_enter("3")  # Select CICS
                     
                     # Now we should be at CICS regions menu - select the specific region
-                    self._wait(200)
                     logger.info(f"Selecting CICS region option {region_option}")
                     self._type_and_enter(region_option)
                     
@@ -2387,8 +2426,8 @@ class MainframeTerminalScreen(QWidget):
             self._type_and_enter(region_option)
             self._send_enter_and_wait()
         
-        # MENU screen - need extra time for this screen to load
-        self._wait(100)  # Give screen time to fully arrive
+        # MENU screen - can take an extra screen to arrive
+        self.wait_until(self._at_menu_screen, timeout_ms=1000, timeout_log_level=logging.DEBUG)
         
         # MENU screen - type 0000
         self._type_and_enter("0000", use_menu_field=True)
@@ -2545,33 +2584,9 @@ class MainframeTerminalScreen(QWidget):
         
         # Build modified fields from typed_chars
         if self.terminal.typed_chars and self.terminal.last_screen:
-            screen = self.terminal.last_screen
-            input_fields = screen.get_input_fields()
-            modified_fields = []
-            
-            logger.info(f"_auto_send_enter: found {len(input_fields)} input fields")
-            
-            for field in input_fields:
-                field_start = field.address + 1
-                field_end = screen.rows * screen.cols
-                for other in screen.fields:
-                    if other.address > field.address and other.address < field_end:
-                        field_end = other.address
-                
-                typed_in_field = {addr: char for addr, char in self.terminal.typed_chars.items() 
-                                if field_start <= addr < field_end}
-                
-                if typed_in_field:
-                    field_content = []
-                    for addr in range(field_start, field_end):
-                        if addr in self.terminal.typed_chars:
-                            field_content.append(self.terminal.typed_chars[addr])
-                        else:
-                            field_content.append(screen.buffer[addr])
-                    content_str = ''.join(field_content).rstrip()
-                    if content_str:
-                        modified_fields.append((field_start, content_str))
-                        logger.info(f"_auto_send_enter: field at {field_start} = '{content_str[:20]}...' (len={len(content_str)})")
+            modified_fields = self.terminal.last_screen.modified_fields(self.terminal.typed_chars)
+            for field_start, content_str in modified_fields:
+                logger.info(f"_auto_send_enter: field at {field_start} = '{content_str[:20]}...' (len={len(content_str)})")
             
             logger.info(f"_auto_send_enter: sending {len(modified_fields)} modified fields")
             self.client.send_aid(AID.ENTER, modified_fields if modified_fields else None)
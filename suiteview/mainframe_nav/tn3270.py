@@ -3,10 +3,14 @@ TN3270 Terminal Emulator Core
 Implements the TN3270 protocol for mainframe connectivity
 """
 
+import re
 import socket
 import ssl
 import logging
-from typing import Optional, Tuple, List, Callable
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Optional, Tuple, List, Callable, Set, Dict
 from enum import IntEnum
 from dataclasses import dataclass, field
 
@@ -123,6 +127,15 @@ for c in 'abcdefghijklmnopqrstuvwxyz':
     ASCII_TO_EBCDIC[c.upper()] = ASCII_TO_EBCDIC.get(c.upper(), 0x40)
 
 
+# Byte-for-byte translation of EBCDIC to the Latin-1 bytes of the table
+# above (unmapped codes become a space), for decoding runs of characters
+EBCDIC_TRANSLATION = bytes(
+    ord(EBCDIC_TO_ASCII.get(b, ' ')) for b in range(256))
+
+# Any order byte; the characters between two orders are decoded as one run
+ORDER_BYTES = re.compile(b'[' + re.escape(bytes(sorted(Order3270))) + b']')
+
+
 def ebcdic_to_ascii(byte_val: int) -> str:
     """Convert EBCDIC byte to ASCII character"""
     return EBCDIC_TO_ASCII.get(byte_val, ' ')
@@ -191,9 +204,24 @@ class Field:
     content: str = ""
 
 
+def field_style(f: Optional[Field]) -> Optional[Tuple[bool, bool]]:
+    """Display class of the characters in a field: (protected, intensified), None before any field"""
+    if f is None:
+        return None
+    return (f.protected, f.intensified)
+
+
 @dataclass 
 class Screen:
-    """Represents the 3270 screen buffer"""
+    """
+    Represents the 3270 screen buffer
+    
+    Writes are tracked so a display can repaint only what changed:
+    ``take_dirty_rows`` returns the rows whose characters or field
+    attribute runs differ from when it was last called. ``fields`` is kept
+    sorted by address, one field per address, so the field owning an
+    address is found by bisection.
+    """
     rows: int = 24
     cols: int = 80
     buffer: List[str] = field(default_factory=list)
@@ -207,15 +235,81 @@ class Screen:
             self.buffer = [' '] * size
         if not self.attributes:
             self.attributes = [0] * size
+        self.fields.sort(key=lambda f: f.address)
+        self._field_addresses: List[int] = [f.address for f in self.fields]
+        self._changed: Set[int] = set()  # addresses written since take_dirty_rows
+        self._taken: Optional[List[str]] = None  # buffer as of take_dirty_rows
+        self._taken_runs: Optional[List[list]] = None  # row_runs() as of take_dirty_rows
+        self._fields_version = 0
+        self._taken_fields_version = -1
+        self._runs_cache: Optional[Tuple[int, List[list]]] = None
     
     def clear(self):
         """Clear the screen"""
         size = self.rows * self.cols
+        self._changed.update(addr for addr, char in enumerate(self.buffer) if char != ' ')
         self.buffer = [' '] * size
         self.attributes = [0] * size
         self.fields = []
+        self._field_addresses = []
+        self._fields_version += 1
         self.cursor_address = 0
     
+    def row_runs(self) -> List[List[Tuple[int, int, Optional[Tuple[bool, bool]]]]]:
+        """
+        Field attribute runs per row
+        
+        Each row is a list of (start col, end col, style) spans where style
+        is ``field_style`` of the field the characters belong to; adjacent
+        fields with the same style form one span.
+        """
+        if self._runs_cache and self._runs_cache[0] == self._fields_version:
+            return self._runs_cache[1]
+        starts = {f.address: field_style(f) for f in self.fields}
+        runs = []
+        style = None
+        for row in range(self.rows):
+            row_start = row * self.cols
+            spans = []
+            begin = 0
+            for col in range(self.cols):
+                new_style = starts.get(row_start + col, style)
+                if new_style != style and col > begin:
+                    spans.append((begin, col, style))
+                    begin = col
+                style = new_style
+            spans.append((begin, self.cols, style))
+            runs.append(spans)
+        self._runs_cache = (self._fields_version, runs)
+        return runs
+    
+    def take_dirty_rows(self) -> Set[int]:
+        """
+        Rows that changed since the last call (every row on the first call)
+        
+        A row is dirty when one of its characters differs from the last
+        call - rewriting the same text after an Erase/Write does not count -
+        or when its field attribute runs differ.
+        """
+        if self._taken is None:
+            dirty = set(range(self.rows))
+            self._taken = list(self.buffer)
+        else:
+            dirty = set()
+            for addr in self._changed:
+                if self.buffer[addr] != self._taken[addr]:
+                    dirty.add(addr // self.cols)
+                    self._taken[addr] = self.buffer[addr]
+        self._changed.clear()
+        
+        if self._fields_version != self._taken_fields_version:
+            runs = self.row_runs()
+            if self._taken_runs is not None:
+                dirty.update(row for row in range(self.rows) if runs[row] != self._taken_runs[row])
+            self._taken_runs = runs
+            self._taken_fields_version = self._fields_version
+        return dirty
+    
     def get_text(self) -> str:
         """Get screen as text"""
         lines = []
@@ -264,10 +358,10 @@ class Screen:
         intensified = (display_bits == 0x02)
         modified = bool(attribute & 0x01)
         
-        row = address // 80
-        col = address % 80
-        field_type = "protected" if protected else "INPUT"
-        logger.info(f"add_field: addr={address} (row={row}, col={col}) {field_type} hidden={hidden}")
+        if logger.isEnabledFor(logging.DEBUG):
+            field_type = "protected" if protected else "INPUT"
+            logger.debug(f"add_field: addr={address} (row={address // 80}, col={address % 80}) "
+                         f"{field_type} hidden={hidden}")
         
         field_obj = Field(
             address=address,
@@ -278,12 +372,46 @@ class Screen:
             intensified=intensified,
             modified=modified
         )
-        self.fields.append(field_obj)
+        # A field rewritten at the same address replaces the old one
+        idx = bisect_left(self._field_addresses, address)
+        if idx < len(self._field_addresses) and self._field_addresses[idx] == address:
+            self.fields[idx] = field_obj
+        else:
+            self.fields.insert(idx, field_obj)
+            self._field_addresses.insert(idx, address)
+        self._fields_version += 1
     
     def get_input_fields(self) -> List[Field]:
         """Get list of unprotected (input) fields"""
         return [f for f in self.fields if not f.protected]
     
+    def field_end(self, f: Field) -> int:
+        """Address just past the last character of a field (the next attribute or end of screen)"""
+        idx = bisect_right(self._field_addresses, f.address)
+        return self._field_addresses[idx] if idx < len(self._field_addresses) else self.rows * self.cols
+    
+    def field_at(self, address: int) -> Optional[Field]:
+        """The field whose characters include address, None before the first field"""
+        idx = bisect_left(self._field_addresses, address)
+        return self.fields[idx - 1] if idx else None
+    
+    def modified_fields(self, typed_chars: Dict[int, str]) -> List[Tuple[int, str]]:
+        """
+        (field start, content) of each input field with typed characters
+        
+        The content is the field's buffer overlaid with what was typed, with
+        trailing blanks removed, as a Read Modified reply carries it.
+        """
+        modified = []
+        for f in self.get_input_fields():
+            start, end = f.address + 1, self.field_end(f)
+            if not any(start <= addr < end for addr in typed_chars):
+                continue
+            content = ''.join(typed_chars.get(addr, self.buffer[addr]) for addr in range(start, end)).rstrip()
+            if content:
+                modified.append((start, content))
+        return modified
+    
     def get_next_input_field(self, current_addr: int) -> Optional[int]:
         """Get address of next unprotected field after current position"""
         input_fields = self.get_input_fields()
@@ -358,24 +486,30 @@ class Screen:
     
     def is_password_field(self, address: int) -> bool:
         """Check if the given address is in a non-display (password) field"""
-        for f in self.fields:
-            if not f.display:  # Non-display field
-                # Check if address is within this field
-                # Field extends from f.address to next field or end of screen
-                if address > f.address:
-                    # Find next field to determine end of this field
-                    next_field_addr = self.rows * self.cols  # Default to end of screen
-                    for other in self.fields:
-                        if other.address > f.address and other.address < next_field_addr:
-                            next_field_addr = other.address
-                    if address < next_field_addr:
-                        return True
-        return False
+        f = self.field_at(address)
+        return f is not None and not f.display
     
     def set_char(self, address: int, char: str):
         """Set character at address"""
         if 0 <= address < len(self.buffer):
-            self.buffer[address] = char
+            if self.buffer[address] != char:
+                self.buffer[address] = char
+                self._changed.add(address)
+    
+    def write_text(self, address: int, text: str) -> int:
+        """Write text from address on, wrapping at the end of the buffer; returns the next address"""
+        size = len(self.buffer)
+        pos = 0
+        while pos < len(text):
+            n = min(len(text) - pos, size - address)
+            chunk = text[pos:pos + n]
+            old = self.buffer[address:address + n]
+            if ''.join(old) != chunk:
+                self._changed.update(address + i for i, (was, char) in enumerate(zip(old, chunk)) if was != char)
+                self.buffer[address:address + n] = chunk
+            address = (address + n) % size
+            pos += n
+        return address
     
     def get_char(self, address: int) -> str:
         """Get character at address"""
@@ -384,6 +518,24 @@ class Screen:
         return ' '
 
 
+# WCC bit that unlocks the keyboard: the host is done with the last AID
+WCC_KEYBOARD_RESTORE = 0x02
+
+
+def screen_has_text(screen: Screen, text: str, row: Optional[int] = None, col: Optional[int] = None,
+                    ignore_case: bool = False) -> bool:
+    """Whether text is on the screen: anywhere, anywhere on a row, or exactly at row/col"""
+    if row is None:
+        haystack = ''.join(screen.buffer)
+    elif col is None:
+        haystack = screen.get_string_at(row, 0, screen.cols)
+    else:
+        haystack = screen.get_string_at(row, col, len(text))
+    if ignore_case:
+        haystack, text = haystack.upper(), text.upper()
+    return haystack == text if row is not None and col is not None else text in haystack
+
+
 class TN3270Client:
     """TN3270 Terminal Client"""
     
@@ -403,6 +555,11 @@ class TN3270Client:
         self.assigned_lu_name = ""  # LU name assigned by server via TN3270E CONNECT
         self._on_screen_update: Optional[Callable] = None
         self._receive_buffer = b''
+        # Locked from sending an AID until a write with keyboard restore;
+        # screen_count counts processed host records for waiters
+        self.keyboard_locked = False
+        self.screen_count = 0
+        self._settled = threading.Condition(threading.RLock())
         
     def set_screen_update_callback(self, callback: Callable):
         """Set callback for screen updates"""
@@ -475,6 +632,8 @@ class TN3270Client:
                 pass
         self.socket = None
         self.connected = False
+        with self._settled:
+            self._settled.notify_all()
         logger.info("Disconnected")
     
     def _send(self, data: bytes):
@@ -792,7 +951,10 @@ class TN3270Client:
                 screen_data = self._extract_3270_data(record_data)
                 
                 if screen_data:
-                    self._process_3270_data(screen_data)
+                    with self._settled:
+                        self._process_3270_data(screen_data)
+                        self.screen_count += 1
+                        self._settled.notify_all()
                     logger.info(f"Screen updated. Buffer length: {len(self.screen.buffer)}. Fields: {len(self.screen.fields)}")
                     if self._on_screen_update:
                         self._on_screen_update(self.screen)
@@ -883,6 +1045,8 @@ class TN3270Client:
                 wcc = data[1]
                 logger.debug(f"WCC: {hex(wcc)}")
                 self._process_write_data(data[2:])
+                if wcc & WCC_KEYBOARD_RESTORE:
+                    self.keyboard_locked = False
         elif cmd in (0x05, 0xF5):  # Erase/Write
             logger.info("Erase/Write command")
             self.screen.clear()
@@ -890,6 +1054,8 @@ class TN3270Client:
                 wcc = data[1]
                 logger.debug(f"WCC: {hex(wcc)}")
                 self._process_write_data(data[2:])
+                if wcc & WCC_KEYBOARD_RESTORE:
+                    self.keyboard_locked = False
         elif cmd in (0x0D, 0x7E):  # Erase/Write Alternate
             logger.info("Erase/Write Alternate command")
             self.screen.clear()
@@ -897,6 +1063,8 @@ class TN3270Client:
                 wcc = data[1]
                 logger.debug(f"WCC: {hex(wcc)}")
                 self._process_write_data(data[2:])
+                if wcc & WCC_KEYBOARD_RESTORE:
+                    self.keyboard_locked = False
         elif cmd in (0x11, 0xF3):  # Write Structured Field
             logger.info("Write Structured Field command")
             # WSF has different format - parse structured fields
@@ -911,17 +1079,32 @@ class TN3270Client:
             self._process_write_data(data)
     
     def _process_write_data(self, data: bytes):
-        """Process write data (orders and characters)"""
+        """Process write data (orders and characters)
+        
+        Characters between orders are translated and written as one run;
+        only the orders themselves are parsed byte by byte.
+        """
+        screen = self.screen
+        size = screen.rows * screen.cols
         i = 0
-        current_address = self.screen.cursor_address
+        current_address = screen.cursor_address
         chars_written = 0
         orders_processed = 0
         
         logger.debug(f"Processing write data: {len(data)} bytes")
         
         while i < len(data):
-            byte = data[i]
+            match = ORDER_BYTES.search(data, i)
+            run_end = match.start() if match else len(data)
+            if run_end > i:
+                # Regular characters up to the next order
+                text = data[i:run_end].translate(EBCDIC_TRANSLATION).decode('latin-1')
+                current_address = screen.write_text(current_address, text)
+                chars_written += run_end - i
+                i = run_end
+                continue
             
+            byte = data[i]
             if byte == Order3270.SBA:  # 0x11
                 # Set Buffer Address
                 if i + 2 < len(data):
@@ -934,12 +1117,12 @@ class TN3270Client:
                 # Start Field
                 if i + 1 < len(data):
                     attr = data[i + 1]
-                    self.screen.set_char(current_address, ' ')
-                    if 0 <= current_address < len(self.screen.attributes):
-                        self.screen.attributes[current_address] = attr
+                    screen.set_char(current_address, ' ')
+                    if 0 <= current_address < len(screen.attributes):
+                        screen.attributes[current_address] = attr
                     # Track this field
-                    self.screen.add_field(current_address, attr)
-                    current_address = (current_address + 1) % (self.screen.rows * self.screen.cols)
+                    screen.add_field(current_address, attr)
+                    current_address = (current_address + 1) % size
                     orders_processed += 1
                     i += 2
                 else:
@@ -958,11 +1141,11 @@ class TN3270Client:
                             attr_value = data[pair_idx + 1]
                             if attr_type == 0xC0:  # Basic 3270 field attribute
                                 attr = attr_value
-                    self.screen.set_char(current_address, ' ')
-                    if 0 <= current_address < len(self.screen.attributes):
-                        self.screen.attributes[current_address] = attr
-                    self.screen.add_field(current_address, attr)
-                    current_address = (current_address + 1) % (self.screen.rows * self.screen.cols)
+                    screen.set_char(current_address, ' ')
+                    if 0 <= current_address < len(screen.attributes):
+                        screen.attributes[current_address] = attr
+                    screen.add_field(current_address, attr)
+                    current_address = (current_address + 1) % size
                     orders_processed += 1
                     i += 2 + (count * 2)
                 else:
@@ -972,17 +1155,15 @@ class TN3270Client:
                 i += 3 if i + 2 < len(data) else 1
             elif byte == Order3270.IC:
                 # Insert Cursor - sets where cursor should be positioned
-                self.screen.cursor_address = current_address
-                logger.info(f"IC order: cursor_address set to {current_address} (row={current_address // 80}, col={current_address % 80})")
+                screen.cursor_address = current_address
+                logger.debug(f"IC order: cursor_address set to {current_address} (row={current_address // 80}, col={current_address % 80})")
                 i += 1
             elif byte == Order3270.RA:
                 # Repeat to Address
                 if i + 3 < len(data):
                     end_addr = decode_buffer_address(data[i + 1], data[i + 2])
                     char = ebcdic_to_ascii(data[i + 3])
-                    while current_address != end_addr:
-                        self.screen.set_char(current_address, char)
-                        current_address = (current_address + 1) % (self.screen.rows * self.screen.cols)
+                    current_address = screen.write_text(current_address, char * ((end_addr - current_address) % size))
                     i += 4
                 else:
                     i += 1
@@ -990,9 +1171,7 @@ class TN3270Client:
                 # Erase Unprotected to Address
                 if i + 2 < len(data):
                     end_addr = decode_buffer_address(data[i + 1], data[i + 2])
-                    while current_address != end_addr:
-                        self.screen.set_char(current_address, ' ')
-                        current_address = (current_address + 1) % (self.screen.rows * self.screen.cols)
+                    current_address = screen.write_text(current_address, ' ' * ((end_addr - current_address) % size))
                     i += 3
                 else:
                     i += 1
@@ -1003,8 +1182,8 @@ class TN3270Client:
                 # Graphic Escape
                 if i + 1 < len(data):
                     char = ebcdic_to_ascii(data[i + 1])
-                    self.screen.set_char(current_address, char)
-                    current_address = (current_address + 1) % (self.screen.rows * self.screen.cols)
+                    screen.set_char(current_address, char)
+                    current_address = (current_address + 1) % size
                     i += 2
                 else:
                     i += 1
@@ -1015,16 +1194,9 @@ class TN3270Client:
                     i += 2 + (count * 2)
                 else:
                     i += 1
-            else:
-                # Regular character
-                char = ebcdic_to_ascii(byte)
-                self.screen.set_char(current_address, char)
-                current_address = (current_address + 1) % (self.screen.rows * self.screen.cols)
-                chars_written += 1
-                i += 1
         
-        self.screen.cursor_address = current_address
-        logger.info(f"Write data complete: {chars_written} chars written, {orders_processed} orders processed")
+        screen.cursor_address = current_address
+        logger.debug(f"Write data complete: {chars_written} chars written, {orders_processed} orders processed")
     
     def _process_wsf(self, data: bytes):
         """Process Write Structured Field command"""
@@ -1161,6 +1333,8 @@ class TN3270Client:
         
         # Wrap in telnet with EOR
         telnet_data = bytes(data) + bytes([TelnetCmd.IAC, TelnetCmd.EOR])
+        with self._settled:
+            self.keyboard_locked = True
         self._send(telnet_data)
         logger.debug(f"Sent AID {hex(aid)} with {len(modified_fields) if modified_fields else 0} modified fields (Short Read={is_short_read})")
     
@@ -1192,3 +1366,32 @@ class TN3270Client:
         pa_aids = {1: AID.PA1, 2: AID.PA2, 3: AID.PA3}
         if pa_num in pa_aids:
             self.send_aid(pa_aids[pa_num])
+
+    def wait_for(self, predicate: Callable[[Screen], bool], timeout: float = 5.0) -> bool:
+        """
+        Block until the keyboard is unlocked and predicate(screen) holds
+
+        Wakes on each record the receive loop processes rather than polling,
+        so it returns as soon as the host's answer is on the screen. For use
+        off the thread that calls receive_screen.
+
+        Returns:
+            True if the screen settled as wanted, False on timeout or disconnect
+        """
+        deadline = time.monotonic() + timeout
+        with self._settled:
+            while not (not self.keyboard_locked and predicate(self.screen)):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.connected:
+                    return False
+                self._settled.wait(remaining)
+            return True
+
+    def wait_for_screen(self, after_count: int, timeout: float = 5.0) -> bool:
+        """Block until a record after ``after_count`` has arrived and the keyboard is unlocked"""
+        return self.wait_for(lambda screen: self.screen_count > after_count, timeout)
+
+    def wait_for_text(self, text: str, row: Optional[int] = None, col: Optional[int] = None,
+                      timeout: float = 5.0, ignore_case: bool = False) -> bool:
+        """Block until text appears (anywhere, on a row, or at row/col) on a settled screen"""
+        return self.wait_for(lambda screen: screen_has_text(screen, text, row, col, ignore_case), timeout)
@@ -11,6 +11,8 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 import logging
 
+from suiteview.core.ftp_manager import describe_total
+
 logger = logging.getLogger(__name__)
 
 
@@ -89,6 +91,12 @@ class SearchContentWindow(QWidget):
         # Search button row
         button_layout = QHBoxLayout()
         button_layout.addStretch()
+        # Search only what the local mirror holds - works without the host
+        self.offline_cb = QCheckBox("Local mirror only")
+        self.offline_cb.setStyleSheet("font-size: 8pt;")
+        self.offline_cb.setToolTip("Search the members mirrored under ~/.suiteview without connecting to the mainframe")
+        self.offline_cb.setEnabled(getattr(self.ftp_manager, 'mirror', None) is not None)
+        button_layout.addWidget(self.offline_cb)
         search_btn = QPushButton("Search")
         search_btn.setStyleSheet("""
             QPushButton {
@@ -365,7 +373,8 @@ class SearchContentWindow(QWidget):
         
         # Read dataset content
         try:
-            content, total_lines = self.ftp_manager.read_dataset(full_path, max_lines=1000)
+            preview = self.ftp_manager.preview_dataset(full_path, max_lines=1000)
+            content, total_lines = preview['content'], preview['lines']
             
             if total_lines == 0:
                 QMessageBox.warning(self, "No Content", f"Dataset {dataset_name} is empty or could not be read.")
@@ -378,7 +387,7 @@ class SearchContentWindow(QWidget):
             
             layout = QVBoxLayout(dialog)
             
-            info_label = QLabel(f"Showing first 1000 lines of {dataset_name} (Total: {total_lines} lines)")
+            info_label = QLabel(f"Showing first {total_lines} lines of {dataset_name} (Total: {describe_total(preview)})")
             info_label.setStyleSheet("font-weight: bold; padding: 4px; background-color: #e8f4f8;")
             layout.addWidget(info_label)
             
@@ -454,7 +463,8 @@ class SearchContentWindow(QWidget):
             search_strings,
             case_sensitive,
             False,  # whole_word not used anymore
-            ""  # current_dataset not needed here
+            "",  # current_dataset not needed here
+            offline=self.offline_cb.isChecked()
         )
         
         cancel_btn.clicked.connect(self.search_thread.cancel)
@@ -464,6 +474,11 @@ class SearchContentWindow(QWidget):
             lambda msg, curr, total: progress_label.setText(f"{msg} ({curr} of {total})")
         )
         
+        # Hits are listed as they are found; the final list replaces them in dataset order
+        self.current_results = []
+        self.results_table.setRowCount(0)
+        self.results_info_label.setText("Searching...")
+        self.search_thread.result_found.connect(self.add_result)
         self.search_thread.search_complete.connect(self.display_results)
         self.search_thread.search_complete.connect(progress_dialog.close)
         
@@ -499,25 +514,33 @@ class SearchContentWindow(QWidget):
         
         # Populate results table
         for result in results:
-            row = self.results_table.rowCount()
-            self.results_table.insertRow(row)
-            
-            dataset_name = result['dataset']
-            full_path = result['full_path']
-            
-            # Count total matches
-            total_matches = sum(len(mg['matches']) for mg in result['matches'])
-            
-            # Store result data in first item
-            name_item = QTableWidgetItem(dataset_name)
-            name_item.setData(Qt.ItemDataRole.UserRole, result)
-            
-            self.results_table.setItem(row, 0, name_item)
-            self.results_table.setItem(row, 1, QTableWidgetItem(str(total_matches)))
-            self.results_table.setItem(row, 2, QTableWidgetItem(full_path))
+            self._append_result_row(result)
         
         logger.info(f"Display complete: {len(results)} results, {len(skipped)} skipped, {len(errors)} errors")
     
+    def _append_result_row(self, result):
+        """Add one dataset's result to the results table"""
+        row = self.results_table.rowCount()
+        self.results_table.insertRow(row)
+        
+        # Count total matches
+        total_matches = sum(len(mg['matches']) for mg in result['matches'])
+        
+        # Store result data in first item
+        name_item = QTableWidgetItem(result['dataset'])
+        name_item.setData(Qt.ItemDataRole.UserRole, result)
+        
+        self.results_table.setItem(row, 0, name_item)
+        self.results_table.setItem(row, 1, QTableWidgetItem(str(total_matches)))
+        self.results_table.setItem(row, 2, QTableWidgetItem(result['full_path']))
+    
+    def add_result(self, result):
+        """Show a hit while the search is still running"""
+        self.current_results.append(result)
+        self._append_result_row(result)
+        self.results_info_label.setText(f"{len(self.current_results)} with matches so far...")
+        self.results_info_label.setStyleSheet("color: #27ae60; font-style: italic; font-size: 9pt; padding: 6px;")
+    
     def view_result_details(self, item):
         """View detailed match information for a result"""
         row = item.row()
@@ -0,0 +1,185 @@
+"""
+Arrow-backed row source for FilterTableView's windowed mode.
+
+Holds a result as a pyarrow Table — never as one big pandas frame — and
+answers what the grid asks of it: a window of rows to paint, the rows that
+pass the column filters / global search in the current sort order, a
+column's distinct values for the filter popup, and a stream of row batches
+for copy and export.
+
+Filtering, search, sorting and distinct values are pushed down as SQL to an
+in-process DuckDB connection over the Arrow table. A filter/sort result is a
+NumPy array of row positions into the table (``None`` means every row in
+load order), and windows are cut from the table with ``take`` — so only the
+rows being painted are converted to pandas.
+
+Filter and search semantics match the in-memory pandas path: a filter value
+is the cell's text with nulls as ``"(Blanks)"``; search is a case-insensitive
+substring match on any column's text. Pure Python — no PyQt.
+"""
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+BLANKS = "(Blanks)"
+DEFAULT_BATCH_SIZE = 50_000
+
+# Hidden row-position column added to the registered table.
+_ROW = "__sv_row"
+
+
+def _qi(identifier: str) -> str:
+    return '"' + str(identifier).replace('"', '""') + '"'
+
+
+def _text_expr(column: str, null_text: str) -> str:
+    return f"COALESCE(CAST({_qi(column)} AS VARCHAR), '{null_text}')"
+
+
+def where_clause(
+    filters: Dict[str, Set[str]],
+    search: str = "",
+    columns: Sequence[str] = (),
+) -> Tuple[str, list]:
+    """``WHERE`` text and parameters for column filters plus a global search.
+
+    Each filter keeps rows whose text (nulls as ``(Blanks)``) is one of the
+    selected values; the search keeps rows where any of ``columns`` contains
+    ``search`` case-insensitively. Returns ``("", [])`` when nothing applies.
+    """
+    clauses: List[str] = []
+    params: list = []
+    for column, values in filters.items():
+        clauses.append(f"{_text_expr(column, BLANKS)} IN (SELECT unnest(?::VARCHAR[]))")
+        params.append(sorted(str(v) for v in values))
+    needle = search.lower().strip()
+    if needle and columns:
+        matches = [f"contains(lower({_text_expr(c, '')}), ?)" for c in columns]
+        clauses.append("(" + " OR ".join(matches) + ")")
+        params.extend([needle] * len(columns))
+    if not clauses:
+        return "", []
+    return "WHERE " + "\n  AND ".join(clauses), params
+
+
+class ArrowTableSource:
+    """A read-only result table the grid browses through row windows."""
+
+    def __init__(self, table):
+        import pyarrow as pa
+
+        self._table = table
+        self._indexed = table.append_column(
+            _ROW, pa.array(np.arange(table.num_rows, dtype=np.int64)))
+        self.columns: List[str] = list(table.column_names)
+        self._con = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame) -> "ArrowTableSource":
+        """Convert a frame (index dropped). Raises if pyarrow can't type a column."""
+        import pyarrow as pa
+
+        frame = df.copy(deep=False)
+        frame.columns = [str(c) for c in frame.columns]
+        return cls(pa.Table.from_pandas(frame, preserve_index=False))
+
+    @classmethod
+    def from_parquet(cls, path: str) -> "ArrowTableSource":
+        import pyarrow.parquet as pq
+
+        return cls(pq.read_table(path))
+
+    # ── Shape ───────────────────────────────────────────────────────
+
+    @property
+    def total_rows(self) -> int:
+        return self._table.num_rows
+
+    def row_count(self, rows: Optional[np.ndarray]) -> int:
+        return self.total_rows if rows is None else len(rows)
+
+    def schema_frame(self) -> pd.DataFrame:
+        """Zero-row frame with the dtypes windows come back in."""
+        return self._table.schema.empty_table().to_pandas(types_mapper=pd.ArrowDtype)
+
+    # ── Windows and streams ─────────────────────────────────────────
+
+    def _slice(self, rows: Optional[np.ndarray], start: int, stop: int,
+               columns: Optional[Sequence[str]]):
+        table = self._table if columns is None else self._table.select(list(columns))
+        if rows is None:
+            return table.slice(start, max(0, stop - start))
+        return table.take(rows[start:stop])
+
+    def window(self, rows: Optional[np.ndarray], offset: int, limit: int,
+               columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Rows ``offset .. offset+limit`` of the view as a pandas frame."""
+        table = self._slice(rows, offset, offset + limit, columns)
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+
+    def iter_frames(self, rows: Optional[np.ndarray],
+                    columns: Optional[Sequence[str]] = None,
+                    batch_size: int = DEFAULT_BATCH_SIZE) -> Iterator[pd.DataFrame]:
+        """The whole view in order, ``batch_size`` rows per frame."""
+        for start in range(0, self.row_count(rows), batch_size):
+            yield self.window(rows, start, batch_size, columns)
+
+    def to_dataframe(self, rows: Optional[np.ndarray],
+                     columns: Optional[Sequence[str]] = None) -> pd.DataFrame:
+        """Materialize the view — for callers that genuinely need a frame."""
+        return self.window(rows, 0, self.row_count(rows), columns)
+
+    # ── Pushed-down queries ─────────────────────────────────────────
+
+    def _run(self, sql: str, params: list, fetch):
+        """Execute and fetch under the lock (one DuckDB connection, any thread)."""
+        with self._lock:
+            if self._con is None:
+                import duckdb
+
+                self._con = duckdb.connect()
+                self._con.register("sv_rows", self._indexed)
+            return fetch(self._con.execute(sql, params))
+
+    def query_rows(
+        self,
+        filters: Dict[str, Set[str]],
+        search: str = "",
+        sort: Optional[Tuple[str, bool]] = None,
+    ) -> Optional[np.ndarray]:
+        """Row positions passing ``filters``/``search`` in ``sort`` order.
+
+        ``sort`` is ``(column, ascending)``; nulls sort last either way.
+        Returns ``None`` (every row, load order) when nothing applies.
+        """
+        where, params = where_clause(filters, search, self.columns)
+        if not where and sort is None:
+            return None
+        order = _qi(_ROW)
+        if sort is not None:
+            column, ascending = sort
+            order = f"{_qi(column)} {'ASC' if ascending else 'DESC'} NULLS LAST, {order}"
+        sql = f"SELECT {_qi(_ROW)} FROM sv_rows {where}\nORDER BY {order}"
+        result = self._run(sql, params, lambda cursor: cursor.fetchnumpy()[_ROW])
+        return np.asarray(result, dtype=np.int64)
+
+    def unique_values(self, column: str, filters: Dict[str, Set[str]]) -> List[str]:
+        """Distinct texts of ``column`` under every OTHER column's filter."""
+        others = {c: v for c, v in filters.items() if c != column}
+        where, params = where_clause(others)
+        sql = f"SELECT DISTINCT {_text_expr(column, BLANKS)} AS v FROM sv_rows {where}"
+        return [row[0] for row in self._run(sql, params, lambda cursor: cursor.fetchall())]
+
+    def close(self):
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
@@ -33,6 +33,10 @@ Key principles:
 - Color is stored directly on category items
 - Each item has a unique integer ID
 - Moving items = remove from source array, insert into target array
+- Lookups by ID or category name go through indexes kept up to date by every
+  manager mutation, so drag/drop and menu builds don't walk the whole tree
+- save() notifies callbacks at once but writes the file SAVE_DELAY_MS later,
+  so a burst of edits costs one write (flush() writes immediately)
 
 Usage:
     manager = get_bookmark_manager()
@@ -41,13 +45,20 @@ Usage:
     manager.add_category(bar_id=0, name="Work", color="#FF6B6B")
     manager.move_item(item_id=3, target_bar_id=1, target_index=0)
     manager.save()
+
+    with manager.batch():       # many edits, one save
+        ...
 """
 
+import atexit
 import json
 import logging
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, Any, List, Callable, Optional, Tuple, Union
 
+from PyQt6.QtCore import QCoreApplication, QTimer
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +73,7 @@ class BookmarkDataManager:
     - Simple move operations (just array manipulation)
     - Default initialization with two bars (horizontal + vertical)
     - Change notification callbacks
+    - ID / category-name indexes and debounced saves
     """
     
     _instance = None
@@ -70,6 +82,9 @@ class BookmarkDataManager:
     # File path
     DATA_FILE = Path.home() / ".suiteview" / "bookmarks.json"
     
+    # Delay between save() and the file write; later saves restart it
+    SAVE_DELAY_MS = 500
+    
     # Default bar configurations
     DEFAULT_BARS = {
         0: {"orientation": "horizontal"},  # Top bar
@@ -97,8 +112,22 @@ class BookmarkDataManager:
         # Callbacks for save notifications (bar_id -> list of callbacks)
         self._save_callbacks: Dict[int, List[Callable]] = {}
         
+        # Indexes (see _rebuild_index)
+        self._items_by_id: Dict[Any, Dict[str, Any]] = {}
+        self._categories_by_name: Dict[str, List[Dict[str, Any]]] = {}
+        self._locations: Dict[int, Tuple[Dict[str, Any], List, int, Union[Dict[str, Any], str]]] = {}
+        self._flat_items: Optional[List[Dict[str, Any]]] = None
+        self._index_stale = False
+        
+        # Deferred writes
+        self._save_pending = False
+        self._batch_depth = 0
+        self._save_timer: Optional[QTimer] = None
+        atexit.register(self.flush)
+        
         # Load data
         self._load()
+        self._rebuild_index()
     
     @classmethod
     def instance(cls) -> 'BookmarkDataManager':
@@ -108,6 +137,8 @@ class BookmarkDataManager:
     @classmethod
     def reset_instance(cls):
         """Reset the singleton (useful for testing)"""
+        if cls._instance is not None and cls._initialized:
+            cls._instance.flush()
         cls._instance = None
         cls._initialized = False
     
@@ -128,21 +159,9 @@ class BookmarkDataManager:
         return new_id
     
     def _find_max_item_id(self) -> int:
-        """Scan all items recursively and find the highest ID"""
-        max_id = 0
-        
-        def scan_items(items):
-            nonlocal max_id
-            for item in items:
-                if 'id' in item and isinstance(item['id'], int):
-                    max_id = max(max_id, item['id'])
-                if item.get('type') == 'category' and 'items' in item:
-                    scan_items(item['items'])
-        
-        for bar_data in self._data.get('bars', {}).values():
-            scan_items(bar_data.get('items', []))
-        
-        return max_id
+        """Find the highest item ID"""
+        self._ensure_index()
+        return max((item_id for item_id in self._items_by_id if isinstance(item_id, int)), default=0)
     
     def _find_max_bar_id(self) -> int:
         """Find the highest bar ID"""
@@ -176,6 +195,135 @@ class BookmarkDataManager:
         if needs_save:
             self.save()
     
+    # =========================================================================
+    # Indexes
+    # =========================================================================
+    #
+    # _items_by_id:        item id -> item
+    # _categories_by_name: category name -> categories with that name
+    # _locations:          id(item) -> (item, parent items list, index, parent)
+    #                      where parent is the containing category, or the bar
+    #                      key for top-level items
+    #
+    # Manager methods keep these current as they edit, and save() leaves them
+    # alone. Widgets also edit the lists they got from get_bar_data() /
+    # get_bar_items() / find_item_location() - sometimes long after, through
+    # a reference they keep - so those hand-outs mark the indexes stale, a
+    # hit is checked against the tree (O(depth)) before it is trusted, and a
+    # miss rebuilds the indexes once.
+    
+    def _rebuild_index(self):
+        """Index every item in every bar"""
+        self._items_by_id = {}
+        self._categories_by_name = {}
+        self._locations = {}
+        self._flat_items = None
+        for key, bar_data in self._data.get('bars', {}).items():
+            items = bar_data.get('items', [])
+            for i, item in enumerate(items):
+                self._index_item(item, items, i, key)
+        self._index_stale = False
+    
+    def _ensure_index(self):
+        """Rebuild the indexes if the tree may have been edited outside the manager"""
+        if self._index_stale:
+            self._rebuild_index()
+    
+    def _index_item(self, item: Dict[str, Any], items: List, index: int,
+                    parent: Union[Dict[str, Any], str]):
+        """Index an item and everything inside it"""
+        self._locations[id(item)] = (item, items, index, parent)
+        item_id = item.get('id')
+        if item_id is not None:
+            self._items_by_id.setdefault(item_id, item)
+        if item.get('type') == 'category':
+            self._categories_by_name.setdefault(item.get('name'), []).append(item)
+            children = item.get('items', [])
+            for i, child in enumerate(children):
+                self._index_item(child, children, i, item)
+    
+    def _unindex_item(self, item: Dict[str, Any]):
+        """Drop an item and everything inside it from the indexes"""
+        self._locations.pop(id(item), None)
+        item_id = item.get('id')
+        if item_id is not None and self._items_by_id.get(item_id) is item:
+            del self._items_by_id[item_id]
+        if item.get('type') == 'category':
+            self._unindex_name(item)
+            for child in item.get('items', []):
+                self._unindex_item(child)
+    
+    def _unindex_name(self, category: Dict[str, Any]):
+        name = category.get('name')
+        same_name = self._categories_by_name.get(name, [])
+        for i, other in enumerate(same_name):
+            if other is category:
+                same_name.pop(i)
+                break
+        if not same_name:
+            self._categories_by_name.pop(name, None)
+    
+    def _reposition(self, items: List, parent: Union[Dict[str, Any], str], start: int = 0):
+        """Record the new indexes of items[start:] after an insert or removal"""
+        for i in range(start, len(items)):
+            self._locations[id(items[i])] = (items[i], items, i, parent)
+    
+    def _is_attached(self, item: Dict[str, Any]) -> bool:
+        """Whether the recorded location of item (and of each parent) still holds"""
+        while True:
+            location = self._locations.get(id(item))
+            if location is None or location[0] is not item:
+                return False
+            _, items, index, parent = location
+            if index >= len(items) or items[index] is not item:
+                return False
+            if isinstance(parent, str):
+                bar_data = self._data.get('bars', {}).get(parent)
+                return bar_data is not None and bar_data.get('items') is items
+            if parent.get('items') is not items:
+                return False
+            item = parent
+    
+    def _tree_position(self, item: Dict[str, Any]) -> Tuple[int, ...]:
+        """Sort key putting items in the order a depth-first walk of the bars meets them"""
+        path = []
+        while True:
+            _, _, index, parent = self._locations[id(item)]
+            path.append(index)
+            if isinstance(parent, str):
+                path.append(list(self._data.get('bars', {})).index(parent))
+                return tuple(reversed(path))
+            item = parent
+    
+    def _insert_item(self, items: List, parent: Union[Dict[str, Any], str],
+                     index: Optional[int], item: Dict[str, Any]):
+        """Insert item at index (None or out of range = end) and index it"""
+        if index is None or not 0 <= index <= len(items):
+            index = len(items)
+        items.insert(index, item)
+        self._reposition(items, parent, index + 1)
+        self._index_item(item, items, index, parent)
+        self._flat_items = None
+    
+    def _pop_item(self, items: List, parent: Union[Dict[str, Any], str], index: int) -> Dict[str, Any]:
+        """Remove items[index] and drop it from the indexes"""
+        item = items.pop(index)
+        self._reposition(items, parent, index)
+        self._unindex_item(item)
+        self._flat_items = None
+        return item
+    
+    def _location_of(self, item_id: int) -> Optional[Tuple[Dict[str, Any], List, int, Union[Dict[str, Any], str]]]:
+        """(item, parent items list, index, parent) for an ID, or None"""
+        item = self._items_by_id.get(item_id)
+        if item is not None and item.get('id') == item_id and self._is_attached(item):
+            return self._locations[id(item)]
+        self._rebuild_index()
+        item = self._items_by_id.get(item_id)
+        if item is not None:
+            return self._locations[id(item)]
+        return None
+    
     # =========================================================================
     # Bar Operations
     # =========================================================================
@@ -189,6 +337,12 @@ class BookmarkDataManager:
         Get the full data dict for a bar.
         Returns a reference (not a copy).
         """
+        # The caller may edit it directly
+        self._index_stale = True
+        return self._bar_data(bar_id)
+    
+    def _bar_data(self, bar_id: int) -> Dict[str, Any]:
+        """get_bar_data() for the manager's own edits"""
         key = str(bar_id)
         if key not in self._data['bars']:
             orientation = self.DEFAULT_BARS.get(bar_id, {}).get('orientation', 'horizontal')
@@ -204,11 +358,11 @@ class BookmarkDataManager:
     
     def get_bar_orientation(self, bar_id: int) -> str:
         """Get the orientation of a bar ('horizontal' or 'vertical')"""
-        return self.get_bar_data(bar_id).get('orientation', 'horizontal')
+        return self._bar_data(bar_id).get('orientation', 'horizontal')
     
     def set_bar_orientation(self, bar_id: int, orientation: str):
         """Set the orientation of a bar"""
-        self.get_bar_data(bar_id)['orientation'] = orientation
+        self._bar_data(bar_id)['orientation'] = orientation
     
     def create_bar(self, orientation: str = 'horizontal') -> int:
         """Create a new bar and return its ID"""
@@ -223,6 +377,9 @@ class BookmarkDataManager:
         """Delete a bar. Returns True if deleted, False if not found."""
         key = str(bar_id)
         if key in self._data['bars']:
+            for item in self._data['bars'][key].get('items', []):
+                self._unindex_item(item)
+            self._flat_items = None
             del self._data['bars'][key]
             if bar_id in self._save_callbacks:
                 del self._save_callbacks[bar_id]
@@ -282,8 +439,8 @@ class BookmarkDataManager:
                         category['items'].append(bookmark)
             
             # Add to bar 0
-            bar_items = self.get_bar_items(0)
-            bar_items.append(category)
+            bar_data = self._bar_data(0)
+            self._insert_item(bar_data.setdefault('items', []), '0', None, category)
             
             return True
         else:
@@ -304,26 +461,22 @@ class BookmarkDataManager:
     # Item Addition
     # =========================================================================
     
+    def _add_to_bar(self, bar_id: int, item: Dict[str, Any], index: int = None):
+        bar_data = self._bar_data(bar_id)
+        self._insert_item(bar_data.setdefault('items', []), str(bar_id), index, item)
+    
     def add_bookmark_to_bar(self, bar_id: int, name: str, path: str, 
                             index: int = None) -> Dict[str, Any]:
         """Add a new bookmark to a bar at the given index (None = end)"""
         bookmark = self.create_bookmark(name, path)
-        items = self.get_bar_items(bar_id)
-        if index is not None and 0 <= index <= len(items):
-            items.insert(index, bookmark)
-        else:
-            items.append(bookmark)
+        self._add_to_bar(bar_id, bookmark, index)
         return bookmark
     
     def add_category_to_bar(self, bar_id: int, name: str, color: str = None,
                             index: int = None) -> Dict[str, Any]:
         """Add a new category to a bar at the given index (None = end)"""
         category = self.create_category(name, color)
-        items = self.get_bar_items(bar_id)
-        if index is not None and 0 <= index <= len(items):
-            items.insert(index, category)
-        else:
-            items.append(category)
+        self._add_to_bar(bar_id, category, index)
         return category
     
     def add_bookmark_to_category(self, category_id: int, name: str, path: str,
@@ -334,11 +487,7 @@ class BookmarkDataManager:
             return None
         
         bookmark = self.create_bookmark(name, path)
-        items = category.setdefault('items', [])
-        if index is not None and 0 <= index <= len(items):
-            items.insert(index, bookmark)
-        else:
-            items.append(bookmark)
+        self._insert_item(category.setdefault('items', []), category, index, bookmark)
         return bookmark
     
     def add_category_to_category(self, parent_id: int, name: str, color: str = None,
@@ -349,11 +498,7 @@ class BookmarkDataManager:
             return None
         
         category = self.create_category(name, color)
-        items = parent.setdefault('items', [])
-        if index is not None and 0 <= index <= len(items):
-            items.insert(index, category)
-        else:
-            items.append(category)
+        self._insert_item(parent.setdefault('items', []), parent, index, category)
         return category
     
     # =========================================================================
@@ -362,21 +507,8 @@ class BookmarkDataManager:
     
     def find_item_by_id(self, item_id: int) -> Optional[Dict[str, Any]]:
         """Find an item by ID anywhere in the tree"""
-        def search(items):
-            for item in items:
-                if item.get('id') == item_id:
-                    return item
-                if item.get('type') == 'category':
-                    found = search(item.get('items', []))
-                    if found:
-                        return found
-            return None
-        
-        for bar_data in self._data.get('bars', {}).values():
-            found = search(bar_data.get('items', []))
-            if found:
-                return found
-        return None
+        location = self._location_of(item_id)
+        return location[0] if location else None
     
     def find_item_location(self, item_id: int) -> Optional[Tuple[List, int]]:
         """
@@ -384,39 +516,26 @@ class BookmarkDataManager:
         Returns (parent_items_list, index) or None if not found.
         The parent_items_list is a reference, so you can modify it.
         """
-        def search(items):
-            for i, item in enumerate(items):
-                if item.get('id') == item_id:
-                    return (items, i)
-                if item.get('type') == 'category':
-                    found = search(item.get('items', []))
-                    if found:
-                        return found
+        location = self._location_of(item_id)
+        if not location:
             return None
-        
-        for bar_data in self._data.get('bars', {}).values():
-            found = search(bar_data.get('items', []))
-            if found:
-                return found
-        return None
+        # The caller may edit the list directly
+        self._index_stale = True
+        return (location[1], location[2])
     
     def find_category_by_name(self, name: str) -> Optional[Dict[str, Any]]:
         """Find a category by name (searches entire tree)"""
-        def search(items):
-            for item in items:
-                if item.get('type') == 'category' and item.get('name') == name:
-                    return item
-                if item.get('type') == 'category':
-                    found = search(item.get('items', []))
-                    if found:
-                        return found
+        categories = self._categories_by_name.get(name)
+        fresh = categories and all(c.get('name') == name and self._is_attached(c) for c in categories)
+        if not fresh:
+            self._rebuild_index()
+            categories = self._categories_by_name.get(name)
+        if not categories:
             return None
-        
-        for bar_data in self._data.get('bars', {}).values():
-            found = search(bar_data.get('items', []))
-            if found:
-                return found
-        return None
+        if len(categories) == 1:
+            return categories[0]
+        # Same name in several places: the first one a tree walk would meet
+        return min(categories, key=self._tree_position)
     
     def category_name_exists(self, name: str) -> bool:
         """Check if a category with this name exists anywhere"""
@@ -424,7 +543,7 @@ class BookmarkDataManager:
     
     def get_category_names_in_bar(self, bar_id: int) -> List[str]:
         """Get all category names in a specific bar (non-recursive, top-level only)"""
-        bar_data = self.get_bar_data(bar_id)
+        bar_data = self._bar_data(bar_id)
         return [item.get('name') for item in bar_data.get('items', []) 
                 if item.get('type') == 'category']
     
@@ -450,11 +569,7 @@ class BookmarkDataManager:
                 return None  # Already exists
         
         bookmark = self.create_bookmark(name, path)
-        items = category.setdefault('items', [])
-        if index is not None and 0 <= index <= len(items):
-            items.insert(index, bookmark)
-        else:
-            items.append(bookmark)
+        self._insert_item(category.setdefault('items', []), category, index, bookmark)
         return bookmark
     
     def remove_bookmark_from_category_by_name(self, category_name: str, path: str) -> bool:
@@ -462,24 +577,20 @@ class BookmarkDataManager:
         category = self.find_category_by_name(category_name)
         if not category:
             return False
-        
-        items = category.get('items', [])
-        for i, item in enumerate(items):
-            if item.get('type') == 'bookmark' and item.get('path') == path:
-                items.pop(i)
-                return True
-        return False
+        return self._remove_bookmark_from_category(category, path)
     
     def remove_bookmark_from_category_by_id(self, category_id: int, path: str) -> bool:
         """Remove a bookmark from a category by category ID and bookmark path"""
         category = self.find_item_by_id(category_id)
         if not category or category.get('type') != 'category':
             return False
-        
+        return self._remove_bookmark_from_category(category, path)
+    
+    def _remove_bookmark_from_category(self, category: Dict[str, Any], path: str) -> bool:
         items = category.get('items', [])
         for i, item in enumerate(items):
             if item.get('type') == 'bookmark' and item.get('path') == path:
-                items.pop(i)
+                self._pop_item(items, category, i)
                 return True
         return False
     
@@ -504,7 +615,7 @@ class BookmarkDataManager:
         if not item or item.get('type') != 'category':
             return False
         if name is not None:
-            item['name'] = name
+            self._set_category_name(item, name)
         if color is not None:
             item['color'] = color
         elif color == '':
@@ -512,6 +623,11 @@ class BookmarkDataManager:
             item.pop('color', None)
         return True
     
+    def _set_category_name(self, category: Dict[str, Any], name: str):
+        self._unindex_name(category)
+        category['name'] = name
+        self._categories_by_name.setdefault(name, []).append(category)
+    
     def set_category_color(self, item_id: int, color: str) -> bool:
         """Set a category's color"""
         return self.update_category(item_id, color=color)
@@ -529,12 +645,12 @@ class BookmarkDataManager:
         Remove an item by ID and return it.
         Returns the removed item, or None if not found.
         """
-        location = self.find_item_location(item_id)
+        location = self._location_of(item_id)
         if not location:
             return None
         
-        items_list, index = location
-        return items_list.pop(index)
+        _, items_list, index, parent = location
+        return self._pop_item(items_list, parent, index)
     
     def delete_item(self, item_id: int) -> bool:
         """Delete an item by ID. Returns True if deleted."""
@@ -575,17 +691,16 @@ class BookmarkDataManager:
                 logger.error(f"Move failed: target category {target_category_id} not found")
                 return False
             target_items = target_category.setdefault('items', [])
+            target_parent = target_category
         elif target_bar_id is not None:
-            target_items = self.get_bar_items(target_bar_id)
+            target_items = self._bar_data(target_bar_id).setdefault('items', [])
+            target_parent = str(target_bar_id)
         else:
             logger.error("Move failed: no target specified")
             return False
         
         # Insert at target
-        if target_index is not None and 0 <= target_index <= len(target_items):
-            target_items.insert(target_index, item)
-        else:
-            target_items.append(item)
+        self._insert_item(target_items, target_parent, target_index, item)
         
         return True
     
@@ -593,11 +708,11 @@ class BookmarkDataManager:
         """
         Move an item within its current parent to a new index.
         """
-        location = self.find_item_location(item_id)
+        location = self._location_of(item_id)
         if not location:
             return False
         
-        items_list, current_index = location
+        _, items_list, current_index, parent = location
         
         if new_index < 0 or new_index > len(items_list):
             return False
@@ -611,6 +726,8 @@ class BookmarkDataManager:
         if current_index < new_index:
             new_index -= 1
         items_list.insert(new_index, item)
+        self._reposition(items_list, parent, min(current_index, new_index))
+        self._flat_items = None
         
         return True
     
@@ -620,18 +737,21 @@ class BookmarkDataManager:
     
     def get_all_items_flat(self) -> List[Dict[str, Any]]:
         """Get all items as a flat list (for searching, etc.)"""
-        result = []
-        
-        def collect(items):
-            for item in items:
-                result.append(item)
-                if item.get('type') == 'category':
-                    collect(item.get('items', []))
-        
-        for bar_data in self._data.get('bars', {}).values():
-            collect(bar_data.get('items', []))
+        self._ensure_index()
+        if self._flat_items is None:
+            result = []
+            
+            def collect(items):
+                for item in items:
+                    result.append(item)
+                    if item.get('type') == 'category':
+                        collect(item.get('items', []))
+            
+            for bar_data in self._data.get('bars', {}).values():
+                collect(bar_data.get('items', []))
+            self._flat_items = result
         
-        return result
+        return list(self._flat_items)
     
     def get_all_categories(self) -> List[Dict[str, Any]]:
         """Get all categories as a flat list"""
@@ -645,7 +765,7 @@ class BookmarkDataManager:
     
     def is_path_in_bar(self, bar_id: int, path: str) -> bool:
         """Check if a path exists in a bar (at top level or in any category)"""
-        items = self.get_bar_items(bar_id)
+        items = self._bar_data(bar_id).get('items', [])
         
         def check_items(items_list):
             for item in items_list:
@@ -660,26 +780,57 @@ class BookmarkDataManager:
     
     def remove_bookmark_by_path(self, bar_id: int, path: str) -> bool:
         """Remove a bookmark from a bar by its path (searches recursively)"""
-        items = self.get_bar_items(bar_id)
+        items = self._bar_data(bar_id).get('items', [])
         
-        def remove_from_list(items_list):
+        def remove_from_list(items_list, parent):
             for i, item in enumerate(items_list):
                 if item.get('type') == 'bookmark' and item.get('path') == path:
-                    items_list.pop(i)
+                    self._pop_item(items_list, parent, i)
                     return True
                 if item.get('type') == 'category':
-                    if remove_from_list(item.get('items', [])):
+                    if remove_from_list(item.get('items', []), item):
                         return True
             return False
         
-        return remove_from_list(items)
+        return remove_from_list(items, str(bar_id))
     
     # =========================================================================
     # Persistence
     # =========================================================================
     
     def save(self):
-        """Save all data to the JSON file"""
+        """
+        Save all data to the JSON file.
+        
+        Callbacks run now; the write happens SAVE_DELAY_MS later (restarted by
+        each save) when a Qt application is running, otherwise immediately.
+        Inside batch() nothing happens until the outermost batch ends.
+        """
+        # Callers save after editing the tree directly; lookups re-check the
+        # tree themselves, only the flat list has to be walked again
+        self._flat_items = None
+        self._save_pending = True
+        if self._batch_depth:
+            return
+        
+        self._notify_callbacks()
+        
+        if QCoreApplication.instance() is None:
+            self.flush()
+            return
+        if self._save_timer is None:
+            self._save_timer = QTimer()
+            self._save_timer.setSingleShot(True)
+            self._save_timer.timeout.connect(self.flush)
+        self._save_timer.start(self.SAVE_DELAY_MS)
+    
+    def flush(self):
+        """Write a pending save to disk now"""
+        if self._save_timer is not None:
+            self._save_timer.stop()
+        if not self._save_pending:
+            return
+        self._save_pending = False
         try:
             self.DATA_FILE.parent.mkdir(parents=True, exist_ok=True)
             
@@ -691,13 +842,24 @@ class BookmarkDataManager:
             temp_file.replace(self.DATA_FILE)
             logger.debug(f"Saved bookmark data to {self.DATA_FILE}")
             
-            self._notify_callbacks()
-            
         except Exception as e:
             logger.error(f"Failed to save bookmark data: {e}")
     
+    @contextmanager
+    def batch(self):
+        """Group edits so their save() calls become one save at the end"""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._save_pending:
+                self.save()
+    
     def _load(self):
         """Load data from file or initialize with defaults"""
+        # self._data is replaced below
+        self._index_stale = True
         try:
             if self.DATA_FILE.exists():
                 with open(self.DATA_FILE, 'r', encoding='utf-8') as f:
@@ -967,7 +1129,7 @@ class BookmarkDataManager:
         if not category:
             return False
         
-        category['name'] = new_name
+        self._set_category_name(category, new_name)
         return True
     
     def delete_category(self, name: str, recursive: bool = True) -> bool:
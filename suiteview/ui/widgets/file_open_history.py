@@ -3,13 +3,15 @@ File Open History Panel — reads Windows Recent Items to show files and folders
 across ALL applications (Office, Notepad++, VS Code, etc.) over the last 30 days.
 
 Displays 3 columns filled top-to-bottom, oldest at top-left, newest at bottom-right.
+Entries come from the persisted index in recent_files_index, so the panel opens
+from memory and only links that changed since the last look are resolved, in the
+background.
 """
 
 import os
 import sys
 import logging
 from pathlib import Path
-from datetime import datetime, timedelta
 from collections import defaultdict
 
 from PyQt6.QtWidgets import (
@@ -17,9 +19,13 @@ from PyQt6.QtWidgets import (
     QFrame, QToolButton, QPushButton, QSizePolicy, QMenu,
     QLineEdit, QFileIconProvider, QApplication,
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize, QEvent, QTimer, QFileInfo
+from PyQt6.QtCore import Qt, pyqtSignal, QSize, QEvent, QTimer, QFileInfo, QThread
 from PyQt6.QtGui import QIcon
 
+from suiteview.ui.widgets.recent_files_index import (
+    NameSearchIndex, get_recent_files_index, recent_items_dir,
+)
+
 logger = logging.getLogger(__name__)
 
 # Extensions we care about (common work files)
@@ -45,185 +51,36 @@ TRACKED_EXTENSIONS = {
 DAY_NAMES = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
 
 
-def _get_recent_files(days=7):
-    """
-    Scan Windows Recent Items folder and return a dict:
-        { date_str: [ (filename, full_target_path, timestamp), ... ] }
-    grouped by calendar day for the last `days` days.
+def get_recent_files_cached(days=7):
     """
-    recent_dir = Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Windows' / 'Recent'
-    if not recent_dir.is_dir():
-        return {}
+    Return recent files from the persisted Recent Items index:
+        { date_str: [ (filename, full_target_path, timestamp, is_folder), ... ] }
+    grouped by calendar day for the last `days` days, oldest first.
 
-    cutoff = datetime.now() - timedelta(days=days)
+    Reflects the index as of its last update() — the panel runs that in the
+    background and refreshes when it finds new links.
+    """
     by_day = defaultdict(list)
-
-    # Try using win32com for fast shortcut resolution
-    shell = None
-    try:
-        import win32com.client
-        shell = win32com.client.Dispatch("WScript.Shell")
-    except Exception:
-        pass
-
-    for lnk in recent_dir.iterdir():
-        if lnk.suffix.lower() != '.lnk':
-            continue
-        try:
-            mtime = datetime.fromtimestamp(lnk.stat().st_mtime)
-        except OSError:
-            continue
-        if mtime < cutoff:
-            continue
-
-        # Resolve the shortcut target
-        target = None
-        if shell:
-            try:
-                sc = shell.CreateShortCut(str(lnk))
-                target = sc.Targetpath
-            except Exception:
-                pass
-
-        if not target:
-            # Derive from .lnk filename as a fallback (strip trailing .lnk)
-            target = lnk.stem  # e.g. "report.xlsx"
-
-        target_path = Path(target) if target else None
-
-        # Determine if it looks like a folder
-        is_folder = bool(target_path and target_path.is_dir())
-
+    for display_name, full_path, timestamp, is_folder in get_recent_files_index().entries(days):
         # Filter by extension (folders pass through without extension check)
-        if not is_folder:
-            ext = target_path.suffix.lower() if target_path else ''
-            if ext not in TRACKED_EXTENSIONS:
-                continue
-
-        day_key = mtime.strftime('%Y-%m-%d')
-        display_name = target_path.name if target_path else lnk.stem
-        # Keep the full path even if the file isn't locally cached
-        # (OneDrive on-demand files aren't on disk but os.startfile handles them)
-        full_path = str(target_path) if target_path and len(target_path.parts) > 1 else ''
-        by_day[day_key].append((display_name, full_path, mtime, is_folder))
-
-    # Sort each day's entries by time ascending (oldest first at top, newest at bottom)
-    for day in by_day:
-        by_day[day].sort(key=lambda x: x[2], reverse=False)
-
+        if not is_folder and Path(display_name).suffix.lower() not in TRACKED_EXTENSIONS:
+            continue
+        by_day[timestamp.strftime('%Y-%m-%d')].append((display_name, full_path, timestamp, is_folder))
     return dict(by_day)
 
 
-# ── Cache for previous days (they never change) ──
-_day_cache = {}       # { 'YYYY-MM-DD': [ (name, path, datetime), ... ] }
-_cache_date = None    # date when cache was last built
-
-
-def get_recent_files_cached(days=7):
-    """Return recent files with caching for past days.
-    
-    Only today's column is rescanned each time. Previous days are
-    served from an in-memory cache that persists for the session.
-    """
-    global _day_cache, _cache_date
-
-    today = datetime.now().date()
-    today_key = today.strftime('%Y-%m-%d')
-
-    # If the calendar day rolled over, invalidate the whole cache
-    if _cache_date != today:
-        _day_cache.clear()
-        _cache_date = today
-
-    # Figure out which days we still need to scan
-    needed_days = set()
-    for offset in range(days):
-        day = today - timedelta(days=offset)
-        day_key = day.strftime('%Y-%m-%d')
-        if day_key == today_key or day_key not in _day_cache:
-            needed_days.add(day_key)
-
-    if needed_days:
-        # Only scan .lnk files whose mtime falls in a needed day
-        fresh = _scan_recent_for_days(needed_days, days)
-        _day_cache.update(fresh)
-        # Ensure days with no files still get cached (so we don't rescan)
-        for dk in needed_days:
-            if dk not in _day_cache:
-                _day_cache[dk] = []
-
-    # Return only the last `days` worth
-    result = {}
-    for offset in range(days):
-        day = today - timedelta(days=offset)
-        day_key = day.strftime('%Y-%m-%d')
-        if day_key in _day_cache:
-            result[day_key] = _day_cache[day_key]
-    return result
-
-
-def _scan_recent_for_days(needed_day_keys, max_days=7):
-    """Scan Windows Recent Items but only process .lnk files whose date is in needed_day_keys."""
-    recent_dir = Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Windows' / 'Recent'
-    if not recent_dir.is_dir():
-        return {}
-
-    cutoff = datetime.now() - timedelta(days=max_days)
-    by_day = defaultdict(list)
+class _IndexUpdateThread(QThread):
+    """Brings the Recent Items index up to date off the UI thread."""
 
-    shell = None
-    try:
-        import win32com.client
-        shell = win32com.client.Dispatch("WScript.Shell")
-    except Exception:
-        pass
+    updated = pyqtSignal(int)  # number of records changed
 
-    for lnk in recent_dir.iterdir():
-        if lnk.suffix.lower() != '.lnk':
-            continue
+    def run(self):
         try:
-            mtime = datetime.fromtimestamp(lnk.stat().st_mtime)
-        except OSError:
-            continue
-        if mtime < cutoff:
-            continue
-
-        day_key = mtime.strftime('%Y-%m-%d')
-        if day_key not in needed_day_keys:
-            continue
-
-        target = None
-        if shell:
-            try:
-                sc = shell.CreateShortCut(str(lnk))
-                target = sc.Targetpath
-            except Exception:
-                pass
-
-        if not target:
-            target = lnk.stem
-
-        target_path = Path(target) if target else None
-
-        # Determine if it looks like a folder
-        is_folder = bool(target_path and target_path.is_dir())
-
-        # Filter by extension (folders pass through without extension check)
-        if not is_folder:
-            ext = target_path.suffix.lower() if target_path else ''
-            if ext not in TRACKED_EXTENSIONS:
-                continue
-
-        display_name = target_path.name if target_path else lnk.stem
-        # Keep the full path even if the file isn't locally cached
-        # (OneDrive on-demand files aren't on disk but os.startfile handles them)
-        full_path = str(target_path) if target_path and len(target_path.parts) > 1 else ''
-        by_day[day_key].append((display_name, full_path, mtime, is_folder))
-
-    for day in by_day:
-        by_day[day].sort(key=lambda x: x[2], reverse=False)
-
-    return dict(by_day)
+            changed = get_recent_files_index().update()
+        except Exception as e:
+            logger.error(f"Recent files index update failed: {e}")
+            changed = 0
+        self.updated.emit(changed)
 
 
 class FileOpenHistoryPanel(QWidget):
@@ -254,6 +111,9 @@ class FileOpenHistoryPanel(QWidget):
         self._resize_start_w = 0
         self._resize_start_left = 0
         self._file_buttons = []  # list of (QPushButton, display_name) for search highlighting
+        self._search_index = NameSearchIndex([])
+        self._highlighted = set()  # positions in _file_buttons currently highlighted
+        self._index_thread = None
         self._build_ui()
         self._build_custom_tooltip()
 
@@ -418,6 +278,7 @@ class FileOpenHistoryPanel(QWidget):
 
         # Clear old columns
         self._file_buttons.clear()
+        self._highlighted = set()
         while self.columns_layout.count():
             item = self.columns_layout.takeAt(0)
             w = item.widget()
@@ -460,10 +321,26 @@ class FileOpenHistoryPanel(QWidget):
             col = self._make_column(col_entries)
             self.columns_layout.addWidget(col, 1)  # equal stretch factor
 
+        self._search_index = NameSearchIndex(name for _, name in self._file_buttons)
+        self._on_search_changed(self._search_box.text())
+
+    def update_index(self):
+        """Pick up new Recent Items in the background; refreshes when any changed."""
+        if self._index_thread is not None and self._index_thread.isRunning():
+            return
+        self._index_thread = _IndexUpdateThread(self)
+        self._index_thread.updated.connect(self._on_index_updated)
+        self._index_thread.start()
+
+    def _on_index_updated(self, changed: int):
+        if changed and self.isVisible():
+            self.refresh()
+
     def show_under(self, button: QWidget):
         """Position with bottom edge aligned to top of the button, stretching up to top of screen."""
         self._search_box.clear()
         self.refresh()
+        self.update_index()
 
         screen = button.screen().availableGeometry() if button.screen() else None
         if FileOpenHistoryPanel._session_width is not None:
@@ -766,12 +643,12 @@ class FileOpenHistoryPanel(QWidget):
 
     def _on_search_changed(self, text: str):
         """Highlight file buttons whose name contains the search string."""
-        needle = text.strip().lower()
-        for btn, display_name in self._file_buttons:
-            if needle and needle in display_name.lower():
-                btn.setStyleSheet(self._BTN_STYLE_HIGHLIGHT)
-            else:
-                btn.setStyleSheet(self._BTN_STYLE_NORMAL)
+        matches = self._search_index.matching(text.strip())
+        # Restyle only the buttons whose highlight changed
+        for i in matches ^ self._highlighted:
+            btn = self._file_buttons[i][0]
+            btn.setStyleSheet(self._BTN_STYLE_HIGHLIGHT if i in matches else self._BTN_STYLE_NORMAL)
+        self._highlighted = matches
 
     # ── File icon helper ─────────────────────────────────────────────
     @classmethod
@@ -883,7 +760,7 @@ class FileOpenHistoryPanel(QWidget):
 
     def _open_recent_folder(self):
         """Open the Windows Recent Items folder in Explorer."""
-        recent_dir = Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Windows' / 'Recent'
+        recent_dir = recent_items_dir()
         if recent_dir.is_dir():
             self.hide()
             try:
@@ -0,0 +1,153 @@
+"""
+Categorical-code filter and sort engine for FilterTableView.
+
+Each column is factorized once, on first use, into per-row integer codes
+plus its distinct values. The engine keeps, for each code:
+
+* the filter text the popup shows (``str(value)``, nulls as ``(Blanks)``);
+* the ascending and descending sort rank, built once per column.
+
+With those cached:
+
+* a column filter is a flag per distinct value looked up by code — a
+  boolean row mask built without stringifying the column;
+* several filters are AND-ed mask by mask, and each column's mask is
+  cached against its selected values;
+* the filter popup's cascading values are the codes that survive every
+  other column's mask (one ``bincount``);
+* a sort is a cached stable permutation of all rows. Re-ordering any row
+  subset keeps that permutation's order, so the frame is never copied or
+  re-sorted.
+
+Everything works on row positions. The view maps them to index labels.
+Pure Python — no PyQt.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+BLANKS = "(Blanks)"
+
+
+class _ColumnCodes:
+    """One column as codes into its distinct values (nulls get the last code)."""
+
+    def __init__(self, values: pd.Series):
+        try:
+            codes, uniques = pd.factorize(values)
+            distinct = list(uniques)
+        except TypeError:  # unhashable cells (lists, dicts): factorize their text
+            codes, uniques = pd.factorize(values.astype(str).where(values.notna()))
+            distinct = list(uniques)
+        self.null_code = len(distinct)
+        codes = np.asarray(codes, dtype=np.int64)
+        self.has_nulls = bool((codes < 0).any())
+        codes[codes < 0] = self.null_code
+        self.codes = codes
+        self.uniques = uniques
+        self.values: List[Any] = distinct + [np.nan]
+        self.labels = np.array([str(v) for v in distinct] + [BLANKS], dtype=object)
+        self._ranks: Dict[bool, np.ndarray] = {}
+
+    def flags(self, selected: FrozenSet[str]) -> np.ndarray:
+        """Per-code flag: is this value's filter text selected?"""
+        return np.fromiter((label in selected for label in self.labels),
+                           dtype=bool, count=len(self.labels))
+
+    def rank(self, ascending: bool) -> np.ndarray:
+        """Per-code sort rank; nulls last in either direction (as sort_values)."""
+        rank = self._ranks.get(ascending)
+        if rank is None:
+            try:
+                order = np.asarray(pd.Index(self.uniques).argsort(), dtype=np.int64)
+            except TypeError:  # mixed types: order by their text
+                order = np.argsort(self.labels[:-1], kind="stable")
+            if not ascending:
+                order = order[::-1]
+            rank = np.empty(len(self.labels), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            rank[self.null_code] = len(order)
+            self._ranks[ascending] = rank
+        return rank
+
+
+class FilterEngine:
+    """Filter masks, cascading distinct values and sort orders for one DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self.row_count = len(df)
+        self._columns: Dict[str, _ColumnCodes] = {}
+        self._masks: Dict[str, Tuple[FrozenSet[str], np.ndarray]] = {}
+        self._permutations: Dict[Tuple[str, bool], np.ndarray] = {}
+
+    def column(self, name: str) -> _ColumnCodes:
+        codes = self._columns.get(name)
+        if codes is None:
+            codes = _ColumnCodes(self._df[name])
+            self._columns[name] = codes
+        return codes
+
+    # ── Filters ─────────────────────────────────────────────────────
+
+    def column_mask(self, name: str, selected: Set[str]) -> np.ndarray:
+        """Rows whose filter text is one of ``selected`` (cached per selection)."""
+        key = frozenset(selected)
+        cached = self._masks.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        column = self.column(name)
+        mask = column.flags(key)[column.codes]
+        self._masks[name] = (key, mask)
+        return mask
+
+    def filter_mask(self, filters: Dict[str, Set[str]], exclude: Optional[str] = None) -> Optional[np.ndarray]:
+        """AND of every column filter except ``exclude``; None when none apply."""
+        combined = None
+        for name, selected in filters.items():
+            if name == exclude:
+                continue
+            mask = self.column_mask(name, selected)
+            combined = mask.copy() if combined is None else np.logical_and(combined, mask, out=combined)
+        return combined
+
+    def filtered_positions(self, filters: Dict[str, Set[str]]) -> Optional[np.ndarray]:
+        """Row positions passing all filters, in frame order (None = every row)."""
+        mask = self.filter_mask(filters)
+        return None if mask is None else np.flatnonzero(mask)
+
+    def unique_values(self, name: str, filters: Dict[str, Set[str]]) -> List[Any]:
+        """Distinct values of ``name`` among rows passing every OTHER filter.
+
+        Nulls come back as NaN (shown as ``(Blanks)``).
+        """
+        column = self.column(name)
+        mask = self.filter_mask(filters, exclude=name)
+        if mask is None:
+            present = np.arange(column.null_code + (1 if column.has_nulls else 0))
+        else:
+            counts = np.bincount(column.codes[mask], minlength=len(column.labels))
+            present = np.flatnonzero(counts)
+        return [column.values[code] for code in present]
+
+    # ── Sort ────────────────────────────────────────────────────────
+
+    def permutation(self, name: str, ascending: bool) -> np.ndarray:
+        """All row positions in sorted order (stable; cached per column and direction)."""
+        key = (name, ascending)
+        perm = self._permutations.get(key)
+        if perm is None:
+            column = self.column(name)
+            perm = np.argsort(column.rank(ascending)[column.codes], kind="stable")
+            self._permutations[key] = perm
+        return perm
+
+    def sort_positions(self, positions: np.ndarray, name: str, ascending: bool) -> np.ndarray:
+        """``positions`` re-ordered by ``name`` (ties keep frame order)."""
+        perm = self.permutation(name, ascending)
+        keep = np.zeros(self.row_count, dtype=bool)
+        keep[positions] = True
+        return perm[keep[perm]]
@@ -1,22 +1,38 @@
 """FilterTableView - Excel-style filterable table view for DataFrames"""
 
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Set, List, Any
+import numpy as np
 import pandas as pd
 from functools import reduce
 import operator
 from pandas.api.types import is_numeric_dtype
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView, QListView, QAbstractItemView,
                               QHeaderView, QLineEdit, QPushButton, QMenu, QStyledItemDelegate,
-                              QLabel, QWidgetAction, QFileDialog, QMessageBox)
+                              QLabel, QWidgetAction, QFileDialog, QMessageBox, QProgressDialog)
 from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel, pyqtSignal, QRect, QPoint, QTimer, QThread, QStringListModel, QSize
 from PyQt6.QtGui import QFont, QFontMetrics, QAction, QPainter, QColor
 
+from .arrow_table_source import ArrowTableSource
+from .filter_engine import FilterEngine
+from .search_index import SearchIndex
+from .table_export import (ExportCancelled, ExportPlan, EXCEL_MAX_DATA_ROWS, WRITERS,
+                           clipboard_text, display_texts)
+
 logger = logging.getLogger(__name__)
 
-# Performance optimization: Limit displayed rows for large datasets
-MAX_DISPLAY_ROWS = 50000  # Configurable maximum rows to display
+# Performance optimization: DataFrames larger than this are browsed through the
+# windowed Arrow/DuckDB backend (ArrowTableModel) instead of a pandas model
+MAX_DISPLAY_ROWS = 50000  # Configurable maximum rows held in a pandas model
+UNIQUE_VALUES_CACHE_SIZE = 64  # cascading filter-popup value lists kept
+SEARCH_INDEX_MIN_ROWS = 20000  # frames this large get a background search index
+
+_ALIGN_LEFT = int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+_ALIGN_RIGHT = int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
 
 
 class _SolidColumnDelegate(QStyledItemDelegate):
@@ -326,6 +342,7 @@ class PandasTableModel(QAbstractTableModel):
     def __init__(self, df: pd.DataFrame):
         super().__init__()
         self._original_df = df  # Keep original (no copy!)
+        self._column_names = [str(c) for c in df.columns]  # fixed for a model
         self._filtered_indices = df.index  # Indices after column filters
         self._display_indices = df.index   # Indices after global search
         self._default_numeric_decimals: Optional[int] = None
@@ -335,20 +352,95 @@ class PandasTableModel(QAbstractTableModel):
         self._header_labels: Dict[str, str] = {}
         self._not_computed_columns: Set[str] = set()
         self._not_computed_note: str = ""
+        # Display cache: pre-formatted cell text per (row block, column block),
+        # aligned with _display_indices. Built on first paint of a block and
+        # dropped when indices (filter / search / sort) or decimals change.
+        self._display_positions: Optional[np.ndarray] = None
+        self._display_blocks: "OrderedDict[tuple[int, int], List[List[str]]]" = OrderedDict()
+
+    # Cache geometry: a block is DISPLAY_ROW_BLOCK rows x DISPLAY_COLUMN_BLOCK
+    # columns; at most DISPLAY_MAX_BLOCKS are kept (least recently painted go).
+    DISPLAY_ROW_BLOCK = 512
+    DISPLAY_COLUMN_BLOCK = 16
+    DISPLAY_MAX_BLOCKS = 128
 
     def set_filtered_indices(self, indices: pd.Index):
         """Update the filtered indices (after column filters)"""
         self.beginResetModel()
         self._filtered_indices = indices
         self._display_indices = indices
+        self._invalidate_display_cache()
         self.endResetModel()
 
     def set_display_indices(self, indices: pd.Index):
         """Update the display indices (after global search)"""
         self.beginResetModel()
         self._display_indices = indices
+        self._invalidate_display_cache()
         self.endResetModel()
 
+    def _invalidate_display_cache(self):
+        self._display_positions = None
+        self._display_blocks.clear()
+
+    def _positions(self) -> Optional[np.ndarray]:
+        """Integer row positions of _display_indices (None for duplicate labels)."""
+        if self._display_positions is None:
+            index = self._original_df.index
+            if not index.is_unique:
+                return None
+            self._display_positions = index.get_indexer(self._display_indices)
+        return self._display_positions
+
+    def _cached_text(self, row: int, column: int) -> Optional[str]:
+        """Formatted display text for a cell from the block cache, building the block on a miss."""
+        key = (row // self.DISPLAY_ROW_BLOCK, column // self.DISPLAY_COLUMN_BLOCK)
+        block = self._display_blocks.get(key)
+        if block is None:
+            block = self._build_block(*key)
+            if block is None:
+                return None
+            self._display_blocks[key] = block
+            while len(self._display_blocks) > self.DISPLAY_MAX_BLOCKS:
+                self._display_blocks.popitem(last=False)
+        else:
+            self._display_blocks.move_to_end(key)
+        return block[column % self.DISPLAY_COLUMN_BLOCK][row % self.DISPLAY_ROW_BLOCK]
+
+    def _build_block(self, row_block: int, column_block: int) -> Optional[List[List[str]]]:
+        positions = self._positions()
+        if positions is None:
+            return None
+        return self._format_block(positions, row_block, column_block)
+
+    def _format_block(self, positions: np.ndarray, row_block: int, column_block: int) -> List[List[str]]:
+        """Format one block column-by-column (same text as format_value_for_column)."""
+        r0 = row_block * self.DISPLAY_ROW_BLOCK
+        c0 = column_block * self.DISPLAY_COLUMN_BLOCK
+        c1 = min(c0 + self.DISPLAY_COLUMN_BLOCK, self.columnCount())
+        frame = self._original_df.iloc[positions[r0:r0 + self.DISPLAY_ROW_BLOCK], c0:c1]
+        return self._format_frame(frame, c0)
+
+    def _format_frame(self, frame: pd.DataFrame, c0: int) -> List[List[str]]:
+        """Display text per column of ``frame``, whose first column is model column ``c0``."""
+        columns = []
+        for offset in range(frame.shape[1]):
+            decimals = None
+            if self.is_numeric_column(c0 + offset):
+                decimals = self.decimal_mode_for_column(c0 + offset)
+            columns.append(display_texts(frame.iloc[:, offset].array, decimals))
+        return columns
+
+    def export_decimals(self) -> Dict[str, int]:
+        """Decimals per numeric column that has a fixed setting (copy / export formatting)."""
+        decimals = {}
+        for column_index, column_name in enumerate(self._column_names):
+            if self.is_numeric_column(column_index):
+                mode = self.decimal_mode_for_column(column_index)
+                if mode is not None:
+                    decimals[column_name] = mode
+        return decimals
+
     def get_original_data(self) -> pd.DataFrame:
         """Get the original unfiltered data"""
         return self._original_df
@@ -361,6 +453,13 @@ class PandasTableModel(QAbstractTableModel):
         """Get the currently displayed data"""
         return self._original_df.loc[self._display_indices]
 
+    def display_sample(self, sample_rows: int) -> pd.DataFrame:
+        """Up to ``sample_rows`` displayed rows, half from each end (column autofit)."""
+        df = self.get_display_data()
+        if len(df) > sample_rows:
+            df = pd.concat([df.head(sample_rows // 2), df.tail(sample_rows // 2)])
+        return df
+
     def set_numeric_formatting(
         self,
         default_decimals: Optional[int] = None,
@@ -368,6 +467,7 @@ class PandasTableModel(QAbstractTableModel):
     ):
         self._default_numeric_decimals = default_decimals
         self._column_decimals = dict(column_decimals or {})
+        self._invalidate_display_cache()
         if self.rowCount() > 0 and self.columnCount() > 0:
             top_left = self.index(0, 0)
             bottom_right = self.index(self.rowCount() - 1, self.columnCount() - 1)
@@ -433,7 +533,7 @@ class PandasTableModel(QAbstractTableModel):
         return is_numeric_dtype(self._original_df.iloc[:, column_index])
 
     def column_name(self, column_index: int) -> str:
-        return str(self._original_df.columns[column_index])
+        return self._column_names[column_index]
 
     def decimal_mode_for_column(self, column_index: int) -> Optional[int]:
         return self._column_decimals.get(self.column_name(column_index), self._default_numeric_decimals)
@@ -463,7 +563,10 @@ class PandasTableModel(QAbstractTableModel):
         if role == Qt.ItemDataRole.DisplayRole:
             if self.is_not_computed_column(self.column_name(index.column())):
                 return self.NOT_COMPUTED_MARKER
-            # Use display indices to get actual row
+            text = self._cached_text(index.row(), index.column())
+            if text is not None:
+                return text
+            # Duplicate index labels: resolve the cell directly
             actual_row = self._display_indices[index.row()]
             value = self._original_df.iloc[self._original_df.index.get_loc(actual_row), index.column()]
             return self.format_value_for_column(self.column_name(index.column()), value)
@@ -496,8 +599,8 @@ class PandasTableModel(QAbstractTableModel):
 
         if role == Qt.ItemDataRole.TextAlignmentRole:
             if hasattr(self, '_left_align_columns') and index.column() in self._left_align_columns:
-                return int(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                return _ALIGN_LEFT
+            return _ALIGN_RIGHT
 
         return None
 
@@ -520,6 +623,65 @@ class PandasTableModel(QAbstractTableModel):
         return None
 
 
+class ArrowTableModel(PandasTableModel):
+    """Windowed table model over an ``ArrowTableSource``.
+
+    For results too large to hold as a DataFrame. Painting goes through the
+    same block cache as PandasTableModel, but each block is cut from the Arrow
+    table on demand instead of indexed out of a frame. What is displayed is an
+    array of row positions produced by the source's pushed-down filters,
+    search and sort (``None`` = every row in load order).
+    """
+
+    def __init__(self, source: ArrowTableSource):
+        super().__init__(source.schema_frame())
+        self._source = source
+        self._rows: Optional[np.ndarray] = None
+
+    @property
+    def source(self) -> ArrowTableSource:
+        return self._source
+
+    def display_rows(self) -> Optional[np.ndarray]:
+        return self._rows
+
+    def set_display_rows(self, rows: Optional[np.ndarray]):
+        """Show the given row positions (after filters / search / sort)."""
+        self.beginResetModel()
+        self._rows = rows
+        self._invalidate_display_cache()
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return self._source.row_count(self._rows)
+
+    def _build_block(self, row_block: int, column_block: int) -> List[List[str]]:
+        r0 = row_block * self.DISPLAY_ROW_BLOCK
+        c0 = column_block * self.DISPLAY_COLUMN_BLOCK
+        c1 = min(c0 + self.DISPLAY_COLUMN_BLOCK, self.columnCount())
+        frame = self._source.window(self._rows, r0, self.DISPLAY_ROW_BLOCK, self._column_names[c0:c1])
+        return self._format_frame(frame, c0)
+
+    # Whole-frame accessors materialize the view — copy/export stream from
+    # the source instead; these remain for callers that need a DataFrame.
+    def get_original_data(self) -> pd.DataFrame:
+        return self._source.to_dataframe(None)
+
+    def get_filtered_data(self) -> pd.DataFrame:
+        return self.get_display_data()
+
+    def get_display_data(self) -> pd.DataFrame:
+        return self._source.to_dataframe(self._rows)
+
+    def display_sample(self, sample_rows: int) -> pd.DataFrame:
+        count = self.rowCount()
+        if count <= sample_rows:
+            return self.get_display_data()
+        half = sample_rows // 2
+        return pd.concat([self._source.window(self._rows, 0, half),
+                          self._source.window(self._rows, count - half, half)])
+
+
 class _CompactDelegate(QStyledItemDelegate):
     """Minimal-height rows for filter popup list items."""
 
@@ -863,11 +1025,13 @@ class SearchWorker(QThread):
     
     search_completed = pyqtSignal(pd.Index)  # Emits matching indices
     
-    def __init__(self, df: pd.DataFrame, indices: pd.Index, search_text: str):
+    def __init__(self, df: pd.DataFrame, indices: pd.Index, search_text: str,
+                 search_index: Optional[SearchIndex] = None):
         super().__init__()
         self.df = df
         self.indices = indices
         self.search_text = search_text.lower().strip()
+        self.search_index = search_index
         self._is_cancelled = False
     
     def run(self):
@@ -875,6 +1039,17 @@ class SearchWorker(QThread):
         try:
             if self._is_cancelled:
                 return
+
+            if self.search_index is not None:
+                # Indexed: whole-frame match mask, intersected with the filtered rows
+                mask = self.search_index.match(self.search_text)
+                if self.indices is self.df.index:
+                    matching_indices = self.indices[mask]
+                else:
+                    matching_indices = self.indices[mask[self.df.index.get_indexer(self.indices)]]
+                if not self._is_cancelled:
+                    self.search_completed.emit(matching_indices)
+                return
             
             # Get the subset DataFrame
             subset = self.df.loc[self.indices]
@@ -907,6 +1082,87 @@ class SearchWorker(QThread):
         self._is_cancelled = True
 
 
+class SearchIndexWorker(QThread):
+    """Background worker building the global-search index for a DataFrame"""
+
+    index_ready = pyqtSignal(object, int)  # SearchIndex, generation
+
+    def __init__(self, df: pd.DataFrame, generation: int):
+        super().__init__()
+        self.df = df
+        self.generation = generation
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            search_index = SearchIndex(self.df)
+        except Exception as e:
+            logger.error(f"Search index build failed: {e}")
+            return
+        logger.info(f"Search index built for {len(self.df):,} rows in {(time.perf_counter() - start)*1000:.0f}ms")
+        self.index_ready.emit(search_index, self.generation)
+
+
+class SourceQueryWorker(QThread):
+    """Background worker running a pushed-down filter/search/sort on an ArrowTableSource"""
+
+    rows_ready = pyqtSignal(object, int)  # row positions (None = all rows), generation
+    query_failed = pyqtSignal(str, int)   # error message, generation
+
+    def __init__(self, source: ArrowTableSource, filters: Dict[str, Set[str]],
+                 search_text: str, sort, generation: int):
+        super().__init__()
+        self.source = source
+        self.filters = filters
+        self.search_text = search_text
+        self.sort = sort
+        self.generation = generation
+
+    def run(self):
+        try:
+            rows = self.source.query_rows(self.filters, self.search_text, self.sort)
+        except Exception as e:
+            logger.error(f"Windowed query error: {e}")
+            self.query_failed.emit(str(e), self.generation)
+            return
+        self.rows_ready.emit(rows, self.generation)
+
+
+class ExportWorker(QThread):
+    """Background worker streaming an ExportPlan to the clipboard text or a file"""
+
+    progress = pyqtSignal(int)            # rows written so far
+    completed = pyqtSignal(object)        # ExportResult, or clipboard text (path "")
+    failed = pyqtSignal(str)              # error message
+    cancelled = pyqtSignal()
+
+    def __init__(self, plan: ExportPlan, path: str = ""):
+        super().__init__()
+        self.plan = plan
+        self.path = path
+        self._cancel = threading.Event()
+
+    def run(self):
+        try:
+            if self.path:
+                writer = WRITERS[os.path.splitext(self.path)[1].lower()]
+                result = writer(self.plan, self.path, self.progress.emit, self._cancel)
+            else:
+                result = clipboard_text(self.plan, self.progress.emit, self._cancel)
+        except ExportCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            logger.exception("Export failed")
+            self.failed.emit(str(e))
+            return
+        self.completed.emit(result)
+
+    def cancel(self):
+        """Stop at the next chunk (a partly written file is removed)"""
+        self._cancel.set()
+
+
 class ColumnGroupHeaderBar(QWidget):
     """A grouped-header band painted above the table.
 
@@ -1014,10 +1270,22 @@ class FilterTableView(QWidget):
         self.sort_order = {}  # column_index -> Qt.SortOrder
         
         # Performance optimizations
-        self._unique_values_cache: Dict[str, List[Any]] = {}  # Cache unique values per column
+        self._unique_values_cache: Dict[tuple, List[Any]] = {}  # Unique values per (column, other filters)
         self._string_columns_cache: Dict[str, pd.Series] = {}  # Pre-converted string columns
         self._all_unique_values: Dict[str, List[Any]] = {}  # Pre-computed unique values per column
         self._search_worker: Optional[SearchWorker] = None  # Background search thread
+        # Global-search index, built in the background for large frames
+        self._search_index: Optional[SearchIndex] = None
+        self._index_workers: List[SearchIndexWorker] = []
+        # Windowed mode (set_table_source): rows live in an Arrow table and
+        # filters / search / sort run as DuckDB queries on worker threads.
+        self._source: Optional[ArrowTableSource] = None
+        self._source_workers: List[SourceQueryWorker] = []
+        # In-memory frames (unique index): categorical-code filters / sorts
+        self._filter_engine: Optional[FilterEngine] = None
+        self._data_generation = 0
+        # Copy / export jobs stream in chunks on worker threads
+        self._export_workers: List[ExportWorker] = []
         self._search_debounce_timer = QTimer()
         self._search_debounce_timer.setSingleShot(True)
         self._search_debounce_timer.timeout.connect(self._execute_search)
@@ -1374,7 +1642,7 @@ class FilterTableView(QWidget):
         special columns (e.g. narrowing a separator column)."""
         if self.model is None:
             return
-        columns = self.model.get_original_data().columns
+        columns = self.model._original_df.columns
         if column_name not in columns:
             return
         column_index = columns.get_loc(column_name)
@@ -1402,15 +1670,13 @@ class FilterTableView(QWidget):
         measurement. Call after set_dataframe / set_numeric_formatting /
         set_header_labels so widths reflect the final formatting.
         """
-        if self.model is None or self.model.get_original_data().empty:
+        if self.model is None or self._total_row_count() == 0 or self.model.columnCount() == 0:
             return
-        df = self.model.get_display_data()
-        if len(df) > sample_rows:
-            df = pd.concat([df.head(sample_rows // 2), df.tail(sample_rows // 2)])
+        df = self.model.display_sample(sample_rows)
 
         metrics = QFontMetrics(self.table_view.font())
         header_metrics = QFontMetrics(self.header.wrap_font())
-        for column_index, column_name in enumerate(self.model.get_original_data().columns):
+        for column_index, column_name in enumerate(self.model._original_df.columns):
             if (
                 self.table_view.isColumnHidden(column_index)
                 and self.frozen_table_view.isColumnHidden(column_index)
@@ -1450,7 +1716,7 @@ class FilterTableView(QWidget):
             return
         metrics = QFontMetrics(self.header.wrap_font())
         tallest = 18
-        for column_index in range(len(self.model.get_original_data().columns)):
+        for column_index in range(self.model.columnCount()):
             if (
                 self.table_view.isColumnHidden(column_index)
                 and self.frozen_table_view.isColumnHidden(column_index)
@@ -1479,24 +1745,78 @@ class FilterTableView(QWidget):
 
         Args:
             df: DataFrame to display
-            limit_rows: If True, limit to MAX_DISPLAY_ROWS for performance. Set to False for query results.
+            limit_rows: If True, browse frames over MAX_DISPLAY_ROWS through the
+                windowed Arrow backend. Set to False for query results: callers read
+                them back through get_original_data() / get_display_data() and
+                rely on the frame's own index and numpy dtypes, so they stay whole
+                in the pandas model.
         """
-        # Auto-limit large datasets for optimal performance (only if limit_rows=True)
+        # Large datasets (only if limit_rows=True) are browsed through the
+        # windowed Arrow backend; truncation is the fallback when pyarrow
+        # can't type a column.
         original_row_count = len(df)
         if limit_rows and original_row_count > MAX_DISPLAY_ROWS:
-            df = df.head(MAX_DISPLAY_ROWS)
-            logger.info(f"Limited dataset to {MAX_DISPLAY_ROWS:,} rows (original: {original_row_count:,})")
-        
+            try:
+                source = ArrowTableSource.from_dataframe(df)
+            except Exception as e:
+                logger.warning(f"Windowed view unavailable ({e}); limiting to {MAX_DISPLAY_ROWS:,} rows")
+                df = df.head(MAX_DISPLAY_ROWS)
+                logger.info(f"Limited dataset to {MAX_DISPLAY_ROWS:,} rows (original: {original_row_count:,})")
+            else:
+                self.set_table_source(source)
+                return
+
+        self._install_model(PandasTableModel(df))
+        if len(df) >= SEARCH_INDEX_MIN_ROWS and df.index.is_unique:
+            self._start_search_index(df)
+        logger.info(f"FilterTableView loaded {len(df)} rows, {len(df.columns)} columns")
+
+    def _start_search_index(self, df: pd.DataFrame):
+        self._index_workers = [w for w in self._index_workers if w.isRunning()]
+        worker = SearchIndexWorker(df, self._data_generation)
+        worker.index_ready.connect(self._on_search_index_ready)
+        self._index_workers.append(worker)
+        worker.start()
+
+    def _on_search_index_ready(self, search_index: SearchIndex, generation: int):
+        if generation == self._data_generation:
+            self._search_index = search_index
+
+    def set_arrow_table(self, table):
+        """Display a pyarrow Table through the windowed backend (no pandas copy)."""
+        self.set_table_source(ArrowTableSource(table))
+
+    def set_table_source(self, source: ArrowTableSource):
+        """Browse a large result through row windows.
+
+        Only the rows being painted are converted to pandas; column filters,
+        sorting, filter-popup values and global search run as SQL against the
+        source, and copy / export stream from it in batches. ``self.df`` is a
+        zero-row frame carrying the columns and dtypes.
+        """
+        self._install_model(ArrowTableModel(source))
+        logger.info(f"FilterTableView windowing {source.total_rows:,} rows, {len(source.columns)} columns")
+
+    def _install_model(self, model: PandasTableModel):
+        # New data: drop pending query results / search index and any old connection
+        self._data_generation += 1
+        self._search_index = None
+        if self._source is not None and getattr(model, "source", None) is not self._source:
+            self._source.close()
+        self._source = model.source if isinstance(model, ArrowTableModel) else None
+        self._filter_engine = None
+        if self._source is None and model._original_df.index.is_unique:
+            self._filter_engine = FilterEngine(model._original_df)
+
         # Store reference (no copy - saves memory!)
-        self.df = df
+        self.df = model._original_df
         
         # Clear caches - don't pre-compute anything yet (lazy loading for better performance)
         logger.info("Clearing caches for new dataframe...")
         self._string_columns_cache.clear()
         self._all_unique_values.clear()
-        logger.info(f"DataFrame loaded with {len(df)} rows, {len(df.columns)} columns - caches will be computed on demand")
         
-        self.model = PandasTableModel(self.df)
+        self.model = model
         self.model.set_numeric_formatting(self._default_numeric_decimals, self._column_decimals)
         self.table_view.setModel(self.model)
         self.frozen_table_view.setModel(self.model)
@@ -1517,8 +1837,6 @@ class FilterTableView(QWidget):
         
         # Update info
         self.update_info_label()
-        
-        logger.info(f"FilterTableView loaded {len(df)} rows, {len(df.columns)} columns")
 
     def _sync_frozen_vertical_scroll(self, value: int):
         if self._syncing_vertical_scroll:
@@ -1705,6 +2023,11 @@ class FilterTableView(QWidget):
         """Sort the displayed data using index-based operations"""
         if self.model is None:
             return
+
+        if self._source is not None:
+            self.sort_order = {column_index: sort_order}
+            self._refresh_source_rows()
+            return
         
         column_name = self.df.columns[column_index]
         
@@ -1713,6 +2036,19 @@ class FilterTableView(QWidget):
         
         # Sort the data using these indices
         ascending = (sort_order == Qt.SortOrder.AscendingOrder)
+        if self._filter_engine is not None:
+            # Cached permutation for the column: no frame copy, no re-sort.
+            # Filtered rows are re-ordered too so clearing the search keeps it.
+            self.sort_order = {column_index: sort_order}
+            engine = self._filter_engine
+            filtered = engine.sort_positions(
+                self.df.index.get_indexer(self.model._filtered_indices), column_name, ascending)
+            displayed = engine.sort_positions(
+                self.df.index.get_indexer(current_indices), column_name, ascending)
+            self.model.set_filtered_indices(self.df.index[filtered])
+            self.model.set_display_indices(self.df.index[displayed])
+            self.update_info_label()
+            return
         sorted_data = self.df.loc[current_indices].sort_values(by=column_name, ascending=ascending)
         
         # Update model with sorted indices
@@ -1721,6 +2057,28 @@ class FilterTableView(QWidget):
 
     def _get_filtered_unique_values(self, column_name: str) -> List[Any]:
         """Get unique values for a column, considering all OTHER active filters (Excel cascading behavior)"""
+        # Cached per column and the OTHER filters' selections, so the cache
+        # survives filter changes
+        cache_key = (column_name, tuple(sorted(
+            (c, frozenset(v)) for c, v in self.column_filters.items() if c != column_name)))
+        if cache_key in self._unique_values_cache:
+            return self._unique_values_cache[cache_key]
+        if len(self._unique_values_cache) >= UNIQUE_VALUES_CACHE_SIZE:
+            self._unique_values_cache.clear()
+
+        if self._source is not None:
+            # Pushed down: SELECT DISTINCT under the other filters
+            unique_vals = self._source.unique_values(column_name, self.column_filters)
+        elif self._filter_engine is not None:
+            # From the column's codes under the other filters' masks
+            unique_vals = self._filter_engine.unique_values(column_name, self.column_filters)
+        else:
+            unique_vals = self._scan_unique_values(column_name)
+        self._unique_values_cache[cache_key] = unique_vals
+        return unique_vals
+
+    def _scan_unique_values(self, column_name: str) -> List[Any]:
+        """Unique values by masking string columns (frames with duplicate index labels)"""
         # Lazy compute unique values for this column if not already done
         if column_name not in self._all_unique_values:
             self._all_unique_values[column_name] = self.df[column_name].unique().tolist()
@@ -1729,11 +2087,6 @@ class FilterTableView(QWidget):
         if not any(col != column_name for col in self.column_filters.keys()):
             return self._all_unique_values[column_name]
         
-        # Check cache for filtered scenario
-        cache_key = f"{column_name}_{'_'.join(sorted([c for c in self.column_filters.keys() if c != column_name]))}"
-        if cache_key in self._unique_values_cache:
-            return self._unique_values_cache[cache_key]
-        
         # Start with full index
         filtered_indices = self.df.index
         
@@ -1749,12 +2102,7 @@ class FilterTableView(QWidget):
                 filtered_indices = filtered_indices[mask[filtered_indices]]
         
         # Get unique values from the filtered data
-        unique_vals = self.df.loc[filtered_indices, column_name].unique().tolist()
-        
-        # Cache the result
-        self._unique_values_cache[cache_key] = unique_vals
-        
-        return unique_vals
+        return self.df.loc[filtered_indices, column_name].unique().tolist()
     
     def show_filter_popup(self, column_index: int):
         """Show filter popup for a column (triggered by clicking filter icon)"""
@@ -1885,26 +2233,26 @@ class FilterTableView(QWidget):
         if self.model is None:
             return
 
-        # Start with all indices
-        filtered_indices = self.df.index
+        if self._source is not None:
+            self._refresh_source_rows()
+            return
 
-        # Apply each column filter using lazy-computed string columns
-        for column_name, selected_values in self.column_filters.items():
-            # Lazy compute string column if needed
-            if column_name not in self._string_columns_cache:
-                self._string_columns_cache[column_name] = self.df[column_name].fillna("(Blanks)").astype(str)
-            # Use cached string column (no conversion needed!)
-            col_str = self._string_columns_cache[column_name]
-            mask = col_str.isin(selected_values)
-            # Filter the indices
-            filtered_indices = filtered_indices[mask[filtered_indices]]
+        if self._filter_engine is not None:
+            # AND the cached per-column code masks, then re-derive the active
+            # sort from its cached permutation
+            positions = self._filter_engine.filtered_positions(self.column_filters)
+            sort = self._active_sort()
+            if sort is not None:
+                if positions is None:
+                    positions = np.arange(len(self.df))
+                positions = self._filter_engine.sort_positions(positions, *sort)
+            filtered_indices = self.df.index if positions is None else self.df.index[positions]
+        else:
+            filtered_indices = self._scan_filtered_indices()
 
         # Update model with filtered indices (no DataFrame copy!)
         self.model.set_filtered_indices(filtered_indices)
         
-        # Invalidate cascading filter cache since filters changed
-        self._unique_values_cache.clear()
-        
         # Re-apply global search if active
         if self.global_search_box.text():
             self.apply_global_search(self.global_search_box.text())
@@ -1915,6 +2263,23 @@ class FilterTableView(QWidget):
         
         logger.info(f"Filters applied: {len(filtered_indices)} rows visible")
 
+    def _scan_filtered_indices(self) -> pd.Index:
+        """Filtered indices by masking string columns (frames with duplicate index labels)"""
+        # Start with all indices
+        filtered_indices = self.df.index
+
+        # Apply each column filter using lazy-computed string columns
+        for column_name, selected_values in self.column_filters.items():
+            # Lazy compute string column if needed
+            if column_name not in self._string_columns_cache:
+                self._string_columns_cache[column_name] = self.df[column_name].fillna("(Blanks)").astype(str)
+            # Use cached string column (no conversion needed!)
+            col_str = self._string_columns_cache[column_name]
+            mask = col_str.isin(selected_values)
+            # Filter the indices
+            filtered_indices = filtered_indices[mask[filtered_indices]]
+        return filtered_indices
+
     def apply_global_search(self, search_text: str):
         """Apply global search with debouncing to avoid blocking on every keystroke"""
         if self.model is None:
@@ -1930,6 +2295,10 @@ class FilterTableView(QWidget):
     
     def _execute_search(self):
         """Execute the search after debounce period"""
+        if self._source is not None:
+            self._refresh_source_rows()
+            return
+
         search_text = self._pending_search_text.lower().strip()
         
         if not search_text:
@@ -1942,7 +2311,8 @@ class FilterTableView(QWidget):
         self._search_worker = SearchWorker(
             self.df,
             self.model._filtered_indices,
-            search_text
+            search_text,
+            self._search_index,
         )
         self._search_worker.search_completed.connect(self._on_search_completed)
         self._search_worker.start()
@@ -1956,6 +2326,42 @@ class FilterTableView(QWidget):
             self.model.set_display_indices(matching_indices)
             self.update_info_label()
 
+    def _active_sort(self):
+        """Current header sort as ``(column name, ascending)``, or None."""
+        for column_index, order in self.sort_order.items():
+            if order is not None and 0 <= column_index < len(self.df.columns):
+                return self.df.columns[column_index], order == Qt.SortOrder.AscendingOrder
+        return None
+
+    def _refresh_source_rows(self):
+        """Re-run filters + search + sort on the windowed source in the background"""
+        self._source_workers = [w for w in self._source_workers if w.isRunning()]
+        self._data_generation += 1
+        worker = SourceQueryWorker(
+            self._source,
+            {column: set(values) for column, values in self.column_filters.items()},
+            self.global_search_box.text(),
+            self._active_sort(),
+            self._data_generation,
+        )
+        worker.rows_ready.connect(self._on_source_rows_ready)
+        worker.query_failed.connect(self._on_source_query_failed)
+        self._source_workers.append(worker)
+        worker.start()
+        self.info_label.setText("🔍 Searching...")
+
+    def _on_source_rows_ready(self, rows, generation: int):
+        """Show the rows of the latest windowed query (stale results are dropped)"""
+        if generation != self._data_generation or not isinstance(self.model, ArrowTableModel):
+            return
+        self.model.set_display_rows(rows)
+        self.update_info_label()
+        logger.info(f"Windowed view applied: {self.model.rowCount():,} rows visible")
+
+    def _on_source_query_failed(self, message: str, generation: int):
+        if generation == self._data_generation:
+            self.info_label.setText(f"Filter failed: {message}")
+
     def clear_all_filters(self):
         """Clear all filters and reset to original data"""
         self.column_filters.clear()
@@ -1967,7 +2373,9 @@ class FilterTableView(QWidget):
         if self._search_worker and self._search_worker.isRunning():
             self._search_worker.cancel()
         
-        if self.model:
+        if self._source is not None:
+            self._refresh_source_rows()
+        elif self.model:
             # Reset to all indices
             all_indices = self.df.index
             self.model.set_filtered_indices(all_indices)
@@ -1982,8 +2390,8 @@ class FilterTableView(QWidget):
             self.info_label.setText("")
             return
 
-        total_rows = len(self.df)
-        display_rows = len(self.model.get_display_data())
+        total_rows = self._total_row_count()
+        display_rows = self._display_row_count()
         
         if display_rows == total_rows:
             self.info_label.setText(f"Showing all {total_rows:,} rows")
@@ -1993,6 +2401,18 @@ class FilterTableView(QWidget):
                 f"({len(self.column_filters)} column filter(s) active)"
             )
 
+    def _total_row_count(self) -> int:
+        if self._source is not None:
+            return self._source.total_rows
+        return 0 if self.df is None else len(self.df)
+
+    def _display_row_count(self) -> int:
+        if self.model is None:
+            return 0
+        if self._source is not None:
+            return self.model.rowCount()
+        return len(self.model.get_display_data())
+
     def show_column_context_menu(self, pos):
         """Show context menu for column operations and numeric formatting."""
         column_index = self.header.logicalIndexAt(pos)
@@ -2058,8 +2478,8 @@ class FilterTableView(QWidget):
             menu.addSeparator()
         
         # Check if filters are active
-        display_rows = len(self.model.get_display_data())
-        total_rows = len(self.df)
+        display_rows = self._display_row_count()
+        total_rows = self._total_row_count()
         is_filtered = display_rows != total_rows
 
         if is_filtered:
@@ -2101,59 +2521,15 @@ class FilterTableView(QWidget):
     
     def copy_entire_table(self):
         """Copy the entire original table to clipboard using displayed formatting."""
-        if self.df is None:
+        if self.df is None or self.model is None:
             return
-        
-        from PyQt6.QtWidgets import QApplication
-        
-        df_to_copy = self.df
-        clipboard_text = self._dataframe_to_clipboard_text(df_to_copy)
-        
-        # Copy to clipboard
-        clipboard = QApplication.clipboard()
-        clipboard.setText(clipboard_text)
-        
-        logger.info(f"Copied entire table: {len(df_to_copy)} rows, {len(df_to_copy.columns)} columns")
-        
-        # Optional: Show a brief notification
-        from PyQt6.QtWidgets import QToolTip
-        from PyQt6.QtGui import QCursor
-        QToolTip.showText(
-            QCursor.pos(),
-            f"✓ Copied {len(df_to_copy):,} rows to clipboard",
-            self.table_view,
-            self.table_view.rect(),
-            2000
-        )
-    
+        self._start_export(self._export_plan(filtered=False), notice="rows")
+
     def copy_filtered_table(self):
         """Copy the currently filtered/displayed table using displayed formatting."""
         if self.model is None:
             return
-        
-        from PyQt6.QtWidgets import QApplication
-        
-        # Get the currently displayed DataFrame
-        df_to_copy = self.model.get_display_data()
-        
-        clipboard_text = self._dataframe_to_clipboard_text(df_to_copy)
-        
-        # Copy to clipboard
-        clipboard = QApplication.clipboard()
-        clipboard.setText(clipboard_text)
-        
-        logger.info(f"Copied filtered table: {len(df_to_copy)} rows, {len(df_to_copy.columns)} columns")
-        
-        # Optional: Show a brief notification
-        from PyQt6.QtWidgets import QToolTip
-        from PyQt6.QtGui import QCursor
-        QToolTip.showText(
-            QCursor.pos(),
-            f"✓ Copied {len(df_to_copy):,} filtered rows to clipboard",
-            self.table_view,
-            self.table_view.rect(),
-            2000
-        )
+        self._start_export(self._export_plan(filtered=True), notice="filtered rows")
 
     def get_filtered_dataframe(self) -> pd.DataFrame:
         """Get the currently filtered/displayed DataFrame"""
@@ -2162,30 +2538,108 @@ class FilterTableView(QWidget):
         return pd.DataFrame()
 
     def export_to_excel(self):
-        """Export the currently displayed (filtered/searched) rows to an Excel file."""
-        df = self.get_filtered_dataframe()
-        if df is None or df.empty:
-            QMessageBox.information(self, "Export to Excel", "There is no data to export.")
+        """Export the currently displayed (filtered/searched) rows to Excel, CSV or Parquet."""
+        if self.model is None or self._display_row_count() == 0:
+            QMessageBox.information(self, "Export", "There is no data to export.")
             return
 
-        column_names = [c for c in self._visible_column_names_in_order() if c in df.columns]
-        if column_names:
-            df = df.loc[:, column_names]
-
-        path, _ = QFileDialog.getSaveFileName(
-            self, "Export to Excel", "export.xlsx", "Excel Workbook (*.xlsx)")
+        path, selected_filter = QFileDialog.getSaveFileName(
+            self, "Export", "export.xlsx",
+            "Excel Workbook (*.xlsx);;CSV (*.csv);;Parquet (*.parquet)")
         if not path:
             return
-        if not path.lower().endswith(".xlsx"):
-            path += ".xlsx"
+        if os.path.splitext(path)[1].lower() not in WRITERS:
+            extension = next((ext for ext in WRITERS if ext in selected_filter), ".xlsx")
+            path += extension
+
+        self._start_export(self._export_plan(filtered=True), path)
+
+    def _export_plan(self, filtered: bool = True) -> ExportPlan:
+        """Visible columns in on-screen order, over the displayed (or all) rows."""
+        names = self._visible_column_names_in_order() or list(self.model._column_names)
+        decimals = self.model.export_decimals()
+        if self._source is not None:
+            source = self._source
+            rows = self.model.display_rows() if filtered else None
+            return ExportPlan(names, source.row_count(rows),
+                              lambda size: source.iter_frames(rows, names, size),
+                              {n: d for n, d in decimals.items() if n in names})
+        df = self.model.get_original_data()
+        if not filtered:
+            return self._frame_plan(df, names, decimals)
+        positions = self.model._positions()
+        if positions is None:  # duplicate index labels: materialize the displayed rows
+            return self._frame_plan(self.model.get_display_data(), names, decimals)
+        return self._frame_plan(df, names, decimals, positions)
 
-        try:
-            df.to_excel(path, index=False, engine="openpyxl")
-        except Exception as exc:
-            logger.exception("Excel export failed")
-            QMessageBox.critical(self, "Export to Excel", f"Could not export the data:\n{exc}")
+    @staticmethod
+    def _frame_plan(df: pd.DataFrame, names: List[str], decimals: Dict[str, int],
+                    positions: Optional[np.ndarray] = None) -> ExportPlan:
+        """Plan over ``df`` (optionally the row positions given), chunked with iloc."""
+        lookup = {str(c): i for i, c in enumerate(df.columns)}
+        names = [n for n in names if n in lookup] or list(lookup)
+        column_positions = [lookup[n] for n in names]
+        total = len(df) if positions is None else len(positions)
+
+        def chunks(size: int):
+            for start in range(0, total, size):
+                rows = slice(start, start + size) if positions is None else positions[start:start + size]
+                frame = df.iloc[rows, column_positions]
+                frame.columns = names
+                yield frame
+
+        return ExportPlan(names, total, chunks, {n: d for n, d in decimals.items() if n in names})
+
+    def _start_export(self, plan: ExportPlan, path: str = "", notice: str = "rows") -> ExportWorker:
+        """Run a copy (no ``path``) or file export on a worker with a cancellable progress dialog."""
+        worker = ExportWorker(plan, path)
+        verb = "Exporting" if path else "Copying"
+        progress = QProgressDialog(f"{verb} {plan.total_rows:,} rows...", "Cancel",
+                                   0, max(plan.total_rows, 1), self)
+        progress.setWindowTitle("Export" if path else "Copy Table")
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(500)  # quick jobs finish without a dialog
+        progress.setAutoClose(False)
+        progress.setAutoReset(False)
+        progress.canceled.connect(worker.cancel)
+        worker.progress.connect(progress.setValue)
+        worker.completed.connect(lambda result: self._on_export_completed(result, plan, path, notice))
+        worker.failed.connect(self._on_export_failed)
+        worker.cancelled.connect(lambda: logger.info(f"{verb} cancelled"))
+        worker.finished.connect(progress.close)
+        worker.finished.connect(progress.deleteLater)
+        progress.setValue(0)
+
+        self._export_workers = [w for w in self._export_workers if w.isRunning()]
+        self._export_workers.append(worker)
+        worker.start()
+        return worker
+
+    def _on_export_completed(self, result, plan: ExportPlan, path: str, notice: str):
+        if not path:
+            from PyQt6.QtWidgets import QApplication, QToolTip
+            from PyQt6.QtGui import QCursor
+
+            QApplication.clipboard().setText(result)
+            logger.info(f"Copied {plan.total_rows} rows, {len(plan.columns)} columns")
+            QToolTip.showText(
+                QCursor.pos(),
+                f"✓ Copied {plan.total_rows:,} {notice} to clipboard",
+                self.table_view,
+                self.table_view.rect(),
+                2000
+            )
             return
-        logger.info("Exported %d rows to %s", len(df), path)
+
+        logger.info("Exported %d rows to %s", result.rows, path)
+        if result.truncated:
+            QMessageBox.information(
+                self, "Export",
+                f"Excel holds at most {EXCEL_MAX_DATA_ROWS:,} rows per sheet — "
+                f"exported the first {result.rows:,} of {plan.total_rows:,}.")
+
+    def _on_export_failed(self, message: str):
+        QMessageBox.critical(self, "Export", f"Could not export the data:\n{message}")
 
     def _visible_column_names_in_order(self) -> List[str]:
         if self.model is None:
@@ -2209,17 +2663,3 @@ class FilterTableView(QWidget):
             names.append(column_name)
             seen.add(column_name)
         return names
-
-    def _dataframe_to_clipboard_text(self, df_to_copy: pd.DataFrame) -> str:
-        column_names = self._visible_column_names_in_order()
-        if not column_names:
-            column_names = list(df_to_copy.columns)
-
-        rows: List[str] = ["\t".join(column_names)]
-        for _, row in df_to_copy.loc[:, column_names].iterrows():
-            formatted = [
-                self.model.format_value_for_column(column_name, row[column_name]) if self.model is not None else str(row[column_name])
-                for column_name in column_names
-            ]
-            rows.append("\t".join(formatted))
-        return "\n".join(rows)
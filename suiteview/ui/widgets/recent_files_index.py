@@ -0,0 +1,268 @@
+"""
+Persisted index of the Windows Recent Items folder for the File Open History panel.
+
+The Recent folder holds one ``.lnk`` per file or folder opened in any
+application; resolving a shortcut's target is the slow part (a COM call per
+link, plus a disk hit to tell folders from files). The index keeps every
+resolved link in ``~/.suiteview/recent_files_index.jsonl``, one JSON record
+per line, appended as links appear or are re-touched::
+
+    {"lnk": "report.xlsx.lnk", "mtime": 1760000000.0, "target": "C:/...", "folder": false}
+    {"lnk": "old.txt.lnk", "deleted": true}
+
+The last line for a link wins. ``update()`` lists the folder, and only links
+that are new or whose mtime moved are resolved; links gone from the folder get
+a ``deleted`` line. The file is rewritten without the superseded lines once
+they outnumber the live ones.
+
+``NameSearchIndex`` answers the panel's search box: a sorted list of every
+suffix of every name, so a substring search is one prefix range found by
+bisection. Pure Python — no PyQt.
+"""
+
+import bisect
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Links older than this are not resolved, and dropped when the file is compacted
+KEEP_DAYS = 30
+
+# Rewrite the file when it has this many more lines than live records
+COMPACT_SLACK = 200
+
+
+def recent_items_dir() -> Path:
+    """The Windows Recent Items folder"""
+    return Path(os.environ.get('APPDATA', '')) / 'Microsoft' / 'Windows' / 'Recent'
+
+
+def _shell_resolver() -> Optional[Callable[[Path], Optional[str]]]:
+    """A shortcut-target resolver for the calling thread, or None without pywin32"""
+    try:
+        import pythoncom
+        import win32com.client
+        pythoncom.CoInitialize()
+        shell = win32com.client.Dispatch("WScript.Shell")
+    except Exception:
+        return None
+
+    def resolve(lnk: Path) -> Optional[str]:
+        try:
+            return shell.CreateShortCut(str(lnk)).Targetpath
+        except Exception:
+            return None
+    return resolve
+
+
+class RecentFilesIndex:
+    """
+    Resolved Recent Items links, persisted and updated incrementally.
+
+    ``update()`` may run on a worker thread while the UI reads ``entries()``.
+    """
+
+    INDEX_FILE = Path.home() / ".suiteview" / "recent_files_index.jsonl"
+
+    def __init__(self, recent_dir: Optional[Path] = None, index_file: Optional[Path] = None,
+                 resolver: Optional[Callable[[Path], Optional[str]]] = None):
+        self.recent_dir = Path(recent_dir) if recent_dir else recent_items_dir()
+        self.index_file = Path(index_file) if index_file else self.INDEX_FILE
+        self._resolver = resolver
+        self._records: Dict[str, dict] = {}
+        self._lines = 0
+        self._loaded = False
+        self._lock = threading.Lock()         # guards _records
+        self._update_lock = threading.Lock()  # one update at a time
+
+    # ── Persistence ──
+
+    def load(self):
+        """Read the index file (once); later calls are no-ops"""
+        with self._lock:
+            if self._loaded:
+                return
+            self._loaded = True
+            try:
+                with open(self.index_file, 'r', encoding='utf-8') as f:
+                    for line in f:
+                        self._lines += 1
+                        try:
+                            record = json.loads(line)
+                            name = record['lnk']
+                        except (ValueError, KeyError, TypeError):
+                            continue  # torn last line after a crash
+                        if record.get('deleted'):
+                            self._records.pop(name, None)
+                        else:
+                            self._records[name] = record
+            except FileNotFoundError:
+                return
+            except OSError as e:
+                logger.error(f"Failed to read recent files index: {e}")
+                return
+            logger.debug(f"Loaded {len(self._records)} recent items from {self.index_file}")
+        if self._lines > len(self._records) + COMPACT_SLACK:
+            self._compact()
+
+    def _append(self, records: List[dict]):
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.index_file, 'a', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self._lines += len(records)
+        except OSError as e:
+            logger.error(f"Failed to append to recent files index: {e}")
+
+    def _compact(self):
+        """Rewrite the file with just the live records of the last KEEP_DAYS"""
+        cutoff = time.time() - KEEP_DAYS * 86400
+        with self._lock:
+            for name in [n for n, r in self._records.items() if r['mtime'] < cutoff]:
+                del self._records[name]
+            records = sorted(self._records.values(), key=lambda r: r['mtime'])
+        try:
+            temp_file = self.index_file.with_suffix('.jsonl.tmp')
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                for record in records:
+                    f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            temp_file.replace(self.index_file)
+            self._lines = len(records)
+            logger.debug(f"Compacted recent files index to {len(records)} records")
+        except OSError as e:
+            logger.error(f"Failed to compact recent files index: {e}")
+
+    # ── Updating ──
+
+    def update(self) -> int:
+        """
+        Pick up links added, re-touched or removed since the last update.
+
+        Returns:
+            Number of records changed (0 when nothing did)
+        """
+        self.load()
+        with self._update_lock:
+            if not self.recent_dir.is_dir():
+                return 0
+            cutoff = time.time() - KEEP_DAYS * 86400
+            with self._lock:
+                known = {name: record['mtime'] for name, record in self._records.items()}
+
+            changed = []
+            present = set()
+            try:
+                with os.scandir(self.recent_dir) as it:
+                    for entry in it:
+                        if not entry.name.lower().endswith('.lnk'):
+                            continue
+                        try:
+                            mtime = entry.stat().st_mtime
+                        except OSError:
+                            continue
+                        present.add(entry.name)
+                        if mtime < cutoff or known.get(entry.name) == mtime:
+                            continue
+                        changed.append((entry.name, mtime))
+            except OSError as e:
+                logger.error(f"Failed to list {self.recent_dir}: {e}")
+                return 0
+
+            resolve = self._resolver or _shell_resolver()
+            new_records = [self._resolve(name, mtime, resolve) for name, mtime in changed]
+            new_records += [{'lnk': name, 'deleted': True} for name in known if name not in present]
+            if not new_records:
+                return 0
+
+            with self._lock:
+                for record in new_records:
+                    if record.get('deleted'):
+                        self._records.pop(record['lnk'], None)
+                    else:
+                        self._records[record['lnk']] = record
+            self._append(new_records)
+            logger.debug(f"Recent files index: {len(changed)} resolved, "
+                         f"{len(new_records) - len(changed)} removed")
+            if self._lines > len(self._records) + COMPACT_SLACK:
+                self._compact()
+            return len(new_records)
+
+    def _resolve(self, name: str, mtime: float, resolve) -> dict:
+        target = resolve(self.recent_dir / name) if resolve else None
+        if not target:
+            # Derive from the .lnk filename as a fallback (strip trailing .lnk)
+            target = name[:-4]
+        try:
+            is_folder = Path(target).is_dir()
+        except OSError:
+            is_folder = False
+        return {'lnk': name, 'mtime': mtime, 'target': target, 'folder': is_folder}
+
+    # ── Reading ──
+
+    def entries(self, days: int = KEEP_DAYS) -> List[Tuple[str, str, datetime, bool]]:
+        """
+        ``(display_name, full_path, timestamp, is_folder)`` for links touched in
+        the last ``days`` days, oldest first. ``full_path`` is '' when the
+        target is a bare file name.
+        """
+        self.load()
+        cutoff = time.time() - days * 86400
+        with self._lock:
+            records = [r for r in self._records.values() if r['mtime'] >= cutoff]
+        result = []
+        for record in sorted(records, key=lambda r: r['mtime']):
+            target_path = Path(record['target'])
+            # Keep the full path even if the file isn't locally cached
+            # (OneDrive on-demand files aren't on disk but os.startfile handles them)
+            full_path = str(target_path) if len(target_path.parts) > 1 else ''
+            result.append((target_path.name or record['target'], full_path,
+                           datetime.fromtimestamp(record['mtime']), record['folder']))
+        return result
+
+
+class NameSearchIndex:
+    """
+    Case-insensitive substring search over a fixed list of names.
+
+    Every suffix of every lowercased name goes into one sorted list; the
+    names containing a needle are the owners of the suffixes that start with
+    it, a single range found by bisection.
+    """
+
+    def __init__(self, names: Iterable[str]):
+        suffixes = []
+        for i, name in enumerate(names):
+            lowered = name.lower()
+            suffixes.extend((lowered[k:], i) for k in range(len(lowered)))
+        suffixes.sort()
+        self._suffixes = [suffix for suffix, _ in suffixes]
+        self._owners = [owner for _, owner in suffixes]
+
+    def matching(self, needle: str) -> Set[int]:
+        """Positions of the names containing ``needle`` (none for an empty needle)"""
+        needle = needle.lower()
+        if not needle:
+            return set()
+        start = bisect.bisect_left(self._suffixes, needle)
+        end = bisect.bisect_left(self._suffixes, needle + '\U0010FFFF', start)
+        return set(self._owners[start:end])
+
+
+_index: Optional[RecentFilesIndex] = None
+
+
+def get_recent_files_index() -> RecentFilesIndex:
+    """The shared index of the current user's Recent Items folder"""
+    global _index
+    if _index is None:
+        _index = RecentFilesIndex()
+    return _index
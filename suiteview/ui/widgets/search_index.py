@@ -0,0 +1,183 @@
+"""
+Substring search index for FilterTableView's global search.
+
+Built once per DataFrame (in the background) so a keystroke no longer
+re-stringifies every cell. Per column the index keeps:
+
+* ``codes`` — each row's position in the column's distinct values
+  (``pd.factorize``; nulls are -1 and never match), and
+* ``texts`` — those distinct values as lowercase strings, the same text
+  ``astype(str).str.lower()`` produces,
+
+so a search only tests each distinct value once and maps the hits back to
+rows with one vectorized lookup. High-cardinality text columns also get a
+trigram posting index (sorted trigram keys -> distinct-value ids, built with
+NumPy), which narrows a 3+ character needle to the values containing all of
+its trigrams before the exact ``in`` check.
+
+Matches are whole-frame boolean masks by row position, independent of the
+column filters, so a filter change only re-intersects the cached mask.
+Typing on from a previous needle re-checks only that needle's matches. Pure
+Python — no PyQt.
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+# Text columns with at least this many distinct values get a trigram index ...
+TRIGRAM_MIN_UNIQUES = 2048
+# ... unless their padded text matrix would exceed this many code points.
+TRIGRAM_MAX_CELLS = 40_000_000
+MASK_CACHE_SIZE = 16
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+def _trigram_keys(chars: np.ndarray) -> np.ndarray:
+    """Pack code-point triples (columns of ``chars``) into int64 keys (21 bits each)."""
+    a, b, c = (chars[..., i].astype(np.int64) for i in range(3))
+    return (a << 42) | (b << 21) | c
+
+
+def _text_series(texts) -> pd.Series:
+    """Distinct texts as an Arrow-backed string Series when pyarrow is installed."""
+    try:
+        return pd.Series(texts, dtype="string[pyarrow]")
+    except ImportError:
+        return pd.Series(texts, dtype=object)
+
+
+def _keep_members(ids: np.ndarray, members: np.ndarray, size: int) -> np.ndarray:
+    """``ids`` that also appear in ``members`` (order kept; a flag array beats a sort)."""
+    present = np.zeros(size, dtype=bool)
+    present[members] = True
+    return ids[present[ids]]
+
+
+def _contains(texts: pd.Series, needle: str) -> np.ndarray:
+    return texts.str.contains(needle, regex=False).to_numpy(dtype=bool, na_value=False)
+
+
+class _ColumnIndex:
+    """Distinct lowercase texts of one column plus an optional trigram index."""
+
+    def __init__(self, values: pd.Series):
+        # Numbers and dates are checked value-by-value over their distinct
+        # texts; trigram postings pay off for free text and identifiers.
+        is_text = is_object_dtype(values.dtype) or is_string_dtype(values.dtype)
+        try:
+            codes, uniques = pd.factorize(values)
+            texts = pd.Index(uniques).astype(str).str.lower()
+        except TypeError:  # unhashable cells (lists, dicts): factorize their text
+            text = values.astype(str).str.lower().where(values.notna())
+            codes, texts = pd.factorize(text)
+        self.codes = np.asarray(codes, dtype=np.int64)
+        self.texts = _text_series(texts)
+        self._keys: Optional[np.ndarray] = None
+        self._ids: Optional[np.ndarray] = None
+        if len(self.texts) >= TRIGRAM_MIN_UNIQUES and is_text:
+            self._build_trigrams()
+
+    @property
+    def has_trigrams(self) -> bool:
+        return self._keys is not None
+
+    def _build_trigrams(self):
+        matrix = np.array(self.texts.tolist(), dtype=str)  # fixed width, \0 padded
+        width = matrix.dtype.itemsize // 4
+        if width < 3 or len(matrix) * width > TRIGRAM_MAX_CELLS:
+            return
+        chars = matrix.view(np.uint32).reshape(len(matrix), width)
+        windows = np.lib.stride_tricks.sliding_window_view(chars, 3, axis=1)
+        keys = _trigram_keys(windows)
+        valid = windows[..., 2] != 0  # all three are real characters
+        ids = np.broadcast_to(np.arange(len(matrix), dtype=np.int64)[:, None], keys.shape)
+        keys, ids = keys[valid], ids[valid]
+        order = np.argsort(keys)  # a posting list may repeat an id (trigram seen twice)
+        self._keys, self._ids = keys[order], ids[order]
+
+    def _candidates(self, needle: str) -> Optional[np.ndarray]:
+        """Distinct-value ids holding every trigram of ``needle`` (None = no narrowing)."""
+        if self._keys is None or len(needle) < 3:
+            return None
+        chars = np.frombuffer(needle.encode("utf-32-le"), dtype=np.uint32)
+        grams = np.unique(_trigram_keys(np.lib.stride_tricks.sliding_window_view(chars, 3)))
+        lists = []
+        for gram in grams:
+            lo = np.searchsorted(self._keys, gram, side="left")
+            hi = np.searchsorted(self._keys, gram, side="right")
+            if lo == hi:
+                return _EMPTY
+            lists.append(self._ids[lo:hi])
+        lists.sort(key=len)
+        present = np.zeros(len(self.texts), dtype=bool)
+        present[lists[0]] = True
+        result = np.flatnonzero(present)
+        for ids in lists[1:]:
+            result = _keep_members(result, ids, len(self.texts))
+            if not len(result):
+                break
+        return result
+
+    def match_ids(self, needle: str, within: Optional[np.ndarray] = None) -> np.ndarray:
+        """Ids of the distinct values containing ``needle``."""
+        candidates = self._candidates(needle)
+        if within is not None:
+            candidates = within if candidates is None else _keep_members(candidates, within, len(self.texts))
+        if candidates is None:
+            return np.flatnonzero(_contains(self.texts, needle))
+        return candidates[_contains(self.texts.iloc[candidates], needle)]
+
+    def row_mask(self, ids: np.ndarray) -> np.ndarray:
+        hit = np.zeros(len(self.texts) + 1, dtype=bool)  # slot -1 = nulls
+        hit[ids] = True
+        return hit[self.codes]
+
+
+class SearchIndex:
+    """Case-insensitive substring index over every column of a DataFrame."""
+
+    def __init__(self, df: pd.DataFrame):
+        self.row_count = len(df)
+        self._columns: List[_ColumnIndex] = [_ColumnIndex(df.iloc[:, i]) for i in range(df.shape[1])]
+        self._masks: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._last: Optional[tuple] = None  # (needle, per-column matched ids)
+        self._lock = threading.Lock()
+
+    @property
+    def trigram_columns(self) -> int:
+        return sum(1 for column in self._columns if column.has_trigrams)
+
+    def match(self, search_text: str) -> np.ndarray:
+        """Boolean mask by row position: any column's text contains ``search_text``."""
+        needle = search_text.lower().strip()
+        if not needle:
+            return np.ones(self.row_count, dtype=bool)
+        with self._lock:
+            mask = self._masks.get(needle)
+            if mask is not None:
+                self._masks.move_to_end(needle)
+                return mask
+            previous = self._last if self._last is not None and self._last[0] in needle else None
+
+        matched: Dict[int, np.ndarray] = {}
+        mask = np.zeros(self.row_count, dtype=bool)
+        for i, column in enumerate(self._columns):
+            within = previous[1][i] if previous is not None else None
+            ids = column.match_ids(needle, within)
+            matched[i] = ids
+            if len(ids):
+                mask |= column.row_mask(ids)
+
+        with self._lock:
+            self._last = (needle, matched)
+            self._masks[needle] = mask
+            while len(self._masks) > MASK_CACHE_SIZE:
+                self._masks.popitem(last=False)
+        return mask
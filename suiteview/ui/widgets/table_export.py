@@ -0,0 +1,220 @@
+"""
+Streaming copy / export of FilterTableView rows.
+
+An ``ExportPlan`` describes what the grid is showing: the visible columns in
+their on-screen order, each numeric column's decimals setting, and a
+generator that yields the displayed rows in chunks (from a pandas frame or
+an Arrow source). The writers never hold more than one chunk as Python
+objects:
+
+* ``clipboard_text`` — tab-separated text in the grid's display format
+  (thousands separators / fixed decimals), built chunk by chunk;
+* ``write_xlsx`` — openpyxl write-only workbook with typed cells. Columns
+  with a decimals setting get a matching number format, and the sheet is
+  capped at Excel's row limit;
+* ``write_csv`` — pandas' C writer, appended per chunk, with decimals
+  applied (no thousands separators, so numbers stay machine-readable);
+* ``write_parquet`` — a pyarrow ParquetWriter, one row group per chunk,
+  with the raw typed values.
+
+Every writer takes ``progress(rows_done)`` and a ``threading.Event``. When
+the event is set the writer stops at the next chunk and raises
+``ExportCancelled``; a partly written file is removed. Pure Python — no
+PyQt. FilterTableView runs these on an ExportWorker thread.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_CHUNK_ROWS = 20_000
+EXCEL_MAX_DATA_ROWS = 1_048_575  # sheet row limit less the header row
+
+Progress = Optional[Callable[[int], None]]
+
+
+class ExportCancelled(Exception):
+    """Raised by a writer when its cancel event is set."""
+
+
+@dataclass
+class ExportPlan:
+    """The rows and columns to copy or export, in display order."""
+
+    columns: List[str]
+    total_rows: int
+    chunks: Callable[[int], Iterator[pd.DataFrame]]  # chunk size -> frames (columns = names)
+    decimals: Dict[str, int] = field(default_factory=dict)  # numeric column -> decimals
+
+
+@dataclass
+class ExportResult:
+    rows: int
+    truncated: bool = False
+    path: str = ""
+
+
+def display_texts(values, decimals: Optional[int]) -> List[str]:
+    """Cell text exactly as the grid shows it ("" for nulls)."""
+    missing = pd.isna(values)
+    if decimals is not None:
+        fmt = f"{{:,.{decimals}f}}".format
+        return ["" if na else fmt(float(v)) for v, na in zip(values, missing)]
+    return ["" if na else str(v) for v, na in zip(values, missing)]
+
+
+def _chunks(plan: ExportPlan, chunk_rows: int, progress: Progress,
+            cancel: Optional[threading.Event]) -> Iterator[pd.DataFrame]:
+    done = 0
+    for frame in plan.chunks(chunk_rows):
+        if cancel is not None and cancel.is_set():
+            raise ExportCancelled()
+        yield frame
+        done += len(frame)
+        if progress is not None:
+            progress(done)
+
+
+def clipboard_text(plan: ExportPlan, progress: Progress = None,
+                   cancel: Optional[threading.Event] = None,
+                   chunk_rows: int = DEFAULT_CHUNK_ROWS) -> str:
+    """Header line plus one tab-separated line per displayed row."""
+    parts = ["\t".join(plan.columns)]
+    for frame in _chunks(plan, chunk_rows, progress, cancel):
+        texts = [display_texts(frame[name].array, plan.decimals.get(name)) for name in plan.columns]
+        parts.append("\n".join("\t".join(row) for row in zip(*texts)))
+    return "\n".join(part for part in parts if part)
+
+
+def _cell_values(column: pd.Series) -> np.ndarray:
+    """Python objects openpyxl can write (nulls -> None, naive datetimes)."""
+    if pd.api.types.is_datetime64_any_dtype(column.dtype) and getattr(column.dt, "tz", None) is not None:
+        column = column.dt.tz_localize(None)  # Excel has no time zones
+    values = column.to_numpy(dtype=object)
+    values[pd.isna(column).to_numpy()] = None
+    return values
+
+
+def _number_format(decimals: int) -> str:
+    return "#,##0." + "0" * decimals if decimals > 0 else "#,##0"
+
+
+def _remove_partial(path: str):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def write_xlsx(plan: ExportPlan, path: str, progress: Progress = None,
+               cancel: Optional[threading.Event] = None,
+               chunk_rows: int = DEFAULT_CHUNK_ROWS, sheet_name: str = "Sheet1") -> ExportResult:
+    """Stream the rows into a write-only workbook (typed cells, decimals as number formats)."""
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_name)
+    bold = Font(bold=True)
+    header = []
+    for name in plan.columns:
+        cell = WriteOnlyCell(sheet, value=name)
+        cell.font = bold
+        header.append(cell)
+    sheet.append(header)
+
+    formats = {i: _number_format(plan.decimals[name])
+               for i, name in enumerate(plan.columns) if name in plan.decimals}
+    written = 0
+    truncated = False
+    try:
+        for frame in _chunks(plan, chunk_rows, progress, cancel):
+            room = EXCEL_MAX_DATA_ROWS - written
+            if room <= 0:
+                truncated = True
+                break
+            if len(frame) > room:
+                frame, truncated = frame.iloc[:room], True
+            columns = [_cell_values(frame[name]) for name in plan.columns]
+            for row in zip(*columns):
+                if formats:
+                    row = list(row)
+                    for i, number_format in formats.items():
+                        if row[i] is not None:
+                            cell = WriteOnlyCell(sheet, value=row[i])
+                            cell.number_format = number_format
+                            row[i] = cell
+                sheet.append(row)
+            written += len(frame)
+            if truncated:
+                break
+        workbook.save(path)
+    except ExportCancelled:
+        _remove_partial(path)
+        raise
+    return ExportResult(rows=written, truncated=truncated, path=path)
+
+
+def write_csv(plan: ExportPlan, path: str, progress: Progress = None,
+              cancel: Optional[threading.Event] = None,
+              chunk_rows: int = DEFAULT_CHUNK_ROWS) -> ExportResult:
+    """Append each chunk with pandas' CSV writer (decimals applied, no separators)."""
+    written = 0
+    try:
+        with open(path, "w", newline="", encoding="utf-8-sig") as handle:
+            pd.DataFrame(columns=plan.columns).to_csv(handle, index=False)
+            for frame in _chunks(plan, chunk_rows, progress, cancel):
+                frame = frame.loc[:, plan.columns]
+                for name, decimals in plan.decimals.items():
+                    fmt = f"{{:.{decimals}f}}".format
+                    values = frame[name].array
+                    frame[name] = ["" if na else fmt(float(v)) for v, na in zip(values, pd.isna(values))]
+                frame.to_csv(handle, index=False, header=False)
+                written += len(frame)
+    except ExportCancelled:
+        _remove_partial(path)
+        raise
+    return ExportResult(rows=written, path=path)
+
+
+def write_parquet(plan: ExportPlan, path: str, progress: Progress = None,
+                  cancel: Optional[threading.Event] = None,
+                  chunk_rows: int = DEFAULT_CHUNK_ROWS) -> ExportResult:
+    """One row group per chunk; raw typed values in display column order."""
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    schema = None
+    written = 0
+    try:
+        for frame in _chunks(plan, chunk_rows, progress, cancel):
+            frame = frame.loc[:, plan.columns]
+            table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+            if writer is None:
+                schema = table.schema
+                writer = pq.ParquetWriter(path, schema)
+            writer.write_table(table)
+            written += len(frame)
+        if writer is None:  # no rows: still write the columns
+            empty = pa.table({name: pa.array([], type=pa.string()) for name in plan.columns})
+            pq.write_table(empty, path)
+    except ExportCancelled:
+        if writer is not None:
+            writer.close()
+            writer = None
+        _remove_partial(path)
+        raise
+    finally:
+        if writer is not None:
+            writer.close()
+    return ExportResult(rows=written, path=path)
+
+
+WRITERS = {".xlsx": write_xlsx, ".csv": write_csv, ".parquet": write_parquet}
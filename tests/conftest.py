@@ -41,6 +41,11 @@ _PERFORMANCE_TESTS = {
     "test_illustration_solve_premium_to_target.py::test_real_engine_av_target_matches_premium_arithmetic",
     "test_illustration_solve_premium_to_target.py::test_real_engine_premium_stops_at_the_row_span",
     "test_illustration_max_level_solve.py::test_real_engine_guideline_drop_lowers_max_level",
+    "test_tn3270_rendering.py::test_benchmark_replay_recorded_streams",
+    "test_tn3270_decoding.py::test_benchmark_decode_captured_streams",
+    "test_taskbar_startup.py::test_measure_script_meets_startup_budgets",
+    "test_bookmark_data_manager.py::test_benchmark_lookups_with_thousands_of_bookmarks",
+    "test_recent_files_index.py::test_benchmark_reopen_after_restart",
 }
 
 
@@ -132,6 +132,19 @@ def test_coverage_level_uses_resultcov_alias_for_th_cov():
     assert "RESULTCOV.COV_PHA_NBR = CUSTOM_THCOV.COV_PHA_NBR" in sql
 
 
+def test_rebuild_with_unchanged_tabs_comes_from_cache():
+    _app()
+    tab = CustomDisplayTab()
+    build_cyberlife_sql.cache_clear()
+    first = _build(tab)
+    assert _build(tab) == first
+    assert build_cyberlife_sql.cache_info().hits == 1
+    _select(tab, "Policy (LH_BAS_POL)", ["APP_WRT_DT"])
+    changed = _build(tab)
+    assert "  , POLICY1.APP_WRT_DT APP_WRT_DT" in changed
+    assert build_cyberlife_sql.cache_info().misses == 2
+
+
 def test_state_round_trips_selections():
     _app()
     tab = CustomDisplayTab()
@@ -0,0 +1,211 @@
+"""Indexed lookups and deferred saves in BookmarkDataManager (suiteview/ui/widgets/bookmark_data_manager.py)."""
+import json
+import os
+import random
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.ui.widgets.bookmark_data_manager import BookmarkDataManager
+
+_QT_APP = None
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    monkeypatch.setattr(BookmarkDataManager, "DATA_FILE", tmp_path / "bookmarks.json")
+    BookmarkDataManager.reset_instance()
+    yield BookmarkDataManager()
+    BookmarkDataManager.reset_instance()
+
+
+def _walk(manager):
+    """(item, parent list, index) for every item, by a full tree walk"""
+    found = []
+
+    def walk(items):
+        for i, item in enumerate(items):
+            found.append((item, items, i))
+            if item.get('type') == 'category':
+                walk(item.get('items', []))
+
+    for bar_data in manager._data['bars'].values():
+        walk(bar_data.get('items', []))
+    return found
+
+
+def _assert_lookups_match_walk(manager):
+    walked = _walk(manager)
+    for item, items, index in walked:
+        assert manager.find_item_by_id(item['id']) is item
+        location = manager.find_item_location(item['id'])
+        assert location[0] is items and location[1] == index
+    for name in {item['name'] for item, _, _ in walked if item['type'] == 'category'}:
+        first = next(item for item, _, _ in walked if item['type'] == 'category' and item['name'] == name)
+        assert manager.find_category_by_name(name) is first
+    assert manager.get_all_items_flat() == [item for item, _, _ in walked]
+    assert manager.find_item_by_id(10 ** 6) is None
+    assert manager.find_category_by_name("No such category") is None
+
+
+def _build(manager, categories=3, bookmarks=4):
+    for bar_id in (0, 1):
+        for c in range(categories):
+            category = manager.add_category_to_bar(bar_id, f"Cat {bar_id}.{c}")
+            for b in range(bookmarks):
+                manager.add_bookmark_to_category(category['id'], f"B{b}", f"C:/bar{bar_id}/c{c}/b{b}")
+            sub = manager.add_category_to_category(category['id'], f"Sub {bar_id}.{c}")
+            manager.add_bookmark_to_category(sub['id'], "Deep", f"C:/bar{bar_id}/c{c}/deep")
+        manager.add_bookmark_to_bar(bar_id, "Top", f"C:/bar{bar_id}/top", index=0)
+
+
+def test_index_follows_manager_edits(manager):
+    _build(manager)
+    _assert_lookups_match_walk(manager)
+
+    rng = random.Random(7)
+    for step in range(200):
+        ids = [item['id'] for item, _, _ in _walk(manager)]
+        categories = [item for item, _, _ in _walk(manager) if item['type'] == 'category']
+        action = step % 8
+        if action == 0:
+            manager.move_item(rng.choice(ids), target_bar_id=rng.choice([0, 1]), target_index=rng.randint(0, 3))
+        elif action == 1:
+            moving = rng.choice(ids)
+            target = rng.choice(categories)
+            if moving != target['id'] and manager.find_item_by_id(moving).get('type') == 'bookmark':
+                manager.move_item(moving, target_category_id=target['id'], target_index=0)
+        elif action == 2:
+            manager.reorder_item(rng.choice(ids), rng.randint(0, 2))
+        elif action == 3 and len(ids) > 10:
+            manager.delete_item(rng.choice(ids))
+        elif action == 4:
+            manager.add_bookmark_to_category(rng.choice(categories)['id'], "New", f"C:/new/{step}", index=1)
+        elif action == 5:
+            manager.update_category(rng.choice(categories)['id'], name=rng.choice(["Work", "Home", f"N{step}"]))
+        elif action == 6:
+            manager.add_category_to_bar(rng.choice([0, 1]), rng.choice(["Work", "Home"]), index=0)
+        else:
+            manager.remove_bookmark_by_path(rng.choice([0, 1]), f"C:/new/{step - 4}")
+        _assert_lookups_match_walk(manager)
+
+    assert manager._find_max_item_id() == max(item['id'] for item, _, _ in _walk(manager))
+
+
+def test_index_catches_up_with_direct_edits(manager):
+    """Widgets edit the bar lists in place and then save()"""
+    _build(manager)
+    top = manager.get_bar_items(0)
+    category = top[1]
+    moved = category['items'].pop(0)
+    top.insert(0, moved)
+    manager.get_bar_items(1).append(manager.create_bookmark("Added", "C:/added"))
+    category['name'] = "Renamed"
+    del top[3]
+    manager.save()
+    _assert_lookups_match_walk(manager)
+    assert manager.find_category_by_name("Cat 0.0") is None
+    assert manager.find_category_by_name("Cat 0.1") is None
+    assert manager.find_category_by_name("Renamed") is category
+
+    # Replacing a category's list detaches everything that was in it
+    sub = manager.find_category_by_name("Sub 0.0")
+    deep_id = sub['items'][0]['id']
+    sub['items'] = []
+    manager.save()
+    assert manager.find_item_by_id(deep_id) is None
+    _assert_lookups_match_walk(manager)
+
+
+def test_saving_manager_edits_keeps_the_index(manager, monkeypatch):
+    _build(manager)
+    manager.find_item_by_id(1)  # settle the index
+    rebuilds = []
+    original = BookmarkDataManager._rebuild_index
+    monkeypatch.setattr(BookmarkDataManager, "_rebuild_index",
+                        lambda self: (rebuilds.append(1), original(self)))
+
+    category = manager.find_category_by_name("Cat 1.2")
+    for i in range(20):
+        bookmark = manager.add_bookmark_to_category(category['id'], f"N{i}", f"C:/n{i}")
+        manager.save()
+        assert manager.find_item_by_id(bookmark['id']) is bookmark
+        assert manager.find_category_by_name("Cat 1.2") is category
+    assert rebuilds == []
+
+    # A list handed out earlier is edited long after the index settled
+    held = manager.get_bar_items(1)
+    manager.get_all_items_flat()
+    added = manager.create_bookmark("Held", "C:/held")
+    held.append(added)
+    manager.save()
+    assert manager.find_item_by_id(added['id']) is added
+    assert added in manager.get_all_items_flat()
+    _assert_lookups_match_walk(manager)
+
+
+def test_saves_are_deferred_and_batched(manager):
+    _app()
+    notified = []
+    manager.register_save_callback(0, lambda: notified.append(1))
+    with manager.batch():
+        for i in range(5):
+            manager.add_bookmark_to_bar(0, f"B{i}", f"C:/b{i}")
+            manager.save()
+    assert notified == [1]
+    assert not manager.DATA_FILE.exists()
+
+    manager.add_category_to_bar(1, "Later")
+    manager.save()
+    assert len(notified) == 2
+    manager.flush()
+    saved = json.loads(manager.DATA_FILE.read_text(encoding="utf-8"))
+    assert [item['name'] for item in saved['bars']['0']['items']] == [f"B{i}" for i in range(5)]
+    assert saved['bars']['1']['items'][0]['name'] == "Later"
+
+    manager.update_bookmark(saved['bars']['0']['items'][0]['id'], name="Renamed")
+    manager.save()
+    deadline = time.monotonic() + 5
+    while "Renamed" not in manager.DATA_FILE.read_text(encoding="utf-8") and time.monotonic() < deadline:
+        _QT_APP.processEvents()
+        time.sleep(0.02)
+    assert "Renamed" in manager.DATA_FILE.read_text(encoding="utf-8")
+
+    BookmarkDataManager.reset_instance()
+    assert BookmarkDataManager().find_category_by_name("Later")['name'] == "Later"
+
+
+def test_benchmark_lookups_with_thousands_of_bookmarks(manager):
+    _build(manager, categories=40, bookmarks=50)
+    walked = _walk(manager)
+    ids = [item['id'] for item, _, _ in walked][::20]
+    names = sorted({item['name'] for item, _, _ in walked if item['type'] == 'category'})
+
+    start = time.perf_counter()
+    for item_id in ids:
+        manager.find_item_location(item_id)
+        manager.find_item_by_id(item_id)
+    for name in names:
+        manager.find_category_by_name(name)
+    indexed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for item_id in ids:
+        next(entry for entry in _walk(manager) if entry[0]['id'] == item_id)
+        next(entry for entry in _walk(manager) if entry[0]['id'] == item_id)
+    for name in names:
+        next(entry for entry in _walk(manager) if entry[0]['type'] == 'category' and entry[0]['name'] == name)
+    walking = time.perf_counter() - start
+
+    print(f"\n{len(walked)} items, {2 * len(ids) + len(names)} lookups: "
+          f"tree walk {walking * 1000:.1f} ms, indexed {indexed * 1000:.1f} ms")
+    assert indexed < walking
@@ -0,0 +1,88 @@
+"""Tests for the criteria cache in front of build_cyberlife_sql.
+
+Plain objects with ``get_state()`` stand in for the audit tabs (the real
+tabs need the DB2 driver to import); calls to the uncached builder are
+counted.
+"""
+import os
+import sys
+
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from suiteview.audit import cyberlife_query  # noqa: E402
+from suiteview.audit.cyberlife_query import CyberLifeCriteria, build_cyberlife_sql  # noqa: E402
+
+
+class _Tab:
+    def __init__(self):
+        self.state = {"txt": "", "chk": False, "list": []}
+
+    def get_state(self):
+        return {key: list(value) if isinstance(value, list) else value
+                for key, value in self.state.items()}
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    def fake_build(*args, **kwargs):
+        calls.append(args)
+        return f"SQL {len(calls)}"
+
+    monkeypatch.setattr(cyberlife_query, "_build_cyberlife_sql", fake_build)
+    build_cyberlife_sql.cache_clear()
+    yield calls
+    build_cyberlife_sql.cache_clear()
+
+
+def _build(tabs, **kwargs):
+    return build_cyberlife_sql("DB2TAB", "", "25", *tabs, **kwargs)
+
+
+def test_criteria_are_frozen_and_compare_by_state():
+    tab = _Tab()
+    first = CyberLifeCriteria.from_tabs("DB2TAB", "I", "25", policy=tab, display=None)
+    assert first == CyberLifeCriteria.from_tabs("DB2TAB", "I", "25", policy=tab)
+    assert hash(first) == hash(CyberLifeCriteria.from_tabs("DB2TAB", "I", "25", policy=tab))
+    tab.state["list"].append("01-One")
+    assert CyberLifeCriteria.from_tabs("DB2TAB", "I", "25", policy=tab) != first
+    with pytest.raises(AttributeError):
+        first.schema = "OTHER"
+
+
+def test_unchanged_tabs_reuse_the_built_sql(calls):
+    tabs = [_Tab() for _ in range(8)]
+    assert _build(tabs) == _build(tabs) == "SQL 1"
+    assert build_cyberlife_sql.cache_info().hits == 1
+
+    tabs[3].state["chk"] = True
+    assert _build(tabs) == "SQL 2"
+    tabs[5].state["list"].append("1U143900")
+    assert _build(tabs) == "SQL 3"
+    assert _build(tabs, coverage_level=True) == "SQL 4"
+    assert len(calls) == 4
+
+
+def test_today_is_part_of_the_key(calls, monkeypatch):
+    tabs = [_Tab() for _ in range(8)]
+    _build(tabs)
+    monkeypatch.setattr(cyberlife_query, "today_str", lambda: "2099-01-01")
+    _build(tabs)
+    assert len(calls) == 2
+
+
+def test_unhashable_state_builds_uncached(calls):
+    tabs = [_Tab() for _ in range(8)]
+    tabs[0].state["txt"] = object.__new__(type("Odd", (), {"__hash__": None}))
+    _build(tabs)
+    _build(tabs)
+    assert len(calls) == 2
+    assert build_cyberlife_sql.cache_info().uncacheable == 2
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
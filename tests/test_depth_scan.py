@@ -0,0 +1,103 @@
+"""Concurrent depth-search scan (suiteview/file_nav/depth_scan.py)."""
+import os
+import threading
+
+import pytest
+
+from suiteview.file_nav.depth_scan import ensure_stat, format_size, format_timestamp, iter_folder, scan_tree
+
+
+def _tree(root):
+    # root/a.txt, root/d1/b.csv, root/d1/d2/c.txt, root/d1/d2/d3/e.txt, root/empty/
+    (root / "a.txt").write_text("aaaa")
+    d3 = root / "d1" / "d2" / "d3"
+    d3.mkdir(parents=True)
+    (root / "d1" / "b.csv").write_text("b")
+    (root / "d1" / "d2" / "c.txt").write_text("cc")
+    (d3 / "e.txt").write_text("e")
+    (root / "empty").mkdir()
+    return root
+
+
+def _names(items):
+    return sorted(item['display_name'] for item in items)
+
+
+def test_scan_matches_walk_at_every_depth(tmp_path):
+    root = _tree(tmp_path)
+    everything = scan_tree(str(root), -1, max_workers=4)
+    assert _names(everything) == [
+        "a.txt", "d1", "d1 | b.csv", "d1 | d2", "d1 | d2 | c.txt", "d1 | d2 | d3",
+        "d1 | d2 | d3 | e.txt", "empty"]
+    walked = {os.path.join(base, n) for base, dirs, files in os.walk(root) for n in dirs + files}
+    assert {item['path'] for item in everything} == walked
+
+    one = scan_tree(str(root), 1)
+    assert _names(one) == ["a.txt", "d1", "empty"]
+    assert {item['depth'] for item in scan_tree(str(root), 2)} == {1, 2}
+    assert scan_tree(str(root), 0) == []
+    assert scan_tree(str(root / "missing"), -1) == []
+
+
+def test_stat_is_deferred_until_display(tmp_path):
+    root = _tree(tmp_path)
+    items = {item['display_name']: item for item in scan_tree(str(root), 1, with_stat=False)}
+    file_item = items["a.txt"]
+    assert file_item['size'] is None and file_item['mtime'] is None
+    assert items["d1"]['size'] == 0
+
+    ensure_stat(file_item)
+    assert file_item['size'] == 4
+    assert format_timestamp(file_item['mtime']) == format_timestamp(os.stat(root / "a.txt").st_mtime)
+    assert format_timestamp(None) == ""
+
+    listed = {item['display_name']: item for item in scan_tree(str(root), 1, with_stat=True)}
+    assert listed["a.txt"]['size'] == 4 and listed["a.txt"]['mtime']
+
+
+def test_format_size():
+    assert format_size(None) == ""
+    assert format_size(512) == "512 B"
+    assert format_size(1536) == "1.5 KB"
+    assert format_size(3 * 1024 * 1024) == "3.0 MB"
+    assert format_size(5 * 1024 ** 3) == "5.00 GB"
+
+
+def test_partial_results_stream_and_cancel_stops_the_queue(tmp_path):
+    for i in range(6):
+        sub = tmp_path / f"dir{i}"
+        sub.mkdir()
+        (sub / "f.txt").write_text("x")
+    batches = []
+    items = scan_tree(str(tmp_path), -1, max_workers=3, on_items=batches.append)
+    assert sum(len(b) for b in batches) == len(items) == 12
+    assert len(batches) == 7  # one per folder listed
+
+    cancel = threading.Event()
+    cancel.set()
+    partial = scan_tree(str(tmp_path), -1, cancel=cancel)
+    assert len(partial) <= 6
+
+
+def test_iter_folder_yields_batches_and_stops_on_cancel(tmp_path):
+    for i in range(25):
+        (tmp_path / f"f{i:02d}.txt").write_text("x" * i)
+    (tmp_path / "sub").mkdir()
+
+    batches = list(iter_folder(str(tmp_path), batch_size=10, with_stat=True))
+    assert [len(b) for b in batches] == [10, 10, 6]
+    items = {item['display_name']: item for batch in batches for item in batch}
+    assert items["sub"]['is_dir'] and items["sub"]['size'] == 0
+    assert items["f07.txt"]['size'] == 7 and items["f07.txt"]['depth'] == 1
+
+    lazy = next(iter_folder(str(tmp_path), batch_size=100, with_stat=False))
+    assert all(item['mtime'] is None for item in lazy)
+
+    cancel = threading.Event()
+    chunks = iter_folder(str(tmp_path), batch_size=10, cancel=cancel)
+    next(chunks)
+    cancel.set()
+    assert list(chunks) == []
+
+    with pytest.raises(OSError):
+        list(iter_folder(str(tmp_path / "missing")))
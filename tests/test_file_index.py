@@ -0,0 +1,135 @@
+"""Persistent depth-search file index (suiteview/file_nav/file_index.py)."""
+import os
+
+from suiteview.file_nav import file_index
+from suiteview.file_nav.depth_scan import scan_tree
+from suiteview.file_nav.file_index import FileIndex
+
+
+def _tree(root):
+    root.mkdir()
+    (root / "top.txt").write_text("t")
+    for name in ("alpha", "beta"):
+        sub = root / name / "inner"
+        sub.mkdir(parents=True)
+        (root / name / f"{name}_report.xlsx").write_text("x")
+        (sub / "notes.txt").write_text("n")
+    return root
+
+
+def _scan(root, db, depth=-1):
+    index = FileIndex(str(root), db).load()
+    results = scan_tree(index.root, depth, lister=index.lister, with_stat=True)
+    index.save(depth)
+    return index, results
+
+
+def _names(items):
+    return sorted(item['display_name'] for item in items)
+
+
+def test_revisit_relists_only_changed_folders(tmp_path, monkeypatch):
+    root = _tree(tmp_path / "share")
+    db = tmp_path / "index.sqlite"
+    index, first = _scan(root, db)
+    assert index.changed and len(first) == 9
+    index.close()
+
+    listed = []
+    real_list_folder = file_index.list_folder
+
+    def counting(folder, *args, **kwargs):
+        listed.append(os.path.relpath(folder, root))
+        return real_list_folder(folder, *args, **kwargs)
+
+    monkeypatch.setattr(file_index, "list_folder", counting)
+    index = FileIndex(str(root), db).load()
+    assert _names(index.snapshot(-1)) == _names(first)
+    assert _names(index.snapshot(2)) == _names(i for i in first if i['depth'] <= 2)
+    assert FileIndex(str(root), db).snapshot(1) is None  # not loaded
+    results = scan_tree(index.root, -1, lister=index.lister, with_stat=True)
+    index.save(-1)
+    assert listed == [] and not index.changed
+    assert _names(results) == _names(first)
+    index.close()
+
+    (root / "beta" / "new.csv").write_text("n")
+    for path in (root / "alpha" / "inner").iterdir():
+        path.unlink()
+    (root / "alpha" / "inner").rmdir()
+    os.utime(root / "alpha", (1, 1))  # a distinct mtime even on coarse clocks
+    os.utime(root / "beta", (2, 2))
+
+    index, results = _scan(root, db)
+    assert sorted(listed) == ["alpha", "beta"] and index.changed
+    index.close()
+    index = FileIndex(str(root), db).load()
+    expected = _names(results)
+    assert "beta | new.csv" in expected and "alpha | inner | notes.txt" not in expected
+    assert _names(index.snapshot(-1)) == expected
+
+
+def test_relisted_folder_picks_up_size_edits(tmp_path):
+    root = _tree(tmp_path / "share")
+    db = tmp_path / "index.sqlite"
+    index, _ = _scan(root, db)
+    index.close()
+
+    report = root / "beta" / "beta_report.xlsx"
+    report.write_text("a much longer body")
+    os.utime(report, (3, 3))
+    os.utime(root / "beta", (4, 4))  # force a relist; the names are unchanged
+
+    index, results = _scan(root, db)
+    assert index.changed
+    index.close()
+    stored = {item['path']: item for item in FileIndex(str(root), db).load().snapshot(-1)}
+    assert stored[str(report)]['size'] == len("a much longer body")
+    assert stored[str(report)]['mtime'] == 3
+    assert _names(stored.values()) == _names(results)
+
+
+def test_unreadable_folder_keeps_its_stored_subtree(tmp_path, monkeypatch):
+    root = _tree(tmp_path / "share")
+    db = tmp_path / "index.sqlite"
+    index, first = _scan(root, db)
+    index.close()
+
+    beta = str(root / "beta")
+    real_list_folder = file_index.list_folder
+
+    def denied(folder, *args, strict=False, **kwargs):
+        if folder == beta:  # what list_folder does when scandir is refused
+            if strict:
+                raise PermissionError(13, "Access is denied", folder)
+            return [], []
+        return real_list_folder(folder, *args, strict=strict, **kwargs)
+
+    monkeypatch.setattr(file_index, "list_folder", denied)
+    os.utime(beta, (1, 1))  # changed, so the index has to list it again
+    index = FileIndex(str(root), db).load()
+    results = scan_tree(index.root, -1, lister=index.lister, with_stat=True)
+    assert not any(item['path'].startswith(beta + os.sep) for item in results)
+    index.save(-1)
+    assert not index.changed
+    assert _names(index.snapshot(-1)) == _names(first)
+    index.close()
+
+
+def test_name_search_uses_fts_and_like(tmp_path):
+    root = _tree(tmp_path / "share")
+    db = tmp_path / "index.sqlite"
+    index, _ = _scan(root, db, depth=2)
+    index.close()
+
+    index = FileIndex(str(root), db)
+    assert index.is_complete(2) and index.is_complete(1) and not index.is_complete(-1)
+    assert index.search("REPORT") == {str(root / "alpha" / "alpha_report.xlsx"),
+                                      str(root / "beta" / "beta_report.xlsx")}
+    assert index.fts
+    assert index.search("alpha |") == {str(root / "alpha" / "alpha_report.xlsx"),
+                                       str(root / "alpha" / "inner")}
+    assert index.search("a_") == {str(root / "alpha" / "alpha_report.xlsx"),
+                                  str(root / "beta" / "beta_report.xlsx")}  # LIKE, literal "_"
+    assert index.search("report", depth_level=1) == set()
+    assert index.search("  ") == set()
@@ -272,6 +272,47 @@ def test_limit_caps_rows(tmp_path):
     assert len(df) == 5
 
 
+def test_delimited_and_fixed_width_members_scan_lazily(tmp_path, monkeypatch):
+    csv_path = _write(tmp_path / "CLAIMS.txt", "policy,amount\n007,100\nP2,x\n")
+    fw_path = _write(tmp_path / "FW.txt", "PROD1TX0100\n\nPROD2CA0200\n")
+    claims = FileDataSource(
+        name="Claims", source_type="csv",
+        parse_spec=delimited_text_spec(),
+        columns=[FileColumn("policy"), FileColumn("amount", "INTEGER")],
+        members=[FileMember(path=csv_path, table_name="CLAIMS")],
+    )
+    fw = FileDataSource(
+        name="FW", source_type="fixed_width",
+        parse_spec=fixed_width_spec([
+            {"name": "code", "start": 1, "width": 5},
+            {"name": "amt", "start": 8, "width": 4},
+        ]),
+        columns=[FileColumn("code"), FileColumn("amt", "INTEGER")],
+        members=[FileMember(path=fw_path, table_name="FW")],
+    )
+    assert "read_csv(" in file_query_runner.member_scan_sql(claims, claims.members[0])
+    assert "substring(" in file_query_runner.member_scan_sql(fw, fw.members[0])
+
+    def no_pandas(*_args, **_kwargs):
+        raise AssertionError("member should not be loaded through pandas")
+
+    monkeypatch.setattr(file_query_runner, "dataframe_from_adhoc_metadata", no_pandas)
+    df = file_query_runner.run_sql(claims, 'SELECT * FROM "CLAIMS"').dataframe
+    # Declared TEXT keeps leading zeros; declared INTEGER is enforced.
+    assert df["policy"].tolist() == ["007", "P2"]
+    assert df["amount"].iloc[0] == 100 and df["amount"].isna().iloc[1]
+
+    df = file_query_runner.run_sql(fw, 'SELECT * FROM "FW"').dataframe
+    assert df["code"].tolist() == ["PROD1", "PROD2"]
+    assert df["amt"].tolist() == [100, 200]
+
+
+def test_excel_member_falls_back_to_pandas():
+    fds = FileDataSource(name="X", source_type="excel",
+                         members=[FileMember(path="/x/BOOK.xlsx")])
+    assert file_query_runner.member_scan_sql(fds, fds.members[0]) is None
+
+
 def test_run_sql_without_members_raises(tmp_path):
     from suiteview.audit.dataforge.forge_engine import ForgeEngineError
 
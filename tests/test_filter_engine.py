@@ -0,0 +1,88 @@
+"""Categorical-code filter/sort engine (suiteview/ui/widgets/filter_engine.py)."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.ui.widgets.filter_engine import FilterEngine
+from suiteview.ui.widgets.filter_table_view import FilterTableView
+
+_QT_APP = None
+_KEEP = []  # keep Qt objects alive for the session (no GC mid-event-loop)
+
+
+def _frame() -> pd.DataFrame:
+    return pd.DataFrame({
+        "ST": ["TX", "OK", None, "TX", "CA", "OK", "TX", None],
+        "AMT": [5.0, 1.5, 3.0, np.nan, 2.0, 5.0, 0.5, 4.0],
+        "CNT": pd.array([3, None, 1, 2, 2, None, 7, 1], dtype="Int64"),
+        "DT": pd.to_datetime(["2024-01-31", "2024-02-29", None, "2024-01-31",
+                              "2024-03-31", "2024-02-29", "2024-01-31", "2024-03-31"]),
+    }, index=[10, 11, 12, 13, 14, 15, 16, 17])
+
+
+def _texts(values):
+    return sorted(str(v) if not pd.isna(v) else "(Blanks)" for v in values)
+
+
+def test_masks_match_string_isin_and_combine():
+    df = _frame()
+    engine = FilterEngine(df)
+    mask = engine.column_mask("ST", {"TX", "(Blanks)"})
+    assert (mask == df["ST"].fillna("(Blanks)").astype(str).isin({"TX", "(Blanks)"}).to_numpy()).all()
+    assert engine.column_mask("ST", {"(Blanks)", "TX"}) is mask  # cached per selection
+
+    positions = engine.filtered_positions({"ST": {"TX", "(Blanks)"}, "AMT": {"5.0", "(Blanks)"}})
+    assert list(positions) == [0, 3]
+    assert engine.filtered_positions({}) is None
+
+    # Int64 and datetime columns filter on the popup's own text
+    assert list(engine.filtered_positions({"CNT": {"(Blanks)", "7"}})) == [1, 5, 6]
+    assert list(engine.filtered_positions({"DT": {"2024-01-31 00:00:00"}})) == [0, 3, 6]
+
+
+def test_cascading_unique_values_come_from_codes():
+    engine = FilterEngine(_frame())
+    assert _texts(engine.unique_values("ST", {})) == ["(Blanks)", "CA", "OK", "TX"]
+    filters = {"ST": {"TX"}, "AMT": {"5.0", "0.5"}}
+    assert _texts(engine.unique_values("ST", filters)) == ["OK", "TX"]   # own filter ignored
+    assert _texts(engine.unique_values("AMT", filters)) == ["(Blanks)", "0.5", "5.0"]
+    assert _texts(engine.unique_values("CNT", filters)) == ["3", "7"]
+
+
+def test_sort_permutations_match_sort_values_and_are_cached():
+    df = _frame()
+    engine = FilterEngine(df)
+    for column in df.columns:
+        for ascending in (True, False):
+            expected = df.sort_values(column, ascending=ascending, kind="stable").index
+            got = df.index[engine.sort_positions(np.arange(len(df)), column, ascending)]
+            assert list(got) == list(expected), (column, ascending)
+    assert engine.permutation("AMT", True) is engine.permutation("AMT", True)
+    subset = np.array([7, 0, 4])
+    assert list(engine.sort_positions(subset, "AMT", True)) == [4, 7, 0]
+
+
+def test_grid_keeps_sort_through_filter_and_search_changes():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    grid = FilterTableView()
+    _KEEP.append(grid)
+    grid.set_dataframe(_frame())
+    assert grid._filter_engine is not None
+
+    grid.apply_sort(1, Qt.SortOrder.DescendingOrder)
+    assert list(grid.model._display_indices) == [10, 15, 17, 12, 14, 11, 16, 13]
+
+    grid.apply_column_filter("ST", {"TX", "OK"})
+    assert list(grid.model._display_indices) == [10, 15, 11, 16, 13]
+
+    grid.apply_column_filter("CNT", {"3", "(Blanks)"})
+    assert list(grid.model._display_indices) == [10, 15, 11]
+    cached = len(grid._unique_values_cache)
+    grid._get_filtered_unique_values("ST")
+    assert len(grid._unique_values_cache) == cached + 1
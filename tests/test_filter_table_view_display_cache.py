@@ -0,0 +1,93 @@
+"""PandasTableModel pre-formatted display cache."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.ui.widgets.filter_table_view import FilterTableView, PandasTableModel
+
+_QT_APP = None
+_KEEP = []  # keep Qt objects alive for the session (no GC mid-event-loop)
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+def _frame(rows: int = 1200) -> pd.DataFrame:
+    return pd.DataFrame({
+        "POL": [f"U{i:05d}" for i in range(rows)],
+        "AMT": np.linspace(0, 1_000_000, rows),
+        "F32": np.full(rows, 1.1, dtype="float32"),
+        "CNT": pd.array([i if i % 7 else None for i in range(rows)], dtype="Int64"),
+        "DT": pd.to_datetime(["2024-01-31"] * (rows - 1) + [None]),
+    }, index=range(100, 100 + rows))
+
+
+def _keep(obj):
+    _KEEP.append(obj)
+    return obj
+
+
+def _text(model, row, column):
+    return model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole)
+
+
+def _expected(model, row, column):
+    df = model.get_original_data()
+    label = model._display_indices[row]
+    value = df.iloc[df.index.get_loc(label), column]
+    return model.format_value_for_column(model.column_name(column), value)
+
+
+def test_cached_text_matches_per_cell_formatting():
+    _app()
+    model = _keep(PandasTableModel(_frame()))
+    model.set_numeric_formatting(None, {"AMT": 2})
+    for row in (0, 6, 7, 511, 512, 1199):
+        for column in range(5):
+            assert _text(model, row, column) == _expected(model, row, column)
+    assert _text(model, 1, 1) == "834.03"
+    assert _text(model, 0, 3) == ""          # <NA>
+    assert _text(model, 1199, 4) == ""       # NaT
+
+
+def test_blocks_are_built_lazily_and_dropped_on_changes():
+    _app()
+    model = _keep(PandasTableModel(_frame()))
+    assert not model._display_blocks
+    _text(model, 0, 0)
+    assert list(model._display_blocks) == [(0, 0)]
+    _text(model, 700, 1)
+    assert list(model._display_blocks) == [(0, 0), (1, 0)]
+
+    model.set_numeric_formatting(0, {})
+    assert not model._display_blocks
+    assert _text(model, 1, 1) == "834"
+
+    reversed_index = model.get_original_data().index[::-1]
+    model.set_display_indices(reversed_index)
+    assert _text(model, 0, 0) == "U01199"
+
+
+def test_sorted_and_filtered_view_reads_through_cache():
+    _app()
+    grid = _keep(FilterTableView())
+    grid.set_dataframe(_frame(50))
+    grid.apply_sort(1, Qt.SortOrder.DescendingOrder)
+    assert _text(grid.model, 0, 0) == "U00049"
+    assert _text(grid.model, 0, 0) == _expected(grid.model, 0, 0)
+
+
+def test_duplicate_index_labels_fall_back_to_direct_lookup():
+    _app()
+    df = pd.DataFrame({"A": ["x", "y"]}, index=[1, 1])
+    model = _keep(PandasTableModel(df))
+    assert model._positions() is None
+    assert model._cached_text(0, 0) is None
@@ -0,0 +1,161 @@
+"""FilterTableView windowed (Arrow/DuckDB) backend."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+import pytest
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import QApplication
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pyarrow")
+
+from suiteview.ui.widgets import filter_table_view  # noqa: E402
+from suiteview.ui.widgets.arrow_table_source import (  # noqa: E402
+    ArrowTableSource, where_clause,
+)
+from suiteview.ui.widgets.filter_table_view import (  # noqa: E402
+    ArrowTableModel, FilterTableView, PandasTableModel,
+)
+from suiteview.ui.widgets.table_export import clipboard_text  # noqa: E402
+
+_QT_APP = None
+_KEEP = []  # keep Qt objects alive for the session (no GC mid-event-loop)
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+def _keep(obj):
+    _KEEP.append(obj)
+    return obj
+
+
+def _frame(rows: int = 2000) -> pd.DataFrame:
+    return pd.DataFrame({
+        "POL": [f"U{i:05d}" for i in range(rows)],
+        "ST": [("TX", "OK", None)[i % 3] for i in range(rows)],
+        "AMT": np.arange(rows, dtype=float) * 1.5,
+        "CNT": pd.array([i if i % 7 else None for i in range(rows)], dtype="Int64"),
+    })
+
+
+def _text(model, row, column):
+    return model.data(model.index(row, column), Qt.ItemDataRole.DisplayRole)
+
+
+def _settle(grid):
+    for worker in list(grid._source_workers):
+        worker.wait()
+    QApplication.processEvents()
+
+
+def test_where_clause_filters_and_search():
+    where, params = where_clause({"ST": {"TX", "(Blanks)"}}, " Ok ", ["POL", "ST"])
+    assert where.startswith("WHERE COALESCE(CAST(\"ST\" AS VARCHAR), '(Blanks)') IN")
+    assert params == [["(Blanks)", "TX"], "ok", "ok"]
+    assert where_clause({}, "   ", ["POL"]) == ("", [])
+
+
+def test_source_pushes_down_filters_search_sort_and_uniques():
+    source = ArrowTableSource.from_dataframe(_frame())
+    assert source.query_rows({}) is None
+    assert source.total_rows == 2000
+
+    rows = source.query_rows({"ST": {"TX", "(Blanks)"}}, sort=("AMT", False))
+    assert len(rows) == 1333 and list(rows[:2]) == [1998, 1997]
+    window = source.window(rows, 0, 3, ["POL", "ST"])
+    assert list(window["POL"]) == ["U01998", "U01997", "U01995"]
+
+    assert list(source.query_rows({}, "u0199")) == list(range(1990, 2000))
+    assert sorted(source.unique_values("ST", {"ST": {"TX"}})) == ["(Blanks)", "OK", "TX"]
+    assert source.unique_values("ST", {"POL": {"U00001"}}) == ["OK"]
+
+    nulls_last = source.query_rows({}, sort=("CNT", True))
+    assert source.window(nulls_last, 1999, 1)["CNT"].isna().all()
+
+    frames = list(source.iter_frames(rows[:2], ["POL", "CNT"], batch_size=1))
+    assert [list(frame.itertuples(index=False, name=None)) for frame in frames] == [
+        [("U01998", 1998)], [("U01997", 1997)]]
+
+
+def test_large_frame_switches_to_windowed_model(monkeypatch):
+    _app()
+    monkeypatch.setattr(filter_table_view, "MAX_DISPLAY_ROWS", 100)
+    grid = _keep(FilterTableView())
+    grid.set_dataframe(_frame())
+    assert isinstance(grid.model, ArrowTableModel)
+    assert grid.model.rowCount() == 2000          # nothing truncated
+    assert _text(grid.model, 1999, 0) == "U01999"
+    assert _text(grid.model, 7, 3) == ""          # <NA>
+    assert len(grid.model._display_blocks) == 2   # only painted blocks built
+
+    grid.set_dataframe(_frame(50))
+    assert type(grid.model) is PandasTableModel
+
+
+def test_query_result_accessors_keep_index_and_dtypes():
+    _app()
+    rows = filter_table_view.MAX_DISPLAY_ROWS + 10_000
+    df = _frame(rows)
+    df.index = pd.RangeIndex(1000, 1000 + rows)
+    grid = _keep(FilterTableView())
+    grid.set_dataframe(df, limit_rows=False)
+    assert type(grid.model) is PandasTableModel
+    for frame in (grid.model.get_original_data(), grid.model.get_display_data(),
+                  grid.get_filtered_dataframe()):
+        assert len(frame) == rows
+        assert frame.index.equals(df.index)
+        assert frame.dtypes.equals(df.dtypes)
+        assert pd.api.types.is_float_dtype(frame["AMT"])
+
+
+def test_windowed_grid_filters_sorts_searches_and_copies():
+    _app()
+    grid = _keep(FilterTableView())
+    grid.set_table_source(ArrowTableSource.from_dataframe(_frame()))
+    grid.set_numeric_formatting(None, {"AMT": 2})
+
+    grid.apply_column_filter("ST", {"TX"})
+    _settle(grid)
+    assert grid.model.rowCount() == 667
+    assert "Showing 667 of 2,000 rows" in grid.info_label.text()
+
+    grid.apply_sort(2, Qt.SortOrder.DescendingOrder)
+    _settle(grid)
+    assert _text(grid.model, 0, 0) == "U01998"
+    assert _text(grid.model, 0, 2) == "2,997.00"
+
+    grid.global_search_box.setText("u0199")
+    grid._execute_search()
+    _settle(grid)
+    assert [_text(grid.model, r, 0) for r in range(grid.model.rowCount())] == ["U01998", "U01995", "U01992"]
+
+    text = clipboard_text(grid._export_plan(filtered=True))
+    assert text.splitlines()[:2] == ["POL\tST\tAMT\tCNT", "U01998\tTX\t2,997.00\t1998"]
+
+    grid.clear_all_filters()
+    _settle(grid)
+    assert grid.model.rowCount() == 2000
+
+
+def test_windowed_export_streams_records(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    _app()
+    grid = _keep(FilterTableView())
+    grid.set_table_source(ArrowTableSource.from_dataframe(_frame(30)))
+    path = str(tmp_path / "out.xlsx")
+    grid.table_view.setColumnHidden(1, True)  # ST, AMT
+    grid.table_view.setColumnHidden(2, True)
+    worker = grid._start_export(grid._export_plan(filtered=True), path)
+    worker.wait()
+    QApplication.processEvents()
+    sheet = openpyxl.load_workbook(path).active
+    assert [c.value for c in sheet[1]] == ["POL", "CNT"]
+    assert [c.value for c in sheet[8]] == ["U00006", 6]
+    assert [c.value for c in sheet[9]] == ["U00007", None]
@@ -0,0 +1,311 @@
+"""Streaming dataset reads in MainframeFTPManager against a local fake FTP host."""
+import socket
+import socketserver
+import threading
+
+import pytest
+
+from suiteview.core.ftp_manager import FTPSessionPool, MainframeFTPManager, describe_total
+from suiteview.mainframe_nav.content_search import compile_search_patterns, search_datasets, search_lines
+
+RECORD = "X" * 72
+
+
+class FakeHost:
+    """Datasets by name; ``listings`` answers LIST by argument."""
+
+    def __init__(self):
+        self.datasets = {}
+        self.listings = {}
+        self.sent = {}       # lines pushed per RETR before it finished or broke
+        self.sessions = 0
+        self.commands = []
+        self.active = 0
+        self.peak = 0         # most sessions logged in at once
+        self.login_limit = None
+        self.lock = threading.Lock()
+
+
+def _serve(host):
+    class Handler(socketserver.StreamRequestHandler):
+        def reply(self, text):
+            self.wfile.write((text + "\r\n").encode("ascii"))
+            self.wfile.flush()
+
+        def send_data(self, lines, name=None):
+            conn, _ = self.data_listener.accept()
+            self.data_listener.close()
+            sent = 0
+            try:
+                for start in range(0, len(lines), 100):
+                    conn.sendall("".join(f"{line}\r\n" for line in lines[start:start + 100]).encode("ascii"))
+                    sent = start + 100
+                conn.shutdown(socket.SHUT_WR)
+                ok = True
+            except OSError:
+                ok = False
+            finally:
+                conn.close()
+            if name is not None:
+                host.sent[name] = min(sent, len(lines))
+            self.reply("250 Transfer completed successfully." if ok else "426 Connection closed; transfer aborted.")
+
+        def handle(self):
+            with host.lock:
+                if host.login_limit is not None and host.active >= host.login_limit:
+                    self.reply("421 Too many users logged on.")
+                    return
+                host.sessions += 1
+                host.active += 1
+                host.peak = max(host.peak, host.active)
+            try:
+                self.serve()
+            finally:
+                with host.lock:
+                    host.active -= 1
+
+        def serve(self):
+            self.reply("220 fake z/OS FTP")
+            for raw in self.rfile:
+                line = raw.decode("ascii").strip()
+                verb, _, arg = line.partition(" ")
+                verb = verb.upper()
+                host.commands.append(verb)
+                if verb == "USER":
+                    self.reply("331 Send password please.")
+                elif verb == "PASS":
+                    self.reply("230 USER is logged on.")
+                elif verb in ("TYPE", "NOOP"):
+                    self.reply("200 OK")
+                elif verb == "PWD":
+                    self.reply("257 \"'USER.'\" is working directory.")
+                elif verb == "CWD":
+                    self.reply("250 working directory changed.")
+                elif verb == "PASV":
+                    self.data_listener = socket.socket()
+                    self.data_listener.bind(("127.0.0.1", 0))
+                    self.data_listener.listen(1)
+                    port = self.data_listener.getsockname()[1]
+                    self.reply(f"227 Entering Passive Mode (127,0,0,1,{port >> 8},{port & 255})")
+                elif verb == "RETR":
+                    name = arg.strip("'")
+                    if name not in host.datasets:
+                        self.data_listener.close()
+                        self.reply("550 Data set not found.")
+                        continue
+                    self.reply("125 Sending data set")
+                    self.send_data(host.datasets[name], name)
+                elif verb == "STOR":
+                    self.reply("125 Storing data set")
+                    conn, _ = self.data_listener.accept()
+                    self.data_listener.close()
+                    with conn, conn.makefile("rb") as data:
+                        host.datasets[arg.strip("'")] = [l.decode("ascii").rstrip("\r\n") for l in data]
+                    self.reply("250 Transfer completed successfully.")
+                elif verb == "LIST":
+                    self.reply("125 List started OK")
+                    self.send_data(host.listings.get(arg, []))
+                elif verb == "ABOR":
+                    self.reply("226 ABOR command successful.")
+                elif verb == "QUIT":
+                    self.reply("221 Quit command received.")
+                    return
+                else:
+                    self.reply("502 Command not implemented.")
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def ftp():
+    host = FakeHost()
+    host.datasets["BIG.DATA"] = [f"{i:08d}{RECORD}" for i in range(200_000)]
+    host.datasets["SMALL.DATA"] = ["LINE ONE", "LINE TWO"]
+    host.datasets["SRC.PDS(MEMBER1)"] = [f"M{i:07d}" for i in range(5000)]
+    host.listings["'BIG.DATA'"] = [
+        "Volume Unit    Referred Ext Used Recfm Lrecl BlkSz Dsorg Dsname",
+        "VOL001 3390   2025/12/29  1  300  FB      80 27920  PS  BIG.DATA",
+    ]
+    host.listings["MEMBER1"] = [
+        " Name     VV.MM   Created       Changed      Size  Init   Mod   Id",
+        "MEMBER1   01.00 2025/12/02 2025/12/02 10:12  5000  5000     0 USER",
+    ]
+    server = _serve(host)
+    manager = MainframeFTPManager("127.0.0.1", "USER", "secret", port=server.server_address[1])
+    manager.connect()
+    host.manager = manager
+    yield host
+    manager.disconnect()
+    server.shutdown()
+    server.server_close()
+
+
+def test_preview_stops_the_transfer_and_keeps_the_session(ftp):
+    manager = ftp.manager
+    preview = manager.preview_dataset("BIG.DATA", max_lines=1000)
+    assert preview["lines"] == 1000 and preview["truncated"]
+    assert preview["content"].split("\n")[-1] == f"{999:08d}{RECORD}"
+    assert ftp.sent["BIG.DATA"] < 100_000  # the rest never crossed the wire
+    # 300 tracks x 2 blocks of 27920 bytes x 349 records per block
+    assert preview["total_lines"] == 209_400 and preview["total_estimated"]
+    assert describe_total(preview) == "about 209,400 lines"
+    assert "ABOR" in ftp.commands
+
+    # Same control connection, back in sync
+    assert manager.read_dataset("SMALL.DATA", max_lines=1000) == ("LINE ONE\nLINE TWO", 2)
+    assert ftp.sessions == 1
+
+
+def test_member_total_comes_from_ispf_statistics(ftp):
+    manager = ftp.manager
+    content, total = manager.read_dataset("SRC.PDS(MEMBER1)", max_lines=10)
+    assert content.split("\n") == [f"M{i:07d}" for i in range(10)]
+    assert total == 5000
+    assert manager.get_catalog_size("SRC.PDS(MEMBER1)") == {"lines": 5000, "estimated": False, "tracks": None}
+
+    assert len(manager.read_dataset("SRC.PDS(MEMBER1)", max_lines=None)[0].split("\n")) == 5000
+    assert ftp.sessions == 1
+
+
+def test_stream_can_be_abandoned_mid_transfer(ftp):
+    manager = ftp.manager
+    lines = manager.iter_dataset_lines("BIG.DATA")
+    assert [next(lines) for _ in range(3)][-1] == f"{2:08d}{RECORD}"
+    lines.close()
+    assert list(manager.iter_dataset_lines("SMALL.DATA")) == ["LINE ONE", "LINE TWO"]
+    assert manager.preview_dataset("MISSING.DATA")["content"] == ""
+    assert ftp.sessions == 2  # a failed RETR still forces a clean reconnect
+
+
+@pytest.fixture
+def pds(ftp):
+    datasets = []
+    for i in range(12):
+        name = f"MEM{i:02d}"
+        lines = [f"{name} LINE {n:05d}" for n in range(3000)]
+        if i % 3 == 0:
+            lines[1500] = f"{name} CALL PGMX1 USING WS-AREA"
+            lines[2500] = "       CALL 'pgmx2'"
+        ftp.datasets[f"SRC.PDS({name})"] = lines
+        datasets.append({"name": name, "full_path": f"SRC.PDS({name})", "dsorg": ""})
+    datasets.append({"name": "SRC.LOAD", "full_path": "SRC.LOAD", "dsorg": "PO"})
+    datasets.append({"name": "GONE", "full_path": "SRC.PDS(GONE)", "dsorg": ""})
+    ftp.datasets["SRC.PDS(EMPTY)"] = []
+    datasets.append({"name": "EMPTY", "full_path": "SRC.PDS(EMPTY)", "dsorg": ""})
+    return datasets
+
+
+def test_search_lines_stops_once_every_string_is_full():
+    patterns = compile_search_patterns(["pgm?1", "A*Z"], case_sensitive=False)
+    read = []
+
+    def lines():
+        for n in range(1000):
+            read.append(n)
+            yield f"CALL PGMX1 ALPHAZ {n}" if n % 2 else "nothing here"
+
+    groups, count = search_lines(lines(), patterns, max_matches=3)
+    assert [g["search_string"] for g in groups] == ["pgm?1", "A*Z"]
+    assert [m["line_number"] for m in groups[0]["matches"]] == [2, 4, 6]
+    assert count == 6 and len(read) == 6
+
+    whole = compile_search_patterns(["PGM"], case_sensitive=True, whole_word=True)
+    assert search_lines(["PGMX PGM", "pgm", "XPGM"], whole) == (
+        [{"search_string": "PGM", "matches": [{"line_number": 1, "line_content": "PGMX PGM"}]}], 3)
+
+
+def test_search_fans_out_over_a_capped_pool(ftp, pds):
+    streamed = []
+    progress = []
+    patterns = compile_search_patterns(["pgmx?", "ws-area"])
+    with FTPSessionPool(ftp.manager, max_sessions=3) as pool:
+        outcome = search_datasets(pool, pds, patterns, on_result=streamed.append,
+                                  on_progress=lambda name, done, total: progress.append((done, total)))
+        assert pool.open_sessions <= 3
+    assert pool.open_sessions == 0
+
+    hits = [r["dataset"] for r in outcome["results"]]
+    assert hits == ["MEM00", "MEM03", "MEM06", "MEM09"]
+    assert sorted(r["dataset"] for r in streamed) == hits
+    first = outcome["results"][0]["matches"]
+    assert [m["line_number"] for m in first[0]["matches"]] == [1501, 2501]
+    assert first[1] == {"search_string": "ws-area",
+                        "matches": [{"line_number": 1501, "line_content": "MEM00 CALL PGMX1 USING WS-AREA"}]}
+    assert outcome["skipped"] == ["SRC.LOAD (PO dataset - cannot read directly)", "EMPTY (empty or no content)"]
+    assert len(outcome["errors"]) == 1 and outcome["errors"][0].startswith("GONE: 550")
+    assert sorted(progress) == [(n, len(pds)) for n in range(1, len(pds) + 1)]
+    assert ftp.peak <= 4  # browsing session + 3 pooled
+
+
+def test_pool_caps_itself_at_the_host_login_limit(ftp, pds):
+    ftp.login_limit = 3  # browsing session + 2
+    with FTPSessionPool(ftp.manager, max_sessions=5) as pool:
+        outcome = search_datasets(pool, pds, compile_search_patterns(["PGMX1"]))
+        assert pool.max_sessions == 2
+    assert len(outcome["results"]) == 4 and outcome["errors"] == [outcome["errors"][0]]
+    assert ftp.peak == 3
+
+
+def _ispf_listing(members):
+    return [" Name     VV.MM   Created       Changed      Size  Init   Mod   Id"] + [
+        f"{name:<8}  {vv_mm} 2025/12/02 {changed}    10    10     0 USER"
+        for name, vv_mm, changed in members]
+
+
+def test_mirror_serves_listings_and_unchanged_members(ftp, tmp_path):
+    from suiteview.core.mainframe_mirror import MainframeMirror
+
+    manager = ftp.manager
+    manager.mirror = MainframeMirror("127.0.0.1", "USER", path=tmp_path / "mirror.sqlite")
+    ftp.datasets["SRC.PDS(ALPHA)"] = ["ALPHA 1", "ALPHA 2"]
+    ftp.datasets["SRC.PDS(BETA)"] = ["BETA 1"]
+    ftp.listings[""] = _ispf_listing([("ALPHA", "01.00", "2025/12/02 10:12"),
+                                      ("BETA", "01.00", "2025/12/02 10:12")])
+
+    assert [m["name"] for m in manager.list_datasets("SRC.PDS")] == ["ALPHA", "BETA"]
+    assert [m["name"] for m in manager.list_datasets("SRC.PDS")] == ["ALPHA", "BETA"]
+    assert ftp.commands.count("LIST") == 1
+
+    assert manager.read_dataset("SRC.PDS(ALPHA)") == ("ALPHA 1\nALPHA 2", 2)
+    assert manager.read_dataset("SRC.PDS(ALPHA)") == ("ALPHA 1\nALPHA 2", 2)
+    assert ftp.commands.count("RETR") == 1
+
+    # Saved in ISPF: the next listing shows a new level, so the member is read again
+    ftp.datasets["SRC.PDS(ALPHA)"] = ["ALPHA 1", "ALPHA 2 CHANGED"]
+    ftp.listings[""] = _ispf_listing([("ALPHA", "01.01", "2025/12/03 09:00"),
+                                      ("BETA", "01.00", "2025/12/02 10:12")])
+    manager.list_datasets("SRC.PDS", refresh=True)
+    assert manager.read_dataset("SRC.PDS(ALPHA)")[0].endswith("CHANGED")
+    assert ftp.commands.count("RETR") == 2
+
+    # Writing through the manager drops the member and its library listing
+    assert manager.read_dataset("SRC.PDS(BETA)") == ("BETA 1", 1)
+    assert manager.write_content("SRC.PDS(BETA)", "BETA 2")[0]
+    assert manager.mirror.get_listing("SRC.PDS") is None
+    assert manager.mirror.member_lines("SRC.PDS(BETA)", current_only=False) is None
+    assert manager.read_dataset("SRC.PDS(BETA)") == ("BETA 2", 1)
+
+
+def test_search_uses_and_fills_the_mirror_and_runs_offline(ftp, pds, tmp_path):
+    from suiteview.core.mainframe_mirror import MainframeMirror
+
+    mirror = MainframeMirror("127.0.0.1", "USER", path=tmp_path / "mirror.sqlite")
+    mirror.put_listing("SRC.PDS", [{"name": f"MEM{i:02d}", "type": "member", "vv_mm": "01.00",
+                                    "modified": "2025/12/02 10:12"} for i in range(6)])
+    patterns = compile_search_patterns(["WS-AREA"])
+    with FTPSessionPool(ftp.manager, max_sessions=2) as pool:
+        online = search_datasets(pool, pds, patterns, mirror=mirror)
+    retrs = ftp.commands.count("RETR")
+    assert retrs == 14  # every member but the PO dataset once
+
+    with FTPSessionPool(ftp.manager, max_sessions=2) as pool:
+        again = search_datasets(pool, pds, patterns, mirror=mirror)
+    assert ftp.commands.count("RETR") - retrs == 8  # MEM00-MEM05 now come from the mirror
+    assert again["results"] == online["results"]
+
+    offline = search_datasets(None, pds, patterns, mirror=mirror)
+    assert [r["dataset"] for r in offline["results"]] == ["MEM00", "MEM03"]
+    assert "MEM07 (not in local mirror)" in offline["skipped"]
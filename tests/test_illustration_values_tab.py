@@ -18,6 +18,7 @@ from suiteview.illustration.ui.values_overview import (
     build_charge_bands,
     build_chart_series,
 )
+from suiteview.ui.widgets.table_export import clipboard_text
 
 
 _QT_APP = None
@@ -152,7 +153,7 @@ def test_values_group_copy_includes_frozen_locator_columns():
     tab.display_projection(_policy(), [_state()])
 
     grid = tab._tab_grids["Monthly Deduction"]
-    copied_header = grid._dataframe_to_clipboard_text(grid.df).splitlines()[0].split("\t")
+    copied_header = clipboard_text(grid._export_plan(filtered=False)).splitlines()[0].split("\t")
     assert copied_header[:4] == ["Date", "Year", "Month", "Attained Age"]
 
 
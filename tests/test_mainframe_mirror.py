@@ -0,0 +1,55 @@
+"""Local mirror of mainframe listings and members (suiteview/core/mainframe_mirror.py)."""
+import time
+
+from suiteview.core.mainframe_mirror import MainframeMirror, mirror_path_for, split_member
+
+
+def _member(name, vv_mm="01.00", modified="2025/12/02 10:12"):
+    return {"name": name, "type": "member", "vv_mm": vv_mm, "modified": modified, "size": 10}
+
+
+def test_listing_is_reused_until_the_ttl(tmp_path):
+    mirror = MainframeMirror("host", "user", path=tmp_path / "m.sqlite", listing_ttl=60)
+    mirror.put_listing("'src.pds'", [_member("A")])
+    assert mirror.get_listing("SRC.PDS") == [_member("A")]
+
+    mirror.conn.execute("UPDATE listings SET fetched = ?", (time.time() - 120,))
+    assert mirror.get_listing("SRC.PDS") is None
+    assert mirror.stats_for("SRC.PDS(A)") is None
+    assert mirror.stats_for("SRC.PDS(A)", current_only=False) == ("01.00", "2025/12/02 10:12")
+
+
+def test_members_are_keyed_on_ispf_statistics(tmp_path):
+    path = tmp_path / "m.sqlite"
+    mirror = MainframeMirror("host", "user", path=path)
+    mirror.put_listing("SRC.PDS", [_member("A"), _member("B"), {"name": "NOSTATS", "type": "member",
+                                                                  "vv_mm": "", "modified": ""}])
+    assert mirror.put_member("SRC.PDS(A)", ["LINE 1", "LINE 2"])
+    assert mirror.put_member("src.pds(b)", [])
+    assert not mirror.put_member("SRC.PDS(NOSTATS)", ["X"])
+    assert not mirror.put_member("SRC.SEQ.DATA", ["X"])
+    assert mirror.member_lines("SRC.PDS(A)") == ["LINE 1", "LINE 2"]
+    assert mirror.member_lines("SRC.PDS(B)") == []
+
+    # A new modification level drops A; B is unchanged and kept
+    mirror.put_listing("SRC.PDS", [_member("A", "01.01", "2025/12/03 08:00"), _member("B")])
+    assert mirror.member_lines("SRC.PDS(A)") is None
+    assert mirror.member_lines("SRC.PDS(B)") == []
+
+    # Offline use ignores the listing age; the file survives a reopen
+    mirror.put_member("SRC.PDS(A)", ["NEW"])
+    mirror.close()
+    reopened = MainframeMirror("host", "user", path=path, listing_ttl=0)
+    assert reopened.member_lines("SRC.PDS(A)") is None
+    assert reopened.member_lines("SRC.PDS(A)", current_only=False) == ["NEW"]
+
+    reopened.invalidate("'SRC.PDS(A)'")
+    assert reopened.member_lines("SRC.PDS(A)", current_only=False) is None
+    assert reopened.stats_for("SRC.PDS(B)", current_only=False) is None  # listing dropped too
+
+
+def test_paths_and_member_names():
+    assert split_member("'d03.src.pds(mem1)'") == ("D03.SRC.PDS", "MEM1")
+    assert split_member("D03.SEQ.DATA") is None
+    assert mirror_path_for("Host", "User") == mirror_path_for("HOST ", "user")
+    assert mirror_path_for("HOST", "A") != mirror_path_for("HOST", "B")
@@ -0,0 +1,60 @@
+"""Refresh in the mainframe browser (suiteview/mainframe_nav/mainframe_nav_screen.py)."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from suiteview.mainframe_nav.mainframe_nav_screen import MainframeNavScreen  # noqa: E402
+
+_QT_APP = None
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+class _Repo:
+    def get_all_connections(self):
+        return []
+
+
+class _ConnManager:
+    repo = _Repo()
+
+    def get_connection(self, name):
+        return None
+
+
+class _FTP:
+    """Records how each listing was asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    def is_alive(self):
+        return True
+
+    def list_datasets(self, path="", refresh=False):
+        self.calls.append((path, refresh))
+        return [{"name": "MEMBER1", "type": "member"}]
+
+
+def test_refresh_lists_again_from_the_host(monkeypatch):
+    _app()
+    monkeypatch.setattr(MainframeNavScreen, "load_default_settings", lambda self: None)
+    screen = MainframeNavScreen(_ConnManager())
+    screen.ftp_manager = _FTP()
+    assert not screen.refresh_button.isEnabled()
+
+    screen.navigate_to_dataset("D03.AA0139.SRC")
+    screen.navigate_to_dataset("D03.AA0139.SRC")  # served from the folder cache
+    assert screen.ftp_manager.calls == [("D03.AA0139.SRC", False)]
+    assert screen.refresh_button.isEnabled()
+
+    screen.refresh_button.click()
+    assert screen.ftp_manager.calls[-1] == ("D03.AA0139.SRC", True)
+    assert screen.members_table.rowCount() == 1
+    screen.deleteLater()
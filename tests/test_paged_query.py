@@ -0,0 +1,170 @@
+"""Unit tests for count-first paged execution (suiteview/audit/paged_query.py).
+
+Pure SQL rewriting + a fake executor — no ODBC, no PyQt.
+"""
+import os
+import sys
+import threading
+
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from suiteview.audit.paged_query import (  # noqa: E402
+    PagedQuery, count_sql, mask_sql, page_sql, select_list_size, split_sql,
+)
+
+CYBERLIFE_SQL = """WITH COVERAGE1 AS (
+  SELECT CK_POLICY_NBR FROM DB2TAB.LH_COV_PHA WHERE COV_PHA_NBR = 1
+  ORDER BY CK_POLICY_NBR FETCH FIRST 5 ROWS ONLY
+)
+SELECT DISTINCT POL.CK_POLICY_NBR AS PolicyNumber, 'ORDER BY x' AS Note
+FROM DB2TAB.LH_BAS_POL POL -- FETCH FIRST 1 ROWS ONLY
+WHERE POL.CK_SYS_CD = 'I'
+FETCH FIRST 5000 ROWS ONLY"""
+
+
+def test_mask_keeps_only_top_level_text():
+    masked = mask_sql("SELECT a, (SELECT b FROM t) FROM u WHERE c = 'x' -- note")
+    assert len(masked) == len("SELECT a, (SELECT b FROM t) FROM u WHERE c = 'x' -- note")
+    assert "SELECT b" not in masked and "'x'" not in masked and "note" not in masked
+    assert masked.startswith("SELECT a, (") and "FROM u WHERE" in masked
+
+
+def test_split_keeps_cte_prefix_and_finds_only_top_level_clauses():
+    parts = split_sql(CYBERLIFE_SQL)
+    assert parts.cte_prefix.startswith("WITH COVERAGE1 AS (")
+    assert parts.body.startswith("SELECT DISTINCT")
+    assert parts.limit == 5000
+    assert parts.order_by == ""          # nested ORDER BY and literal ignored
+    assert "FETCH FIRST 5000" not in parts.body
+
+
+def test_count_sql_drops_order_by_cap_and_keeps_isolation_tail():
+    sql = "SELECT A, B FROM T WHERE A > 1 ORDER BY B DESC FETCH FIRST 10 ROWS ONLY WITH UR;"
+    assert count_sql(sql) == (
+        "SELECT COUNT(*) AS ROW_COUNT FROM (\nSELECT A, B FROM T WHERE A > 1\n)"
+        " AS PAGED_COUNT WITH UR")
+    counted = count_sql(CYBERLIFE_SQL)
+    assert counted.startswith("WITH COVERAGE1 AS (")
+    assert "SELECT COUNT(*) AS ROW_COUNT FROM (\nSELECT DISTINCT" in counted
+
+
+def test_page_sql_uses_offset_and_keeps_order_by():
+    sql = "SELECT A FROM T ORDER BY A"
+    assert page_sql(sql, 100) == "SELECT A FROM T ORDER BY A\nFETCH FIRST 100 ROWS ONLY"
+    assert page_sql(sql, 100, 300) == (
+        "SELECT A FROM T ORDER BY A\nOFFSET 300 ROWS FETCH FIRST 100 ROWS ONLY")
+
+
+def test_page_sql_leaves_unordered_statements_alone_by_default():
+    page = page_sql(CYBERLIFE_SQL, 500, 1000)
+    assert page.startswith("WITH COVERAGE1 AS (")
+    assert page.endswith("WHERE POL.CK_SYS_CD = 'I'\nOFFSET 1000 ROWS FETCH FIRST 500 ROWS ONLY")
+    assert page_sql("SELECT * FROM T WITH UR", 10) == "SELECT * FROM T\nFETCH FIRST 10 ROWS ONLY WITH UR"
+    assert page_sql("SELECT A FROM T FETCH FIRST 5 ROWS ONLY", None) == "SELECT A FROM T"
+
+
+def test_stable_pages_are_ordered_by_the_select_list():
+    # No ORDER BY: every select-list position, so pages never overlap or skip rows
+    page = page_sql(CYBERLIFE_SQL, 500, 1000, stable=True)
+    assert page.endswith("WHERE POL.CK_SYS_CD = 'I'\nORDER BY 1, 2\nOFFSET 1000 ROWS FETCH FIRST 500 ROWS ONLY")
+    assert select_list_size("SELECT A, COALESCE(B, C), (SELECT MAX(D) FROM U) FROM T") == 3
+    assert select_list_size("SELECT * FROM T") is None
+    assert page_sql("SELECT * FROM T WITH UR", 10, column_count=2, stable=True) == (
+        "SELECT * FROM T\nORDER BY 1, 2\nFETCH FIRST 10 ROWS ONLY WITH UR")
+    with pytest.raises(ValueError):
+        page_sql("SELECT * FROM T", 10, stable=True)
+    for sql in ("SELECT A FROM T", "SELECT A FROM T ORDER BY A", CYBERLIFE_SQL):
+        for offset in (0, 500):
+            assert "ORDER BY" in split_sql(page_sql(sql, 500, offset, stable=True)).order_by
+
+
+def test_stable_select_star_pages_learn_the_column_count():
+    statements = []
+
+    def execute(sql):
+        statements.append(sql)
+        return ["A", "B", "C"], []
+
+    PagedQuery("SELECT * FROM T", execute).page(1)
+    assert statements == ["SELECT * FROM T\nOFFSET 500 ROWS FETCH FIRST 500 ROWS ONLY"]
+
+    statements.clear()
+    PagedQuery("SELECT * FROM T", execute, stable=True).page(1)
+    assert statements[0].endswith("FETCH FIRST 1 ROWS ONLY")
+    assert "ORDER BY 1, 2, 3\nOFFSET 500 ROWS" in statements[1]
+
+
+class FakeDb:
+    """Executes the rewritten statements against an in-memory list of rows."""
+
+    def __init__(self, total):
+        self.rows = [(i,) for i in range(total)]
+        self.statements = []
+        self.threads = set()
+        self.lock = threading.Lock()
+
+    def execute(self, sql):
+        with self.lock:
+            self.statements.append(sql)
+            self.threads.add(threading.get_ident())
+        if "COUNT(*)" in sql:
+            return ["ROW_COUNT"], [(len(self.rows),)]
+        tail = sql.rsplit("\n", 1)[-1].split()
+        offset = int(tail[1]) if tail[0] == "OFFSET" else 0
+        size = int(tail[tail.index("FIRST") + 1]) if "FIRST" in tail else len(self.rows)
+        return ["N"], self.rows[offset:offset + size]
+
+
+def test_preview_runs_count_and_first_page_then_pages_forward():
+    db = FakeDb(1234)
+    pager = PagedQuery("SELECT N FROM T", db.execute, page_size=500)
+    first = pager.preview()
+    assert first.total_rows == 1234 and first.page_count == 3
+    assert first.rows[0] == (0,) and len(first.rows) == 500 and first.has_next
+    assert len(db.statements) == 2
+
+    last = pager.page(2)
+    assert last.row_offset == 1000 and len(last.rows) == 234 and not last.has_next
+    assert "OFFSET 1000 ROWS FETCH FIRST 500 ROWS ONLY" in db.statements[-1]
+
+    columns, rows = pager.fetch_all()
+    assert len(rows) == 1234 and db.statements[-1] == "SELECT N FROM T"
+
+
+def test_users_row_cap_bounds_count_and_pages():
+    db = FakeDb(1234)
+    pager = PagedQuery("SELECT N FROM T FETCH FIRST 700 ROWS ONLY", db.execute,
+                       page_size=500)
+    assert pager.preview().total_rows == 700
+    second = pager.page(1)
+    assert len(second.rows) == 200 and not second.has_next
+    assert "FETCH FIRST 200 ROWS ONLY" in db.statements[-1]
+    assert pager.page(2).rows == []
+
+
+def test_stable_fetch_all_applies_the_cap_under_the_page_order():
+    db = FakeDb(1234)
+    pager = PagedQuery("SELECT N FROM T FETCH FIRST 700 ROWS ONLY WITH UR", db.execute,
+                       page_size=500, stable=True)
+    pager.page(1)
+    assert "ORDER BY 1\nOFFSET 500 ROWS FETCH FIRST 200 ROWS ONLY" in db.statements[-1]
+    columns, rows = pager.fetch_all()
+    assert db.statements[-1] == "SELECT N FROM T\nORDER BY 1\nFETCH FIRST 700 ROWS ONLY WITH UR"
+    assert len(rows) == 700
+
+
+def test_count_error_propagates():
+    def execute(sql):
+        if "COUNT(*)" in sql:
+            raise RuntimeError("SQL0104N")
+        return ["N"], []
+
+    with pytest.raises(RuntimeError):
+        PagedQuery("SELECT N FROM T", execute).preview()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -166,6 +166,40 @@ def test_republish_adopts_existing_id(tmp_home):
     print("  republish adopts id (no fork)  OK")
 
 
+def test_index_lists_entries_without_parsing(tmp_home, monkeypatch):
+    a = _make("Indexed A")
+    _make("Indexed B", dsn="UL_Rates")
+
+    def no_parse(path):
+        raise AssertionError(f"unexpected parse of {path}")
+
+    monkeypatch.setattr(query_object_store, "_load_path", no_parse)
+    entries = query_object_store.list_entries()
+    assert {e.name for e in entries} == {"Indexed A", "Indexed B"}
+    assert query_object_store.object_exists("Indexed A")
+    assert query_object_store._find_path_by_id(a.id).name.endswith(
+        f"__{a.id[:8]}.json")
+    print("  index lists + lookups without parsing  OK")
+
+
+def test_index_follows_external_edits_and_lost_manifest(tmp_home):
+    a = _make("Drifting")
+    objects_dir = Path(os.environ["SUITEVIEW_QUERY_OBJECTS_DIR"])
+    path = query_object_store.object_path(a)
+    data = json.loads(path.read_text())
+    data["name"] = "Drifted Elsewhere"
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(path.stat().st_atime_ns, path.stat().st_mtime_ns + 10**9))
+    assert query_object_store.load_object("Drifted Elsewhere").id == a.id
+    assert not query_object_store.object_exists("Drifting")
+
+    # A corrupt manifest is rebuilt from the files.
+    (objects_dir / query_object_store._INDEX_FILENAME).write_text("{nope")
+    query_object_store._index_dir = None
+    assert query_object_store.load_object_by_id(a.id) is not None
+    print("  index mtime drift + manifest rebuild  OK")
+
+
 def test_copy_by_id_keeps_name_new_id(tmp_home):
     src = _make("Reins")
     copied = query_object_store.copy_object_by_id(src.id)
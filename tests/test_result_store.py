@@ -0,0 +1,171 @@
+"""Unit tests for the shared Audit query result store (suiteview/audit/result_store.py).
+
+Pure pandas + Parquet on a temp directory — no ODBC, no PyQt.
+"""
+import os
+import sys
+import threading
+import time
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from suiteview.audit import result_store  # noqa: E402
+from suiteview.audit.result_store import (  # noqa: E402
+    QueryResultStore, estimated_bytes, normalize_sql, result_key,
+)
+
+
+def _loader(calls, rows=3):
+    def load():
+        calls.append(1)
+        return pd.DataFrame({"POL": [f"P{i}" for i in range(rows)]}), {"POL": "VARCHAR(10)"}
+    return load
+
+
+def test_normalize_sql_collapses_whitespace_outside_literals():
+    assert normalize_sql("SELECT  a\n FROM t ;") == "SELECT a FROM t"
+    assert normalize_sql("WHERE x = 'a  b'") == "WHERE x = 'a  b'"
+    assert result_key("neon_dsn", "SELECT 1") == result_key("NEON_DSN", " SELECT   1 ")
+    assert result_key("NEON_DSN", "SELECT 1") != result_key("OTHER", "SELECT 1")
+
+
+def test_second_fetch_is_reused_and_isolated(tmp_path):
+    store = QueryResultStore(cache_dir=tmp_path)
+    calls = []
+    first = store.fetch("NEON_DSN", "SELECT POL FROM T", _loader(calls))
+    first.dataframe.loc[0, "POL"] = "changed"
+    second = store.fetch("NEON_DSN", "SELECT POL\nFROM T", _loader(calls))
+    assert len(calls) == 1
+    assert not first.reused and second.reused
+    assert second.dataframe["POL"].iloc[0] == "P0"
+    assert second.column_types == {"POL": "VARCHAR(10)"}
+
+
+def test_reused_results_share_the_cached_data(tmp_path):
+    if not result_store._copy_on_write():
+        pytest.skip("pandas copy-on-write is off")
+    store = QueryResultStore(cache_dir=tmp_path, persist=False)
+
+    def load():
+        return pd.DataFrame({"AMT": np.arange(1000, dtype=float)}), {}
+
+    first = store.fetch("DSN", "SELECT AMT", load)
+    second = store.fetch("DSN", "SELECT AMT", load)
+    assert np.shares_memory(first.dataframe["AMT"].to_numpy(),
+                            second.dataframe["AMT"].to_numpy())
+    first.dataframe.loc[0, "AMT"] = -1.0
+    assert second.dataframe["AMT"].iloc[0] == 0.0
+
+
+def test_memory_is_bounded_by_estimated_bytes(tmp_path):
+    one = estimated_bytes(pd.DataFrame({"POL": [f"P{i}" for i in range(100)]}))
+    store = QueryResultStore(cache_dir=tmp_path, persist=False, max_bytes=2 * one)
+    calls = []
+    for n in range(3):
+        store.fetch("DSN", f"SELECT {n}", _loader(calls, rows=100))
+    assert store.memory_bytes == 2 * one
+    assert store.peek("DSN", "SELECT 0") is None      # evicted, oldest first
+    assert store.peek("DSN", "SELECT 2") is not None
+
+    store.fetch("DSN", "SELECT BIG", _loader(calls, rows=1000))
+    assert store.memory_bytes == 0                    # too big to keep at all
+    assert store.fetch("DSN", "SELECT 2", _loader(calls)).reused is False
+
+
+def test_parquet_is_written_off_the_fetch_thread(tmp_path, monkeypatch):
+    store = QueryResultStore(cache_dir=tmp_path)
+    writers = []
+    original = QueryResultStore._write_files
+
+    def record(self, key, sql, entry):
+        writers.append(threading.current_thread())
+        original(self, key, sql, entry)
+
+    monkeypatch.setattr(QueryResultStore, "_write_files", record)
+    store.fetch("DSN", "SELECT POL", _loader([]))
+    store.flush()
+    assert writers and writers[0] is not threading.current_thread()
+    assert len(list(tmp_path.glob("*.parquet"))) == 1
+
+
+def test_invalidate_cancels_a_queued_write(tmp_path):
+    store = QueryResultStore(cache_dir=tmp_path)
+    with store._disk_lock:   # hold the writer back
+        store.fetch("DSN", "SELECT POL", _loader([]))
+        assert store.invalidate("DSN", "SELECT POL") == 1
+    store.flush()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_concurrent_identical_requests_share_one_fetch(tmp_path):
+    store = QueryResultStore(cache_dir=tmp_path, persist=False)
+    calls = []
+    gate = threading.Event()
+
+    def slow_load():
+        calls.append(1)
+        gate.wait(2)
+        return pd.DataFrame({"n": [1]}), {}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(
+        store.fetch("DSN", "SELECT n", slow_load))) for _ in range(4)]
+    for t in threads:
+        t.start()
+    time.sleep(0.1)
+    gate.set()
+    for t in threads:
+        t.join()
+    assert len(calls) == 1
+    assert len(results) == 4
+    assert sum(r.reused for r in results) == 3
+
+
+def test_loader_error_reaches_caller_and_is_not_cached(tmp_path):
+    store = QueryResultStore(cache_dir=tmp_path)
+
+    def boom():
+        raise RuntimeError("SQL0204N")
+
+    with pytest.raises(RuntimeError):
+        store.fetch("DSN", "SELECT 1", boom)
+    calls = []
+    assert not store.fetch("DSN", "SELECT 1", _loader(calls)).reused
+
+
+def test_parquet_entry_survives_a_new_session_until_invalidated(tmp_path):
+    calls = []
+    first = QueryResultStore(cache_dir=tmp_path)
+    first.fetch("DSN", "SELECT POL", _loader(calls))
+    first.flush()
+    restarted = QueryResultStore(cache_dir=tmp_path)
+    again = restarted.fetch("DSN", "SELECT POL", _loader(calls))
+    assert again.reused and len(calls) == 1
+    assert again.dataframe["POL"].tolist() == ["P0", "P1", "P2"]
+
+    assert restarted.invalidate("dsn") == 1
+    assert not restarted.fetch("DSN", "SELECT POL", _loader(calls)).reused
+    assert len(calls) == 2
+
+
+def test_expired_entries_and_refresh_fetch_again(tmp_path):
+    store = QueryResultStore(cache_dir=tmp_path, ttl=timedelta(0))
+    calls = []
+    store.fetch("DSN", "SELECT 1", _loader(calls))
+    time.sleep(0.01)
+    assert not store.fetch("DSN", "SELECT 1", _loader(calls)).reused
+
+    fresh = QueryResultStore(cache_dir=tmp_path / "other")
+    fresh.fetch("DSN", "SELECT 1", _loader(calls))
+    assert not fresh.fetch("DSN", "SELECT 1", _loader(calls), refresh=True).reused
+    assert len(calls) == 4
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
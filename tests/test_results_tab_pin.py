@@ -0,0 +1,59 @@
+"""Pin from the Results tab (suiteview/audit/tabs/results_tab.py)."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import pandas as pd  # noqa: E402
+import pytest  # noqa: E402
+from PyQt6.QtTest import QTest  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+
+from suiteview.audit.paged_query import PagedQuery  # noqa: E402
+from suiteview.audit.tabs.results_tab import ResultsTab  # noqa: E402
+
+_QT_APP = None
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+def _execute(sql):
+    rows = [(i,) for i in range(1200)]
+    if "COUNT(*)" in sql:
+        return ["ROW_COUNT"], [(len(rows),)]
+    if "FETCH FIRST" in sql:
+        return ["N"], rows[:500]
+    return ["N"], rows
+
+
+def test_pin_of_a_paged_result_carries_every_row():
+    pytest.importorskip("pyodbc", exc_type=ImportError)  # the background fetch runs through query_runner
+    _app()
+    tab = ResultsTab()
+    pinned = []
+    tab.pin_requested.connect(pinned.append)
+    pager = PagedQuery("SELECT N FROM T", _execute)
+    tab.set_paged_results(pager, pager.preview())
+    assert tab.btn_pin.isEnabled() and not tab.btn_pin.isHidden()
+
+    tab.request_pin()
+    assert QTest.qWaitFor(lambda: bool(pinned), 5000)
+    assert len(pinned[0]) == 1200 and not tab.is_paged()
+    tab.deleteLater()
+
+
+def test_pin_of_a_full_result_emits_it_directly():
+    _app()
+    tab = ResultsTab()
+    tab.set_results(pd.DataFrame({"N": [1, 2]}))
+    assert tab.btn_pin.isHidden()
+    pinned = []
+    tab.pin_requested.connect(pinned.append)
+    tab.set_results(pd.DataFrame({"N": [1, 2]}))
+    assert not tab.btn_pin.isHidden()
+    tab.btn_pin.click()
+    assert list(pinned[0]["N"]) == [1, 2]
+    tab.deleteLater()
@@ -0,0 +1,79 @@
+"""Global-search index for FilterTableView (suiteview/ui/widgets/search_index.py)."""
+import os
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.ui.widgets import filter_table_view, search_index
+from suiteview.ui.widgets.filter_table_view import FilterTableView
+from suiteview.ui.widgets.search_index import SearchIndex
+
+_QT_APP = None
+_KEEP = []  # keep Qt objects alive for the session (no GC mid-event-loop)
+
+
+def _frame(rows: int = 3000) -> pd.DataFrame:
+    return pd.DataFrame({
+        "POL": [f"U{i:05d}" for i in range(rows)],
+        "NAME": [f"Smith, Ann {i % 40}" if i % 5 else None for i in range(rows)],
+        "AMT": np.arange(rows) * 12.5,
+        "CNT": pd.array([i if i % 7 else None for i in range(rows)], dtype="Int64"),
+        "DT": pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(rows) % 90, unit="D"),
+        "TAGS": [["a", "b"] if i % 2 else ["c"] for i in range(rows)],
+    })
+
+
+def _scan(df: pd.DataFrame, needle: str) -> np.ndarray:
+    mask = np.zeros(len(df), dtype=bool)
+    for column in df.columns:
+        text = df[column].astype(str).str.lower().where(df[column].notna(), "")
+        mask |= text.str.contains(needle, regex=False).to_numpy(dtype=bool)
+    return mask
+
+
+def test_matches_equal_a_full_column_scan(monkeypatch):
+    monkeypatch.setattr(search_index, "TRIGRAM_MIN_UNIQUES", 100)
+    df = _frame()
+    index = SearchIndex(df)
+    assert index.trigram_columns == 1  # POL; NAME has too few distinct values
+    for needle in ("u0", "U0012", "u00123", "smith, ann 3", "125.0", "2024-02",
+                   "'b'", "nan", "<na>", "zz", "1"):
+        assert (index.match(needle) == _scan(df, needle.lower())).all(), needle
+    assert index.match("  ").all()
+
+
+def test_typing_on_reuses_previous_matches_and_masks_are_cached(monkeypatch):
+    monkeypatch.setattr(search_index, "TRIGRAM_MIN_UNIQUES", 100)
+    index = SearchIndex(_frame())
+    first = index.match("u001")
+    assert index._last[0] == "u001"
+    narrowed = index.match("u0012")
+    assert narrowed.sum() == 10 and not (narrowed & ~first).any()
+    assert index.match("U0012 ") is narrowed
+
+
+def test_grid_search_uses_background_index(monkeypatch):
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    monkeypatch.setattr(filter_table_view, "SEARCH_INDEX_MIN_ROWS", 1000)
+    grid = FilterTableView()
+    _KEEP.append(grid)
+    df = _frame()
+    grid.set_dataframe(df)
+    for worker in grid._index_workers:
+        worker.wait()
+    QApplication.processEvents()
+    assert isinstance(grid._search_index, SearchIndex)
+
+    grid.apply_column_filter("AMT", {"12.5", "25.0", "100.0", "187.5"})
+    grid.global_search_box.setText("u0000")
+    grid._execute_search()
+    grid._search_worker.wait()
+    QApplication.processEvents()
+    assert list(grid.model._display_indices) == [1, 2, 8]
+
+    grid.set_dataframe(df.head(10))
+    assert grid._search_index is None
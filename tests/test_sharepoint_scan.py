@@ -0,0 +1,179 @@
+"""SharePoint depth scan against a local fake Graph server (suiteview/file_nav/sharepoint_scan.py)."""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from suiteview.file_nav.sharepoint_client import SP_MAX_CONCURRENCY, SharePointClient, make_sp_path
+from suiteview.file_nav.sharepoint_scan import LibrarySnapshot, scan_library
+
+PAGE = 2  # children per page, so listings follow @odata.nextLink
+
+
+class FakeGraph:
+    """A drive "D" with root "R"; ``tree`` maps folder id -> child ids."""
+
+    def __init__(self):
+        self.items = {}
+        self.tree = {"R": []}
+        self.changes = []
+        self.delta_token = 0
+        self.listed = []     # folder ids whose first children page was requested
+        self.batches = []    # sizes of $batch calls
+        self.ports = set()   # client connections seen
+        self.lock = threading.Lock()
+
+    def add(self, item_id, name, parent, folder=False, size=0):
+        self.items[item_id] = {"id": item_id, "name": name, "folder": folder, "size": size, "parent": parent}
+        self.tree[parent].append(item_id)
+        if folder:
+            self.tree[item_id] = []
+
+    def graph_item(self, item_id):
+        item = self.items[item_id]
+        out = {"id": item_id, "name": item["name"], "size": item["size"],
+               "lastModifiedDateTime": "2024-05-01T12:00:00Z",
+               "webUrl": f"https://tenant.sharepoint.com/{item['name']}",
+               "parentReference": {"id": item["parent"]}}
+        if item["folder"]:
+            out["folder"] = {"childCount": len(self.tree[item_id])}
+        else:
+            out["file"] = {}
+        return out
+
+    def route(self, base, url):
+        parsed = urlparse(url)
+        path = parsed.path[len("/v1.0"):] if parsed.path.startswith("/v1.0") else parsed.path
+        query = parse_qs(parsed.query)
+        if path == "/drives/D/root":
+            return {"id": "R"}
+        if path == "/drives/D/root/delta":
+            if query.get("token") == ["latest"]:
+                changes = []
+            else:
+                assert query.get("token") == [str(self.delta_token)]
+                changes, self.changes = self.changes, []
+            self.delta_token += 1
+            return {"value": changes, "@odata.deltaLink": f"{base}/drives/D/root/delta?token={self.delta_token}"}
+        if path.endswith("/children"):
+            folder = "R" if path == "/drives/D/root/children" else path.split("/")[-2]
+            page = int(query.get("page", ["0"])[0])
+            if page == 0:
+                with self.lock:
+                    self.listed.append(folder)
+            children = self.tree[folder][page * PAGE:(page + 1) * PAGE]
+            body = {"value": [self.graph_item(c) for c in children]}
+            if len(self.tree[folder]) > (page + 1) * PAGE:
+                body["@odata.nextLink"] = f"{base}/drives/D/items/{folder}/children?page={page + 1}"
+            return body
+        raise KeyError(path)
+
+
+def _serve(graph):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self, body):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            graph.ports.add(self.client_address[1])
+            self._reply(graph.route(base, self.path))
+
+        def do_POST(self):
+            graph.ports.add(self.client_address[1])
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            assert self.path == "/v1.0/$batch"
+            graph.batches.append(len(payload["requests"]))
+            self._reply({"responses": [
+                {"id": r["id"], "status": 200, "body": graph.route(base, r["url"])}
+                for r in payload["requests"]]})
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    base = f"http://127.0.0.1:{server.server_address[1]}/v1.0"
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, base
+
+
+@pytest.fixture
+def graph():
+    graph = FakeGraph()
+    graph.add("top", "top.txt", "R", size=10)
+    graph.add("A", "Alpha", "R", folder=True)
+    graph.add("B", "Beta", "R", folder=True)
+    graph.add("a1", "a1.txt", "A", size=1)
+    graph.add("A2", "Inner", "A", folder=True)
+    graph.add("deep", "deep.txt", "A2", size=2)
+    for i in range(5):
+        graph.add(f"b{i}", f"b{i}.txt", "B", size=i)
+    server, base = _serve(graph)
+    client = SharePointClient(graph_url=base)
+    client.get_token = lambda allow_interactive=True: "token"
+    graph.client = client
+    yield graph
+    server.shutdown()
+    server.server_close()
+
+
+def _names(items):
+    return sorted(item["display_name"] for item in items)
+
+
+def test_crawl_batches_sibling_folders_and_reuses_connections(graph, tmp_path):
+    snapshot = tmp_path / "snap.json"
+    streamed = []
+    results = scan_library(make_sp_path("D"), -1, client=graph.client,
+                           on_items=streamed.extend, snapshot_path=snapshot)
+
+    assert _names(results) == [
+        "Alpha", "Alpha | Inner", "Alpha | Inner | deep.txt", "Alpha | a1.txt",
+        "Beta", "Beta | b0.txt", "Beta | b1.txt", "Beta | b2.txt", "Beta | b3.txt",
+        "Beta | b4.txt", "top.txt"]
+    assert _names(streamed) == _names(results)
+    assert sorted(graph.listed) == ["A", "A2", "B", "R"]
+    assert 2 in graph.batches  # Alpha and Beta listed in one $batch call
+    assert len(graph.ports) <= SP_MAX_CONCURRENCY  # keep-alive pool
+    deep = next(item for item in results if item["name"] == "deep.txt")
+    assert deep["depth"] == 3 and deep["path"] == make_sp_path("D", "deep") and deep["size"] == 2
+
+    shallow = scan_library(make_sp_path("D"), 1, client=graph.client, snapshot_path=tmp_path / "s1.json")
+    assert _names(shallow) == ["Alpha", "Beta", "top.txt"]
+
+
+def test_revisit_applies_delta_and_lists_only_new_folders(graph, tmp_path):
+    snapshot = tmp_path / "snap.json"
+    scan_library(make_sp_path("D"), -1, client=graph.client, snapshot_path=snapshot)
+    graph.listed.clear()
+
+    graph.changes = [
+        {"id": "top", "deleted": {}},
+        {"id": "C", "name": "Gamma", "folder": {"childCount": 1}, "size": 0,
+         "parentReference": {"id": "R"}, "lastModifiedDateTime": "2024-05-02T12:00:00Z"},
+        dict(graph.graph_item("a1"), name="renamed.txt"),
+        dict(graph.graph_item("A2"), parentReference={"id": "elsewhere"}),
+    ]
+    del graph.tree["R"][0]
+    graph.add("C", "Gamma", "R", folder=True)
+    graph.add("c1", "c1.txt", "C")
+
+    streamed = []
+    results = scan_library(make_sp_path("D"), -1, client=graph.client,
+                           on_items=streamed.extend, snapshot_path=snapshot)
+    assert graph.listed == ["C"] and streamed == []
+    assert _names(results) == [
+        "Alpha", "Alpha | renamed.txt", "Beta", "Beta | b0.txt", "Beta | b1.txt",
+        "Beta | b2.txt", "Beta | b3.txt", "Beta | b4.txt", "Gamma", "Gamma | c1.txt"]
+
+    stored = LibrarySnapshot.load(snapshot)
+    assert _names(stored.results("D", 1)) == ["Alpha", "Beta", "Gamma"]
+    assert stored.delta_link.endswith("token=2")
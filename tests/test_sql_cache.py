@@ -0,0 +1,99 @@
+"""Unit tests for memoized Audit SQL generation (suiteview/audit/sql_cache.py).
+
+Pure Python: exercises freeze/memoize_sql and the memoized dynamic_query
+builders — no ODBC, no PyQt.
+"""
+import os
+import sys
+
+import pytest
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from suiteview.audit.common_table import CommonTable  # noqa: E402
+from suiteview.audit.dynamic_query import (  # noqa: E402
+    DB2, SQL_SERVER, _CTE_CACHE, build_common_table_cte, build_dynamic_sql,
+    build_join_sql,
+)
+from suiteview.audit.sql_cache import freeze, memoize_sql  # noqa: E402
+
+FILTERS = [
+    {"column": "POL", "field_key": "T.POL", "mode": "contains", "value": "U1"},
+    {"column": "STA", "field_key": "T.STA", "mode": "list", "list_values": ["22", "23"]},
+]
+
+
+def test_freeze_is_hashable_order_stable_and_type_aware():
+    a = freeze({"b": [1, {"x": ("y",)}], "a": {"z"}})
+    b = freeze({"a": {"z"}, "b": [1, {"x": ["y"]}]})
+    assert a == b and hash(a) == hash(b)
+    assert freeze(1) != freeze(1.0) != freeze(True)
+    assert freeze({"k": "v"}) != freeze([("k", "v")])
+    with pytest.raises(TypeError):
+        freeze([object.__new__(type("Unhashable", (), {"__hash__": None}))])
+
+
+def test_memoize_sql_hits_on_equal_criteria_and_skips_unfreezable_args():
+    calls = []
+
+    @memoize_sql(maxsize=2)
+    def build(filters, *, flag=False):
+        calls.append(1)
+        return f"SQL {len(filters)} {flag}"
+
+    assert build([{"a": 1}]) == build([{"a": 1}])
+    assert len(calls) == 1
+    build([{"a": 2}])
+    build([{"a": 3}])       # evicts the first key
+    build([{"a": 1}])
+    assert len(calls) == 4
+    assert build.cache_info().size == 2
+
+    class Widget:
+        __hash__ = None
+
+    build([Widget()])
+    build([Widget()])
+    assert build.cache_info().uncacheable == 2
+
+
+def test_dynamic_builders_return_identical_sql_from_cache():
+    build_dynamic_sql.cache_clear()
+    first = build_dynamic_sql("LIB.T", "25", FILTERS, dialect=DB2)
+    again = build_dynamic_sql("LIB.T", "25", [dict(f) for f in FILTERS], dialect=DB2)
+    assert again == first == build_dynamic_sql.__wrapped__("LIB.T", "25", FILTERS, dialect=DB2)
+    assert build_dynamic_sql.cache_info().hits == 1
+    changed = build_dynamic_sql("LIB.T", "10", FILTERS, dialect=DB2)
+    assert "FETCH FIRST 10 ROWS ONLY" in changed
+
+    join = {"left_table": "LIB.T", "right_table": "LIB.U", "join_type": "INNER JOIN",
+            "alias_left": "", "alias_right": "", "on_pairs": [("POL", "POL")],
+            "extra_conditions": []}
+    build_join_sql.cache_clear()
+    sql = build_join_sql("LIB.T", "25", FILTERS, join_infos=[join], dialect=DB2)
+    assert build_join_sql("LIB.T", "25", FILTERS, join_infos=[dict(join)], dialect=DB2) == sql
+    assert build_join_sql.cache_info().hits == 1
+
+
+def test_common_table_ctes_are_cached_per_table_content():
+    _CTE_CACHE.clear()
+    plans = CommonTable(name="PLANS", columns=[{"name": "PLAN", "type": "TEXT"},
+                                               {"name": "N", "type": "INTEGER"}],
+                        rows=[["A'1", "1"], ["B", ""]])
+    states = CommonTable(name="STATES", columns=[{"name": "ST", "type": "TEXT"}],
+                         rows=[["TX"]])
+    sql = build_common_table_cte([plans, states], DB2)
+    assert sql.startswith("WITH PLANS (PLAN, N) AS (\n    VALUES ('A''1', 1),\n        ('B', '')")
+    assert _CTE_CACHE.info().misses == 2
+
+    states.rows.append(["OK"])
+    again = build_common_table_cte([plans, states], DB2)
+    assert "('TX'),\n        ('OK')" in again
+    info = _CTE_CACHE.info()
+    assert (info.hits, info.misses) == (1, 3)
+    assert "AS _t(PLAN, N)" in build_common_table_cte([plans], SQL_SERVER)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,115 @@
+"""Streaming copy / export (suiteview/ui/widgets/table_export.py)."""
+import os
+import threading
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import numpy as np
+import pandas as pd
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.ui.widgets import table_export
+from suiteview.ui.widgets.filter_table_view import FilterTableView
+from suiteview.ui.widgets.table_export import (
+    ExportCancelled, ExportPlan, clipboard_text, write_csv, write_parquet, write_xlsx,
+)
+
+_QT_APP = None
+_KEEP = []  # keep Qt objects alive for the session (no GC mid-event-loop)
+
+
+def _frame(rows: int = 25) -> pd.DataFrame:
+    return pd.DataFrame({
+        "POL": [f"U{i:03d}" for i in range(rows)],
+        "AMT": np.arange(rows) * 1234.5,
+        "CNT": pd.array([i if i % 4 else None for i in range(rows)], dtype="Int64"),
+        "DT": pd.date_range("2024-01-01", periods=rows, freq="D", tz="UTC"),
+    })
+
+
+def _plan(df: pd.DataFrame, columns, decimals=None) -> ExportPlan:
+    def chunks(size):
+        for start in range(0, len(df), size):
+            yield df.iloc[start:start + size][columns]
+    return ExportPlan(list(columns), len(df), chunks, dict(decimals or {}))
+
+
+def test_clipboard_text_uses_display_order_and_formatting():
+    df = _frame(10)
+    seen = []
+    text = clipboard_text(_plan(df, ["CNT", "POL", "AMT"], {"AMT": 2}), seen.append, chunk_rows=4)
+    lines = text.splitlines()
+    assert lines[0] == "CNT\tPOL\tAMT"
+    assert lines[1] == "\tU000\t0.00"
+    assert lines[3] == "2\tU002\t2,469.00"
+    assert len(lines) == 11 and seen == [4, 8, 10]
+
+
+def test_xlsx_is_typed_with_number_formats_and_capped(tmp_path, monkeypatch):
+    openpyxl = pytest.importorskip("openpyxl")
+    monkeypatch.setattr(table_export, "EXCEL_MAX_DATA_ROWS", 20)
+    path = str(tmp_path / "out.xlsx")
+    result = write_xlsx(_plan(_frame(), ["POL", "AMT", "CNT", "DT"], {"AMT": 2}), path, chunk_rows=7)
+    assert (result.rows, result.truncated) == (20, True)
+    sheet = openpyxl.load_workbook(path).active
+    assert [c.value for c in sheet[1]] == ["POL", "AMT", "CNT", "DT"]
+    assert sheet[1][0].font.bold
+    assert sheet.max_row == 21
+    row = sheet[3]
+    assert (row[0].value, row[1].value, row[2].value) == ("U001", 1234.5, 1)
+    assert row[1].number_format == "#,##0.00"
+    assert row[3].value == pd.Timestamp("2024-01-02").to_pydatetime()
+    assert sheet[2][2].value is None
+
+
+def test_csv_and_parquet_stream_every_chunk(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    df = _frame()
+    plan = _plan(df, ["AMT", "POL", "CNT"], {"AMT": 1})
+
+    csv_path = str(tmp_path / "out.csv")
+    assert write_csv(plan, csv_path, chunk_rows=6).rows == 25
+    back = pd.read_csv(csv_path, encoding="utf-8-sig")
+    assert list(back.columns) == ["AMT", "POL", "CNT"]
+    assert back["AMT"].iloc[3] == 3703.5 and back["POL"].iloc[24] == "U024"
+    assert back["CNT"].isna().sum() == 7
+
+    parquet_path = str(tmp_path / "out.parquet")
+    assert write_parquet(plan, parquet_path, chunk_rows=6).rows == 25
+    parquet = pq.ParquetFile(parquet_path)
+    assert parquet.metadata.num_row_groups == 5
+    table = parquet.read().to_pandas()
+    assert list(table.columns) == ["AMT", "POL", "CNT"]
+    assert table["CNT"].isna().sum() == 7 and table["AMT"].iloc[3] == 3703.5
+
+
+def test_cancel_stops_and_removes_partial_file(tmp_path):
+    cancel = threading.Event()
+    path = str(tmp_path / "out.csv")
+
+    def progress(done):
+        if done >= 10:
+            cancel.set()
+
+    with pytest.raises(ExportCancelled):
+        write_csv(_plan(_frame(), ["POL"]), path, progress, cancel, chunk_rows=5)
+    assert not os.path.exists(path)
+
+
+def test_grid_copies_on_a_worker_in_visible_order():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    grid = FilterTableView()
+    _KEEP.append(grid)
+    grid.set_dataframe(_frame().set_index(pd.RangeIndex(100, 125)))
+    grid.set_numeric_formatting(None, {"AMT": 0})
+    grid.header.moveSection(1, 0)         # AMT first
+    grid.table_view.setColumnHidden(3, True)
+    grid.apply_column_filter("POL", {"U002", "U005"})
+
+    worker = grid._start_export(grid._export_plan(filtered=True))
+    worker.wait()
+    QApplication.processEvents()
+    assert QApplication.clipboard().text().splitlines() == [
+        "AMT\tPOL\tCNT", "2,469\tU002\t2", "6,172\tU005\t5"]
@@ -0,0 +1,53 @@
+"""Lazy window imports and the startup budget script for the taskbar (suiteview/taskbar_launcher)."""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SCRIPT = ROOT / "scripts" / "measure_taskbar_startup.py"
+
+
+def _run(code_or_args, tmp_path):
+    env = dict(os.environ, QT_QPA_PLATFORM="offscreen", HOME=str(tmp_path), USERPROFILE=str(tmp_path),
+               PYTHONPATH=str(ROOT))
+    args = code_or_args if isinstance(code_or_args, list) else ["-c", code_or_args]
+    return subprocess.run([sys.executable, *args], cwd=ROOT, env=env, capture_output=True, text=True,
+                          timeout=120)
+
+
+def test_taskbar_starts_without_file_navigator_modules(tmp_path):
+    result = _run(
+        "import sys\n"
+        "from PyQt6.QtWidgets import QApplication\n"
+        "app = QApplication([])\n"
+        "from suiteview.taskbar_launcher import suiteview_taskbar\n"
+        "taskbar = suiteview_taskbar.SuiteViewTaskbar()\n"
+        "app.processEvents()\n"
+        "print(sorted(m for m in ('suiteview.taskbar_launcher.file_nav_window',\n"
+        "                         'suiteview.file_nav.file_explorer_core',\n"
+        "                         'suiteview.ui.widgets.bookmark_widgets') if m in sys.modules))\n"
+        "window_cls = suiteview_taskbar.FileNavWindow\n"
+        "print(window_cls.__module__, 'suiteview.file_nav.file_explorer_core' in sys.modules)\n"
+        "taskbar._start_preload()\n"
+        "while taskbar._preload_queue:\n"
+        "    taskbar._preload_next()\n"
+        "print(taskbar._preload_queue)\n",
+        tmp_path)
+    assert result.returncode == 0, result.stderr
+    lines = result.stdout.strip().splitlines()
+    assert lines[-3] == "[]"
+    assert lines[-2] == "suiteview.taskbar_launcher.file_nav_window True"
+    assert lines[-1] == "[]"   # every module imported or skipped
+
+
+def test_measure_script_meets_startup_budgets(tmp_path):
+    result = _run([str(SCRIPT)], tmp_path)
+    assert result.returncode == 0, result.stdout + result.stderr
+    assert "total" in result.stdout and "rss" in result.stdout
+
+
+def test_measure_script_fails_a_blown_budget(tmp_path):
+    result = _run([str(SCRIPT), "--max-rss-mb", "1"], tmp_path)
+    assert result.returncode == 1
+    assert "FAIL: RSS is" in result.stdout
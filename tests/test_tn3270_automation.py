@@ -0,0 +1,142 @@
+"""Event-driven screen-ready waits on TN3270Client and MainframeTerminalScreen."""
+import logging
+import os
+import socket
+import threading
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.mainframe_nav.mainframe_terminal_screen import MainframeTerminalScreen, TerminalReceiveThread
+from suiteview.mainframe_nav.tn3270 import (
+    Order3270, TelnetCmd, TN3270Client, ascii_to_ebcdic, encode_buffer_address, screen_has_text,
+)
+
+_QT_APP = None
+
+ERASE_WRITE, WRITE = 0xF5, 0xF1
+WCC_RESTORE, WCC_LOCKED = 0xC3, 0xC1
+EOR = bytes([TelnetCmd.IAC, TelnetCmd.EOR])
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+def _text_at(row, col, text):
+    return (bytes([Order3270.SBA]) + encode_buffer_address(row * 80 + col)
+            + bytes(ascii_to_ebcdic(c) for c in text))
+
+
+def _record(cmd, wcc, row, col, text):
+    return bytes([cmd, wcc]) + _text_at(row, col, text) + EOR
+
+
+def _connected_client():
+    """A client wired to one end of a socket pair; the other end plays the host"""
+    client_end, host_end = socket.socketpair()
+    client = TN3270Client("localhost")
+    client.socket = client_end
+    client.connected = True
+    return client, host_end
+
+
+def _reply_later(host, records, delay):
+    def send():
+        for record in records:
+            host.sendall(record)
+            time.sleep(0.02)
+    timer = threading.Timer(delay, send)
+    timer.start()
+    return timer
+
+
+def _receive_loop(client):
+    while client.connected:
+        client.receive_screen()
+
+
+def test_screen_has_text_anywhere_on_row_and_at_position():
+    client = TN3270Client("localhost")
+    client._process_3270_data(_record(ERASE_WRITE, WCC_RESTORE, 3, 10, "Menu ===>")[:-2])
+    screen = client.screen
+    assert screen_has_text(screen, "Menu")
+    assert screen_has_text(screen, "MENU", ignore_case=True)
+    assert not screen_has_text(screen, "MENU")
+    assert screen_has_text(screen, "===>", row=3)
+    assert not screen_has_text(screen, "===>", row=4)
+    assert screen_has_text(screen, "Menu", row=3, col=10)
+    assert not screen_has_text(screen, "Menu", row=3, col=11)
+
+
+def test_client_wait_ends_when_the_host_unlocks_the_keyboard():
+    client, host = _connected_client()
+    receiver = threading.Thread(target=_receive_loop, args=(client,), daemon=True)
+    receiver.start()
+    try:
+        client.send_enter()
+        assert client.keyboard_locked
+        # READY shows up in a write that leaves the keyboard locked; only the
+        # second write (keyboard restore) means the host is done
+        _reply_later(host, [_record(WRITE, WCC_LOCKED, 23, 0, "READY"),
+                            _record(WRITE, WCC_RESTORE, 23, 10, "DONE")], delay=0.05)
+        start = time.monotonic()
+        assert client.wait_for_text("READY", row=23, col=0, timeout=5)
+        assert time.monotonic() - start < 2
+        assert client.screen_count == 2
+        assert not client.keyboard_locked
+        assert client.screen.get_string_at(23, 10, 4) == "DONE"
+
+        count = client.screen_count
+        assert not client.wait_for_screen(count, timeout=0.1)
+        assert not client.wait_for_text("MISSING", timeout=0.1)
+    finally:
+        client.disconnect()
+        host.close()
+        receiver.join(5)
+
+
+def test_screen_waits_return_on_settled_screen():
+    _app()
+    widget = MainframeTerminalScreen()
+    client, host = _connected_client()
+    widget.client = client
+    widget.receive_thread = TerminalReceiveThread(client)
+    widget.receive_thread.screen_updated.connect(widget.on_screen_update)
+    widget.receive_thread.start()
+    try:
+        _reply_later(host, [_record(ERASE_WRITE, WCC_LOCKED, 0, 0, "WORKING"),
+                            _record(WRITE, WCC_RESTORE, 2, 0, "Menu ===>")], delay=0.05)
+        start = time.monotonic()
+        assert widget._send_enter_and_wait(timeout_ms=5000)
+        assert time.monotonic() - start < 2
+        assert widget._capture_screen_count() == 2
+        assert widget._at_menu_screen()
+        assert widget.wait_for_text("Menu", row=2, col=0, timeout_ms=50)
+
+        # A PF key the host never answers times out with the keyboard still locked
+        assert not widget._send_pf_and_wait(3, timeout_ms=100)
+        assert not widget._keyboard_unlocked()
+
+        # A follow-up screen the macro is waiting for ends the wait when it arrives
+        _reply_later(host, [_record(WRITE, WCC_RESTORE, 5, 0, "MULTIPLE LOGON")], delay=0.05)
+        assert widget.wait_until(widget._at_known_post_login_screen, timeout_ms=5000)
+    finally:
+        widget.receive_thread.stop()
+        client.disconnect()
+        host.close()
+        widget.receive_thread.wait(3000)
+
+
+def test_settle_poll_timeouts_log_at_the_requested_level(caplog):
+    _app()
+    widget = MainframeTerminalScreen()
+    with caplog.at_level(logging.DEBUG, logger="suiteview.mainframe_nav.mainframe_terminal_screen"):
+        assert not widget.wait_until(lambda: False, timeout_ms=10, timeout_log_level=logging.DEBUG)
+        assert not widget.wait_until(lambda: False, timeout_ms=10)
+    levels = [record.levelno for record in caplog.records if "wait_until: timeout" in record.getMessage()]
+    assert levels == [logging.DEBUG, logging.WARNING]
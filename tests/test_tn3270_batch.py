@@ -0,0 +1,199 @@
+"""Headless batch screen-scraping against a local fake 3270 host (suiteview/mainframe_nav/batch_runner.py)."""
+import socketserver
+import threading
+
+import pytest
+
+from suiteview.mainframe_nav.batch_runner import (
+    Extract, ExtractAfter, Press, ScreenScriptError, ScreenSession, Type, WaitFor, run_batch,
+)
+from suiteview.mainframe_nav.tn3270 import (
+    AID, Order3270, TelnetCmd, TelnetOpt, TN3270Client, ascii_to_ebcdic, decode_buffer_address,
+    ebcdic_to_ascii, encode_buffer_address,
+)
+
+ERASE_WRITE, WRITE = 0xF5, 0xF1
+WCC_RESTORE, WCC_LOCKED = 0xC3, 0xC1
+PROTECTED, INPUT, HIDDEN = 0x60, 0x40, 0x4C
+EOR = bytes([TelnetCmd.IAC, TelnetCmd.EOR])
+
+POLICIES = {
+    "AA000601": ("ACTIVE", "JANE DOE"),
+    "AA000602": ("LAPSED", "JOHN ROE"),
+    "AA000603": ("ACTIVE", "ACME TRUST"),
+    "AA000604": ("PAID UP", "MARY MAJOR"),
+    "AA000605": ("ACTIVE", "SAM MINOR"),
+}
+
+
+def _text(text):
+    return bytes(ascii_to_ebcdic(c) for c in text)
+
+
+def _field(row, col, attr, text=""):
+    return (bytes([Order3270.SBA]) + encode_buffer_address(row * 80 + col)
+            + bytes([Order3270.SF, attr]) + _text(text))
+
+
+def _signon():
+    return bytes([ERASE_WRITE, WCC_RESTORE]) + (
+        _field(5, 10, PROTECTED, "USER ID ==>") + _field(5, 22, INPUT, " " * 8) + _field(5, 31, PROTECTED)
+        + _field(6, 10, PROTECTED, "PASSWORD ==>") + _field(6, 23, HIDDEN, " " * 8) + _field(6, 32, PROTECTED))
+
+
+def _menu(message=""):
+    return bytes([ERASE_WRITE, WCC_RESTORE]) + (
+        _field(0, 0, PROTECTED, "Menu") + _field(0, 5, INPUT, " " * 40) + _field(0, 46, PROTECTED)
+        + _field(23, 0, PROTECTED, message))
+
+
+def _policy(number, status, owner):
+    """The inquiry screen arrives in two writes; only the second unlocks the keyboard"""
+    first = bytes([ERASE_WRITE, WCC_LOCKED]) + _field(2, 0, PROTECTED, "POLICY INQUIRY")
+    second = bytes([WRITE, WCC_RESTORE]) + (
+        _field(0, 0, PROTECTED, "Menu") + _field(0, 5, INPUT, " " * 40) + _field(0, 46, PROTECTED)
+        + _field(4, 0, PROTECTED, f"POLICY: {number}") + _field(5, 0, PROTECTED, f"STATUS: {status}")
+        + _field(6, 0, PROTECTED, f"OWNER: {owner}"))
+    return [first, second]
+
+
+class FakeHost:
+    """
+    A TN3270 host replaying recorded records: the sign-on screen on connect,
+    then the recorded answer to each AID and the fields it carried
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.logins = 0
+        self.lookups = []
+
+    def answer(self, aid, fields):
+        if aid == AID.CLEAR:
+            return [_menu()]
+        if aid != AID.ENTER:
+            return [_menu("KEY NOT ACTIVE")]
+        typed = [text.strip() for _, text in sorted(fields.items())]
+        if len(typed) == 2 and typed == ["USER1", "SECRET"]:
+            with self.lock:
+                self.logins += 1
+            return [_menu()]
+        command = typed[0] if typed else ""
+        if command.startswith("62D2,"):
+            number = command[5:].split()[0]
+            with self.lock:
+                self.lookups.append(number)
+            if number in POLICIES:
+                return _policy(number, *POLICIES[number])
+            return [_menu(f"POLICY {number} NOT ON FILE")]
+        return [_menu("INVALID COMMAND")]
+
+
+def _parse_aid(record):
+    """(aid, {address: text}) from an inbound record, after any telnet negotiation bytes"""
+    while len(record) >= 3 and record[0] == TelnetCmd.IAC:
+        record = record[3:]
+    fields = {}
+    for chunk in record[3:].split(bytes([Order3270.SBA]))[1:]:
+        address = decode_buffer_address(chunk[0], chunk[1])
+        fields[address] = ''.join(ebcdic_to_ascii(b) for b in chunk[2:])
+    return record[0], fields
+
+
+def _serve(host):
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self):
+            with host.lock:
+                host.active += 1
+                host.peak = max(host.peak, host.active)
+            try:
+                self.request.sendall(bytes([TelnetCmd.IAC, TelnetCmd.WILL, TelnetOpt.EOR,
+                                            TelnetCmd.IAC, TelnetCmd.DO, TelnetOpt.EOR])
+                                     + _signon() + EOR)
+                buffer = b""
+                while True:
+                    data = self.request.recv(4096)
+                    if not data:
+                        break
+                    buffer += data
+                    while EOR in buffer:
+                        record, buffer = buffer.split(EOR, 1)
+                        for reply in host.answer(*_parse_aid(record)):
+                            self.request.sendall(reply + EOR)
+            except OSError:
+                pass
+            finally:
+                with host.lock:
+                    host.active -= 1
+
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def fake_host():
+    host = FakeHost()
+    server = _serve(host)
+    host.port = server.server_address[1]
+    yield host
+    server.shutdown()
+    server.server_close()
+
+
+SIGNON = [
+    Type("{userid}"),
+    Type("{password}", row=6, col=24),
+    Press("enter", wait_for="Menu"),
+]
+
+LOOKUP = [
+    Type("62D2,{key}  ;newco={company};.", row=0, col=6),
+    Press("enter", wait_for="STATUS:", timeout=1.0),
+    Extract("status", row=5, col=8, length=10),
+    ExtractAfter("owner", "OWNER:", length=20, offset=1),
+]
+
+
+def test_batch_scrapes_each_key_over_concurrent_sessions(fake_host, tmp_path):
+    keys = ["AA000601", "AA000602", "ZZ999999", "AA000603", "AA000604", "AA000605"]
+    streamed = []
+    csv_path = tmp_path / "policies.csv"
+    frame = run_batch("127.0.0.1", fake_host.port, keys, LOOKUP, setup=SIGNON, recover=[Press("clear")],
+                      sessions=3, variables={"userid": "USER1", "password": "SECRET", "company": "01"},
+                      timeout=5.0, on_result=streamed.append, csv_path=csv_path)
+
+    assert list(frame.columns) == ["key", "status", "owner", "error"]
+    assert list(frame["key"]) == keys
+    found = frame[frame["error"] == ""]
+    assert {row.key: (row.status, row.owner) for row in found.itertuples()} == POLICIES
+    missing = frame[frame["key"] == "ZZ999999"].iloc[0]
+    assert "STATUS:" in missing["error"] and missing["status"] == ""
+
+    assert sorted(fake_host.lookups) == sorted(keys)
+    assert fake_host.logins == 3      # sign-on once per session
+    assert fake_host.peak == 3
+    assert len(streamed) == len(keys)
+    assert csv_path.read_text().splitlines()[0] == "key,status,owner,error"
+
+
+def test_session_rejects_steps_the_screen_cannot_take():
+    client = TN3270Client("localhost")
+    client._process_3270_data(_signon())
+    session = ScreenSession(client, timeout=0.1)
+
+    with pytest.raises(ScreenScriptError):
+        session.type_text("X", row=5, col=12)          # protected label
+    with pytest.raises(ScreenScriptError):
+        session.type_text("TOOLONGUSERID")             # 8-character field
+    with pytest.raises(ScreenScriptError):
+        session.run([WaitFor("Menu")])
+    with pytest.raises(ScreenScriptError):
+        session.press("pf99")
+
+    session.run([Type("USER1"), Type("SECRET", row=6, col=24)])
+    assert client.screen.modified_fields(session.typed_chars) == [
+        (5 * 80 + 23, "USER1"), (6 * 80 + 24, "SECRET")]
@@ -0,0 +1,138 @@
+"""Run-at-a-time 3270 write decoding and sorted field tracking (suiteview/mainframe_nav/tn3270.py)."""
+import time
+
+from suiteview.mainframe_nav.tn3270 import (
+    Order3270, Screen, TN3270Client, ascii_to_ebcdic, decode_buffer_address, ebcdic_to_ascii,
+    encode_buffer_address,
+)
+
+ERASE_WRITE, WRITE, WCC = 0xF5, 0xF1, 0xC3
+PROTECTED, INPUT, BRIGHT = 0x60, 0x40, 0xE8
+
+
+def _text(text):
+    return bytes(ascii_to_ebcdic(c) for c in text)
+
+
+def _sba(address):
+    return bytes([Order3270.SBA]) + encode_buffer_address(address)
+
+
+def _full_screen(seed):
+    """A full-screen CICS-style Erase/Write: extended fields with colour pairs on every row"""
+    data = bytearray([ERASE_WRITE, WCC])
+    for row in range(24):
+        data += _sba(row * 80)
+        data += bytes([Order3270.SFE, 2, 0xC0, BRIGHT if row == 0 else PROTECTED, 0x42, 0xF5])
+        data += _text(f"R{row:02d} LABEL {seed:05d}".ljust(20))
+        data += bytes([Order3270.SFE, 3, 0xC0, INPUT, 0x42, 0xF4, 0x41, 0xF4])
+        data += _text(f"value-{seed * 31 + row:08d} Mixed Case;.,".ljust(38))
+        data += bytes([Order3270.SF, PROTECTED])
+        data += _text(f"PF{row % 12 + 1}=HELP".ljust(14))
+        data += bytes([Order3270.RA]) + encode_buffer_address(row * 80 + 79) + _text("-")
+    data += _sba(80 + 22) + bytes([Order3270.IC])
+    return bytes(data)
+
+
+def _captured_streams(screens=50):
+    return [_full_screen(seed) for seed in range(screens)]
+
+
+def _decode_byte_by_byte(screen, data):
+    """Reference decoder: one set_char per character byte"""
+    size = screen.rows * screen.cols
+    address = screen.cursor_address
+    i = 0
+    while i < len(data):
+        byte = data[i]
+        if byte == Order3270.SBA:
+            address = decode_buffer_address(data[i + 1], data[i + 2])
+            i += 3
+        elif byte in (Order3270.SF, Order3270.SFE):
+            if byte == Order3270.SF:
+                attr, i = data[i + 1], i + 2
+            else:
+                count = data[i + 1]
+                pairs = data[i + 2:i + 2 + count * 2]
+                attr = next((pairs[p + 1] for p in range(0, len(pairs), 2) if pairs[p] == 0xC0), 0)
+                i += 2 + count * 2
+            screen.set_char(address, ' ')
+            screen.attributes[address] = attr
+            screen.add_field(address, attr)
+            address = (address + 1) % size
+        elif byte == Order3270.IC:
+            screen.cursor_address = address
+            i += 1
+        elif byte == Order3270.RA:
+            end, char = decode_buffer_address(data[i + 1], data[i + 2]), ebcdic_to_ascii(data[i + 3])
+            while address != end:
+                screen.set_char(address, char)
+                address = (address + 1) % size
+            i += 4
+        else:
+            screen.set_char(address, ebcdic_to_ascii(byte))
+            address = (address + 1) % size
+            i += 1
+
+
+def test_orders_and_character_runs_decode_to_the_screen():
+    client = TN3270Client("localhost")
+    data = (bytes([ERASE_WRITE, WCC])
+            + _sba(10) + bytes([Order3270.SF, BRIGHT]) + _text("Title (a|b) 100%")
+            + _sba(80) + bytes([Order3270.SFE, 1, 0xC0, INPUT]) + _text("abc")
+            + bytes([Order3270.GE, 0xAD]) + bytes([Order3270.SA, 0x42, 0xF2]) + _text("x")
+            + bytes([Order3270.RA]) + encode_buffer_address(100) + _text("*")
+            + bytes([Order3270.IC, Order3270.PT])
+            + _sba(160) + bytes([Order3270.SF, PROTECTED])
+            + _sba(80) + bytes([Order3270.SF, PROTECTED])          # rewritten field start
+            + _sba(1915) + _text("WRAPPED")                         # runs past the end of the buffer
+            + _sba(200) + _text("ERASEME") + _sba(200)
+            + bytes([Order3270.EUA]) + encode_buffer_address(204))
+    client._process_3270_data(data)
+    screen = client.screen
+
+    assert screen.get_string_at(0, 11, 16) == "Title (a|b) 100%"
+    assert screen.get_string_at(1, 1, 20) == "abc[x" + "*" * 14 + " "
+    assert ''.join(screen.buffer[1915:]) + ''.join(screen.buffer[:2]) == "WRAPPED"
+    assert screen.get_string_at(2, 40, 7) == "    EME"
+    assert [(f.address, f.attribute) for f in screen.fields] == [(10, BRIGHT), (80, PROTECTED), (160, PROTECTED)]
+    assert screen.field_at(85).address == 80 and screen.field_at(10) is None
+    assert screen.field_end(screen.fields[1]) == 160
+    assert screen.field_end(screen.fields[2]) == 1920
+    assert not screen.is_password_field(85)
+
+
+def test_run_decoding_matches_byte_by_byte_reference():
+    for data in _captured_streams(3):
+        client = TN3270Client("localhost")
+        client._process_3270_data(data)
+        reference = Screen()
+        _decode_byte_by_byte(reference, data[2:])
+        assert client.screen.buffer == reference.buffer
+        assert client.screen.attributes == reference.attributes
+        assert [(f.address, f.attribute) for f in client.screen.fields] == \
+               [(f.address, f.attribute) for f in reference.fields]
+        assert client.screen.cursor_address == reference.cursor_address
+        assert client.screen.take_dirty_rows() == reference.take_dirty_rows()
+
+
+def test_benchmark_decode_captured_streams():
+    streams = _captured_streams()
+    client = TN3270Client("localhost")
+    start = time.perf_counter()
+    for data in streams:
+        client._process_3270_data(data)
+    runs = time.perf_counter() - start
+
+    reference = Screen()
+    start = time.perf_counter()
+    for data in streams:
+        reference.clear()
+        _decode_byte_by_byte(reference, data[2:])
+    per_byte = time.perf_counter() - start
+
+    assert client.screen.buffer == reference.buffer
+    size = sum(map(len, streams)) // len(streams)
+    print(f"\n{len(streams)} screens of ~{size} bytes: byte by byte {per_byte * 1000:.1f} ms, "
+          f"runs {runs * 1000:.1f} ms")
+    assert runs < per_byte
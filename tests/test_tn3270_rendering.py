@@ -0,0 +1,161 @@
+"""Dirty-row tracking in the 3270 Screen and incremental TerminalWidget rendering."""
+import os
+import time
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtGui import QTextCursor
+from PyQt6.QtWidgets import QApplication
+
+from suiteview.mainframe_nav.mainframe_terminal_screen import TerminalWidget
+from suiteview.mainframe_nav.tn3270 import (
+    Order3270, TN3270Client, ascii_to_ebcdic, encode_buffer_address,
+)
+
+_QT_APP = None
+
+PROTECTED_BRIGHT, PROTECTED, INPUT = 0xE8, 0x60, 0x40
+ERASE_WRITE, WRITE, WCC = 0xF5, 0xF1, 0xC3
+
+
+def _app():
+    global _QT_APP
+    _QT_APP = QApplication.instance() or QApplication([])
+    return _QT_APP
+
+
+def _text(text):
+    return bytes(ascii_to_ebcdic(c) for c in text)
+
+
+def _at(row, col):
+    return bytes([Order3270.SBA]) + encode_buffer_address(row * 80 + col)
+
+
+def _field(row, col, attr, text=""):
+    return _at(row, col) + bytes([Order3270.SF, attr]) + _text(text)
+
+
+def _panel(title, lines, status="", command=""):
+    """An ISPF-style Erase/Write: title, command line, list rows and a status line"""
+    data = bytearray([ERASE_WRITE, WCC])
+    data += _field(0, 0, PROTECTED_BRIGHT, title.ljust(60))
+    data += _field(1, 0, PROTECTED, "Command ===>") + _field(1, 13, INPUT, command.ljust(40))
+    data += _field(1, 54, PROTECTED, "Scroll ===> CSR")
+    for i, line in enumerate(lines):
+        data += _field(3 + i, 0, PROTECTED, line[:79])
+    data += _field(23, 0, PROTECTED, status.ljust(79))
+    data += _at(1, 14) + bytes([Order3270.IC])
+    return bytes(data)
+
+
+def _status(status):
+    """A Write that only rewrites the status line (what the host sends for a message)"""
+    return bytes([WRITE, WCC]) + _at(23, 1) + _text(status.ljust(79))
+
+
+def _rows(n, offset=0):
+    return [f"MEM{i + offset:05d}  01.{i % 100:02d} 2025/12/02 10:{i % 60:02d}  USER" for i in range(n)]
+
+
+def _recorded_session(screens=40):
+    """A browse session: scroll a member list, with status messages between pages"""
+    stream = [_panel("BROWSE  USER.SRC.PDS", _rows(19), "Top of data")]
+    for page in range(1, screens):
+        stream.append(_status(f"Page {page} of {screens}"))
+        stream.append(_panel("BROWSE  USER.SRC.PDS", _rows(19, offset=page * 3), f"Row {page * 3}"))
+    return stream
+
+
+def _client():
+    return TN3270Client("localhost")
+
+
+def test_screen_reports_only_rows_that_really_changed():
+    client = _client()
+    screen = client.screen
+    client._process_3270_data(_panel("TITLE", _rows(5), "READY"))
+    assert screen.take_dirty_rows() == set(range(24))
+    assert screen.take_dirty_rows() == set()
+
+    # An Erase/Write that repaints the same panel changes nothing
+    client._process_3270_data(_panel("TITLE", _rows(5), "READY"))
+    assert screen.take_dirty_rows() == set()
+
+    client._process_3270_data(_status("Member saved"))
+    assert screen.take_dirty_rows() == {23}
+
+    # Same text, one row becomes an input field: its attribute runs change
+    client._process_3270_data(_panel("TITLE", _rows(5), "Member saved").replace(
+        _field(4, 0, PROTECTED), _field(4, 0, INPUT)))
+    assert screen.take_dirty_rows() == {4}
+
+    runs = screen.row_runs()
+    assert runs[1] == [(0, 13, (True, False)), (13, 54, (False, False)), (54, 80, (True, False))]
+    assert runs[0] == [(0, 80, (True, True))]
+
+
+def test_widget_repaints_dirty_rows_with_field_colors():
+    _app()
+    widget = TerminalWidget()
+    client = _client()
+    client._process_3270_data(_panel("BROWSE", _rows(10), "Top of data"))
+    widget.display_screen(client.screen)
+    assert widget.toPlainText() == client.screen.get_text()
+
+    repainted = []
+    insert_row = widget._insert_row
+    widget._insert_row = lambda cursor, screen, spans, row: (repainted.append(row),
+                                                             insert_row(cursor, screen, spans, row))
+    client._process_3270_data(_status("Page 2"))
+    widget.display_screen(client.screen)
+    assert set(repainted) == {23}
+    assert widget.toPlainText() == client.screen.get_text()
+
+    def color(row, col):
+        cursor = QTextCursor(widget.document().findBlockByNumber(row))
+        cursor.movePosition(QTextCursor.MoveOperation.Right, n=col + 1)
+        return cursor.charFormat().foreground().color().name().upper()
+
+    assert color(0, 5) == "#FFFF00"   # intensified protected title
+    assert color(1, 2) == "#00FFFF"   # protected label
+    assert color(1, 20) == "#00FF00"  # input field
+    assert color(23, 3) == "#00FFFF"
+
+    # Typed text is not host data: the next screen repaints that row too
+    widget._move_cursor_to_address(1 * 80 + 14)
+    widget.textCursor().insertText("X")
+    repainted.clear()
+    client._process_3270_data(_status("Page 3"))
+    widget.display_screen(client.screen)
+    assert set(repainted) == {1, 23}
+    assert widget.toPlainText() == client.screen.get_text()
+    assert widget.typed_chars == {}
+
+
+def _replay(stream, render):
+    _app()
+    widget = TerminalWidget()
+    client = _client()
+    elapsed = 0.0
+    for record in stream:
+        client._process_3270_data(record)
+        start = time.perf_counter()
+        render(widget, client.screen)
+        elapsed += time.perf_counter() - start
+    assert widget.toPlainText() == client.screen.get_text()
+    return elapsed
+
+
+def test_benchmark_replay_recorded_streams():
+    stream = _recorded_session()
+
+    def full(widget, screen):
+        screen.take_dirty_rows()
+        widget._render_rows(screen, set(range(screen.rows)))
+
+    full_time = _replay(stream, full)
+    incremental_time = _replay(stream, TerminalWidget.display_screen)
+    print(f"\n{len(stream)} screens: full repaint {full_time * 1000:.1f} ms, "
+          f"dirty rows {incremental_time * 1000:.1f} ms")
+    assert incremental_time < full_time
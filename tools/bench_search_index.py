@@ -0,0 +1,90 @@
+"""Benchmark FilterTableView global search: column scan vs SearchIndex.
+
+Builds a synthetic result frame (policy ids, names, states, amounts, dates)
+at each requested size and times, per needle, the unindexed scan the
+SearchWorker falls back to (``astype(str).str.lower().str.contains`` over
+every column) against ``SearchIndex.match``. The typing sequence reuses
+the previous needle's matches the way successive keystrokes do. Prints one
+JSON report to stdout.
+
+Usage:
+    python tools/bench_search_index.py '{"rows": [100000, 1000000]}'
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from suiteview.ui.widgets.search_index import SearchIndex  # noqa: E402
+
+NEEDLES = ["u0", "u00", "u000", "u0001", "u00012", "smith", "2024-03", "zzz"]
+
+
+def _frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    names = np.array([f"Name {i} Smith" for i in range(max(rows // 20, 1))], dtype=object)
+    return pd.DataFrame({
+        "POLICY": [f"U{i:07d}" for i in range(rows)],
+        "INSURED": rng.choice(names, rows),
+        "STATE": rng.choice(np.array(["TX", "OK", "CA", None], dtype=object), rows),
+        "PLAN": rng.choice(np.array([f"PLAN{i:03d}" for i in range(300)], dtype=object), rows),
+        "FACE": rng.integers(10, 5000, rows) * 1000,
+        "ISSUE_DATE": pd.Timestamp("2000-01-01") + pd.to_timedelta(rng.integers(0, 9000, rows), unit="D"),
+    })
+
+
+def _scan(df: pd.DataFrame, needle: str) -> np.ndarray:
+    mask = np.zeros(len(df), dtype=bool)
+    for column in df.columns:
+        text = df[column].astype(str).str.lower().where(df[column].notna(), "")
+        mask |= text.str.contains(needle, regex=False).to_numpy(dtype=bool)
+    return mask
+
+
+def _bench(rows: int) -> dict:
+    df = _frame(rows)
+    start = time.perf_counter()
+    index = SearchIndex(df)
+    build = time.perf_counter() - start
+
+    needles = []
+    for needle in NEEDLES:
+        start = time.perf_counter()
+        expected = _scan(df, needle)
+        scan = time.perf_counter() - start
+        start = time.perf_counter()
+        got = index.match(needle)
+        indexed = time.perf_counter() - start
+        needles.append({
+            "needle": needle,
+            "matches": int(got.sum()),
+            "same_rows": bool((got == expected).all()),
+            "scan_ms": round(scan * 1000, 1),
+            "index_ms": round(indexed * 1000, 2),
+            "speedup": round(scan / indexed, 1) if indexed else None,
+        })
+    start = time.perf_counter()
+    index.match(NEEDLES[-2])  # filter change: the mask is reused
+    cached = time.perf_counter() - start
+    return {
+        "rows": rows,
+        "build_ms": round(build * 1000, 1),
+        "trigram_columns": index.trigram_columns,
+        "cached_repeat_ms": round(cached * 1000, 3),
+        "needles": needles,
+    }
+
+
+def main():
+    args = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    sizes = [int(n) for n in args.get("rows", [100_000, 1_000_000])]
+    print(json.dumps({"runs": [_bench(n) for n in sizes]}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""Benchmark Audit SQL generation over every saved query object.
+
+Rebuilds the SQL for each saved Visual (dynamic) query object straight from
+its saved config — filters, display fields, joins, Common Tables — first
+with the builder caches cleared (cold) and then repeatedly with them warm,
+the way Build SQL / Run / Save re-generate unchanged criteria. Saved
+CyberLife query objects are restored into a set of offscreen CyberLife tabs
+(as the Audit window reopens them) and timed through
+``build_cyberlife_sql`` the same way. Prints one JSON report to stdout.
+
+Filters are derived from the saved FieldGrid state (mode + values), which
+matches what ``collect_field_filters`` reads from the live widgets for the
+common modes; combo values are taken verbatim.
+
+Usage:
+    python tools/bench_sql_generation.py '{"repeat": 50}'
+"""
+import json
+import os
+import sys
+import time
+from dataclasses import asdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from suiteview.audit import common_table_store, query_object_store  # noqa: E402
+from suiteview.audit.cyberlife_query import build_cyberlife_sql  # noqa: E402
+from suiteview.audit.dynamic_query import (  # noqa: E402
+    DB2, _CTE_CACHE, build_common_table_cte, build_dynamic_sql, build_join_sql,
+)
+from suiteview.audit.query_object import OBJECT_KIND_CYBERLIFE  # noqa: E402
+from suiteview.audit.tabs.field_row import _MODES  # noqa: E402
+from suiteview.audit.tabs.select_tab import _AGGREGATES  # noqa: E402
+
+
+def _filters(config: dict) -> list[dict]:
+    filters = []
+    for tab in config.get("tabs", []):
+        for field_key, state in tab.get("grid", {}).get("fields", {}).items():
+            mode_idx = state.get("mode", 0)
+            mode = _MODES[mode_idx] if 0 <= mode_idx < len(_MODES) else "contains"
+            filt = {"column": field_key.split(".")[-1], "field_key": field_key, "mode": mode}
+            if mode == "range":
+                lo, hi = state.get("val", ""), state.get("hi", "")
+                if lo or hi:
+                    filters.append({**filt, "range_lo": lo, "range_hi": hi})
+            elif mode == "list":
+                if state.get("list_selected"):
+                    filters.append({**filt, "list_values": list(state["list_selected"])})
+            elif state.get("val"):
+                filters.append({**filt, "value": state["val"]})
+    return filters
+
+
+def _select_columns(config: dict) -> list[dict]:
+    columns = []
+    for item in config.get("select_tab", {}).get("fields", []):
+        key = item.get("field_key", "")
+        agg = item.get("aggregate", 0)
+        columns.append({
+            "column": key.split(".")[-1],
+            "field_key": key,
+            "aggregate": _AGGREGATES[agg] if isinstance(agg, int) and agg < len(_AGGREGATES) else "display",
+            "sort": item.get("sort", ""),
+            "sort_order": item.get("sort_order", 0),
+        })
+    return columns
+
+
+def _join_infos(config: dict) -> list[dict]:
+    infos = []
+    for card in config.get("joins_tab", {}).get("cards", []):
+        pairs = [(c.get("left", ""), c.get("right", ""))
+                 for c in card.get("on_conditions", []) if c.get("left") and c.get("right")]
+        if not card.get("enabled", True) or not pairs:
+            continue
+        if not card.get("left_table") or not card.get("right_table"):
+            continue
+        infos.append({
+            "left_table": card["left_table"],
+            "right_table": card["right_table"],
+            "join_type": card.get("join_type") or "INNER JOIN",
+            "alias_left": card.get("alias_left", ""),
+            "alias_right": card.get("alias_right", ""),
+            "on_pairs": pairs,
+            "extra_conditions": [(c.get("column", ""), c.get("expr", ""))
+                                 for c in card.get("extra_conditions", [])
+                                 if c.get("column") and c.get("expr")],
+        })
+    return infos
+
+
+def _build(config: dict, tables: list[str], common_tables: list) -> str:
+    select_tab = config.get("select_tab", {})
+    kwargs = dict(
+        select_columns=_select_columns(config),
+        display_all=select_tab.get("display_all", False),
+        distinct=select_tab.get("show_distinct", False),
+        dialect=DB2,
+    )
+    max_count = config.get("max_count", "25")
+    joins = _join_infos(config)
+    if joins:
+        sql = build_join_sql(tables[0], max_count, _filters(config), join_infos=joins, **kwargs)
+    else:
+        sql = build_dynamic_sql(tables[0], max_count, _filters(config), **kwargs)
+    prefix = build_common_table_cte(common_tables, DB2)
+    return prefix + "\n" + sql if prefix else sql
+
+
+def _cyberlife_tabs(obj) -> dict:
+    """A fresh set of CyberLife tabs restored from a saved object's criteria."""
+    from suiteview.audit.tabs.adv_tab import AdvTab
+    from suiteview.audit.tabs.benefits_tab import BenefitsTab
+    from suiteview.audit.tabs.coverages_tab import CoveragesTab
+    from suiteview.audit.tabs.custom_display_tab import CustomDisplayTab
+    from suiteview.audit.tabs.display_tab import DisplayTab
+    from suiteview.audit.tabs.plancode_tab import PlancodeTab
+    from suiteview.audit.tabs.policy2_tab import Policy2Tab
+    from suiteview.audit.tabs.policy_tab import PolicyTab
+    from suiteview.audit.tabs.transaction_tab import TransactionTab
+
+    criteria = (obj.config or {}).get("criteria") or {}
+    tab_states = criteria.get("tabs") or {}
+    tabs = {
+        "policy": PolicyTab(), "display": DisplayTab(), "policy2": Policy2Tab(),
+        "adv": AdvTab(), "coverages": CoveragesTab(), "plancode": PlancodeTab(),
+        "benefits": BenefitsTab(), "transaction": TransactionTab(),
+        "custom_display": CustomDisplayTab(),
+    }
+    for key, tab in tabs.items():
+        tab.set_state(tab_states.get(key, {}))
+    return tabs
+
+
+def _build_cyberlife(config: dict, tabs: dict) -> str:
+    from suiteview.core.db2_constants import DEFAULT_SCHEMA, REGION_SCHEMA_MAP
+
+    criteria = config.get("criteria") or {}
+    return build_cyberlife_sql(
+        schema=REGION_SCHEMA_MAP.get(config.get("region") or "", DEFAULT_SCHEMA),
+        sys_code=str(config.get("system_code") or "").strip(),
+        max_count_text=str(criteria.get("max_count", "25")).strip(),
+        coverage_level=bool(criteria.get("coverage_level", False)),
+        policy_tab=tabs["policy"], display_tab=tabs["display"],
+        custom_display_tab=tabs["custom_display"], policy2_tab=tabs["policy2"],
+        adv_tab=tabs["adv"], coverages_tab=tabs["coverages"],
+        plancode_tab=tabs["plancode"], benefits_tab=tabs["benefits"],
+        transaction_tab=tabs["transaction"],
+    )
+
+
+def _clear_caches():
+    for fn in (build_dynamic_sql, build_join_sql, build_cyberlife_sql):
+        fn.cache_clear()
+    _CTE_CACHE.clear()
+
+
+def _time(cases, build, repeat: int) -> tuple[float, float, list[dict]]:
+    """Cold pass, then mean warm pass, over ``(name, *args)`` cases."""
+    failures = []
+    t0 = time.perf_counter()
+    for name, *args in cases:
+        try:
+            build(*args)
+        except Exception as exc:  # report, keep timing the rest
+            failures.append({"name": name, "error": str(exc)})
+    cold = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        for _name, *args in cases:
+            try:
+                build(*args)
+            except Exception:
+                pass
+    warm = (time.perf_counter() - t0) / max(repeat, 1)
+    return cold, warm, failures
+
+
+def _timings(count: int, cold: float, warm: float) -> dict:
+    return {
+        "queries": count,
+        "cold_ms": round(cold * 1000, 3),
+        "warm_ms_per_pass": round(warm * 1000, 3),
+        "speedup": round(cold / warm, 1) if warm else None,
+    }
+
+
+def main():
+    args = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    repeat = int(args.get("repeat", 50))
+
+    all_common = {ct.name: ct for ct in common_table_store.list_tables()}
+    cases = []
+    cyberlife_objects = []
+    for entry in query_object_store.list_entries():
+        obj = query_object_store.load_object_by_id(entry.id)
+        if obj is not None and obj.kind == OBJECT_KIND_CYBERLIFE:
+            cyberlife_objects.append(obj)
+            continue
+        config = (obj.config or {}) if obj is not None else {}
+        tables = list(config.get("tables") or [s.name for s in obj.sources]) if obj else []
+        if not tables or "select_tab" not in config:
+            continue  # manual SQL / file objects have no Visual config
+        selected = config.get("common_tables_tab", {}).get("selected_tables", [])
+        cases.append((entry.name, config, tables,
+                      [all_common[n] for n in selected if n in all_common]))
+
+    cyberlife_cases = []
+    if cyberlife_objects:
+        from PyQt6.QtWidgets import QApplication
+
+        app = QApplication.instance() or QApplication([])  # keeps the tabs alive
+        cyberlife_cases = [(obj.name, obj.config or {}, _cyberlife_tabs(obj))
+                           for obj in cyberlife_objects]
+
+    _clear_caches()
+    cold, warm, failures = _time(cases, _build, repeat)
+    cl_cold, cl_warm, cl_failures = _time(cyberlife_cases, _build_cyberlife, repeat)
+
+    print(json.dumps({
+        **_timings(len(cases), cold, warm),
+        "cyberlife": _timings(len(cyberlife_cases), cl_cold, cl_warm),
+        "cache": {
+            "build_dynamic_sql": asdict(build_dynamic_sql.cache_info()),
+            "build_join_sql": asdict(build_join_sql.cache_info()),
+            "common_table_cte": asdict(_CTE_CACHE.info()),
+            "build_cyberlife_sql": asdict(build_cyberlife_sql.cache_info()),
+        },
+        "failures": failures + cl_failures,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()